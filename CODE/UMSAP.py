@@ -15,6 +15,7 @@
 
 
 #region -------------------------------------------------------------> Imports
+import multiprocessing
 import platform
 from pathlib import Path
 
@@ -173,6 +174,7 @@ class SplashWindow(wx.adv.SplashScreen):
 
 #region -----------------------------------------------------------> Start App
 if __name__ == "__main__":
+    multiprocessing.freeze_support()                                            # Worker pools in frozen executables
     app = UmsapApp()
     app.MainLoop()
 #endregion --------------------------------------------------------> Start App
@@ -0,0 +1,124 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Run analyses from the command line without the graphical user interface.
+
+    Examples
+    --------
+    Run the analyses in a JSON or TOML job file:
+    >>> python UMSAPBatch.py job.json
+
+    Run again all analyses in an UMSAP file and save them in a new file:
+    >>> python UMSAPBatch.py results.umsap --output rerun/results.umsap
+
+    Run the analyses in four worker processes:
+    >>> python UMSAPBatch.py job.json --jobs 4
+"""
+
+
+#region -------------------------------------------------------------> Imports
+import argparse
+import sys
+from pathlib import Path
+
+from config.config import config as mConfig
+from batch  import method as batchMethod
+from result import file   as resFile
+#endregion ----------------------------------------------------------> Imports
+
+
+#region -------------------------------------------------------------> Methods
+def GetArgs(argv:list[str]) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+        Parameters
+        ----------
+        argv: list[str]
+            Command line arguments.
+
+        Returns
+        -------
+        argparse.Namespace
+    """
+    # No test
+    parser = argparse.ArgumentParser(
+        description=f'{mConfig.core.softwareF} - Batch mode')
+    parser.add_argument(
+        'job', type=Path, help='JSON or TOML job file, or an UMSAP file.')
+    parser.add_argument(
+        '-s', '--section', default=None,
+        help='Only run the analyses in this section of the UMSAP file.')
+    parser.add_argument(
+        '-o', '--output', type=Path, default=None,
+        help='UMSAP file for the results of all analyses.')
+    parser.add_argument(
+        '-j', '--jobs', type=int, default=1,
+        help='Number of analyses to run in parallel. 0 uses all processors.')
+    return parser.parse_args(argv)
+#---
+
+
+def Main(argv:list[str]) -> int:
+    """Run the analyses.
+
+        Parameters
+        ----------
+        argv: list[str]
+            Command line arguments.
+
+        Returns
+        -------
+        int
+            Exit code. 1 if at least one analysis failed.
+    """
+    # No test
+    #region ---------------------------------------------------------> Jobs
+    args = GetArgs(argv)
+    mConfig.LoadUserConfig()
+    #------------------------------>
+    if args.job.suffix == '.umsap':
+        umsap = resFile.UMSAPFile(args.job)
+        jobs  = [
+            {'section': k, 'umsap': args.job, 'date': j}
+            for k,v in umsap.rData.items() if k in batchMethod.BatchRun.cAnalysisMethod
+            for j in v
+        ]
+    else:
+        jobs = batchMethod.ReadJob(args.job)
+    #------------------------------>
+    if args.section is not None:
+        section = mConfig.batch.oSection.get(args.section.lower(), args.section)
+        jobs = [x for x in jobs if x.get('section') in [args.section, section]]
+    if args.output is not None:
+        for job in jobs:
+            job['uFile'] = args.output
+    #endregion ------------------------------------------------------> Jobs
+
+    #region ----------------------------------------------------------> Run
+    if args.jobs == 1:
+        runL = batchMethod.RunJob(jobs)
+        msgL = [x.rMsgError for x in runL]
+    else:
+        resL = batchMethod.RunJobQueue(jobs, maxWorkers=args.jobs or None)
+        msgL = [x.msgError for x in resL]
+    #endregion -------------------------------------------------------> Run
+
+    return 1 if any(msgL) else 0
+#---
+#endregion ----------------------------------------------------------> Methods
+
+
+#region -----------------------------------------------------------> Start App
+if __name__ == "__main__":
+    sys.exit(Main(sys.argv[1:]))
+#endregion --------------------------------------------------------> Start App
@@ -0,0 +1,37 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Configuration for the batch module of the app"""
+
+
+#region -------------------------------------------------------------> Imports
+from dataclasses import dataclass, field
+#endregion ----------------------------------------------------------> Imports
+
+
+#region -------------------------------------------------------> Configuration
+@dataclass
+class Configuration():
+    """Configuration for the batch module"""
+    #region ---------------------------------------------------------> Options
+    #------------------------------> Options
+    oSection:dict = field(default_factory=lambda: {                             # Short names for the sections in the job files
+        'corra'   : 'Correlation Analysis',
+        'dataprep': 'Data Preparation',
+        'limprot' : 'Limited Proteolysis',
+        'protprof': 'Proteome Profiling',
+        'tarprot' : 'Targeted Proteolysis',
+    })
+    #endregion ------------------------------------------------------> Options
+#---
+#endregion ----------------------------------------------------> Configuration
@@ -0,0 +1,1189 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Methods to run the analyses without the graphical user interface"""
+
+
+#region -------------------------------------------------------------> Imports
+import json
+import multiprocessing
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses        import dataclass, field
+from datetime           import datetime
+from functools          import partial
+from pathlib            import Path
+from typing             import Callable, Optional, Union
+
+import pandas as pd
+
+try:
+    import tomllib                                                              # Python >= 3.11
+except ImportError:
+    try:
+        import tomli as tomllib                                                 # type: ignore
+    except ImportError:
+        tomllib = None                                                          # pylint: disable=invalid-name
+
+from config.config import config as mConfig
+from core     import check     as cCheck
+from core     import exception as cException
+from core     import file      as cFile
+from core     import method    as cMethod
+from corr     import method as corrMethod
+from dataprep import method as dataMethod
+from limprot  import method as limpMethod
+from protprof import method as protMethod
+from result   import file   as resFile
+from tarprot  import method as tarpMethod
+#endregion ----------------------------------------------------------> Imports
+
+
+#region -------------------------------------------------------------> Classes
+class BatchRun():
+    """Run one analysis and write the output like the configuration panes.
+
+        Parameters
+        ----------
+        cSection: str
+            Section of the analysis in the UMSAP file, e.g. mConfig.tarp.tMod
+        rDO: cMethod.BaseUserData
+            User input. Column numbers must be already set, see SetColumn.
+        msgFunc: Callable
+            Called with the progress messages.
+        inQueue: bool
+            The analysis runs in a JobQueue. rDO.uFile is final and the UMSAP
+            file is written by the JobQueue. Default is False.
+        cancel: cMethod.CancelToken or None
+            Token to cancel the analysis.
+
+        Attributes
+        ----------
+        rCheckpoint: cFile.Checkpoint or None
+            Output of the finished steps. Set in PrepareRun. None if
+            mConfig.core.checkpoint is False.
+        rDateDict: dict
+            Data of the analysis for the UMSAP file.
+        rMsgError: str
+            Error message. Empty if the analysis was successful.
+        rRepVal: list[int]
+            Number of values replaced with np.nan in each column of dfF.
+        rTimer: cMethod.StepTimer
+            Wall time, CPU time and peak memory of the steps of the analysis.
+        rException: Exception or None
+            Exception raised during the analysis.
+
+        Notes
+        -----
+        It runs the steps in core.pane.BaseConfPanel.Run: PrepareRun,
+        ReadInputFiles, RunAnalysis & WriteOutput with the same functions in
+        core.method and the StepDict method of each section.
+    """
+    # Test in test.unit.batch.test_method.Test_RunJob
+    #region -----------------------------------------------------> Class setup
+    cLPdPrepare  = 'Preparing analysis: '
+    cLPdReadFile = 'Reading input files: '
+    cLPdRun      = 'Running analysis: '
+    cLPdWrite    = 'Writing output: '
+    #------------------------------>
+    cAnalysisMethod = {
+        mConfig.corr.tUtil: corrMethod.CorrA,
+        mConfig.data.tUtil: dataMethod.RunDataPreparation,
+        mConfig.limp.tMod : limpMethod.LimProt,
+        mConfig.prot.tMod : protMethod.ProtProf,
+        mConfig.tarp.tMod : tarpMethod.TarProt,
+    }
+    cStepDict = {
+        mConfig.corr.tUtil: corrMethod.StepDict,
+        mConfig.data.tUtil: dataMethod.StepDict,
+        mConfig.limp.tMod : limpMethod.StepDict,
+        mConfig.prot.tMod : protMethod.StepDict,
+        mConfig.tarp.tMod : tarpMethod.StepDict,
+    }
+    #endregion --------------------------------------------------> Class setup
+
+    #region --------------------------------------------------> Instance setup
+    def __init__(
+        self,
+        cSection:str,
+        rDO:cMethod.BaseUserData,
+        msgFunc:Callable[[str], object] = print,
+        inQueue:bool                    = False,
+        cancel:Optional[cMethod.CancelToken] = None,
+        ) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.cSection   = cSection
+        self.rDO        = rDO
+        self.rMsgFunc   = msgFunc
+        self.rInQueue   = inQueue
+        self.rCancel    = cancel if cancel is not None else cMethod.CancelToken()
+        self.rCheckpoint:Optional[cFile.Checkpoint] = None
+        self.rTimer     = cMethod.StepTimer(memory=mConfig.core.traceMemory)
+        self.rDateDict:dict = {}
+        self.rMsgError  = ''
+        self.rException:Optional[Exception] = None
+        self.rDate      = ''
+        self.rDateID    = ''
+        self.rOFolder   = Path()
+        self.rDeltaT    = ''
+        self.rIFileObj:Optional[cFile.CSVFile]   = None
+        self.rSeqFileObj:Optional[cFile.FastaFile] = None
+        #------------------------------>
+        self.dfI     = pd.DataFrame()
+        self.dfF     = pd.DataFrame()
+        self.dfMR    = pd.DataFrame()
+        self.dfT     = pd.DataFrame()
+        self.dfN     = pd.DataFrame()
+        self.dfIm    = pd.DataFrame()
+        self.dfTP    = pd.DataFrame()
+        self.dfE     = pd.DataFrame()
+        self.dfS     = pd.DataFrame()
+        self.dfR     = pd.DataFrame()
+        self.dfAA    = pd.DataFrame()
+        self.dfHist  = pd.DataFrame()
+        self.dfCpR   = pd.DataFrame()
+        self.dfCEvol = pd.DataFrame()
+        self.rRepVal:list[int] = []
+        #endregion --------------------------------------------> Initial Setup
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class methods
+    def Run(self) -> bool:
+        """Run all steps of the analysis.
+
+            Returns
+            -------
+            bool
+        """
+        #region -------------------------------------------------------> Steps
+        start = datetime.now()
+        self.rTimer.Start()
+        profiler = cMethod.Profiler()
+        profiler.Start()
+        #------------------------------>
+        for name, step in [
+            ('Prepare run',      self.PrepareRun),
+            ('Read input files', self.ReadInputFiles),
+            ('Run analysis',     self.RunAnalysis),
+            ('Write output',     self.WriteOutput),
+            ]:
+            self.rTimer.Begin(name)
+            try:
+                if not (self.rCancel.Check() and step()):
+                    break
+            except Exception as e:
+                self.rMsgError  = self.rMsgError or 'Unexpected error.'
+                self.rException = e
+                break
+            finally:
+                self.rTimer.End(name)
+        #------------------------------> Intermediate steps of failed runs
+        cFile.RemoveSpilledDF(list(self.DFDict().values()))
+        #------------------------------> Profile
+        if (profile := profiler.Stop(
+            cMethod.ProfileFile(self.rDO.uFile, self.cSection))):
+            self.Msg(profile)
+        self.rTimer.Stop()
+        #------------------------------> Cancelled
+        if self.rCancel.IsCancelled() and (
+            self.rMsgError or isinstance(self.rException, cException.Cancelled)):
+            self.rMsgError  = cMethod.StrCancel()
+            self.rException = None
+        #------------------------------>
+        self.rDeltaT = datetime.utcfromtimestamp(
+            (datetime.now()-start).total_seconds()
+        ).strftime("%H:%M:%S")
+        #endregion ----------------------------------------------------> Steps
+
+        return not self.rMsgError
+    #---
+
+    def Msg(self, msg:str) -> bool:
+        """Report progress.
+
+            Parameters
+            ----------
+            msg: str
+                Message to report.
+
+            Returns
+            -------
+            bool
+        """
+        self.rMsgFunc(f'{self.cSection} - {self.rDO.ID}: {msg}')
+        return True
+    #---
+
+    def DFDict(self) -> dict:
+        """Output of the steps of the analysis.
+
+            Returns
+            -------
+            dict
+                {'dfI': pd.DataFrame, ...}, see mConfig.core.ltDFKeys.
+        """
+        return {k: getattr(self, k) for k in mConfig.core.ltDFKeys}
+    #---
+
+    def PrepareRun(self) -> bool:
+        """Set date, output folder and date ID.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        self.Msg(self.cLPdPrepare + 'Output folder')
+        #------------------------------> Date & Output folder
+        if self.rInQueue:
+            self.rDate = cMethod.ReserveDataFolder(
+                self.rDO.uFile.parent, self.cSection)
+        else:
+            self.rDate = cMethod.ReserveOutput(self.rDO, self.cSection)
+        self.rOFolder = self.rDO.uFile.parent
+        #------------------------------> DateID
+        self.rDateID = f'{self.rDate} - {self.rDO.ID}'
+        #------------------------------> Checkpoint
+        self.rCheckpoint = cFile.NewCheckpoint(
+            cMethod.StrCheckpointKey(self.cSection, self.rDO))
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def ReadInputFiles(self) -> bool:
+        """Read the data and sequence files.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Read
+        self.rIFileObj, self.rSeqFileObj, self.rMsgError, self.rException = (
+            cMethod.ReadInputFiles(
+                self.rDO, msgFunc=lambda x: self.Msg(self.cLPdReadFile + x)))
+        #endregion ------------------------------------------------> Read
+
+        return not self.rMsgError
+    #---
+
+    def RunAnalysis(self) -> bool:
+        """Run the analysis.
+
+            Returns
+            -------
+            bool
+        """
+        #region ----------------------------------------------------> Analysis
+        self.Msg(self.cLPdRun + 'Main Analysis')
+        #------------------------------>
+        dfDict, self.rMsgError, self.rException = cMethod.RunAnalysisMethod(
+            self.cAnalysisMethod[self.cSection],
+            self.rIFileObj.rDf,                                                 # type: ignore
+            self.rDO,
+            cancel     = self.rCancel,
+            checkpoint = self.rCheckpoint,
+            timer      = self.rTimer,
+            spill      = self.SpillData,
+        )
+        #------------------------------>
+        if dfDict:
+            for k,v in dfDict.items():
+                setattr(self, k, v)
+        else:
+            return False
+        #endregion -------------------------------------------------> Analysis
+
+        #region --------------------------------------------> Further Analysis
+        if self.cSection == mConfig.tarp.tMod:
+            dfDict, self.rMsgError, self.rException = (
+                tarpMethod.FurtherAnalysis(
+                    self.dfR,
+                    self.rDO,
+                    cancel     = self.rCancel,
+                    checkpoint = self.rCheckpoint,
+                    timer      = self.rTimer,
+                    msgFunc    = lambda x: self.Msg(self.cLPdRun + x),
+                ))
+            for k,v in dfDict.items():
+                setattr(self, k, v)
+        #endregion -----------------------------------------> Further Analysis
+
+        return not self.rMsgError
+    #---
+
+    def SpillData(self, dfDict:dict, keep:tuple[str, ...]=('dfR',)) -> dict:
+        """Write the intermediate steps to the Data-Steps folder when they
+            use more memory than mConfig.core.memoryBudget.
+
+            Parameters
+            ----------
+            dfDict: dict
+                Output of the finished steps of the analysis method.
+            keep: tuple[str, ...]
+                Keys of the pd.DataFrames still needed by the analysis.
+
+            Returns
+            -------
+            dict
+                dfDict with the written steps replaced by cFile.SpilledDF.
+        """
+        return cFile.SpillDFs(
+            cMethod.DataStepsFolder(self.rOFolder, self.rDate, self.cSection),
+            dfDict,
+            mConfig.core.memoryBudget,
+            keep = keep,
+        )
+    #---
+
+    def WriteOutput(self) -> bool:
+        """Write the Data-Steps files and add the analysis to the UMSAP file.
+            The UMSAP file is not written when running in a JobQueue.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Step Dict
+        stepDict = self.cStepDict[self.cSection](
+            self.rDate, self.rDO, self.DFDict())
+        #endregion ------------------------------------------------> Step Dict
+
+        #region ------------------------------------------------> Data Initial
+        self.Msg(self.cLPdWrite + 'Data files, Input Data')
+        #------------------------------>
+        try:
+            cMethod.CopyInputFiles(self.rDO, self.rDate)
+        except Exception as e:
+            self.rMsgError = ('It was not possible to copy the input files to '
+                'the output folder.')
+            self.rException = e
+            return False
+        #endregion ---------------------------------------------> Data Initial
+
+        #region --------------------------------------------------> Data Steps
+        self.Msg(self.cLPdWrite + 'Data files, Output Data')
+        try:
+            cFile.WriteDFs2CSV(
+                cMethod.DataStepsFolder(
+                    self.rOFolder, self.rDate, self.cSection),
+                stepDict['Files'],
+            )
+        except Exception as e:
+            self.rMsgError = ('It was not possible to create the files with '
+                'the data for the intermediate steps of the analysis.')
+            self.rException = e
+            return False
+        #------------------------------>
+        if self.rCheckpoint is not None:
+            self.rCheckpoint.Clear()
+        #endregion -----------------------------------------------> Data Steps
+
+        #region --------------------------------------------------> UMSAP File
+        self.Msg(self.cLPdWrite + 'Main file')
+        #------------------------------>
+        self.rDateDict = cMethod.DateDict(
+            self.rDO, stepDict, self.rTimer.Dict(), self.rRepVal)
+        #------------------------------>
+        if self.rInQueue:
+            return True
+        #------------------------------>
+        try:
+            cFile.WriteUMSAPData(
+                self.rDO.uFile, self.cSection, self.rDateID, self.rDateDict)
+        except Exception as e:
+            self.rMsgError = ('It was not possible to create the dictionary '
+                'with the UMSAP data.')
+            self.rException = e
+            return False
+        #endregion -----------------------------------------------> UMSAP File
+
+        return True
+    #---
+    #endregion ------------------------------------------------> Class methods
+#---
+
+
+@dataclass
+class JobResult():
+    """Result of an analysis run in a JobQueue.
+
+        Notes
+        -----
+        The exception is stored as a string because not all exceptions can be
+        sent back from the worker processes.
+    """
+    #region ---------------------------------------------------------> Options
+    jobID:int
+    cSection:str
+    ID:str
+    uFile:Path     = Path()
+    dateID:str     = ''
+    dateDict:dict  = field(default_factory=dict)
+    deltaT:str     = ''
+    msgError:str   = ''
+    exception:str  = ''
+    cancelled:bool = False
+    #endregion ------------------------------------------------------> Options
+#---
+
+
+class JobQueue():
+    """Run several analyses in parallel in a pool of worker processes.
+
+        Parameters
+        ----------
+        maxWorkers: int or None
+            Number of worker processes. None means the number of processors.
+        msgFunc: Callable
+            Called with the job ID and the progress messages of the analyses.
+        endFunc: Callable or None
+            Called with the JobResult of each analysis after the UMSAP file was
+            written.
+
+        Attributes
+        ----------
+        rCancel: dict
+            Job ID as keys and cMethod.CancelToken as values.
+        rCancelAll: bool
+            All analyses were cancelled in Shutdown.
+        rJob: dict
+            Job ID as keys and (msgFunc, endFunc) as values.
+        rLock: threading.Lock
+            Serialize writes to the UMSAP files.
+        rResult: dict
+            Job ID as keys and JobResult as values.
+        rUFile: dict
+            Requested UMSAP file as keys and the file used as values.
+
+        Notes
+        -----
+        The analyses run in the worker processes write their Data-Steps and
+        Input-Data files. The UMSAP files are written only in the process
+        owning the JobQueue, one analysis at a time. Worker processes are
+        spawned, not forked, also on Linux. Progress messages are
+        forwarded from the workers by a listener thread. msgFunc and endFunc
+        are called from threads other than the one that created the JobQueue.
+    """
+    # Test in test.unit.batch.test_method.Test_RunJobQueue
+    #region --------------------------------------------------> Instance setup
+    def __init__(
+        self,
+        maxWorkers:Optional[int]                         = None,
+        msgFunc:Callable[[int, str], object]             = print,
+        endFunc:Optional[Callable[[JobResult], object]]  = None,
+        ) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.rMsgFunc = msgFunc
+        self.rEndFunc = endFunc
+        self.rJobID   = 0
+        self.rJob:dict[int, tuple]          = {}
+        self.rCancel:dict[int, cMethod.CancelToken] = {}
+        self.rCancelAll = False
+        self.rResult:dict[int, JobResult]   = {}
+        self.rUFile:dict[Path, Path]        = {}
+        self.rLock    = threading.Lock()
+        #------------------------------>
+        ctx = multiprocessing.get_context('spawn')                              # Forking the threaded GUI process is unsafe
+        self.rManager  = ctx.Manager()
+        self.rQueue    = self.rManager.Queue()
+        self.rExecutor = ProcessPoolExecutor(
+            max_workers=maxWorkers, initializer=InitWorker, mp_context=ctx)
+        #------------------------------>
+        self.rListener = threading.Thread(target=self.Listen, daemon=True)
+        self.rListener.start()
+        #endregion --------------------------------------------> Initial Setup
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class methods
+    def CancelToken(self) -> cMethod.CancelToken:
+        """Create a token that can cancel an analysis in a worker process.
+
+            Returns
+            -------
+            cMethod.CancelToken
+        """
+        return cMethod.CancelToken(self.rManager.Event())
+    #---
+
+    def Cancel(self, jobID:int) -> bool:
+        """Cancel an analysis.
+
+            Parameters
+            ----------
+            jobID: int
+                Job ID.
+
+            Returns
+            -------
+            bool
+        """
+        return self.rCancel[jobID].Cancel()
+    #---
+
+    def Submit(
+        self,
+        cSection:str,
+        rDO:cMethod.BaseUserData,
+        msgFunc:Optional[Callable[[int, str], object]]  = None,
+        endFunc:Optional[Callable[[JobResult], object]] = None,
+        cancel:Optional[cMethod.CancelToken]            = None,
+        ) -> int:
+        """Add an analysis to the queue.
+
+            Parameters
+            ----------
+            cSection: str
+                Section of the analysis in the UMSAP file.
+            rDO: cMethod.BaseUserData
+                User input. Column numbers must be already set.
+            msgFunc: Callable or None
+                Replace the msgFunc of the JobQueue for this analysis.
+            endFunc: Callable or None
+                Replace the endFunc of the JobQueue for this analysis.
+            cancel: cMethod.CancelToken or None
+                Token to cancel the analysis. It must be created with
+                self.CancelToken. None creates a new token.
+
+            Returns
+            -------
+            int
+                Job ID.
+
+            Notes
+            -----
+            All analyses for the same UMSAP file go to the same output folder.
+        """
+        #region ---------------------------------------------------> Job
+        with self.rLock:
+            self.rJobID += 1
+            jobID = self.rJobID
+            #------------------------------>
+            if (uFile := Path(rDO.uFile)) not in self.rUFile:
+                self.rUFile[uFile] = cMethod.SetOutputFile(
+                    uFile, cMethod.StrNow())
+            rDO.uFile = self.rUFile[uFile]
+            #------------------------------>
+            self.rJob[jobID] = (
+                msgFunc if msgFunc is not None else self.rMsgFunc,
+                endFunc if endFunc is not None else self.rEndFunc,
+            )
+            self.rCancel[jobID] = (
+                cancel if cancel is not None else self.CancelToken())
+        #endregion ------------------------------------------------> Job
+
+        #region ---------------------------------------------------> Submit
+        future = self.rExecutor.submit(
+            RunQueueJob, jobID, cSection, rDO, self.rQueue,
+            self.rCancel[jobID])
+        future.add_done_callback(
+            partial(self.JobEnd, JobResult(jobID, cSection, rDO.ID, rDO.uFile)))
+        #endregion ------------------------------------------------> Submit
+
+        return jobID
+    #---
+
+    def Listen(self) -> bool:
+        """Forward the progress messages from the worker processes.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Listen
+        while (item := self.rQueue.get()) is not None:
+            jobID, msg = item
+            self.rJob[jobID][0](jobID, msg)
+        #endregion ------------------------------------------------> Listen
+
+        return True
+    #---
+
+    def JobEnd(self, result:JobResult, future:Future) -> bool:
+        """Write the analysis to the UMSAP file.
+
+            Parameters
+            ----------
+            result: JobResult
+                Result to use when the worker process failed.
+            future: Future
+                Future of the analysis.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Result
+        try:
+            result = future.result()
+        except Exception as e:
+            if self.rCancelAll:
+                result.msgError  = cMethod.StrCancel()
+                result.cancelled = True
+            else:
+                result.msgError  = 'The analysis was not completed.'
+                result.exception = cMethod.StrException(e)
+        #endregion ------------------------------------------------> Result
+
+        #region ---------------------------------------------------> UMSAP
+        if not result.msgError:
+            with self.rLock:
+                try:
+                    cFile.WriteUMSAPData(
+                        result.uFile,
+                        result.cSection,
+                        result.dateID,
+                        result.dateDict,
+                    )
+                except Exception as e:
+                    result.msgError = ('It was not possible to create the '
+                        'dictionary with the UMSAP data.')
+                    result.exception = cMethod.StrException(e)
+        #endregion ------------------------------------------------> UMSAP
+
+        #region ---------------------------------------------------> End
+        self.rResult[result.jobID] = result
+        #------------------------------>
+        if (endFunc := self.rJob[result.jobID][1]) is not None:
+            endFunc(result)
+        #endregion ------------------------------------------------> End
+
+        return True
+    #---
+
+    def Shutdown(self, wait:bool=True, cancel:bool=False) -> bool:
+        """Stop the worker processes.
+
+            Parameters
+            ----------
+            wait: bool
+                Wait for the submitted analyses to finish.
+            cancel: bool
+                Cancel the analyses not started and the running ones.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Shutdown
+        if cancel:
+            self.rCancelAll = True
+            for token in self.rCancel.values():
+                token.Cancel()
+        #------------------------------>
+        self.rExecutor.shutdown(wait=wait, cancel_futures=cancel or not wait)
+        self.rQueue.put(None)
+        self.rListener.join()
+        self.rManager.shutdown()
+        #endregion ------------------------------------------------> Shutdown
+
+        return True
+    #---
+    #endregion ------------------------------------------------> Class methods
+#---
+#endregion ----------------------------------------------------------> Classes
+
+
+#region -------------------------------------------------------------> Methods
+def InitWorker() -> bool:
+    """Load the user configuration in the worker processes of a JobQueue.
+
+        Returns
+        -------
+        bool
+    """
+    # No test
+    return mConfig.LoadUserConfig()
+#---
+
+
+def RunQueueJob(
+    jobID:int,
+    cSection:str,
+    rDO:cMethod.BaseUserData,
+    queue:'multiprocessing.Queue',
+    cancel:cMethod.CancelToken,
+    ) -> JobResult:
+    """Run one analysis in a worker process of a JobQueue.
+
+        Parameters
+        ----------
+        jobID: int
+            Job ID.
+        cSection: str
+            Section of the analysis in the UMSAP file.
+        rDO: cMethod.BaseUserData
+            User input.
+        queue: multiprocessing.Queue
+            Queue for the progress messages.
+        cancel: cMethod.CancelToken
+            Token to cancel the analysis.
+
+        Returns
+        -------
+        JobResult
+    """
+    # No test
+    #region ---------------------------------------------------> Run
+    run = BatchRun(
+        cSection,
+        rDO,
+        msgFunc = lambda x: queue.put((jobID, x)),
+        inQueue = True,
+        cancel  = cancel,
+    )
+    run.Run()
+    #endregion ------------------------------------------------> Run
+
+    return JobResult(
+        jobID     = jobID,
+        cSection  = cSection,
+        ID        = rDO.ID,
+        uFile     = rDO.uFile,
+        dateID    = run.rDateID,
+        dateDict  = run.rDateDict,
+        deltaT    = run.rDeltaT,
+        msgError  = run.rMsgError,
+        exception = (
+            cMethod.StrException(run.rException)
+            if run.rException is not None else ''),
+        cancelled = cancel.IsCancelled() and bool(run.rMsgError),
+    )
+#---
+
+
+def ReadJob(fileP:Union[Path, str]) -> list[dict]:
+    """Read a JSON or TOML job file.
+
+        Parameters
+        ----------
+        fileP: Path or str
+            Path to the job file.
+
+        Returns
+        -------
+        list[dict]
+            One dict per analysis.
+
+        Notes
+        -----
+        The file may contain one analysis, a list of analyses or a 'jobs' key
+        with the list of analyses. Relative paths in the analyses are relative
+        to the folder of the job file.
+    """
+    # Test in test.unit.batch.test_method.Test_ReadJob
+    #region ---------------------------------------------------> Read
+    fileP = Path(fileP)
+    #------------------------------>
+    try:
+        if fileP.suffix.lower() == '.toml':
+            if tomllib is None:
+                raise RuntimeError(
+                    'Reading TOML files requires Python 3.11 or tomli.')
+            with open(fileP, 'rb') as file:
+                data = tomllib.load(file)
+        else:
+            with open(fileP, 'r', encoding='utf-8') as file:
+                data = json.load(file)
+    except Exception as e:
+        raise RuntimeError(mConfig.core.mFileRead.format(fileP)) from e
+    #endregion ------------------------------------------------> Read
+
+    #region ---------------------------------------------------> Jobs
+    if isinstance(data, dict):
+        data = data.get('jobs', [data])
+    #------------------------------>
+    for job in data:
+        for k in ['umsap', 'uFile', 'iFile', 'seqFile']:
+            if k in job:
+                job[k] = fileP.parent / Path(job[k]).expanduser()
+    #endregion ------------------------------------------------> Jobs
+
+    return data
+#---
+
+
+def SetColumn(cSection:str, rDO:cMethod.BaseUserData) -> bool:
+    """Set the column numbers derived from the user input.
+
+        Parameters
+        ----------
+        cSection: str
+            Section of the analysis in the UMSAP file.
+        rDO: cMethod.BaseUserData
+            User input.
+
+        Returns
+        -------
+        bool
+
+        Notes
+        -----
+        The derived values are calculated as in the PrepareRun method of the
+        configuration panes. ocResCtrl is used when resCtrl is empty, e.g. for
+        analyses in old UMSAP files.
+    """
+    # Test in test.unit.batch.test_method.Test_SetColumn
+    #region ---------------------------------------------------> Res - Ctrl
+    if rDO.resCtrl:
+        resCtrl = cMethod.ResControl2ListNumber(rDO.resCtrl)
+    else:
+        resCtrl = rDO.ocResCtrl
+    resCtrlFlat = cMethod.ResControl2Flat(resCtrl)
+    #------------------------------>
+    if rDO.minRep:
+        rDO.minRepList = cMethod.ResControl2ListNumber(rDO.minRep)
+    #endregion ------------------------------------------------> Res - Ctrl
+
+    #region ---------------------------------------------------> Columns
+    if cSection in [mConfig.corr.tUtil, mConfig.data.tUtil]:
+        first    = []
+        rDO.ocResCtrlFlat = resCtrlFlat
+    elif cSection == mConfig.prot.tMod:
+        first    = [rDO.ocGene, rDO.ocTargetProt, rDO.ocScore] + rDO.ocExcludeR
+        rDO.dfGene       = 0
+        rDO.dfTargetProt = 1
+        rDO.dfScore      = 2
+        rDO.dfExcludeR   = [2+x for x in range(1, len(rDO.ocExcludeR)+1)]
+        rDO.rawInt       = rDO.ctrlType != mConfig.prot.oControlType['Ratio']
+    else:
+        first    = [rDO.ocSeq, rDO.ocTargetProt, rDO.ocScore]
+        rDO.dfSeq        = 0
+        rDO.dfTargetProt = 1
+        rDO.dfScore      = 2
+    #------------------------------>
+    resCtrlDF     = cMethod.ResControl2DF(resCtrl, len(first))
+    resCtrlDFFlat = cMethod.ResControl2Flat(resCtrlDF)
+    #------------------------------>
+    rDO.ocResCtrl     = resCtrl
+    rDO.ocColumn      = first + resCtrlFlat
+    rDO.dfResCtrl     = resCtrlDF
+    rDO.dfResCtrlFlat = resCtrlDFFlat
+    rDO.dfColumnR     = resCtrlDFFlat
+    rDO.dfColumnF     = [2] + resCtrlDFFlat if first else resCtrlDFFlat
+    #endregion ------------------------------------------------> Columns
+
+    #region ---------------------------------------------------> dI
+    if not rDO.dI:
+        rDO.dI = {
+            k:k for k in rDO.dO if not k.startswith(('oc', 'df', 'prot'))}
+    rDO.longestKey = max(len(x) for x in rDO.dI.values())
+    #endregion ------------------------------------------------> dI
+
+    return True
+#---
+
+
+def SetUserData(job:dict) -> tuple[str, cMethod.BaseUserData]:
+    """Create the user input for one analysis in a job.
+
+        Parameters
+        ----------
+        job: dict
+            Analysis description. It contains the 'section' key and either the
+            user input for the analysis, e.g. 'iFile', 'ID', 'resCtrl', etc. or
+            the 'umsap' and 'date' keys pointing to a previous analysis in an
+            UMSAP file. In the later case, other keys in job replace the
+            values of the previous analysis.
+
+        Returns
+        -------
+        tuple[str, cMethod.BaseUserData]
+            Section and user input.
+
+        Raises
+        ------
+        ValueError:
+            - When the section is unknown.
+    """
+    # Test in test.unit.batch.test_method.Test_SetUserData
+    #region ---------------------------------------------------> Section
+    job = dict(job)
+    cSection = job.pop('section', '')
+    cSection = mConfig.batch.oSection.get(cSection.lower(), cSection)
+    #------------------------------>
+    if cSection not in BatchRun.cAnalysisMethod:
+        msg = (f"'{cSection}' is not a valid section. Valid sections are: "
+            f"{', '.join(BatchRun.cAnalysisMethod)}.")
+        raise ValueError(msg)
+    #endregion ------------------------------------------------> Section
+
+    #region ---------------------------------------------------> User Data
+    if (umsap := job.pop('umsap', None)) is not None:
+        rDO = resFile.UMSAPFile(Path(umsap)).GetDataUser(
+            cSection, job.pop('date'))
+    else:
+        rDO = resFile.UMSAPFile.rUserDataClass[cSection]()
+    #------------------------------>
+    rDO.FromDict(job)
+    SetColumn(cSection, rDO)
+    #endregion ------------------------------------------------> User Data
+
+    return (cSection, rDO)
+#---
+
+
+def CheckUserData(cSection:str, rDO:cMethod.BaseUserData) -> bool:
+    """Check the user input for one analysis in a job.
+
+        Parameters
+        ----------
+        cSection: str
+            Section of the analysis in the UMSAP file.
+        rDO: cMethod.BaseUserData
+            User input. Column numbers must be already set, see SetColumn.
+
+        Returns
+        -------
+        bool
+
+        Raises
+        ------
+        ValueError:
+            - When a value cannot be used in the analysis.
+
+        Notes
+        -----
+        Like the CheckInput method of the configuration panes, it checks only
+        what can be checked without reading the input files.
+    """
+    # Test in test.unit.batch.test_method.Test_CheckUserData
+    #region ---------------------------------------------------> Files & ID
+    fileL = [
+        ('uFile', 'UMSAP', cCheck.Path2FFOutput),
+        ('iFile', 'Data',  cCheck.Path2FFInput),
+    ]
+    if cSection in [mConfig.limp.tMod, mConfig.tarp.tMod]:
+        fileL.append(('seqFile', 'Sequences', cCheck.Path2FFInput))
+    #------------------------------>
+    for k, label, check in fileL:
+        tPath = getattr(rDO, k)
+        tPath = '' if Path(tPath) == Path() else tPath
+        if not (b := check(tPath, 'file'))[0]:
+            msg = mConfig.core.mFileBad.format(tPath, label)
+            raise ValueError(f'{msg}\n{b[1][2]}')                                # type: ignore
+    #------------------------------>
+    if not rDO.ID:
+        raise ValueError(f'ID: {mConfig.core.mEmpty}')
+    #endregion ------------------------------------------------> Files & ID
+
+    #region ---------------------------------------------------> Options
+    optL = [
+        ('tran', list(dataMethod.TRANS_METHOD)),
+        ('norm', list(dataMethod.NORM_METHOD)),
+        ('imp',  list(dataMethod.IMPUTATION_METHOD)),
+    ]
+    if cSection == mConfig.corr.tUtil:
+        optL.append(('corr', [x for x in mConfig.corr.oCorrMethod if x]))
+    if cSection in [mConfig.limp.tMod, mConfig.prot.tMod, mConfig.tarp.tMod]:
+        optL.append(('indSample', list(mConfig.core.oSamplesP)))
+        optL.append(('correctedP', [x for x in mConfig.core.oCorrectP if x]))
+    if cSection == mConfig.prot.tMod:
+        optL.append(
+            ('ctrlType', [x for x in mConfig.prot.oControlType.values() if x]))
+    if cSection == mConfig.tarp.tMod:
+        optL.append(('method', list(mConfig.tarp.oMethodP)))
+    #------------------------------>
+    for k, valid in optL:
+        if (v := getattr(rDO, k)) not in valid:
+            msg = (f"{mConfig.core.mOptionBad.format(v, k)} Valid options "
+                f"are: {', '.join(valid)}.")
+            raise ValueError(msg)
+    #endregion ------------------------------------------------> Options
+
+    #region ---------------------------------------------------> Numbers
+    numL = []
+    if rDO.imp == 'Normal Distribution':
+        numL.append(('shift', None, mConfig.core.mOneRPlusNumText))
+        numL.append(('width', None, mConfig.core.mOneRPlusNumText))
+    if cSection in [mConfig.limp.tMod, mConfig.prot.tMod, mConfig.tarp.tMod]:
+        numL.append(('alpha', 1, mConfig.core.mOne01NumText))
+    if cSection == mConfig.limp.tMod:
+        numL.append(('beta',  1, mConfig.core.mOne01NumText))
+        numL.append(('gamma', 1, mConfig.core.mOne01NumText))
+    #------------------------------>
+    for k, vMax, msg in numL:
+        v = getattr(rDO, k)
+        if (not isinstance(v, (int, float)) or v < 0
+            or (vMax is not None and v > vMax)):
+            raise ValueError(
+                f'{k}: {mConfig.core.mInvalidValue.format(v)} {msg}')
+    #endregion ------------------------------------------------> Numbers
+
+    #region ---------------------------------------------------> Columns
+    if not rDO.dfResCtrlFlat:
+        raise ValueError(f'resCtrl: {mConfig.core.mEmpty}')
+    #------------------------------>
+    if (min(rDO.ocColumn) < 0
+        or len(set(rDO.ocColumn)) != len(rDO.ocColumn)):
+        raise ValueError(
+            f'Column numbers {rDO.ocColumn}: {mConfig.core.mNZPlusNumText}')
+    #endregion ------------------------------------------------> Columns
+
+    return True
+#---
+
+
+def _InvalidJob(job:dict, e:Exception) -> tuple[str, Optional[Exception]]:
+    """Error message for an analysis that cannot be run.
+
+        Parameters
+        ----------
+        job: dict
+            Analysis description.
+        e: Exception
+            Exception raised by SetUserData or CheckUserData.
+
+        Returns
+        -------
+        tuple
+            Error message and exception. ValueError are already readable and
+            the exception is None.
+    """
+    # No test
+    if isinstance(e, ValueError):
+        return (f"Invalid analysis '{job.get('ID', '')}'.\n{e}", None)
+    return (f'Invalid analysis: {job}', e)
+#---
+
+
+def RunJob(
+    jobs:list[dict],
+    msgFunc:Callable[[str], object] = print,
+    ) -> list[BatchRun]:
+    """Run all analyses in a job.
+
+        Parameters
+        ----------
+        jobs: list[dict]
+            Analyses to run. See SetUserData.
+        msgFunc: Callable
+            Called with the progress messages.
+
+        Returns
+        -------
+        list[BatchRun]
+            One element per analysis. Check rMsgError for errors.
+    """
+    # Test in test.unit.batch.test_method.Test_RunJob
+    #region ---------------------------------------------------> Check
+    runL = []
+    #------------------------------>
+    for job in jobs:
+        try:
+            cSection, rDO = SetUserData(job)
+            CheckUserData(cSection, rDO)
+        except Exception as e:
+            run = BatchRun(mConfig.data.tUtil, cMethod.BaseUserData(), msgFunc)
+            run.rMsgError, run.rException = _InvalidJob(job, e)
+        else:
+            run = BatchRun(cSection, rDO, msgFunc)
+        #------------------------------>
+        runL.append(run)
+    #endregion ------------------------------------------------> Check
+
+    #region ---------------------------------------------------> Run
+    for run in runL:
+        if not run.rMsgError:
+            run.Run()
+        #------------------------------>
+        if run.rMsgError:
+            msgFunc(f'{mConfig.core.lPdError}: {run.rMsgError}')
+            if run.rException is not None:
+                msgFunc(cMethod.StrException(run.rException))
+        else:
+            msgFunc(f'{mConfig.core.lPdDone}: {run.rDO.uFile} ({run.rDeltaT})')
+    #endregion ------------------------------------------------> Run
+
+    return runL
+#---
+
+
+def RunJobQueue(
+    jobs:list[dict],
+    maxWorkers:Optional[int]        = None,
+    msgFunc:Callable[[str], object] = print,
+    ) -> list[JobResult]:
+    """Run all analyses in a job in parallel.
+
+        Parameters
+        ----------
+        jobs: list[dict]
+            Analyses to run. See SetUserData.
+        maxWorkers: int or None
+            Number of worker processes. None means the number of processors.
+        msgFunc: Callable
+            Called with the progress messages.
+
+        Returns
+        -------
+        list[JobResult]
+            One element per analysis. Check msgError for errors.
+    """
+    # Test in test.unit.batch.test_method.Test_RunJobQueue
+    #region ---------------------------------------------------> Helper
+    def JobMsg(jobID:int, msg:str) -> None:
+        msgFunc(f'[{jobID}] {msg}')
+    #---
+
+    def JobEnd(result:JobResult) -> None:
+        if result.msgError:
+            JobMsg(result.jobID, f'{mConfig.core.lPdError}: {result.msgError}')
+            if result.exception:
+                JobMsg(result.jobID, result.exception)
+        else:
+            JobMsg(result.jobID,
+                f'{mConfig.core.lPdDone}: {result.uFile} ({result.deltaT})')
+    #---
+    #endregion ------------------------------------------------> Helper
+
+    #region ---------------------------------------------------> Check
+    resL = []
+    jobL = []
+    #------------------------------>
+    for job in jobs:
+        try:
+            cSection, rDO = SetUserData(job)
+            CheckUserData(cSection, rDO)
+        except Exception as e:
+            msgError, tException = _InvalidJob(job, e)
+            result = JobResult(0, '', job.get('ID', ''))
+            result.msgError  = msgError
+            result.exception = (
+                cMethod.StrException(tException)
+                if tException is not None else '')
+            JobEnd(result)
+            resL.append(result)
+        else:
+            jobL.append((cSection, rDO))
+    #endregion ------------------------------------------------> Check
+
+    #region ---------------------------------------------------> Run
+    jobQueue = JobQueue(maxWorkers=maxWorkers, msgFunc=JobMsg, endFunc=JobEnd)
+    #------------------------------>
+    try:
+        for cSection, rDO in jobL:
+            jobQueue.Submit(cSection, rDO)
+    finally:
+        jobQueue.Shutdown()
+    #------------------------------>
+    resL = resL + [jobQueue.rResult[k] for k in sorted(jobQueue.rResult)]
+    #endregion ------------------------------------------------> Run
+
+    return resL
+#---
+#endregion ----------------------------------------------------------> Methods
@@ -18,6 +18,7 @@
 import json
 from dataclasses import dataclass
 
+from batch    import config as batchConfig
 from core     import config as cConfig
 from corr     import config as corrConfig
 from dataprep import config as dataConfig
@@ -36,6 +37,7 @@ class Configuration():
     """Configuration of the app"""
     # Test in test.unit.config.test_config.Test_Configuration
     #region ---------------------------------------------------------> Options
+    batch:batchConfig.Configuration
     core:cConfig.Configuration
     corr:corrConfig.Configuration
     data:dataConfig.Configuration
@@ -100,6 +102,7 @@ class Configuration():
 #---
 
 config = Configuration(
+    batchConfig.Configuration(),
     cConfig.Configuration(),
     corrConfig.Configuration(),
     dataConfig.Configuration(),
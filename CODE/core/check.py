@@ -29,12 +29,13 @@
 #region -------------------------------------------------------------> Imports
 import os
 from pathlib import Path
-from typing  import Optional, Union, Literal
-
-import wx
+from typing  import Optional, Union, Literal, TYPE_CHECKING
 
 from config.config import config as mConfig
 from core import method as cMethod
+
+if TYPE_CHECKING:
+    import wx
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -722,7 +723,7 @@ def Comparison(
 
 
 def TcUniqueColNumbers(                                                         # pylint: disable=dangerous-default-value
-    tcList:list[wx.TextCtrl],
+    tcList:list['wx.TextCtrl'],
     sepList:list[str] = [' ', ',', ';'],
     ) -> tuple[bool, Optional[tuple[str, Optional[str], str]]]:
     """Checks that all elements in the wx.TextCtrl(s) are unique.
@@ -776,7 +777,7 @@ def TcUniqueColNumbers(
 
 
 def AllTcEmpty(
-    tcList:list[wx.TextCtrl],
+    tcList:list['wx.TextCtrl'],
     ) -> tuple[bool, Optional[tuple[str, Optional[str], str]]]:
     """Check that all values in tcList are empty.
 
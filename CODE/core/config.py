@@ -18,9 +18,10 @@
 import platform
 from dataclasses import dataclass, field
 from pathlib     import Path
-from typing      import Union, Optional
+from typing      import Union, Optional, TYPE_CHECKING
 
-import wx
+if TYPE_CHECKING:
+    import wx
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -51,6 +52,9 @@ class Configuration():
     })
     dtFormat:str     = '%Y%m%d-%H%M%S'                                          # Date Time format
     fConfig:Path     = Path.home() / '.umsap_config.json'                       # Path to user configuration file
+    pCache:Path      = Path.home() / '.umsap_cache'                             # Folder for cached intermediate results
+    envProfile:str   = 'UMSAP_PROFILE'                                          # Env variable to profile analyses and result windows
+    profileTop:int   = 15                                                       # Number of functions shown from a profile
     os:str           = platform.system()                                        # Current operating system
     software:str     = 'UMSAP'                                                  # Software short name
     softwareF:str    = 'Utilities for Mass Spectrometry Analysis of Proteins'   # Software full name
@@ -78,6 +82,7 @@ class Configuration():
     lmTools:str         = 'Tools'
     lPdError:str        = 'Fatal Error'                                         # lPd: Label for Progress Dialog
     lPdDone:str         = 'All Done'
+    lPdCancel:str       = 'Analysis Cancelled'
     lStAAPos:str        = 'AA Positions'                                        # lSt: Label for wx.StaticText
     lStAlpha:str        = 'α Level'
     lStBeta:str         = 'β Level'
@@ -158,6 +163,9 @@ class Configuration():
         ['Sequence', 'Nterm', 'Cterm', 'NtermF', 'CtermF'])
     ltDPKeys:list[str]        = field(default_factory=lambda:                   # ID of Data Prep data frames
         ['dfF', 'dfMP', 'dfT', 'dfN', 'dfIm'])
+    ltDFKeys:list[str]        = field(default_factory=lambda:                   # Output of the steps of an analysis
+        ['dfI', 'dfF', 'dfMR', 'dfT', 'dfN', 'dfIm', 'dfTP', 'dfE', 'dfS',
+         'dfR', 'dfCpR', 'dfCEvol', 'dfAA', 'dfHist'])
     lAA1:list[str]            = field(default_factory=lambda:                   # AA one letter codes
         ['A', 'I', 'L', 'V', 'M', 'F', 'W', 'Y', 'R', 'K', 'D', 'E', 'C', 'Q',
         'H', 'S', 'T', 'N', 'G', 'P'])
@@ -225,6 +233,9 @@ class Configuration():
     mColNumbers:str         = ('In addition, each value must be smaller than '
                                'the total number of columns in the Data file.')
     mCopyFailedW:str        = 'Copy operation failed. Try again.'
+    mCancel:str             = 'The analysis was cancelled.'
+    mCancelCheckpoint:str   = ('Finished steps were saved and will be reused '
+        'when the analysis is started again with the same input.')
     mCutFailedW:str         = 'Cut operation failed. Try again.'
     mCtrlEmpty:str          = 'None of the Control fields can be empty.'
     mEmpty:str              = 'The field value cannot be empty.'
@@ -314,10 +325,10 @@ class Configuration():
         f'equally spaced windows. Multiple numbers allow defining custom sized '
         f'windows.\ne.g. 50 or 0 50 100 150 500{mOptField}')
     #------------------------------> Fonts
-    fSeqAlign:Union[wx.Font, str]              = ''
-    fTreeItem:Union[wx.Font, str]              = ''
-    fTreeItemDataFile:Union[wx.Font, str]      = ''
-    fTreeItemDataFileFalse:Union[wx.Font, str] = ''
+    fSeqAlign:Union['wx.Font', str]              = ''
+    fTreeItem:Union['wx.Font', str]              = ''
+    fTreeItemDataFile:Union['wx.Font', str]      = ''
+    fTreeItemDataFileFalse:Union['wx.Font', str] = ''
     #------------------------------> Other
     MatPlotMargin:float = 0.025                                                 # Margin for the axes range
     cChi:dict = field(default_factory=lambda: {                                 # Chi results in AA
@@ -334,8 +345,16 @@ class Configuration():
     checkUpdate:bool    = True                                                  # True Check, False No check
     DPI:int             = 100                                                   # DPI for plot images
     imgFormat:str       = 'png'                                                 # Default format when saving multiple images
+    traceMemory:bool    = False                                                 # Record peak memory of analysis steps. Slows the analysis
+    profile:bool        = False                                                 # Profile analyses and result windows
+    float32:bool        = False                                                 # Intensities as float32 in new analyses
+    memoryBudget:int    = 0                                                     # MB for intermediate steps before writing them to disk. 0 is no limit
+    checkpoint:bool     = False                                                 # Keep finished steps to resume failed analyses
+    checkpointFolder:str = ''                                                   # Checkpoints go in its umsap-checkpoint subfolder. '' is pCache
+    checkpointMaxAge:int = 7                                                    # Days before unused checkpoints are deleted. 0 is no limit
     #--------------> Colors
     cZebra: str         = '#ffe6e6'                                             # Zebra style in wx.ListCrl
+    cSearch:str         = '#ffff99'                                             # Search matches in wx.ListCrl
     cRecProt:str        = 'gray'                                                # Color in Fragment representation
     cNatProt:str        = '#c94c4c'                                             # Color in Fragment representation
     cFragment:list[str] = field(default_factory=lambda: [                       # Color for Exp/Cond in Fragments
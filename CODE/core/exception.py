@@ -20,6 +20,21 @@ from pathlib import Path
 
 
 #region -------------------------------------------------------------> Classes
+class Cancelled(Exception):
+    """The user cancelled the running analysis."""
+    #region --------------------------------------------------> Instance setup
+    def __init__(self):
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.msg = 'The analysis was cancelled by the user.'
+        #------------------------------>
+        super().__init__(self.msg)
+        #endregion --------------------------------------------> Initial Setup
+    #---
+    #endregion -----------------------------------------------> Instance setup
+#---
+
+
 class Nothing2Plot(Exception):
     """Section in the UMSAP file has no results.
 
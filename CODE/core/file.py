@@ -15,19 +15,24 @@
 
 
 #region -------------------------------------------------------------> Imports
+import copy
+import hashlib
 import json
-from pathlib import Path
-from typing  import Union, Optional, Literal
+import os
+import re
+import shutil
+import time
+from dataclasses import dataclass, asdict
+from functools   import lru_cache
+from pathlib     import Path
+from typing      import Any, Union, Optional, Literal
 
 import numpy  as np
 import pandas as pd
 
-from Bio       import pairwise2
-from Bio.Align import substitution_matrices
+from Bio.Align import PairwiseAligner, substitution_matrices
 
 from config.config import config as mConfig
-from core import generator as cGenerator
-from core import method    as cMethod
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -139,6 +144,81 @@ def ReadFileFirstLine(
 #---
 
 
+@lru_cache(maxsize=None)
+def _SeqAligner() -> PairwiseAligner:
+    """Get the aligner used in the app.
+
+        Returns
+        -------
+        PairwiseAligner
+            Global alignment with BLOSUM62, gap open -10 and gap extend -0.5.
+
+        Notes
+        -----
+        The aligner and the substitution matrix are created only once.
+    """
+    # No test
+    return PairwiseAligner(
+        mode                = 'global',
+        substitution_matrix = substitution_matrices.load("BLOSUM62"),
+        open_gap_score      = -10,
+        extend_gap_score    = -0.5,
+    )
+#---
+
+
+@lru_cache(maxsize=128)
+def SeqAlignment(seqA:str, seqB:str) -> 'SeqAlign':
+    """Calculate the optimal global sequence alignment between both sequences.
+
+        Parameters
+        ----------
+        seqA: str
+            Reference sequence.
+        seqB: str
+            Second sequence.
+
+        Returns
+        -------
+        SeqAlign
+
+        Notes
+        -----
+        Only the optimal alignment is calculated. Results are kept in memory
+        and in mConfig.core.pCache keyed by the hash of the sequence pair, so
+        the alignment of a given pair of sequences is calculated only once.
+        Problems with the cache folder are ignored.
+    """
+    # Test in test.unit.core.test_file.Test_SeqAlignment
+    #region -----------------------------------------------------> Cache
+    key   = hashlib.sha256(f'{seqA}\n{seqB}'.encode('utf-8')).hexdigest()
+    fileP = mConfig.core.pCache / 'alignment' / f'{key}.json'
+    #------------------------------>
+    try:
+        data = ReadJSON(fileP)
+        if data['seqA'].replace('-', '') == seqA and data['seqB'].replace('-', '') == seqB:
+            return SeqAlign(**data)
+    except Exception:
+        pass
+    #endregion --------------------------------------------------> Cache
+
+    #region ---------------------------------------------------> Alignment
+    align = _SeqAligner().align(seqA, seqB)[0]
+    align = SeqAlign(seqA=align[0], seqB=align[1], score=float(align.score))
+    #endregion ------------------------------------------------> Alignment
+
+    #region -----------------------------------------------------> Cache
+    try:
+        fileP.parent.mkdir(parents=True, exist_ok=True)
+        WriteJSON(fileP, asdict(align))
+    except Exception:
+        pass
+    #endregion --------------------------------------------------> Cache
+
+    return align
+#---
+
+
 def WriteJSON(fileP:Union[Path, str], data:dict) -> bool:
     """Writes a JSON file.
 
@@ -223,15 +303,693 @@ def WriteDFs2CSV(
     #region ---------------------------------------------------> Write to file
     for k,i in ncDict.items():
         fileP = baseP / k
+        if isinstance(i, SpilledDF):
+            if (sep, na_rep, index) == ('\t', 'NA', False):
+                i.Move(fileP)
+                continue
+            i = i.Load()
         WriteDF2CSV(fileP, i, sep=sep, na_rep=na_rep, index=index)
     #endregion ------------------------------------------------> Write to file
 
     return True
 #---
+
+
+def SpillDFs(
+    folder:Path,
+    dfDict:dict,
+    budget:float,
+    keep:tuple[str, ...] = ('dfR',),
+    ) -> dict:
+    """Write pd.DataFrames to disk until the rest uses less memory than
+        budget.
+
+        Parameters
+        ----------
+        folder: Path
+            Folder for the files, e.g. the Data-Steps folder of the analysis.
+        dfDict: dict
+            Output of the analysis methods, e.g. {'dfI': df, ..., 'dfR': df}.
+        budget: float
+            Memory in MB for the pd.DataFrames in dfDict. 0 means no limit.
+        keep: tuple[str, ...]
+            Keys of pd.DataFrames that are never written to disk.
+
+        Returns
+        -------
+        dict
+            dfDict with the written pd.DataFrames replaced by SpilledDF.
+
+        Notes
+        -----
+        pd.DataFrames are written in the order of dfDict, i.e. the order of
+        the steps of the analysis, until the memory used by the remaining
+        pd.DataFrames is below budget.
+    """
+    # Test in test.unit.core.test_file.Test_SpillDFs
+    #region ---------------------------------------------------> Size
+    if budget <= 0:
+        return dfDict
+    #------------------------------>
+    size = {
+        k: int(v.memory_usage(deep=True).sum()) for k,v in dfDict.items()
+        if isinstance(v, pd.DataFrame)
+    }
+    total = sum(size.values())
+    limit = budget * 1024 * 1024
+    #endregion ------------------------------------------------> Size
+
+    #region ---------------------------------------------------> Spill
+    out = dict(dfDict)
+    for k,v in size.items():
+        if total <= limit:
+            break
+        if k in keep or dfDict[k].empty:
+            continue
+        #------------------------------>
+        out[k] = SpilledDF(folder/f'.spill-{k}.txt', dfDict[k])
+        total -= v
+    #endregion ------------------------------------------------> Spill
+
+    return out
+#---
+
+
+def RemoveSpilledDF(dfL:list) -> bool:
+    """Delete the files of the SpilledDF in a list that were not moved to
+        their final location, e.g. after a failed analysis.
+
+        Parameters
+        ----------
+        dfL: list
+            pd.DataFrames and SpilledDF.
+
+        Returns
+        -------
+        bool
+    """
+    # No test
+    for df in dfL:
+        if isinstance(df, SpilledDF) and df.rTemp:
+            df.Remove()
+    return True
+#---
+
+
+def NewCheckpoint(key:str) -> Optional['Checkpoint']:
+    """Checkpoint for a new analysis following the user configuration.
+
+        Parameters
+        ----------
+        key: str
+            Identifier of the analysis, e.g. cMethod.StrCheckpointKey.
+
+        Returns
+        -------
+        Checkpoint or None
+            None if mConfig.core.checkpoint is False.
+
+        Notes
+        -----
+        Checkpoints of other analyses not used in the last
+        mConfig.core.checkpointMaxAge days are deleted.
+    """
+    # Test in test.unit.core.test_file.Test_NewCheckpoint
+    #region -------------------------------------------------> Checkpoint
+    if not mConfig.core.checkpoint:
+        return None
+    #------------------------------>
+    checkpoint = Checkpoint(key)
+    checkpoint.Prune(mConfig.core.checkpointMaxAge)
+    #endregion ----------------------------------------------> Checkpoint
+
+    return checkpoint
+#---
+
+
+def WriteUMSAPData(
+    uFile:Path,
+    cSection:str,
+    dateID:str,
+    dateDict:dict,
+    ) -> bool:
+    """Add an analysis to an UMSAP file.
+
+        Parameters
+        ----------
+        uFile: Path
+            UMSAP file. It is created if needed.
+        cSection: str
+            Section of the analysis.
+        dateID: str
+            Date - ID of the analysis.
+        dateDict: dict
+            Data of the analysis.
+
+        Returns
+        -------
+        bool
+    """
+    # No test
+    #region ---------------------------------------------------> Write
+    if uFile.exists():
+        outData = ReadJSON(uFile)
+    else:
+        outData = {}
+    #------------------------------>
+    outData.setdefault(cSection, {})[dateID] = dateDict
+    #------------------------------>
+    WriteJSON(uFile, outData)
+    #endregion ------------------------------------------------> Write
+
+    return True
+#---
 #endregion ----------------------------------------------------------> Methods
 
 
 #region -------------------------------------------------------------> Classes
+@dataclass(frozen=True)
+class SeqAlign():
+    """Optimal global alignment between two sequences.
+
+        Attributes
+        ----------
+        seqA: str
+            First sequence with gaps as '-'.
+        seqB: str
+            Second sequence with gaps as '-'.
+        score: float
+            Alignment score.
+    """
+    #region ---------------------------------------------------------> Options
+    seqA:str
+    seqB:str
+    score:float
+    #endregion ------------------------------------------------------> Options
+#---
+
+
+class Checkpoint():
+    """Store the output of the finished steps of an analysis.
+
+        Parameters
+        ----------
+        key: str
+            Identifier of the analysis, e.g. cMethod.StrCheckpointKey.
+        folder: Path or None
+            Folder for the checkpoints. None means
+            mConfig.core.checkpointFolder or, if not set, mConfig.core.pCache.
+
+        Attributes
+        ----------
+        rFolder: Path
+            Folder with the files of this analysis,
+            folder/umsap-checkpoint/key.
+
+        Notes
+        -----
+        Each step is stored in a pickle file named after the step. A cancelled
+        or failed analysis started again with the same input loads the stored
+        steps instead of calculating them again. Problems with the checkpoint
+        files are ignored, the step is just calculated again.
+        SpilledDF in a step are not loaded in memory, their files are linked
+        to the checkpoint folder instead, see SpilledDF.Link.
+    """
+    # Test in test.unit.core.test_file.Test_Checkpoint
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, key:str, folder:Optional[Path]=None) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        if folder is None:
+            folder = (
+                Path(mConfig.core.checkpointFolder)
+                if mConfig.core.checkpointFolder else
+                mConfig.core.pCache
+            )
+        self.rFolder = folder/'umsap-checkpoint'/key
+        #endregion --------------------------------------------> Initial Setup
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Load(self, step:str) -> Optional[Any]:
+        """Load the output of a step.
+
+            Parameters
+            ----------
+            step: str
+                Name of the step.
+
+            Returns
+            -------
+            object or None
+                None if the step was not stored.
+        """
+        #region ---------------------------------------------------> Load
+        try:
+            data = pd.read_pickle(self.rFolder/f'{step}.pkl')
+        except Exception:
+            return None
+        #------------------------------> Files of SpilledDF are moved on write
+        if isinstance(data, dict) and any(
+            isinstance(v, SpilledDF) and not v.rFileP.is_file()
+            for v in data.values()):
+            return None
+        #endregion ------------------------------------------------> Load
+
+        return data
+    #---
+
+    def Save(self, step:str, data:Any) -> bool:
+        """Store the output of a step.
+
+            Parameters
+            ----------
+            step: str
+                Name of the step.
+            data: object
+                Output of the step.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Save
+        fileP = self.rFolder/f'{step}.pkl'
+        tmpP  = self.rFolder/f'{step}.tmp'
+        #------------------------------> Partial files are never loaded
+        try:
+            self.rFolder.mkdir(parents=True, exist_ok=True)
+            if isinstance(data, dict):
+                data = {
+                    k: v.Link(self.rFolder/f'{step}-{k}.txt')
+                    if isinstance(v, SpilledDF) else v
+                    for k,v in data.items()
+                }
+            pd.to_pickle(data, tmpP)
+            tmpP.replace(fileP)
+        except Exception:
+            return False
+        #endregion ------------------------------------------------> Save
+
+        return True
+    #---
+
+    def Clear(self) -> bool:
+        """Delete all stored steps.
+
+            Returns
+            -------
+            bool
+        """
+        shutil.rmtree(self.rFolder, ignore_errors=True)
+        return True
+    #---
+
+    def Prune(self, maxAge:int) -> bool:
+        """Delete the checkpoints of other analyses not modified recently.
+
+            Parameters
+            ----------
+            maxAge: int
+                Age in days. 0 means no limit.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            Only folders named like a checkpoint key and with stored steps
+            are deleted, other files in the folder are left alone.
+        """
+        #region ---------------------------------------------------> Prune
+        if maxAge <= 0 or not self.rFolder.parent.is_dir():
+            return True
+        #------------------------------>
+        limit = time.time() - maxAge*86400
+        for folder in self.rFolder.parent.iterdir():
+            try:
+                if (folder != self.rFolder
+                    and re.fullmatch(r'[0-9a-f]{64}', folder.name)
+                    and folder.is_dir()
+                    and any(folder.glob('*.pkl'))
+                    and folder.stat().st_mtime < limit):
+                    shutil.rmtree(folder, ignore_errors=True)
+            except OSError:
+                continue
+        #endregion ------------------------------------------------> Prune
+
+        return True
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class SpilledDF():
+    """pd.DataFrame written to disk to free memory.
+
+        Parameters
+        ----------
+        fileP: Path
+            File for the data.
+        df: pd.DataFrame
+            Data to write.
+
+        Attributes
+        ----------
+        rFileP: Path
+            Current location of the file.
+        rNLevel: int
+            Number of levels in the columns of df.
+        rTemp: bool
+            The file was not moved yet to its final location and it is not
+            kept in a checkpoint.
+        shape: tuple[int, int]
+            Shape of df.
+
+        Notes
+        -----
+        The file is written like in WriteDF2CSV, so WriteDFs2CSV only needs to
+        move it to the final Data-Steps file. Load reads the file again, some
+        dtypes may differ from the dtypes in df.
+    """
+    # Test in test.unit.core.test_file.Test_SpillDFs
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, fileP:Path, df:pd.DataFrame) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.rFileP  = fileP
+        self.rNLevel = df.columns.nlevels
+        self.rTemp   = True
+        self.shape   = df.shape
+        #------------------------------>
+        fileP.parent.mkdir(parents=True, exist_ok=True)
+        WriteDF2CSV(fileP, df)
+        #endregion --------------------------------------------> Initial Setup
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Load(self) -> pd.DataFrame:
+        """Read the data again.
+
+            Returns
+            -------
+            pd.DataFrame
+        """
+        header = list(range(self.rNLevel)) if self.rNLevel > 1 else 0
+        return pd.read_csv(self.rFileP, sep='\t', header=header)
+    #---
+
+    def Move(self, fileP:Path) -> bool:
+        """Move the file, e.g. to the final Data-Steps file.
+
+            Parameters
+            ----------
+            fileP: Path
+                New location.
+
+            Returns
+            -------
+            bool
+        """
+        self.rFileP = Path(shutil.move(self.rFileP, fileP))
+        self.rTemp  = False
+        return True
+    #---
+
+    def Link(self, fileP:Path) -> 'SpilledDF':
+        """Keep the file also in fileP, e.g. in a checkpoint.
+
+            Parameters
+            ----------
+            fileP: Path
+                Location of the copy.
+
+            Returns
+            -------
+            SpilledDF
+                Object for the copy. The copy is not removed by
+                RemoveSpilledDF.
+
+            Notes
+            -----
+            A hard link is used when possible, so no extra disk space is
+            needed and moving the file later does not affect the copy.
+        """
+        #region ---------------------------------------------------> Link
+        fileP.unlink(missing_ok=True)
+        try:
+            os.link(self.rFileP, fileP)
+        except OSError:
+            shutil.copy(self.rFileP, fileP)
+        #------------------------------>
+        out = copy.copy(self)
+        out.rFileP = fileP
+        out.rTemp  = False
+        #endregion ------------------------------------------------> Link
+
+        return out
+    #---
+
+    def Remove(self) -> bool:
+        """Delete the file.
+
+            Returns
+            -------
+            bool
+        """
+        self.rFileP.unlink(missing_ok=True)
+        return True
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class FastaIndex():
+    """Offset index for the records in a multi-record fasta file.
+
+        Parameters
+        ----------
+        fileP: Path or str
+            Path to the fasta file.
+
+        Attributes
+        ----------
+        rFileP: Path
+            Path to the fasta file.
+        rIndexP: Path
+            Path to the index file in mConfig.core.pCache.
+        rKey: dict[str, int]
+            Header, first word of the header and accession mapped to the
+            position of the record in the file.
+        rRecord: list[tuple[str, int, int]]
+            Header, offset and length in bytes of the sequence of each record.
+
+        Notes
+        -----
+        The index is saved in mConfig.core.pCache as a tab separated file with
+        one line per record, keyed by the hash of the path to the fasta file.
+        The first line holds the modification time and size of the fasta file
+        and the index is rebuilt when they change. When the index cannot be
+        saved it is kept only in memory.
+    """
+    # Test in test.unit.core.test_file.Test_FastaIndex
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, fileP:Union[Path, str]) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.rFileP  = Path(fileP)
+        key = hashlib.sha256(
+            str(self.rFileP.resolve()).encode('utf-8')).hexdigest()
+        self.rIndexP = mConfig.core.pCache / 'fasta' / f'{key}.idx'
+        self.rRecord:list[tuple[str, int, int]] = []
+        self.rKey:dict[str, int] = {}
+        #------------------------------>
+        try:
+            stat = self.rFileP.stat()
+        except Exception as e:
+            raise RuntimeError(mConfig.core.mFileRead.format(fileP)) from e
+        tag = f'# {stat.st_mtime_ns} {stat.st_size}'
+        #------------------------------>
+        if not self.ReadIndex(tag):
+            self.BuildIndex()
+            self.WriteIndex(tag)
+        #------------------------------>
+        self.SetKey()
+        #endregion --------------------------------------------> Initial Setup
+    #---
+
+    def __len__(self) -> int:
+        """Number of records in the fasta file."""
+        return len(self.rRecord)
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class methods
+    def ReadIndex(self, tag:str) -> bool:
+        """Read the index file.
+
+            Parameters
+            ----------
+            tag: str
+                Modification time and size of the fasta file.
+
+            Returns
+            -------
+            bool
+                False if the index file does not exist, cannot be read or
+                belongs to an older version of the fasta file.
+        """
+        #region ---------------------------------------------------> Read
+        try:
+            with open(self.rIndexP, 'r', encoding='utf-8') as file:
+                if file.readline().rstrip('\n') != tag:
+                    return False
+                for line in file:
+                    header, offset, nByte = line.rstrip('\n').split('\t')
+                    self.rRecord.append((header, int(offset), int(nByte)))
+        except Exception:
+            self.rRecord = []
+            return False
+        #endregion ------------------------------------------------> Read
+
+        return True
+    #---
+
+    def BuildIndex(self) -> bool:
+        """Find the offset and length of each sequence in the fasta file.
+
+            Returns
+            -------
+            bool
+        """
+        #region -------------------------------------------------> Variables
+        offset = 0
+        header = ''
+        start  = -1
+        #endregion ----------------------------------------------> Variables
+
+        #region ----------------------------------------------> Process file
+        try:
+            with open(self.rFileP, 'rb') as file:
+                for line in file:
+                    if line.lstrip()[:1] == b'>':
+                        if start > -1:
+                            self.rRecord.append((header, start, offset-start))
+                        header = line.strip().decode('utf-8')
+                        start  = offset + len(line)
+                    offset = offset + len(line)
+        except Exception as e:
+            raise RuntimeError(
+                mConfig.core.mFileRead.format(self.rFileP)) from e
+        #------------------------------>
+        if start > -1:
+            self.rRecord.append((header, start, offset-start))
+        #endregion -------------------------------------------> Process file
+
+        return True
+    #---
+
+    def WriteIndex(self, tag:str) -> bool:
+        """Save the index in the cache folder.
+
+            Parameters
+            ----------
+            tag: str
+                Modification time and size of the fasta file.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Write
+        try:
+            self.rIndexP.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.rIndexP, 'w', encoding='utf-8') as file:
+                file.write(f'{tag}\n')
+                for header, offset, nByte in self.rRecord:
+                    file.write(f'{header}\t{offset}\t{nByte}\n')
+        except Exception:
+            return False
+        #endregion ------------------------------------------------> Write
+
+        return True
+    #---
+
+    def SetKey(self) -> bool:
+        """Map header, first word of the header and accession to the records.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            The accession is the second field in UniProt headers, e.g. P31545
+            in >sp|P31545|EFEB_ECOLI. The first record wins when a key is
+            found in more than one record.
+        """
+        #region ---------------------------------------------------> Keys
+        for k,(header,_,_) in enumerate(self.rRecord):
+            word = header[1:].split(' ', 1)[0]
+            keys = [header, header[1:], word]
+            if len(field := word.split('|')) > 2:
+                keys.append(field[1])
+            for key in keys:
+                self.rKey.setdefault(key, k)
+        #endregion ------------------------------------------------> Keys
+
+        return True
+    #---
+
+    def GetSeq(self, key:Union[str, int]) -> tuple[str, str]:
+        """Get the header and sequence of a record.
+
+            Parameters
+            ----------
+            key: str or int
+                Header, first word of the header, accession or position of the
+                record in the fasta file.
+
+            Returns
+            -------
+            tuple[str, str]
+                Header and sequence.
+
+            Raises
+            ------
+            KeyError:
+                - When key is not found in the fasta file.
+        """
+        #region --------------------------------------------------> Record
+        try:
+            k = key if isinstance(key, int) else self.rKey[key]
+            if k < 0:                                                           # Not counted from the end
+                raise IndexError(k)
+            header, offset, nByte = self.rRecord[k]
+        except (KeyError, IndexError) as e:
+            msg = f"'{key}' was not found in the fasta file.\n{self.rFileP}"
+            raise KeyError(msg) from e
+        #endregion -----------------------------------------------> Record
+
+        #region ----------------------------------------------------> Read
+        try:
+            with open(self.rFileP, 'rb') as file:
+                file.seek(offset)
+                seq = "".join(file.read(nByte).decode('utf-8').split())
+        except Exception as e:
+            raise RuntimeError(
+                mConfig.core.mFileRead.format(self.rFileP)) from e
+        #endregion -------------------------------------------------> Read
+
+        return (header, seq)
+    #---
+    #endregion ------------------------------------------------> Class methods
+#---
+
+
 class FastaFile():
     """Class to handle fasta files.
 
@@ -242,10 +1000,12 @@ class FastaFile():
 
         Attributes
         ----------
-        rAlignment: BioPython alignment
+        rAlignment: SeqAlign or None
             Last calculated alignment.
         rFileP: Path or str
             Path to the fasta file.
+        rIndex: FastaIndex
+            Offset index of the records in the fasta file.
         rHeaderNat: str
             Header for the Native sequence.
         rHeaderRec: str
@@ -261,9 +1021,10 @@ class FastaFile():
 
         Notes
         -----
-        It handle the first two sequences in the file. All other sequences
-        are discarded. It is assumed that the first sequence is the recombinant
-        sequence and the second sequence is the native sequence.
+        It handle the first two sequences in the file. It is assumed that the
+        first sequence is the recombinant sequence and the second sequence is
+        the native sequence. Other sequences in the file can be retrieved with
+        GetSeq.
     """
     # Test in test.unit.core.test_file.Test_FastaFile
     #region --------------------------------------------------> Instance setup
@@ -271,17 +1032,19 @@ class FastaFile():
         """ """
         #region -----------------------------------------------> Initial Setup
         self.rFileP = fileP
+        self.rIndex = FastaIndex(fileP)
         #------------------------------>
-        gen = cGenerator.FastaSequence(fileP)
-        #------------------------------>
-        self.rHeaderRec, self.rSeqRec = next(gen)
+        try:
+            self.rHeaderRec, self.rSeqRec = self.rIndex.GetSeq(0)
+        except KeyError:
+            self.rHeaderRec, self.rSeqRec = ('', '')
         self.rSeqLengthRec = len(self.rSeqRec)
-        self.rAlignment    = []
+        self.rAlignment:Optional[SeqAlign] = None
         #------------------------------>
         try:
-            self.rHeaderNat, self.rSeqNat = next(gen)
+            self.rHeaderNat, self.rSeqNat = self.rIndex.GetSeq(1)
             self.rSeqLengthNat = len(self.rSeqNat)
-        except StopIteration:
+        except KeyError:
             self.rHeaderNat, self.rSeqNat, self.rSeqLengthNat = ('', '', 0)
         except Exception as e:
             msg = (f'There was an unexpected error when parsing the fasta '
@@ -342,7 +1105,24 @@ class FastaFile():
         return (n, c)
     #---
 
-    def CalculateAlignment(self, seqA:str, seqB:str):
+    def GetSeq(self, key:Union[str, int]) -> tuple[str, str]:
+        """Get the header and sequence of any record in the fasta file.
+
+            Parameters
+            ----------
+            key: str or int
+                Header, first word of the header, accession or position of the
+                record in the fasta file.
+
+            Returns
+            -------
+            tuple[str, str]
+                Header and sequence.
+        """
+        return self.rIndex.GetSeq(key)
+    #---
+
+    def CalculateAlignment(self, seqA:str, seqB:str) -> SeqAlign:
         """Calculate the sequence alignment between both sequences.
 
             Parameters
@@ -354,15 +1134,9 @@ class FastaFile():
 
             Returns
             -------
-            BioPython Alignment
+            SeqAlign
         """
-        #region -----------------------------------------------> Blosum matrix
-        blosum62 = substitution_matrices.load("BLOSUM62")
-        #endregion --------------------------------------------> Blosum matrix
-
-        #region ---------------------------------------------------> Alignment
-        return pairwise2.align.globalds(seqA, seqB, blosum62, -10, -0.5)        # type: ignore
-        #endregion ------------------------------------------------> Alignment
+        return SeqAlignment(seqA, seqB)
     #---
 
     def SetSelfAlignment(self) -> bool:
@@ -385,22 +1159,22 @@ class FastaFile():
         #endregion ------------------------------------------------>
 
         #region ---------------------------------------------------> Alignment
-        if not getattr(self, 'rAlignment', []):
+        if self.rAlignment is None:
             self.rAlignment = self.CalculateAlignment(self.rSeqRec,self.rSeqNat)
         #endregion ------------------------------------------------> Alignment
 
         return True
     #---
 
-    def GetSelfAlignment(self):
+    def GetSelfAlignment(self) -> SeqAlign:
         """Get the alignment between the Recombinant and Native sequence.
 
             Returns
             -------
-            BioPython alignment.
+            SeqAlign
         """
         self.SetSelfAlignment()
-        return self.rAlignment
+        return self.rAlignment                                                  # type: ignore
     #---
 
     def GetSelfDelta(self) -> int:
@@ -418,7 +1192,7 @@ class FastaFile():
         """
         #region ---------------------------------------------------> Alignment
         self.SetSelfAlignment()
-        seqB = self.rAlignment[0].seqB
+        seqB = self.rAlignment.seqB                                             # type: ignore
         #endregion ------------------------------------------------> Alignment
 
         #region ---------------------------------------------------> Get delta
@@ -446,7 +1220,7 @@ class FastaFile():
         """
         #region ---------------------------------------------------> Alignment
         self.SetSelfAlignment()
-        seqB = self.rAlignment[0].seqB
+        seqB = self.rAlignment.seqB                                             # type: ignore
         #endregion ------------------------------------------------> Alignment
 
         #region -------------------------------------------> Get Left Position
@@ -496,6 +1270,8 @@ class CSVFile():
             Copy of the df in the file that can be modified.
         rFileP: str or Path
             Path to the CSV file.
+        rCat: dict[int, pd.Index]
+            Unique values in the columns already searched with StrInCol.
         rHeader: list
             List with the names of the columns in the CSV file. It is assumed
             the names are in the first row of the file.
@@ -520,6 +1296,7 @@ class CSVFile():
 
         #region ---------------------------------------------------> Variables
         self.rDf = self.rData.copy()
+        self.rCat = {}
         self.rHeader = list(self.rData.columns)
         self.rNRow, self.rNCol = self.rDf.shape
         #endregion ------------------------------------------------> Variables
@@ -541,8 +1318,12 @@ class CSVFile():
             -------
             bool
         """
-        df = cMethod.DFFilterByColS(self.rData, col, tStr, comp='e')
-        return not df.empty
+        #region ---------------------------------------------------> Category
+        if col not in self.rCat:
+            self.rCat[col] = pd.Index(self.rData.iloc[:,col].unique())
+        #endregion ------------------------------------------------> Category
+
+        return tStr in self.rCat[col]
     #---
     #endregion ------------------------------------------------> Class methods
 #---
@@ -569,6 +1350,10 @@ class PDBFile():
             of the PDB.
         rFileP: Path or str
             Path to the PDB file.
+        rModel: list[int]
+            Models in the PDB.
+        rModelAtom: np.ndarray
+            Model number of each row in rDFAtom.
     """
     # Test in test.unit.core.test_file.Test_PDBFile
     #region -----------------------------------------------------> Class setup
@@ -618,13 +1403,18 @@ class PDBFile():
             The created DataFrame contains only the ATOM section of the PDB.
         """
         #region --------------------------------------------------->
-        ldf = []
+        ldf    = []
+        lModel = []
+        model  = 1                                                              # Files with a single model may not have a MODEL record
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
         with open(self.rFileP, 'r', encoding="utf-8") as file:
             for l in file:
-                if l[0:4] == 'ATOM':
+                if l[0:5] == 'MODEL':
+                    model = int(l[10:14].strip())
+                elif l[0:4] == 'ATOM':
+                    lModel.append(model)
                     lo = []
                     lo.append(l[0:6].strip())
                     lo.append(int(l[6:11].strip()))
@@ -645,57 +1435,72 @@ class PDBFile():
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
-        self.rDFAtom = pd.DataFrame(ldf, columns=self.cDFAtomCol)
-        self.rChain = self.rDFAtom['Chain'].unique()
+        self.rDFAtom    = pd.DataFrame(ldf, columns=self.cDFAtomCol)
+        self.rChain     = self.rDFAtom['Chain'].unique()
+        self.rModelAtom = np.array(lModel, dtype=int)
+        self.rModel     = list(dict.fromkeys(lModel))
         #endregion ------------------------------------------------>
 
         return True
     #---
 
-    def WritePDB(self, fileP:Union[Path, str], chain:str) -> bool:
+    def WritePDB(
+        self,
+        fileP:Union[Path, str],
+        chain:Union[str, list[str]],
+        beta:Optional[np.ndarray] = None,
+        ) -> bool:
         """Write a PDB File.
 
             Parameters
             ----------
             fileP: Path or str
                 Path for the file to be written.
-            chain: str
-                Chain to write.
+            chain: str or list[str]
+                Chain or chains to write.
+            beta: np.ndarray or None
+                Beta values for each row in self.rDFAtom. If None, the values
+                in self.rDFAtom are used.
 
             Returns
             -------
             bool
-        """
-        #region -------------------------------------------------------->
-        def _line2PDBFormat(row:np.ndarray, buff):
-            """Apply the correct format to the row in the DataFrame and write
-                the line to the buffer.
-
-                Parameters
-                ----------
-                row: np.ndarray
-                    Row in the DataFrame as np.ndarray.
-                buff:
-                    Buffer to write to.
-
-                Returns
-                -------
-                bool
-            """
-            buff.write(f'{self.cPDBformat.format(*row)}\n')
-        #---
-        #endregion ----------------------------------------------------->
 
+            Notes
+            -----
+            MODEL/ENDMDL records are written only when the PDB contains more
+            than one model. Passing beta allows writing several files from
+            the same object at the same time, e.g. from a thread pool.
+        """
         #region --------------------------------------------------->
-        df = self.rDFAtom[self.rDFAtom['Chain'] == chain].copy()
-        df = df.replace(np.nan, '')
+        chainL = [chain] if isinstance(chain, str) else chain
+        df     = self.rDFAtom.copy()
+        #------------------------------>
+        if beta is not None:
+            df['Beta'] = beta
+        #------------------------------>
+        mask   = df['Chain'].isin(chainL).to_numpy()
+        df     = df[mask].replace(np.nan, '')
+        models = self.rModelAtom[mask]
+        multiM = len(self.rModel) > 1
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
-        buff = open(fileP, 'w', encoding="utf-8")
-        df.apply(_line2PDBFormat, raw=True, axis=1, args=[buff])                # type: ignore
-        buff.write('END')
-        buff.close()
+        with open(fileP, 'w', encoding="utf-8") as buff:
+            modelC = None
+            for m, row in zip(models, df.itertuples(index=False, name=None)):
+                #------------------------------>
+                if multiM and m != modelC:
+                    if modelC is not None:
+                        buff.write('ENDMDL\n')
+                    buff.write(f'MODEL     {m:>4d}\n')
+                    modelC = m
+                #------------------------------>
+                buff.write(f'{self.cPDBformat.format(*row)}\n')
+            #------------------------------>
+            if multiM and modelC is not None:
+                buff.write('ENDMDL\n')
+            buff.write('END')
         #endregion ------------------------------------------------>
 
         return True
@@ -715,16 +1520,37 @@ class PDBFile():
                 One letter AA sequence in the selected Chain.
         """
         #region --------------------------------------------------->
+        seq = self.GetResidue(chain)['ResName'].tolist()
+        #endregion ------------------------------------------------>
+
+        return "".join([mConfig.core.oAA3toAA[x] for x in seq])
+    #---
+
+    def GetResidue(self, chain:str) -> pd.DataFrame:
+        """Get the standard residues of a chain in the PDB.
+
+            Parameters
+            ----------
+            chain: str
+                Selected chain.
+
+            Returns
+            -------
+            pd.DataFrame
+                One row per residue. Residues with a name not in
+                mConfig.core.oAA3toAA are discarded so the rows match the
+                sequence returned by self.GetSequence.
+        """
+        #region --------------------------------------------------->
         dfd = self.rDFAtom[self.rDFAtom['Chain']==chain]
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
         dfd = dfd.drop_duplicates(subset='ResNum', keep='first', inplace=False)
         dfd = dfd.loc[dfd.loc[:,'ResName'].isin(mConfig.core.oAA3toAA)]
-        seq = dfd['ResName'].tolist()
         #endregion ------------------------------------------------>
 
-        return "".join([mConfig.core.oAA3toAA[x] for x in seq])
+        return dfd
     #---
 
     def GetResNum(self, chain:str) -> list:
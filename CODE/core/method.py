@@ -15,7 +15,21 @@
 
 
 #region -------------------------------------------------------------> Imports
+import bisect
+import cProfile
+import functools
+import hashlib
+import io
 import itertools
+import json
+import os
+import pstats
+import re
+import shutil
+import sys
+import threading
+import time
+import tracemalloc
 import traceback
 from dataclasses import dataclass, field
 from datetime    import datetime
@@ -23,18 +37,19 @@ from operator    import itemgetter
 from pathlib     import Path
 from typing      import Callable, Literal, Union, Optional, Any, TYPE_CHECKING
 
-import matplotlib as mpl
-import numpy      as np
-import pandas     as pd
+import matplotlib             as mpl
+import matplotlib.collections as mcollections
+import numpy                  as np
+import pandas                 as pd
 
 from pubsub import pub
 
-import wx
-
 from config.config import config as mConfig
-from core import file as cFile
+from core import exception as cException
+from core import file      as cFile
 
 if TYPE_CHECKING:
+    import wx
     from core import window as cWindow
 #endregion ----------------------------------------------------------> Imports
 
@@ -44,6 +59,7 @@ LIT_CompEq     = Literal['e', 'ne']
 LIT_NumType    = Literal['int', 'float']
 LIT_IndSample  = Literal['i', 'p']
 LIT_Region     = Literal['start', 'end']
+LIT_Search     = Literal['substring', 'prefix', 'regex']
 LIT_Tran       = Literal['', 'None', 'Log2']
 LIT_Norm       = Literal['', 'None', 'Median']
 LIT_Imp        = Literal['', 'None', 'Normal Distribution']
@@ -78,6 +94,7 @@ class BaseUserData():
     width:float    = float(mConfig.data.width)                                  # Stdev value
     targetProt:str = ''                                                         # Target Protein
     scoreVal:float = 0                                                          # Minimum Score value
+    float32:bool   = field(default_factory=lambda: mConfig.core.float32)        # Intensities as float32 instead of float64
     #------------------------------> Statistic options
     rawInt:bool               = False                                           # Raw intensity or ration of intensity
     indSample:LIT_IndSample   = 'i'                                             # Samples are independent or not
@@ -315,10 +332,687 @@ class Fragment():
     #---
     #endregion ------------------------------------------------> Class Methods
 #---
+
+
+class CancelToken():
+    """Cooperative cancellation of a running analysis.
+
+        Parameters
+        ----------
+        event: threading.Event-like or None
+            Object with set and is_set methods. None creates a threading.Event.
+            Use a multiprocessing.Manager().Event() to cancel analyses running
+            in other processes.
+
+        Notes
+        -----
+        The analysis checks the token between steps and inside long loops.
+        Check raises cException.Cancelled when the token was cancelled.
+    """
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, event:Optional[Any]=None) -> None:
+        """ """
+        self.rEvent = event if event is not None else threading.Event()
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Cancel(self) -> bool:
+        """Request the cancellation of the analysis.
+
+            Returns
+            -------
+            bool
+        """
+        self.rEvent.set()
+        return True
+    #---
+
+    def IsCancelled(self) -> bool:
+        """Check if the cancellation was requested.
+
+            Returns
+            -------
+            bool
+        """
+        return self.rEvent.is_set()
+    #---
+
+    def Check(self) -> bool:
+        """Stop the analysis if the cancellation was requested.
+
+            Returns
+            -------
+            bool
+
+            Raise
+            -----
+            cException.Cancelled:
+                - When the cancellation was requested.
+        """
+        if self.rEvent.is_set():
+            raise cException.Cancelled()
+        return True
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class StepTimer():
+    """Record the wall time, CPU time and peak memory of the analysis steps.
+
+        Parameters
+        ----------
+        memory: bool
+            Trace the memory allocations with tracemalloc. Default is True.
+
+        Attributes
+        ----------
+        rStep: dict
+            Resources used by each finished step. Keys are the names of the
+            step and its parents joined by '/'. Values are
+            {'Wall': seconds, 'CPU': seconds, 'Memory': MB}.
+        rStack: list
+            Running steps as [name, wall, cpu, memory at start, peak].
+
+        Notes
+        -----
+        Steps are started with Begin and finished with End and can be nested.
+        Memory is the peak of the memory traced by tracemalloc during the step
+        minus the traced memory when the step started. CPU time is the time
+        of the whole process. Memory is only traced between Start and Stop.
+    """
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, memory:bool=True) -> None:
+        """ """
+        self.rMemory = memory
+        self.rTrace  = False
+        self.rStep:dict[str, dict[str, float]] = {}
+        self.rStack:list[list] = []
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Start(self) -> bool:
+        """Remove previous records and start tracing memory allocations.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        self.rStep  = {}
+        self.rStack = []
+        #------------------------------>
+        if self.rMemory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.rTrace = True
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def Stop(self) -> bool:
+        """Finish all running steps and stop tracing memory allocations.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        while self.rStack:
+            self.End()
+        #------------------------------>
+        if self.rTrace:
+            tracemalloc.stop()
+            self.rTrace = False
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def Begin(self, name:str) -> bool:
+        """Start a step nested in the running step.
+
+            Parameters
+            ----------
+            name: str
+                Name of the step.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        memory = 0
+        if tracemalloc.is_tracing():
+            memory, peak = tracemalloc.get_traced_memory()
+            if self.rStack:
+                self.rStack[-1][4] = max(self.rStack[-1][4], peak)
+            tracemalloc.reset_peak()
+        #------------------------------>
+        self.rStack.append(
+            [name, time.perf_counter(), time.process_time(), memory, memory])
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def End(self, name:str='') -> bool:
+        """Finish the running step.
+
+            Parameters
+            ----------
+            name: str
+                Name of the step. Steps started after it that were not
+                finished, e.g. because of an error, are finished too. Empty
+                string finishes only the last started step.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        if name and name not in [x[0] for x in self.rStack]:
+            return False
+        #------------------------------>
+        while self.rStack:
+            tName, wall, cpu, memory, peak = self.rStack[-1]
+            #------------------------------>
+            if tracemalloc.is_tracing():
+                peak = max(peak, tracemalloc.get_traced_memory()[1])
+                tracemalloc.reset_peak()
+            key = '/'.join([x[0] for x in self.rStack])
+            self.rStack.pop()
+            if self.rStack:
+                self.rStack[-1][4] = max(self.rStack[-1][4], peak)
+            #------------------------------>
+            step = self.rStep.setdefault(key, {'Wall': 0, 'CPU': 0, 'Memory': 0})
+            step['Wall']  += time.perf_counter() - wall
+            step['CPU']   += time.process_time() - cpu
+            step['Memory'] = max(step['Memory'], (peak - memory)/1048576)
+            #------------------------------>
+            if not name or tName == name:
+                break
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def Dict(self) -> dict[str, dict[str, float]]:
+        """Get the resources used by the finished steps.
+
+            Returns
+            -------
+            dict
+                Rounded values of rStep.
+        """
+        return {
+            k: {x: round(y, 3) for x,y in v.items()}
+            for k,v in self.rStep.items()
+        }
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class Profiler():
+    """Profile the code running in the current thread with cProfile.
+
+        Parameters
+        ----------
+        enable: bool or None
+            Profile the code. None means the value of ProfileOn().
+
+        Attributes
+        ----------
+        rProfile: cProfile.Profile or None
+            Profiler. None if profiling is disabled or another profiler is
+            already running in the thread.
+
+        Notes
+        -----
+        Start and Stop must be called from the same thread.
+    """
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, enable:Optional[bool]=None) -> None:
+        """ """
+        enable = ProfileOn() if enable is None else enable
+        self.rProfile = cProfile.Profile() if enable else None
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Start(self) -> bool:
+        """Start profiling.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------->
+        if self.rProfile is None:
+            return False
+        #------------------------------> Nested profiles are not supported
+        if sys.getprofile() is not None:
+            self.rProfile = None
+            return False
+        #------------------------------>
+        self.rProfile.enable()
+        #endregion ------------------------------------------------>
+
+        return True
+    #---
+
+    def Stop(self, fileP:Path, nFunc:int=mConfig.core.profileTop) -> str:
+        """Stop profiling and save the profile.
+
+            Parameters
+            ----------
+            fileP: Path
+                File for the profile in the pstats format.
+            nFunc: int
+                Number of functions in the returned text.
+
+            Returns
+            -------
+            str
+                Path to the file and the functions with the longest internal
+                time. Empty string if profiling is disabled or the profile
+                could not be saved.
+        """
+        #region --------------------------------------------------->
+        if self.rProfile is None:
+            return ''
+        #------------------------------>
+        self.rProfile.disable()
+        #------------------------------>
+        try:
+            fileP.parent.mkdir(parents=True, exist_ok=True)
+            self.rProfile.dump_stats(fileP)
+        except Exception:
+            return ''
+        #------------------------------>
+        stream = io.StringIO()
+        stats  = pstats.Stats(self.rProfile, stream=stream)
+        stats.strip_dirs().sort_stats('tottime').print_stats(nFunc)
+        #endregion ------------------------------------------------>
+
+        return f'Profile saved to: {fileP}\n{stream.getvalue().strip()}'
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class ListData():
+    """Content of a virtual wx.ListCtrl formatted as str on demand.
+
+        Parameters
+        ----------
+        col: list
+            Columns as pd.Series, pd.Index or np.ndarray with the same length.
+        idx: np.ndarray or None
+            Position of the visible rows in col. None means all rows.
+
+        Attributes
+        ----------
+        rCol: list[np.ndarray]
+            Values of each column. Codes for categorical columns.
+        rCat: list[np.ndarray or None]
+            Categories as str of categorical columns. The last element is 'nan'
+            for missing values.
+        rIdx: np.ndarray
+            Position of the visible rows.
+        rN: int
+            Number of rows in col.
+
+        Notes
+        -----
+        Cells are converted to str as in DFStrList. Rows in the wx.ListCtrl
+        are the positions in rIdx, so filtering only needs SetIdx.
+    """
+    # Test in test.unit.core.test_method.Test_ListData
+    #region --------------------------------------------------> Instance setup
+    def __init__(
+        self,
+        col:list[Union[pd.Series, pd.Index, np.ndarray]],
+        idx:Optional[np.ndarray] = None,
+        ) -> None:
+        """ """
+        #region -----------------------------------------------------> Columns
+        self.rCol = []
+        self.rCat = []
+        for c in col:
+            if isinstance(c.dtype, pd.CategoricalDtype):
+                c = pd.Categorical(c)
+                self.rCat.append(
+                    np.append(c.categories.astype(str).to_numpy(), 'nan'))
+                self.rCol.append(np.asarray(c.codes))
+            else:
+                self.rCat.append(None)
+                self.rCol.append(np.asarray(c))
+        #------------------------------>
+        self.rN = len(self.rCol[0]) if self.rCol else 0
+        self.SetIdx(idx)
+        #endregion --------------------------------------------------> Columns
+    #---
+
+    def __len__(self) -> int:
+        """Number of visible rows."""
+        return len(self.rIdx)
+    #---
+
+    def __getitem__(self, row:int) -> list[str]:
+        """Visible row as a list of str."""
+        if not -len(self.rIdx) <= row < len(self.rIdx):
+            raise IndexError(row)
+        return [self.Cell(row, c) for c in range(len(self.rCol))]
+    #---
+
+    def __iter__(self):
+        """Iterate over the visible rows."""
+        return (list(x) for x in zip(*[
+            self.Column(c) for c in range(len(self.rCol))]))
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def SetIdx(self, idx:Optional[np.ndarray]=None) -> bool:
+        """Set the visible rows.
+
+            Parameters
+            ----------
+            idx: np.ndarray or None
+                Position of the visible rows. None means all rows.
+
+            Returns
+            -------
+            bool
+        """
+        self.rIdx = (
+            np.arange(self.rN) if idx is None else np.asarray(idx, dtype=int))
+        return True
+    #---
+
+    def Cell(self, row:int, col:int) -> str:
+        """Content of a cell.
+
+            Parameters
+            ----------
+            row: int
+                Visible row.
+            col: int
+                Column.
+
+            Returns
+            -------
+            str
+        """
+        #region --------------------------------------------------------> Cell
+        val = self.rCol[col][self.rIdx[row]]
+        if (cat := self.rCat[col]) is not None:
+            return str(cat[val])
+        #endregion -----------------------------------------------------> Cell
+
+        return str(val)
+    #---
+
+    def Column(self, col:int) -> list[str]:
+        """Content of a column for the visible rows.
+
+            Parameters
+            ----------
+            col: int
+                Column.
+
+            Returns
+            -------
+            list[str]
+        """
+        #region ------------------------------------------------------> Column
+        val = self.rCol[col][self.rIdx]
+        if (cat := self.rCat[col]) is not None:
+            return cat[val].tolist()
+        #endregion ---------------------------------------------------> Column
+
+        return val.astype(str).tolist()
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+class SearchIndex():
+    """Index of the content of a wx.ListCtrl for fast searches.
+
+        Parameters
+        ----------
+        data: list of list of str or ListData
+            Content of the wx.ListCtrl. One str for each column.
+
+        Attributes
+        ----------
+        rN: int
+            Number of rows.
+        rCol: list[list[str]]
+            Content of each column.
+        rSep: str
+            Separator of the cells in rText. Cells with rSep are not found by
+            substring searches.
+        rText: list[str]
+            Content of each column joined with rSep. There is a leading and a
+            trailing rSep.
+        rStart: list[np.ndarray]
+            Position of the leading rSep of each cell in rText.
+        rSorted: list[list[str]]
+            Content of each column sorted.
+        rOrder: list[np.ndarray]
+            Row index of the cells in rSorted.
+
+        Notes
+        -----
+        Substring searches run over rText and prefix searches use a binary
+        search over rSorted. Regular expressions are matched against each
+        cell.
+    """
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, data:Union[list[list[str]], ListData]) -> None:
+        """ """
+        #region ---------------------------------------------------> Variables
+        self.rSep    = '\n'
+        self.rN      = len(data)
+        self.rCol    = []
+        self.rText   = []
+        self.rStart  = []
+        self.rSorted = []
+        self.rOrder  = []
+        #------------------------------>
+        if isinstance(data, ListData):
+            colL = [data.Column(c) for c in range(len(data.rCol))]
+        else:
+            colL = [
+                [str(x[c]) for x in data]
+                for c in range(len(data[0]) if data else 0)
+            ]
+        #endregion ------------------------------------------------> Variables
+
+        #region -------------------------------------------------------> Index
+        for col in colL:
+            order = sorted(range(len(col)), key=col.__getitem__)
+            #------------------------------>
+            self.rCol.append(col)
+            self.rText.append(self.rSep + self.rSep.join(col) + self.rSep)
+            self.rStart.append(np.concatenate(
+                ([0], np.cumsum([len(x) + 1 for x in col])))[:-1])
+            self.rSorted.append([col[x] for x in order])
+            self.rOrder.append(np.array(order, dtype=np.int64))
+        #endregion ----------------------------------------------------> Index
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class Methods
+    def Search(
+        self,
+        tStr:str,
+        mode:LIT_Search = 'substring',
+        ) -> list[list[int]]:
+        """Search tStr in the content of the wx.ListCtrl.
+
+            Parameters
+            ----------
+            tStr: str
+                String to search for.
+            mode: str
+                One of substring, prefix or regex.
+
+            Returns
+            -------
+            list of list of int
+                List with index of the rows in which the tStr was exactly found
+                and list with index of the rows in which tStr was found
+                according to mode. Both lists are sorted.
+
+            Raise
+            -----
+            re.error:
+                - When tStr is not a valid regular expression.
+        """
+        # Test in test.unit.core.test_method.Test_SearchIndex
+        #region ---------------------------------------------------> Variables
+        if not tStr:
+            return [[], []]
+        #------------------------------>
+        iEqual   = np.zeros(self.rN, dtype=bool)
+        iSimilar = np.zeros(self.rN, dtype=bool)
+        pattern  = re.compile(tStr if mode == 'regex' else re.escape(tStr))
+        #endregion ------------------------------------------------> Variables
+
+        #region ------------------------------------------------------> Search
+        for c,tSorted in enumerate(self.rSorted):
+            #------------------------------> Exact match
+            a = bisect.bisect_left(tSorted, tStr)
+            b = bisect.bisect_right(tSorted, tStr)
+            iEqual[self.rOrder[c][a:b]] = True
+            #------------------------------> Mode
+            if mode == 'prefix':
+                a,b = self.Prefix(c, tStr)
+                iSimilar[self.rOrder[c][a:b]] = True
+            elif mode == 'regex':
+                iSimilar[[
+                    k for k,x in enumerate(self.rCol[c]) if pattern.search(x)
+                ]] = True
+            elif self.rSep not in tStr:
+                pos = [x.start() for x in pattern.finditer(self.rText[c])]
+                iSimilar[
+                    np.searchsorted(self.rStart[c], pos, side='right') - 1
+                ] = True
+        #endregion ---------------------------------------------------> Search
+
+        return [
+            np.flatnonzero(iEqual).tolist(),
+            np.flatnonzero(iSimilar | iEqual).tolist(),
+        ]
+    #---
+
+    def Prefix(self, col:int, tStr:str) -> tuple[int, int]:
+        """Range of the cells in rSorted[col] starting with tStr.
+
+            Parameters
+            ----------
+            col: int
+                Column index.
+            tStr: str
+                Prefix.
+
+            Returns
+            -------
+            tuple[int, int]
+                Start and end index in rSorted[col].
+        """
+        # No test
+        #region --------------------------------------------------->
+        tSorted = self.rSorted[col]
+        a       = bisect.bisect_left(tSorted, tStr)
+        #------------------------------> First str after all with the prefix
+        if (last := ord(tStr[-1])) < sys.maxunicode:
+            b = bisect.bisect_left(tSorted, tStr[:-1] + chr(last + 1), lo=a)
+        else:
+            b = a
+            while b < len(tSorted) and tSorted[b].startswith(tStr):
+                b += 1
+        #endregion ------------------------------------------------>
+
+        return (a, b)
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
 #endregion ----------------------------------------------------------> Classes
 
 
 #region ------------------------------------------------------> String Methods
+def StrCheckpointKey(cSection:str, rDO:BaseUserData) -> str:
+    """Get the key identifying the checkpoints of an analysis.
+
+        Parameters
+        ----------
+        cSection: str
+            Section of the analysis in the UMSAP file.
+        rDO: BaseUserData
+            User input.
+
+        Returns
+        -------
+        str
+            Hash of the section, the user input and the size and modification
+            time of the input files.
+
+        Notes
+        -----
+        uFile, iFileN and seqFileN are not included because they may change
+        when the same analysis is started again.
+    """
+    # Test in test.unit.core.test_method.Test_StrCheckpointKey
+    #region ---------------------------------------------------> Key
+    data = {
+        k:v for k,v in rDO.PrintDO().items()
+        if k not in ['uFile', 'iFileN', 'seqFileN']
+    }
+    #------------------------------>
+    fileD = {}
+    for k in rDO.copyFile:
+        fileP = Path(getattr(rDO, k))
+        if fileP.is_file():
+            stat = fileP.stat()
+            fileD[k] = [str(fileP.resolve()), stat.st_size, stat.st_mtime_ns]
+    #------------------------------>
+    key = json.dumps(
+        {'section': cSection, 'rDO': data, 'file': fileD},
+        sort_keys = True,
+        default   = str,
+    )
+    #endregion ------------------------------------------------> Key
+
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+#---
+
+
+def StrCancel() -> str:
+    """Get the message shown when an analysis is cancelled.
+
+        Returns
+        -------
+        str
+            mConfig.core.mCancel, plus mConfig.core.mCancelCheckpoint when
+            checkpoints are enabled.
+    """
+    # Test in test.unit.core.test_method.Test_StrCancel
+    #region ---------------------------------------------------> Message
+    if mConfig.core.checkpoint:
+        return f'{mConfig.core.mCancel} {mConfig.core.mCancelCheckpoint}'
+    #endregion ------------------------------------------------> Message
+
+    return mConfig.core.mCancel
+#---
+
+
 def StrNow(dtFormat:str=mConfig.core.dtFormat) -> str:
     """Get a formatted datetime.now() string.
 
@@ -718,6 +1412,51 @@ def ExpandRange(
 
 
 #region --------------------------------------------------------> pd.DataFrame
+def DFMaskByColS(
+    df:pd.DataFrame,
+    col:int,
+    refStr:str,
+    comp:LIT_CompEq,
+    ) -> np.ndarray:
+    """Get the rows in the pd.DataFrame to keep based on the string values
+        present in col.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+        col: int
+            The column index used to filter rows.
+        refStr: string
+            Reference string.
+        comp: str
+            Comparison to use in the filter. One of: 'e', 'ne.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask with one element per row in df.
+
+        Notes
+        -----
+        - Only col is read. df is not copied.
+        - If comp has an invalid value then non equal values are kept.
+        - For categorical columns the comparison is done with the integer
+          codes of the categories.
+    """
+    # Test in test.unit.core.test_method.Test_DFFilterByColS
+    #region ------------------------------------------------------------> Mask
+    s = df.iloc[:,col]
+    if isinstance(s.dtype, pd.CategoricalDtype):
+        code = s.cat.categories.get_indexer([refStr])[0]
+        m = (s.cat.codes.to_numpy() == code) & (code > -1)
+    else:
+        m = (s == refStr).to_numpy()
+    #endregion ---------------------------------------------------------> Mask
+
+    return m if comp == 'e' else ~m
+#---
+
+
 def DFFilterByColS(
     df:pd.DataFrame,
     col:int,
@@ -747,19 +1486,108 @@ def DFFilterByColS(
         discarded, e.g. c[x] == 'refString'
         - Assumes all values in col are strings.
         - If comp has an invalid value then non equal values are returned.
+        - See DFMaskByColS.
     """
     # Test in test.unit.core.test_method.Test_DFFilterByColS
-    #region ----------------------------------------------------------> Filter
-    #------------------------------>  Copy
-    dfo = df.copy()
-    #------------------------------> Filter
-    if comp == 'e':
-        dfo = dfo.loc[dfo.iloc[:,col] == refStr]
-    else:
-        dfo = dfo.loc[dfo.iloc[:,col] != refStr]
-    #endregion -------------------------------------------------------> Filter
+    return df.loc[DFMaskByColS(df, col, refStr, comp)]
+#---
+
+
+def DFCategory(df:pd.DataFrame, col:list[int]) -> pd.DataFrame:
+    """Encode the given columns in the pd.DataFrame as categorical columns.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            DataFrame with the data.
+        col: list[int]
+            Column numbers of the identifier columns, e.g. Sequence, Gene or
+            Protein. Negative values are ignored.
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Notes
+        -----
+        Only object columns are encoded. Categorical columns keep only the
+        categories still present in the column. Other columns are left
+        untouched and share memory with df.
+    """
+    # Test in test.unit.core.test_method.Test_DFCategory
+    #region ----------------------------------------------------------> Encode
+    dfo = df.copy(deep=False)
+    #------------------------------>
+    for x in dict.fromkeys(col):
+        if x < 0:
+            continue
+        #------------------------------>
+        s = dfo.iloc[:,x]
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            dfo.isetitem(x, s.cat.remove_unused_categories())
+        elif s.dtype == object:
+            dfo.isetitem(x, s.astype('category'))
+    #endregion -------------------------------------------------------> Encode
+
+    return dfo
+#---
+
+
+def DFStrList(df:pd.DataFrame) -> list[list[str]]:
+    """Get the values in the pd.DataFrame as a list of rows of strings.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            DataFrame with the data.
+
+        Returns
+        -------
+        list[list[str]]
+
+        Notes
+        -----
+        Categorical columns are converted to string once per category and not
+        once per row.
+    """
+    # Test in test.unit.core.test_method.Test_DFStrList
+    #region ---------------------------------------------------------> Convert
+    colL = []
+    for _,s in df.items():
+        if isinstance(s.dtype, pd.CategoricalDtype):
+            cat = np.append(s.cat.categories.astype(str).to_numpy(), 'nan')
+            colL.append(cat[s.cat.codes.to_numpy()])
+        else:
+            colL.append(s.astype(str).to_numpy())
+    #endregion ------------------------------------------------------> Convert
+
+    return [list(x) for x in zip(*colL)]
+#---
+
+
+def DFMaskExclude(df:pd.DataFrame, col:list[int]) -> np.ndarray:
+    """Get the rows in the pd.DataFrame to keep based on the values present
+        in col.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            DataFrame with the data.
+        col: list[int]
+            Column numbers to look for rows to exclude.
 
-    return dfo
+        Returns
+        -------
+        np.ndarray
+            Boolean mask with one element per row in df.
+
+        Notes
+        -----
+        Rows with at least one value other than NA in the given columns are
+        not kept. Only the given columns are read.
+    """
+    # Test in test.unit.core.test_method.Test_DFExclude
+    return ~df.iloc[:,col].notna().to_numpy().any(axis=1)
 #---
 
 
@@ -780,31 +1608,21 @@ def DFExclude(df:pd.DataFrame, col:list[int]) -> 'pd.DataFrame':
         Notes
         -----
         Rows with at least one value other than NA in the given columns are
-        discarded.
+        discarded. See DFMaskExclude.
     """
     # Test in test.unit.core.test_method.Test_DFExclude
-    #region ----------------------------------------------------------> Exclude
-    #------------------------------>  Copy
-    dfo = df.copy()
-    #------------------------------> Exclude
-    a = dfo.iloc[:,col].notna()
-    a = a.loc[(a==True).any(axis=1)]                                            # pylint: disable=singleton-comparison
-    idx = a.index
-    dfo = dfo.drop(index=idx)                                                   # type: ignore
-    #endregion -------------------------------------------------------> Exclude
-
-    return dfo
+    return df.loc[DFMaskExclude(df, col)]
 #---
 
 
-def DFFilterByColN(
+def DFMaskByColN(
     df:pd.DataFrame,
     col:list[int],
     refVal:float,
     comp:LIT_Comp,
-    ) -> pd.DataFrame:
-    """Filter rows in the pd.DataFrame based on the numeric values present in
-        col.
+    ) -> np.ndarray:
+    """Get the rows in the pd.DataFrame to keep based on the numeric values
+        present in col.
 
         Parameters
         ----------
@@ -820,36 +1638,76 @@ def DFFilterByColN(
 
         Returns
         -------
-        pd.DataFrame
+        np.ndarray
+            Boolean mask with one element per row in df.
 
-        Notes
+        Raise
         -----
-        Rows with values in col that do not comply with c[x] comp refVal are
-        discarded, e.g. c[x] > 3,45
+        ValueError:
+            - When comp is not one of the valid comparisons.
 
-        Assumes all values in col are numbers.
+        Notes
+        -----
+        Rows with at least one value in col that comply with c[x] comp refVal
+        are kept. Only the given columns are read.
     """
     # Test in test.unit.core.test_method.Test_DFFilterByColN
-    #region ----------------------------------------------------------> Filter
-    #------------------------------>  Copy
-    dfo = df.copy()
-    #------------------------------> Filter
+    #region ------------------------------------------------------------> Mask
+    val = df.iloc[:,col]
+    #------------------------------>
     if comp == 'lt':
-        dfo = dfo.loc[(dfo.iloc[:,col] < refVal).any(axis=1)]                     # type: ignore
+        m = val < refVal
     elif comp == 'le':
-        dfo = dfo.loc[(dfo.iloc[:,col] <= refVal).any(axis=1)]                    # type: ignore
+        m = val <= refVal
     elif comp == 'e':
-        dfo = dfo.loc[(dfo.iloc[:,col] == refVal).any(axis=1)]                    # type: ignore
+        m = val == refVal
     elif comp == 'ge':
-        dfo = dfo.loc[(dfo.iloc[:,col] >= refVal).any(axis=1)]                    # type: ignore
+        m = val >= refVal
     elif comp == 'gt':
-        dfo = dfo.loc[(dfo.iloc[:,col] > refVal).any(axis=1)]                     # type: ignore
+        m = val > refVal
     else:
         msg = mConfig.core.mNotImplementedFull.format(comp, 'comp', LIT_Comp)
         raise ValueError(msg)
-    #endregion -------------------------------------------------------> Filter
+    #endregion ---------------------------------------------------------> Mask
 
-    return dfo
+    return m.to_numpy().any(axis=1)
+#---
+
+
+def DFFilterByColN(
+    df:pd.DataFrame,
+    col:list[int],
+    refVal:float,
+    comp:LIT_Comp,
+    ) -> pd.DataFrame:
+    """Filter rows in the pd.DataFrame based on the numeric values present in
+        col.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            DataFrame with the data.
+        col: list of int
+            The column indexes used to filter rows.
+        refVal: float
+            Reference value.
+        comp: str
+            Numeric comparison to use in the filter. One of:
+            'lt', 'le', 'e', 'ge', 'gt'
+
+        Returns
+        -------
+        pd.DataFrame
+
+        Notes
+        -----
+        Rows with values in col that do not comply with c[x] comp refVal are
+        discarded, e.g. c[x] > 3,45
+
+        Assumes all values in col are numbers. See DFMaskByColN.
+    """
+    # Test in test.unit.core.test_method.Test_DFFilterByColN
+    return df.loc[DFMaskByColN(df, col, refVal, comp)]
 #---
 
 
@@ -888,17 +1746,20 @@ def DFReplace(
 
         Notes
         -----
-        Column selection in the df is done by column number.
+        Column selection in the df is done by column number. When sel is
+        given, the other columns in the returned pd.DataFrame share memory
+        with df.
     """
     # Test in test.unit.core.test_method.Test_DFReplace
     #region ---------------------------------------------------------> Replace
-    #------------------------------> Copy
-    dfo = df.copy()
-    #------------------------------> Replace
     if sel:
-        dfo.iloc[:,sel] = dfo.iloc[:,sel].replace(oriVal, repVal)               # type: ignore
+        #------------------------------> Only the selected columns are copied
+        dfo = df.copy(deep=False)
+        rep = df.iloc[:,sel].replace(oriVal, repVal)                            # type: ignore
+        for k,x in enumerate(sel):
+            dfo.isetitem(x, rep.iloc[:,k])                                      # type: ignore
     else:
-        dfo = dfo.replace(oriVal, repVal)                                       # type: ignore
+        dfo = df.replace(oriVal, repVal)                                        # type: ignore
     #endregion ------------------------------------------------------> Replace
 
     return dfo
@@ -926,6 +1787,7 @@ def GetDisplayInfo(win:'cWindow.BaseWindow') -> dict[str, dict[str, int]]:
             }
     """
     # No test
+    import wx                                                                   # pylint: disable=import-outside-toplevel
     #region ----------------------------------------------------> Display info
     xd, yd, wd, hd =  wx.Display(win).GetClientArea()
     #endregion -------------------------------------------------> Display info
@@ -955,7 +1817,7 @@ def GetDisplayInfo(win:'cWindow.BaseWindow') -> dict[str, dict[str, int]]:
 #---
 
 
-def LCtrlFillColNames(lc:wx.ListCtrl, fileP:Union[Path, str]) -> bool:
+def LCtrlFillColNames(lc:'wx.ListCtrl', fileP:Union[Path, str]) -> bool:
     """Fill the wx.ListCtrl with the name of the columns in fileP.
 
         Parameters
@@ -991,7 +1853,7 @@ def OnGUIMethod(
     tFunc: Callable,
     *args,
     errorMsg:str                    = '',
-    errorParent:Optional[wx.Window] = None,
+    errorParent:Optional['wx.Window'] = None,
     **kwargs
     ) -> bool:
     """Execute a method called from the GUI.
@@ -1022,6 +1884,96 @@ def OnGUIMethod(
 
 
 #region --------------------------------------------------------------> Others
+def ProfileOn() -> bool:
+    """Check if profiling is enabled.
+
+        Returns
+        -------
+        bool
+
+        Notes
+        -----
+        Profiling is enabled with the profile option in the user configuration
+        file or by setting the environment variable mConfig.core.envProfile to
+        a value other than 0.
+    """
+    # No test
+    env = os.environ.get(mConfig.core.envProfile, '').strip()
+    return mConfig.core.profile or env not in ['', '0']
+#---
+
+
+def ProfileFile(uFile:Optional[Path], name:str) -> Path:
+    """Get the file for a profile.
+
+        Parameters
+        ----------
+        uFile: Path or None
+            UMSAP file. The profile is saved in the same folder. If None or the
+            folder does not exist the profile is saved in mConfig.core.pCache.
+        name: str
+            Name of the profiled code.
+
+        Returns
+        -------
+        Path
+    """
+    # Test in test.unit.core.test_method.Test_ProfileFile
+    #region --------------------------------------------------->
+    if uFile is not None and uFile.name and uFile.parent.is_dir():
+        folder = uFile.parent
+    else:
+        folder = mConfig.core.pCache / 'profile'
+    #------------------------------>
+    name = name.replace(' ', '-')
+    #endregion ------------------------------------------------>
+
+    return folder / f'{StrNow("%Y%m%d-%H%M%S-%f")}_{name}.pstats'
+#---
+
+
+def ProfileMethod(name:str) -> Callable:
+    """Decorator to profile a method of a window showing an UMSAP file.
+
+        Parameters
+        ----------
+        name: str
+            Name of the profiled code.
+
+        Returns
+        -------
+        Callable
+
+        Notes
+        -----
+        The profile is saved next to the file in self.rObj.rFileP, when the
+        window has one. It does nothing if profiling is disabled.
+    """
+    # No test
+    def Decorator(func:Callable) -> Callable:
+        """Create the wrapper."""
+        @functools.wraps(func)
+        def Wrapper(self, *args, **kwargs):
+            """Run the method."""
+            #region --------------------------------------------------->
+            if not ProfileOn():
+                return func(self, *args, **kwargs)
+            #------------------------------>
+            profiler = Profiler(enable=True)
+            profiler.Start()
+            try:
+                return func(self, *args, **kwargs)
+            finally:
+                uFile = getattr(getattr(self, 'rObj', None), 'rFileP', None)
+                profiler.Stop(ProfileFile(uFile, name))
+            #endregion ------------------------------------------------>
+        #---
+        return Wrapper
+    #---
+    return Decorator
+#---
+
+
 def PrintIndSample(val:LIT_IndSample) -> str:
     """Pretty Print Independent Sample choice to UMSAP File.
 
@@ -1240,6 +2192,51 @@ def MatplotLibCmap(
 #---
 
 
+def RectCollection(
+    x:Union[float, list[float], np.ndarray],
+    y:Union[float, list[float], np.ndarray],
+    w:Union[float, list[float], np.ndarray],
+    h:Union[float, list[float], np.ndarray],
+    **kwargs,
+    ) -> mcollections.PolyCollection:
+    """Create a single matplotlib collection with many rectangles.
+
+        Parameters
+        ----------
+        x, y: float, list[float] or np.ndarray
+            Lower left corner of the rectangles.
+        w, h: float, list[float] or np.ndarray
+            Width and height of the rectangles.
+        **kwargs:
+            Passed to PolyCollection, e.g. facecolors, linewidths or picker.
+
+        Returns
+        -------
+        mcollections.PolyCollection
+
+        Notes
+        -----
+        The colors or line widths of all rectangles are changed with a single
+        call, e.g. set_facecolors. In a pick event, event.ind holds the index
+        of the picked rectangles.
+    """
+    # Test in test.unit.core.test_method.Test_RectCollection
+    #region ---------------------------------------------------------> Verts
+    x, y, w, h = np.broadcast_arrays(
+        *[np.atleast_1d(np.asarray(a, dtype='float')) for a in (x, y, w, h)])
+    #------------------------------>
+    verts = np.stack([
+        np.column_stack((x,   y)),
+        np.column_stack((x+w, y)),
+        np.column_stack((x+w, y+h)),
+        np.column_stack((x,   y+h)),
+    ], axis=1)
+    #endregion ------------------------------------------------------> Verts
+
+    return mcollections.PolyCollection(verts, closed=True, **kwargs)
+#---
+
+
 def Fragments(
     df:'pd.DataFrame',
     val:float,
@@ -1520,3 +2517,347 @@ def MergeOverlappingFragments(
     return coordO
 #---
 #endregion -----------------------------------------------------------> Others
+
+
+#region ------------------------------------------------------> Analysis Steps
+def DataStepsFolder(oFolder:Path, tDate:str, cSection:str) -> Path:
+    """Get the Data-Steps folder of an analysis.
+
+        Parameters
+        ----------
+        oFolder: Path
+            Output folder.
+        tDate: str
+            Date of the analysis.
+        cSection: str
+            Section of the analysis in the UMSAP file.
+
+        Returns
+        -------
+        Path
+    """
+    # No test
+    folder = f"{tDate}_{cSection.replace(' ', '-')}"
+    return oFolder / mConfig.core.fnDataSteps / folder
+#---
+
+
+def SetOutputFile(uFile:Path, tDate:str) -> Path:
+    """Get the UMSAP file for a new analysis.
+
+        Parameters
+        ----------
+        uFile: Path
+            UMSAP file selected by the user.
+        tDate: str
+            Date of the analysis.
+
+        Returns
+        -------
+        Path
+            uFile or the file with the same name in a new folder named tDate
+            when uFile does not exist but its folder already contains output
+            from other analyses.
+    """
+    # No test
+    #region ---------------------------------------------------> Output file
+    if uFile.exists():
+        return uFile
+    #------------------------------>
+    folder = uFile.parent
+    step   = folder/mConfig.core.fnDataSteps
+    init   = folder/mConfig.core.fnDataInit
+    #------------------------------>
+    if step.exists() or init.exists():
+        return folder/tDate/uFile.name
+    #endregion ------------------------------------------------> Output file
+
+    return uFile
+#---
+
+
+def ReserveDataFolder(oFolder:Path, cSection:str) -> str:
+    """Create the Data-Steps folder for a new analysis.
+
+        Parameters
+        ----------
+        oFolder: Path
+            Output folder.
+        cSection: str
+            Section of the analysis in the UMSAP file.
+
+        Returns
+        -------
+        str
+            Date of the analysis.
+
+        Notes
+        -----
+        Analyses may start in the same second. The folder is created only if
+        it does not exist, so the date is unique for each analysis in the
+        section.
+    """
+    # Test in test.unit.core.test_method.Test_ReserveDataFolder
+    #region ---------------------------------------------------> Reserve
+    while True:
+        tDate = StrNow()
+        try:
+            DataStepsFolder(oFolder, tDate, cSection).mkdir(parents=True)
+        except FileExistsError:
+            time.sleep(1)
+        else:
+            return tDate
+    #endregion ------------------------------------------------> Reserve
+#---
+
+
+def ReserveOutput(rDO:BaseUserData, cSection:str) -> str:
+    """Set the UMSAP file and reserve the Data-Steps folder of a new
+        analysis.
+
+        Parameters
+        ----------
+        rDO: BaseUserData
+            User input. rDO.uFile is updated, see SetOutputFile.
+        cSection: str
+            Section of the analysis in the UMSAP file.
+
+        Returns
+        -------
+        str
+            Date of the analysis.
+    """
+    # No test
+    rDO.uFile = SetOutputFile(Path(rDO.uFile), StrNow())
+    return ReserveDataFolder(rDO.uFile.parent, cSection)
+#---
+
+
+def ReadInputFiles(
+    rDO:BaseUserData,
+    msgFunc:Callable[[str], object] = print,
+    lProt:str                       = '',
+    ) -> tuple[Optional['cFile.CSVFile'], Optional['cFile.FastaFile'], str,
+               Optional[Exception]]:
+    """Read the data and sequence files of an analysis.
+
+        Parameters
+        ----------
+        rDO: BaseUserData
+            User input. The information about the protein in the sequence
+            file is added to rDO.
+        msgFunc: Callable
+            Called with the name of the file being read.
+        lProt: str
+            Label of the column with the target protein in error messages.
+
+        Returns
+        -------
+        tuple
+            - (CSVFile, FastaFile or None, '', None) when everything went fine.
+            - (None, None, 'Error message', Exception or None) otherwise.
+    """
+    # No test
+    #region ---------------------------------------------------> Data file
+    msgFunc('Data File')
+    #------------------------------>
+    try:
+        iFileObj = cFile.CSVFile(rDO.iFile)
+    except Exception as e:
+        return (None, None, mConfig.core.mFileRead.format(rDO.iFile), e)
+    #------------------------------> Target Protein. Needs the file content
+    if rDO.targetProt and not iFileObj.StrInCol(
+        rDO.targetProt, rDO.ocTargetProt):
+        lProt = f'{lProt} column' if lProt else 'column'
+        msg = (f'The Target Protein ({rDO.targetProt}) was not found in the '
+            f'{lProt} ({rDO.ocTargetProt}).')
+        return (None, None, msg, None)
+    #endregion ------------------------------------------------> Data file
+
+    #region ------------------------------------------------> Seq Rec File
+    if not rDO.seqFile.is_file():
+        return (iFileObj, None, '', None)
+    #------------------------------>
+    msgFunc('Sequences File')
+    #------------------------------>
+    try:
+        seqFileObj = cFile.FastaFile(rDO.seqFile)
+    except Exception as e:
+        return (None, None, mConfig.core.mFileRead.format(rDO.seqFile), e)
+    #------------------------------>
+    try:
+        rDO.protLoc = seqFileObj.GetNatProtLoc()
+    except Exception:
+        rDO.protLoc = (-1, -1)
+    #------------------------------>
+    rDO.protLength = (seqFileObj.rSeqLengthRec, seqFileObj.rSeqLengthNat)
+    #------------------------------>
+    try:
+        rDO.protDelta = seqFileObj.GetSelfDelta()
+    except Exception:
+        rDO.protDelta = None
+    #------------------------------>
+    rDO.seqFileObj = seqFileObj
+    #endregion ---------------------------------------------> Seq Rec File
+
+    return (iFileObj, seqFileObj, '', None)
+#---
+
+
+def RunAnalysisMethod(
+    method:Callable,
+    df:pd.DataFrame,
+    rDO:BaseUserData,
+    cancel:Optional[CancelToken]          = None,
+    checkpoint:Optional['cFile.Checkpoint'] = None,
+    timer:Optional[StepTimer]             = None,
+    spill:Optional[Callable[..., dict]]   = None,
+    ) -> tuple[dict, str, Optional[Exception]]:
+    """Run the main method of an analysis or load its output from the
+        checkpoint.
+
+        Parameters
+        ----------
+        method: Callable
+            Analysis method, e.g. corrMethod.CorrA.
+        df: pd.DataFrame
+            Content of the data file.
+        rDO: BaseUserData
+            User input.
+        cancel: CancelToken or None
+            Cancel the analysis.
+        checkpoint: cFile.Checkpoint or None
+            Output of the finished steps.
+        timer: StepTimer or None
+            Record the resources used by the steps of the method.
+        spill: Callable or None
+            Write pd.DataFrames to disk, e.g. BaseConfPanel.SpillData. It is
+            called by method after each data preparation step and with the
+            output of method before it is stored in the checkpoint.
+
+        Returns
+        -------
+        tuple
+            Output of method.
+    """
+    # No test
+    #region ---------------------------------------------------> Checkpoint
+    spill = spill if spill is not None else lambda x, keep=(): x
+    #------------------------------>
+    if checkpoint is not None and (dfDict := checkpoint.Load('R')) is not None:
+        return (spill(dfDict), '', None)
+    #endregion ------------------------------------------------> Checkpoint
+
+    #region ---------------------------------------------------> Run
+    try:
+        dfDict, msgError, tException = method(
+            df         = df,
+            rDO        = rDO,
+            cancel     = cancel,
+            checkpoint = checkpoint,
+            timer      = timer,
+            spill      = spill,
+        )
+    except Exception as e:
+        return ({}, 'Main Analysis failed.', e)
+    #------------------------------>
+    if dfDict:
+        dfDict = spill(dfDict)
+        if checkpoint is not None:
+            checkpoint.Save('R', dfDict)
+    #endregion ------------------------------------------------> Run
+
+    return (dfDict, msgError, tException)
+#---
+
+
+def CopyInputFiles(rDO:BaseUserData, tDate:str) -> list[Union[Path, str]]:
+    """Copy the input files to the Data-Initial folder of the UMSAP file.
+
+        Parameters
+        ----------
+        rDO: BaseUserData
+            User input. The names of the files in the Data-Initial folder are
+            set in rDO, see rDO.copyFile.
+        tDate: str
+            Date of the analysis.
+
+        Returns
+        -------
+        list
+            Files in the Data-Initial folder. '' for files not used in the
+            analysis.
+
+        Notes
+        -----
+        Files already in the Data-Initial folder are not copied again.
+    """
+    # No test
+    #region ---------------------------------------------------> Copy
+    puFolder = rDO.uFile.parent / mConfig.core.fnDataInit
+    puFolder.mkdir(parents=True, exist_ok=True)
+    #------------------------------>
+    fileL:list[Union[Path, str]] = []
+    for k,v in rDO.copyFile.items():
+        tPath = getattr(rDO, k)
+        if not tPath.is_file():
+            fileL.append('')
+            continue
+        #------------------------------>
+        if tPath.parent != puFolder:                                            # Copy new file
+            tStem = tPath.stem.replace(' ', '-').replace('_', '-')
+            file  = puFolder/f"{tDate}_{tStem}{tPath.suffix}"
+            shutil.copy(tPath, file)
+        else:                                                                   # Reference to old file
+            file = tPath
+        #------------------------------>
+        setattr(rDO, v, str(file.name))
+        fileL.append(file)
+    #endregion ------------------------------------------------> Copy
+
+    return fileL
+#---
+
+
+def DateDict(
+    rDO:BaseUserData,
+    stepDict:dict,
+    tDict:dict,
+    repVal:list[int],
+    ) -> dict:
+    """Data of an analysis for the UMSAP file.
+
+        Parameters
+        ----------
+        rDO: BaseUserData
+            User input.
+        stepDict: dict
+            Output of the StepDict method of the section.
+        tDict: dict
+            Resources used by the steps, see StepTimer.Dict.
+        repVal: list[int]
+            Number of values replaced with NA in each column of dfF.
+
+        Returns
+        -------
+        dict
+    """
+    # No test
+    #region ---------------------------------------------------> Dict
+    dateDict = {
+        'V' : mConfig.core.dictVersion,
+        'I' : rDO.PrintDI(),
+        'CI': rDO.PrintDO(),
+        'DP': stepDict['DP'],
+        'T' : tDict,
+        'RV': repVal,
+    }
+    #------------------------------>
+    for k in ['R', 'F', 'CpR', 'CEvol', 'AA', 'Hist', 'S']:
+        if k in stepDict:
+            dateDict[k] = stepDict[k]
+    #endregion ------------------------------------------------> Dict
+
+    return dateDict
+#---
+#endregion ---------------------------------------------------> Analysis Steps
@@ -16,7 +16,6 @@
 
 #region -------------------------------------------------------------> Imports
 import _thread
-import shutil
 from math    import ceil
 from pathlib import Path
 from typing  import Optional, Union, Callable
@@ -27,8 +26,10 @@ from pubsub import pub
 import wx
 import wx.lib.scrolledpanel as scrolled
 
+from batch         import method as batchMethod
 from config.config import config as mConfig
 from core import check     as cCheck
+from core import exception as cException
 from core import file      as cFile
 from core import method    as cMethod
 from core import validator as cValidator
@@ -79,6 +80,9 @@ class BaseConfPanel(
             DataFrame with the results values.
         rCheckUnique: list of wx.TextCtrl
             These fields must contain unique column numbers.
+        rCheckpoint: cFile.Checkpoint or None
+            Output of the finished steps. Set in PrepareRun. None if
+            mConfig.core.checkpoint is False.
         rCheckUserInput: dict
             To check user input in the correct order.
             Keys are widget labels and values a list with [widget,
@@ -104,8 +108,8 @@ class BaseConfPanel(
             Input Data File Object.
         rLCtrlL: list of wx.ListCtrl
             To clear all wx.ListCtrl in the Tab.
-        rMainData: str
-            Name of the file containing the main output data.
+        rRepVal: list[int]
+            Number of values replaced with np.nan in each column of dfF.
         rMsgError: Str
             Error message to show when analysis fails.
         rNCol: int
@@ -115,6 +119,8 @@ class BaseConfPanel(
             Folder to contain the output. Set based on the umsap file path.
         rSeqFileObj: dtsFF.FastaFile
             Object to work with the sequences of the proteins.
+        rStepDictMethod: Callable
+            Files and keys written in the output, e.g. corrMethod.StepDict.
     """
     #region --------------------------------------------------> Instance setup
     def __init__(
@@ -177,6 +183,9 @@ class BaseConfPanel(
         self.cHId    = getattr(self, 'cHId', 'e.g. HIV inhibitor')
         #------------------------------> Tooltips
         self.cTTRun  = getattr(self, 'cTTRun', 'Start the analysis.')
+        self.cTTQueue = getattr(
+            self, 'cTTQueue', ('Run the analysis in the background. Other '
+            'analyses can be configured and queued while this one runs.'))
         self.cTTHelp = getattr(
             self, 'cTTHelp', f'Read online tutorial at {mConfig.core.urlHome}.')
         self.cTTClearAll = getattr(
@@ -226,7 +235,8 @@ class BaseConfPanel(
         #------------------------------> Needed to Run the Analysis
         self.rCheckUnique = []
         self.rAnalysisMethod:Callable
-        self.rMainData = getattr(self, 'rMainData', '')
+        self.rStepDictMethod:Callable
+        self.rInQueue = False                                                   # The JobQueue sets the output
         #--------------> DataClass with the processed user input
         self.rDO:cMethod.BaseUserData = cMethod.BaseUserData()
         #--------------> Error message and exception to show in self.RunEnd
@@ -247,11 +257,14 @@ class BaseConfPanel(
         self.dfHist  = pd.DataFrame()                                           # Histogram
         self.dfCpR   = pd.DataFrame()                                           # Cleavage per Residue
         self.dfCEvol = pd.DataFrame()                                           # Cleavage Evolution
+        self.rRepVal:list[int] = []                                             # Values replaced with NA in each column of dfF
         #--------------> Date for umsap file
         self.rDate   = ''
         self.rDateID = ''
         #--------------> Folder for output
         self.rOFolder:Optional[Path] = None
+        #--------------> Resume cancelled or failed analysis
+        self.rCheckpoint:Optional[cFile.Checkpoint] = None
         #--------------> input file for directing repeating analysis from
         # file copied to oFolder
         self.rDFile = []
@@ -308,6 +321,8 @@ class BaseConfPanel(
             validator  = self.cViFile,
             ownCopyCut = True,
         )
+        self.wBtnQueue = wx.Button(self, label='Queue Analysis')
+        self.wBtnQueue.SetToolTip(self.cTTQueue)
         self.wId = cWidget.StaticTextCtrl(
             self.wSbFile,
             stLabel   = self.cLId,
@@ -478,6 +493,9 @@ class BaseConfPanel(
         )
         self.sSbDataWid.AddGrowableCol(0,1)
         self.sSbDataWid.AddGrowableCol(7,1)
+        #------------------------------> Buttons
+        self.sBtnSizer.SetCols(4)
+        self.sBtnSizer.Add(self.wBtnQueue, border=10, flag=wx.EXPAND|wx.ALL)
         #------------------------------>
         self.sSizer = wx.BoxSizer(wx.VERTICAL)
         self.sSizer.Add(self.sSbFile,   0, wx.EXPAND|wx.ALL,       5)
@@ -491,6 +509,7 @@ class BaseConfPanel(
 
         #region --------------------------------------------------------> Bind
         self.wIFile.wTc.Bind(wx.EVT_TEXT, self.OnIFileLoad)
+        self.wBtnQueue.Bind(wx.EVT_BUTTON, self.OnQueue)
         self.wImputationMethod.wCb.Bind(wx.EVT_COMBOBOX, self.OnImpMethod)
         #endregion -----------------------------------------------------> Bind
 
@@ -690,274 +709,176 @@ class BaseConfPanel(
         return True
     #---
 
-    def SetStepDictDP(self) -> dict:
-        """Set the Data Processing part of the stepDict to write in the output.
+    def DFDict(self) -> dict:
+        """Output of the steps of the analysis.
 
             Returns
             -------
             dict
+                {'dfI': pd.DataFrame, ...}, see mConfig.core.ltDFKeys.
         """
-        #region --------------------------------------------------->
-        stepDict = {
-            'DP': {
-                mConfig.core.ltDPKeys[0] : mConfig.core.fnFloat.format(self.rDate, '02'),
-                mConfig.core.ltDPKeys[1] : mConfig.core.fnMinRep.format(self.rDate,'03'),
-                mConfig.core.ltDPKeys[2] : mConfig.core.fnTrans.format(self.rDate, '04'),
-                mConfig.core.ltDPKeys[3] : mConfig.core.fnNorm.format(self.rDate,  '05'),
-                mConfig.core.ltDPKeys[4] : mConfig.core.fnImp.format(self.rDate,   '06'),
-            },
-        }
-        #endregion ------------------------------------------------>
-
-        return stepDict
+        return {k: getattr(self, k) for k in mConfig.core.ltDFKeys}
     #---
+    #endregion ------------------------------------------------> Class Methods
 
-    def SetStepDictDPFileR(self) -> dict:
-        """Set the Data Processing, Files & Results parts of the stepDict to
-            write in the output.
+    #region ----------------------------------------------------> Run Analysis
+    def OnRun(self, event:wx.CommandEvent) -> bool:
+        """Start analysis of the module/utility.
+
+            Parameter
+            ---------
+            event : wx.Event
+                Event information.
 
             Returns
             -------
-            dict
+            bool
         """
-        #region --------------------------------------------------->
-        dpDict = self.SetStepDictDP()
-        #endregion ------------------------------------------------>
+        #region --------------------------------------------------> Dlg window
+        self.rCancel = cMethod.CancelToken()
+        self.rDlg = cWindow.Progress(                                           # pylint: disable=attribute-defined-outside-init
+            mConfig.main.mainWin, self.cTitlePD, self.cGaugePD,
+            cancel=self.rCancel)
+        #endregion -----------------------------------------------> Dlg window
 
-        #region --------------------------------------------------->
-        resDict = {
-            'Files' : {
-                mConfig.core.fnInitial.format(self.rDate,    '01') : self.dfI,
-                mConfig.core.fnFloat.format(self.rDate,      '02') : self.dfF,
-                mConfig.core.fnMinRep.format(self.rDate,     '03') : self.dfMR,
-                mConfig.core.fnTrans.format(self.rDate,      '04') : self.dfT,
-                mConfig.core.fnNorm.format(self.rDate,       '05') : self.dfN,
-                mConfig.core.fnImp.format(self.rDate,        '06') : self.dfIm,
-                mConfig.core.fnTargetProt.format(self.rDate, '07') : self.dfTP,
-                mConfig.core.fnExclude.format(self.rDate,    '08') : self.dfE,
-                mConfig.core.fnScore.format(self.rDate,      '09') : self.dfS,
-                self.rMainData.format(self.rDate,            '10') : self.dfR,
-            },
-            'R' : self.rMainData.format(self.rDate, '10'),
-        }
-        #endregion ------------------------------------------------>
+        #region ------------------------------------------------------> Thread
+        _thread.start_new_thread(self.Run, ('test',))
+        #endregion ---------------------------------------------------> Thread
 
-        return dpDict | resDict
+        #region ----------------------------------------> Show progress dialog
+        self.rDlg.ShowModal()
+        self.rDlg.Destroy()
+        #endregion -------------------------------------> Show progress dialog
+
+        return True
     #---
 
-    def SetOutputDict(self, dateDict:dict) -> dict:
-        """Creates the output dictionary to be written to the output file.
+    def OnQueue(self, event:wx.CommandEvent) -> bool:                           # pylint: disable=unused-argument
+        """Check the user input and run the analysis in the job queue.
 
-            Parameters
-            ----------
-            dateDict: dict
-                {
-                    date : {
-                        'V' : config.dictVersion,
-                        'I' : User Input for UMSAPCtrl,
-                        'CI': User Input with correct python type,
-                        'R' : Results,
-                    }
-                }
+            Parameter
+            ---------
+            event : wx.Event
+                Event information.
 
-            Return
-            ------
-            dict
-                Output data as a dict
+            Returns
+            -------
+            bool
 
             Notes
             -----
-            If the output file already exists the new data is added to the
-            existing data in the corresponding section.
-            It assumes child class defines a self.cSection attributes with the
-            section name of the analysis.
+            The Progress dialog is not modal, so more analyses can be queued
+            while the analysis runs in a worker process. The UMSAP file is
+            written by mConfig.main.jobQueue one analysis at a time.
         """
-        #region ---------------------------------------------------> Read File
-        if self.rDO.uFile.exists():
-            try:
-                outData = cFile.ReadJSON(self.rDO.uFile)
-            except Exception as e:
-                msg = mConfig.core.mFileRead.format(self.rDO.uFile)
-                raise RuntimeError(msg) from e
-        else:
-            outData = {}
-        #endregion ------------------------------------------------> Read File
+        #region --------------------------------------------------> Dlg window
+        if mConfig.main.jobQueue is None:
+            mConfig.main.jobQueue = batchMethod.JobQueue()
+        cancel = mConfig.main.jobQueue.CancelToken()
+        #------------------------------>
+        self.rDlg = cWindow.Progress(                                           # pylint: disable=attribute-defined-outside-init
+            mConfig.main.mainWin, f'{self.cTitlePD} - {self.wId.wTc.GetValue()}',
+            self.cGaugePD, cancel=cancel)
+        self.rDlg.Show()
+        #endregion -----------------------------------------------> Dlg window
 
-        #region ------------------------------------------------> Add new data
-        if outData.get(self.cSection, False):
-            outData[self.cSection][self.rDateID] = dateDict[self.rDateID]
-        else:
-            outData[self.cSection] = dateDict
-        #endregion ---------------------------------------------> Add new data
+        #region ---------------------------------------------------> Check
+        self.rInQueue = True
+        tCheck = self.CheckInput() and self.PrepareRun()
+        self.rInQueue = False
+        #------------------------------>
+        if not tCheck:
+            wx.CallAfter(
+                self.rDlg.ErrorMessage,
+                self.cLPdError,
+                error      = self.rMsgError,
+                tException = self.rException,
+            )
+            self.rMsgError  = ''
+            self.rException = None
+            return False
+        #endregion ------------------------------------------------> Check
+
+        #region ---------------------------------------------------> Queue
+        dlg = self.rDlg
+        mConfig.main.jobQueue.Submit(
+            self.cSection,
+            self.rDO,
+            msgFunc = lambda jobID, msg: wx.CallAfter(self.QueueMsg, dlg, msg),
+            endFunc = lambda result: wx.CallAfter(self.QueueEnd, dlg, result),
+            cancel  = cancel,
+        )
+        #endregion ------------------------------------------------> Queue
 
-        return outData
+        #region ---------------------------------------------------> Reset
+        self.rDO      = cMethod.BaseUserData()
+        self.rDate    = ''
+        self.rDateID  = ''
+        self.rOFolder = None
+        #endregion ------------------------------------------------> Reset
+
+        return True
     #---
 
-    def WriteOutputData(self, stepDict:dict) -> bool:
-        """Write output.
+    def QueueMsg(self, dlg:cWindow.Progress, msg:str) -> bool:
+        """Show a progress message of an analysis run in the job queue.
 
             Parameters
             ----------
-            stepDict: dict
-                Dict with the data to write the step by step data files
-                Keys are file names and values pd.DataFrame with the values
+            dlg: cWindow.Progress
+                Progress dialog of the analysis.
+            msg: str
+                Message.
 
-            Return
-            ------
+            Returns
+            -------
             bool
         """
-        #region -----------------------------------------------> Create folder
-        msgStep = self.cLPdWrite + 'Creating needed folders, Data-Steps folder'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        dataFolder = f"{self.rDate}_{self.cSection.replace(' ', '-')}"
-        dataFolder = self.rOFolder / mConfig.core.fnDataSteps / dataFolder      # type: ignore
-        dataFolder.mkdir(parents=True, exist_ok=True)
-        #------------------------------>
-        msgStep = self.cLPdWrite + 'Creating needed folders, Data-Initial folder'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        dataInit = self.rOFolder / mConfig.core.fnDataInit                      # type: ignore
-        dataInit.mkdir(parents=True, exist_ok=True)
-        #endregion --------------------------------------------> Create folder
-
-        #region ------------------------------------------------> Data Initial
-        msgStep = self.cLPdWrite + 'Data files, Input Data'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        #------------------------------>
-        puFolder = self.rDO.uFile.parent / mConfig.core.fnDataInit
-        #------------------------------>
-        for k,v in self.rDO.copyFile.items():
-            tPath = getattr(self.rDO, k)
-            if tPath.is_file():
-                #------------------------------>
-                piFolder = tPath.parent
-                #------------------------------>
-                if piFolder != puFolder:                                        # Copy new file
-                    #------------------------------>
-                    tStem = tPath.stem.replace(' ', '-')
-                    tStem = tStem.replace('_', '-')
-                    name = f"{self.rDate}_{tStem}{tPath.suffix}"
-                    file = puFolder/name
-                    #------------------------------>
-                    shutil.copy(tPath, file)
-                    #------------------------------>
-                    setattr(self.rDO, v, str(file.name))
-                    #------------------------------>
-                    self.rDFile.append(file)
-                else:                                                           # Reference to old file
-                    #------------------------------>
-                    setattr(self.rDO, v, str(tPath.name))
-                    #------------------------------>
-                    self.rDFile.append(tPath)
-            else:
-                self.rDFile.append('')
-        #endregion ---------------------------------------------> Data Initial
-
-        #region --------------------------------------------------> Data Steps
-        msgStep = self.cLPdWrite + 'Data files, Output Data'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        try:
-            cFile.WriteDFs2CSV(dataFolder, stepDict['Files'])
-        except Exception as e:
-            self.rMsgError = ('It was not possible to create the files with '
-                'the data for the intermediate steps of the analysis.')
-            self.rException = e
-            return False
-        #endregion -----------------------------------------------> Data Steps
-
-        #region --------------------------------------------> Further Analysis
-        if (aaDict := stepDict.get('AA', {})):
-            fileP = dataFolder/list(aaDict.values())[0]
-            cFile.WriteDF2CSV(fileP, self.dfAA)
-
-        if (histDict := stepDict.get('Hist', {})):
-            fileP = dataFolder/list(histDict.values())[0]
-            cFile.WriteDF2CSV(fileP, self.dfHist)
-
-        if (cpr := stepDict.get('CpR', False)):
-            fileP = dataFolder/cpr
-            cFile.WriteDF2CSV(fileP, self.dfCpR)
-
-        if (cEvol := stepDict.get('CEvol', False)):
-            fileP = dataFolder/cEvol
-            cFile.WriteDF2CSV(fileP, self.dfCEvol)
-        #endregion -----------------------------------------> Further Analysis
-
-        #region --------------------------------------------------> UMSAP File
-        msgStep = self.cLPdWrite + 'Main file'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        #------------------------------> Create output dict
-        dateDict = {
-            self.rDateID : {
-                'V' : mConfig.core.dictVersion,
-                'I' : self.rDO.PrintDI(),
-                'CI': self.rDO.PrintDO(),
-                'DP': stepDict['DP'],
-            }
-        }
-        #--------------> DataPrep Util does not have dfR
-        if not self.dfR.empty:
-            dateDict[self.rDateID]['R'] = stepDict['R']
-        #-------------->
-        if self.cName == mConfig.prot.nPane:
-            #--------------> Filters in ProtProf
-            dateDict[self.rDateID]['F'] = {}
-        elif self.cName == mConfig.tarp.nPane:
-            #--------------> TarProt
-            dateDict[self.rDateID]['CpR']   = stepDict['CpR']
-            dateDict[self.rDateID]['CEvol'] = stepDict['CEvol']
-        #--------------> Further Analysis
-        if stepDict.get('AA', None) is not None:
-            dateDict[self.rDateID]['AA'] = stepDict['AA']
-        if stepDict.get('Hist', None) is not None:
-            dateDict[self.rDateID]['Hist'] = stepDict['Hist']
-        #------------------------------> Append or not
-        try:
-            outData = self.SetOutputDict(dateDict)
-        except Exception as e:
-            self.rMsgError = ('It was not possible to create the dictionary '
-                'with the UMSAP data.')
-            self.rException = e
-            return False
-        #------------------------------> Write
-        try:
-            cFile.WriteJSON(self.rDO.uFile, outData)
-        except Exception as e:
-            self.rMsgError = ('It was not possible to create the dictionary '
-                'with the UMSAP data.')
-            self.rException = e
+        #region ---------------------------------------> Dlg progress dialogue
+        if not dlg:                                                             # Destroyed, e.g. app closing
             return False
-        #endregion -----------------------------------------------> UMSAP File
+        #------------------------------>
+        dlg.UpdateStG(msg)
+        #endregion ------------------------------------> Dlg progress dialogue
 
         return True
     #---
-    #endregion ------------------------------------------------> Class Methods
 
-    #region ----------------------------------------------------> Run Analysis
-    def OnRun(self, event:wx.CommandEvent) -> bool:
-        """Start analysis of the module/utility.
+    def QueueEnd(
+        self,
+        dlg:cWindow.Progress,
+        result:batchMethod.JobResult,
+        ) -> bool:
+        """Load the results of an analysis run in the job queue.
 
-            Parameter
-            ---------
-            event : wx.Event
-                Event information.
+            Parameters
+            ----------
+            dlg: cWindow.Progress
+                Progress dialog of the analysis.
+            result: batchMethod.JobResult
+                Result of the analysis.
 
             Returns
             -------
             bool
         """
-        #region --------------------------------------------------> Dlg window
-        self.rDlg = cWindow.Progress(                                           # pylint: disable=attribute-defined-outside-init
-            mConfig.main.mainWin, self.cTitlePD, self.cGaugePD)
-        #endregion -----------------------------------------------> Dlg window
-
-        #region ------------------------------------------------------> Thread
-        _thread.start_new_thread(self.Run, ('test',))
-        #endregion ---------------------------------------------------> Thread
-
-        #region ----------------------------------------> Show progress dialog
-        self.rDlg.ShowModal()
-        self.rDlg.Destroy()
-        #endregion -------------------------------------> Show progress dialog
+        #region ---------------------------------------> Dlg progress dialogue
+        if not dlg:                                                             # Destroyed, e.g. app closing
+            return False
+        #------------------------------>
+        if result.cancelled:
+            dlg.ErrorMessage(mConfig.core.lPdCancel, error=cMethod.StrCancel())
+        elif not result.msgError:
+            pub.sendMessage(mConfig.core.kwPubLoadUmsap, fileP=result.uFile)
+            #------------------------------>
+            dlg.SuccessMessage(
+                self.cLPdDone, eTime=f"{self.cLPdElapsed} {result.deltaT}")
+        else:
+            msg = result.msgError
+            if result.exception:
+                msg = f'{msg}\n\nFurther details:\n{result.exception}'
+            dlg.ErrorMessage(self.cLPdError, error=msg)
+        #endregion ------------------------------------> Dlg progress dialogue
 
         return True
     #---
@@ -1024,23 +945,23 @@ class BaseConfPanel(
             bool
         """
         #region --------------------------------------------------->
-        #------------------------------> Date
-        self.rDate = cMethod.StrNow()
-        #------------------------------> Output folder
-        if self.rDO.uFile.exists():
-            self.rOFolder = self.rDO.uFile.parent
-        else:
-            folder = self.rDO.uFile.parent
-            step = folder/mConfig.core.fnDataSteps
-            init = folder/mConfig.core.fnDataInit
-            #------------------------------>
-            if step.exists() or init.exists():
-                self.rOFolder = folder/f'{self.rDate}'
-                self.rDO.uFile = self.rOFolder/self.rDO.uFile.name
-            else:
-                self.rOFolder = self.rDO.uFile.parent
+        #------------------------------> The JobQueue sets the output
+        if self.rInQueue:
+            return True
+        #------------------------------> Date & Output folder
+        try:
+            self.rDate = cMethod.ReserveOutput(self.rDO, self.cSection)
+        except Exception as e:
+            self.rMsgError  = mConfig.core.mFileBad.format(
+                self.rDO.uFile, self.cLuFile)
+            self.rException = e
+            return False
+        self.rOFolder = self.rDO.uFile.parent
         #------------------------------> DateID
         self.rDateID = f'{self.rDate} - {self.rDO.ID}'
+        #------------------------------> Checkpoint
+        self.rCheckpoint = cFile.NewCheckpoint(
+            cMethod.StrCheckpointKey(self.cSection, self.rDO))
         #endregion ------------------------------------------------>
 
         return True
@@ -1062,57 +983,17 @@ class BaseConfPanel(
                     'seqFile' : Path to the sequence file or no key - value,
                 }
         """
-        #region ---------------------------------------------------> Data file
-        msgStep = self.cLPdReadFile + f"{self.cLiFile}, reading"
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        #------------------------------>
-        try:
-            self.rIFileObj = cFile.CSVFile(self.rDO.iFile)
-        except Exception as e:
-            self.rMsgError = mConfig.core.mFileRead.format(self.rDO.iFile)
-            self.rException = e
-            return False
-        #------------------------------> Check Target Protein. It cannot be done
-        # before this step
-        if self.rDO.targetProt:
-            a = self.rIFileObj.StrInCol(
-                self.rDO.targetProt, self.rDO.ocTargetProt)
-            if not a:
-                self.rMsgError = (f'The Target Protein '
-                    f'({self.rDO.targetProt}) was not found in the '
-                    f'{self.cLDetectedProt} column '
-                    f'({self.rDO.ocTargetProt}).')
-                return False
-        #endregion ------------------------------------------------> Data file
-
-        #region ------------------------------------------------> Seq Rec File
-        if self.rDO.seqFile.is_file():
-            #------------------------------>
-            msgStep = self.cLPdReadFile + f"{self.cLSeqFile}, reading"
-            wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-            #------------------------------>
-            try:
-                self.rSeqFileObj = cFile.FastaFile(self.rDO.seqFile)
-            except Exception as e:
-                self.rMsgError = mConfig.core.mFileRead.format(self.rDO.seqFile)
-                self.rException = e
-                return False
-            #------------------------------>
-            try:
-                self.rDO.protLoc = self.rSeqFileObj.GetNatProtLoc()
-            except Exception:
-                self.rDO.protLoc = (-1, -1)
-            #------------------------------>
-            self.rDO.protLength = (
-                self.rSeqFileObj.rSeqLengthRec, self.rSeqFileObj.rSeqLengthNat)
-            #------------------------------>
-            try:
-                self.rDO.protDelta = self.rSeqFileObj.GetSelfDelta()
-            except Exception:
-                self.rDO.protDelta = None
-        #endregion ---------------------------------------------> Seq Rec File
+        #region ---------------------------------------------------> Read
+        self.rIFileObj, self.rSeqFileObj, self.rMsgError, self.rException = (
+            cMethod.ReadInputFiles(
+                self.rDO,
+                msgFunc = lambda x: wx.CallAfter(
+                    self.rDlg.UpdateStG, f'{self.cLPdReadFile}{x}, reading'),
+                lProt   = self.cLDetectedProt,
+            ))
+        #endregion ------------------------------------------------> Read
 
-        return True
+        return not self.rMsgError
     #---
 
     def RunAnalysis(self) -> bool:
@@ -1126,13 +1007,15 @@ class BaseConfPanel(
         msgStep = self.cLPdRun + self.cLPdRunText
         wx.CallAfter(self.rDlg.UpdateStG, msgStep)
         #------------------------------>
-        try:
-            dfDict, self.rMsgError, self.rException = self.rAnalysisMethod(
-                df=self.rIFileObj.rDf, rDO=self.rDO)
-        except Exception as e:
-            self.rMsgError = 'Main Analysis failed.'
-            self.rException = e
-            return False
+        dfDict, self.rMsgError, self.rException = cMethod.RunAnalysisMethod(
+            self.rAnalysisMethod,
+            self.rIFileObj.rDf,                                                 # type: ignore
+            self.rDO,
+            cancel     = self.rCancel,
+            checkpoint = self.rCheckpoint,
+            timer      = self.rTimer,
+            spill      = self.SpillData,
+        )
         #------------------------------>
         if dfDict:
             for k,v in dfDict.items():
@@ -1144,6 +1027,31 @@ class BaseConfPanel(
         return True
     #---
 
+    def SpillData(self, dfDict:dict, keep:tuple[str, ...]=('dfR',)) -> dict:
+        """Write the intermediate steps to the Data-Steps folder when they
+            use more memory than mConfig.core.memoryBudget.
+
+            Parameters
+            ----------
+            dfDict: dict
+                Output of the finished steps of the analysis method.
+            keep: tuple[str, ...]
+                Keys of the pd.DataFrames still needed by the analysis.
+
+            Returns
+            -------
+            dict
+                dfDict with the written steps replaced by cFile.SpilledDF.
+        """
+        #region --------------------------------------------------->
+        dataFolder = cMethod.DataStepsFolder(
+            self.rOFolder, self.rDate, self.cSection)                           # type: ignore
+        #endregion ------------------------------------------------>
+
+        return cFile.SpillDFs(
+            dataFolder, dfDict, mConfig.core.memoryBudget, keep=keep)
+    #---
+
     def WriteOutput(self) -> bool:
         """Write output for a module
 
@@ -1152,10 +1060,69 @@ class BaseConfPanel(
             bool
         """
         #region --------------------------------------------------> Data Steps
-        stepDict = self.SetStepDictDPFileR()
+        stepDict = self.rStepDictMethod(self.rDate, self.rDO, self.DFDict())
+        #endregion -----------------------------------------------> Data Steps
+
+        #region ------------------------------------------------> Data Initial
+        msgStep = self.cLPdWrite + 'Data files, Input Data'
+        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
+        #------------------------------>
+        try:
+            self.rDFile = cMethod.CopyInputFiles(self.rDO, self.rDate)
+        except Exception as e:
+            self.rMsgError = ('It was not possible to copy the input files to '
+                'the output folder.')
+            self.rException = e
+            return False
+        #endregion ---------------------------------------------> Data Initial
+
+        #region --------------------------------------------------> Data Steps
+        msgStep = self.cLPdWrite + 'Data files, Output Data'
+        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
+        try:
+            cFile.WriteDFs2CSV(
+                cMethod.DataStepsFolder(
+                    self.rOFolder, self.rDate, self.cSection),                  # type: ignore
+                stepDict['Files'],
+            )
+        except Exception as e:
+            self.rMsgError = ('It was not possible to create the files with '
+                'the data for the intermediate steps of the analysis.')
+            self.rException = e
+            return False
         #endregion -----------------------------------------------> Data Steps
 
-        return self.WriteOutputData(stepDict)
+        #region --------------------------------------------------> UMSAP File
+        msgStep = self.cLPdWrite + 'Main file'
+        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
+        #------------------------------>
+        try:
+            cFile.WriteUMSAPData(
+                self.rDO.uFile,
+                self.cSection,
+                self.rDateID,
+                cMethod.DateDict(
+                    self.rDO, stepDict, self.rTimer.Dict(), self.rRepVal),
+            )
+        except Exception as e:
+            self.rMsgError = ('It was not possible to create the dictionary '
+                'with the UMSAP data.')
+            self.rException = e
+            return False
+        #endregion -----------------------------------------------> UMSAP File
+
+        return True
+    #---
+
+    def ProfileFile(self) -> Path:
+        """Get the file for the profile of the analysis.
+
+            Returns
+            -------
+            Path
+                File in the folder of the UMSAP file.
+        """
+        return cMethod.ProfileFile(self.rDO.uFile, self.cSection)
     #---
 
     def RunEnd(self) -> bool:
@@ -1166,26 +1133,48 @@ class BaseConfPanel(
             bool
         """
         #region ---------------------------------------> Dlg progress dialogue
-        if not self.rMsgError:
+        if (self.rCancel.IsCancelled() and not self.rDeltaT) or isinstance(
+            self.rException, cException.Cancelled):
+            self.rDFile = []
+            #------------------------------>
+            self.rDlg.ErrorMessage(
+                mConfig.core.lPdCancel,
+                error   = cMethod.StrCancel(),
+                profile = self.rProfile,
+            )
+        elif not self.rMsgError:
+            if self.rCheckpoint is not None:
+                self.rCheckpoint.Clear()
+            #------------------------------>
             self.rDFile.append(self.rDO.uFile)
             #--> Here to avoid circular imports problems and thread limitations.
             pub.sendMessage(mConfig.core.kwPubLoadUmsap, fileP=self.rDO.uFile)
             #------------------------------>
             self.rDlg.SuccessMessage(
-                self.cLPdDone, eTime=f"{self.cLPdElapsed} {self.rDeltaT}")
+                self.cLPdDone,
+                eTime   = f"{self.cLPdElapsed} {self.rDeltaT}",
+                profile = self.rProfile,
+            )
         else:
             self.rDFile = []
             #------------------------------>
             self.rDlg.ErrorMessage(
-                self.cLPdError,error=self.rMsgError,tException=self.rException)
+                self.cLPdError,
+                error      = self.rMsgError,
+                tException = self.rException,
+                profile    = self.rProfile,
+            )
         #endregion ------------------------------------> Dlg progress dialogue
 
         #region -------------------------------------------------------> Reset
+        cFile.RemoveSpilledDF(list(self.DFDict().values()))
+        #------------------------------>
         self.rMsgError  = ''                                                    # Error msg to show in self.RunEnd
         self.rException = None                                                  # Exception
         self.rDO        = cMethod.BaseUserData()                                # DataClass for User Input
         self.dfI        = pd.DataFrame()                                        # pd.DataFrame for initial, normalized
         self.dfF        = pd.DataFrame()                                        # etc
+        self.dfMR       = pd.DataFrame()
         self.dfTP       = pd.DataFrame()
         self.dfE        = pd.DataFrame()
         self.dfS        = pd.DataFrame()
@@ -1193,11 +1182,14 @@ class BaseConfPanel(
         self.dfN        = pd.DataFrame()
         self.dfIm       = pd.DataFrame()
         self.dfR        = pd.DataFrame()
+        self.rRepVal    = []
         self.rDate      = ''                                                    # Date for ID
         self.rDateID    = ''                                                    # Full ID
         self.rOFolder   = None                                                  # folder for output
+        self.rCheckpoint = None                                                 # Finished steps
         self.rIFileObj  = None                                                  # Input Data File object
         self.rDeltaT    = ''                                                    # Duration of Analysis
+        self.rProfile   = ''                                                    # Top functions in the profile
 
         if self.rDFile:
             self.wUFile.wTc.SetValue(str(self.rDFile[-1]))
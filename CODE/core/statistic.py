@@ -15,7 +15,8 @@
 
 
 #region -------------------------------------------------------------> Imports
-from typing import Literal, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from typing             import Literal, Optional, Union
 
 import numpy  as np
 import pandas as pd
@@ -161,6 +162,318 @@ def HistBin(x: pd.Series) -> tuple[float, float]:
 #endregion -------------------------------------------------> Data Description
 
 
+#region ---------------------------------------------------------> Correlation
+def _CorrBlock(
+    x0:np.ndarray,
+    m:np.ndarray,
+    colI:slice,
+    colJ:slice,
+    ) -> np.ndarray:
+    """Pairwise complete Pearson coefficients between two column blocks.
+
+        Parameters
+        ----------
+        x0: np.ndarray
+            Centered values with 0 in place of NA.
+        m: np.ndarray
+            1.0 for observed values and 0.0 for NA.
+        colI, colJ: slice
+            Columns in the block.
+
+        Returns
+        -------
+        np.ndarray
+            Coefficients with shape (len(colI), len(colJ)).
+
+        Notes
+        -----
+        For a pair of columns only the rows with values in both columns are
+        used. The sums over these rows are masked matrix products.
+    """
+    # Test in test.unit.core.test_statistic.Test_Corr
+    #region --------------------------------------------------------> Products
+    xI, xJ = x0[:,colI], x0[:,colJ]
+    mI, mJ = m[:,colI],  m[:,colJ]
+    #------------------------------>
+    n   = mI.T @ mJ
+    sx  = xI.T @ mJ
+    sy  = mI.T @ xJ
+    sxx = (xI*xI).T @ mJ
+    syy = mI.T @ (xJ*xJ)
+    sxy = xI.T @ xJ
+    #endregion -----------------------------------------------------> Products
+
+    #region -----------------------------------------------------> Coefficient
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cov = sxy - sx*sy/n
+        vx  = sxx - sx*sx/n
+        vy  = syy - sy*sy/n
+        r   = cov / np.sqrt(vx*vy)
+    #endregion --------------------------------------------------> Coefficient
+
+    return r
+#---
+
+
+def _RankPrep(
+    x:np.ndarray,
+    m:np.ndarray,
+    ) -> tuple[np.ndarray, Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]]:
+    """Sort order and tied values of a column.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            Values in the column.
+        m: np.ndarray
+            True for observed values.
+
+        Returns
+        -------
+        tuple
+            Rows with values sorted by value and, if there are ties, the
+            positions of the tied values in the sorted rows together with
+            the first and last position of their group. None if there are no
+            ties.
+    """
+    # Test in test.unit.core.test_statistic.Test_Corr
+    #region -----------------------------------------------------------> Order
+    rows  = np.flatnonzero(m)
+    order = rows[np.argsort(x[rows], kind='mergesort')]
+    xS    = x[order]
+    #endregion --------------------------------------------------------> Order
+
+    #region ------------------------------------------------------------> Ties
+    if not (xS[1:] == xS[:-1]).any():
+        return (order, None)
+    #------------------------------>
+    newG   = np.r_[True, xS[1:] != xS[:-1]]
+    gId    = np.cumsum(newG) - 1
+    start  = np.flatnonzero(newG)
+    end    = np.r_[start[1:], len(xS)] - 1
+    tie    = np.flatnonzero((end - start)[gId] > 0)
+    #endregion ---------------------------------------------------------> Ties
+
+    return (order, (tie, start[gId][tie], end[gId][tie]))
+#---
+
+
+def _RankMasked(
+    prep:tuple[np.ndarray, Optional[tuple[np.ndarray, np.ndarray, np.ndarray]]],
+    m:np.ndarray,
+    ) -> np.ndarray:
+    """Rank a column using only the rows observed in each column of m.
+
+        Parameters
+        ----------
+        prep: tuple
+            Output of _RankPrep for the column.
+        m: np.ndarray
+            True for observed values. Shape (rows, columns).
+
+        Returns
+        -------
+        np.ndarray
+            Average ranks with 0 for the rows not used. Shape of m.
+
+        Notes
+        -----
+        In the sorted column, the rank of a value is the number of used rows
+        up to the value, i.e. the cumulative sum of the sorted mask. Tied
+        values get the mean of the first and last rank in their group.
+    """
+    # Test in test.unit.core.test_statistic.Test_Corr
+    #region ------------------------------------------------------------> Rank
+    order, tie = prep
+    mS = m[order]
+    c  = np.cumsum(mS, axis=0, dtype='float64')
+    #------------------------------>
+    if tie is not None:
+        t, s, e = tie
+        cB   = np.where((s > 0)[:,None], c[np.maximum(s-1, 0)], 0.0)
+        c[t] = (cB + c[e] + 1)/2
+    c *= mS
+    #endregion ---------------------------------------------------------> Rank
+
+    #region ----------------------------------------------------> Original Row
+    r = np.zeros(m.shape)
+    r[order] = c
+    #endregion -------------------------------------------------> Original Row
+
+    return r
+#---
+
+
+def _SpearmanBlock(
+    prep:list,
+    mB:np.ndarray,
+    k:np.ndarray,
+    colI:np.ndarray,
+    colJ:np.ndarray,
+    ) -> np.ndarray:
+    """Pairwise complete Spearman coefficients between two column blocks.
+
+        Parameters
+        ----------
+        prep: list
+            Output of _RankPrep for each column.
+        mB: np.ndarray
+            True for observed values.
+        k: np.ndarray
+            Number of rows with values in both columns for all pairs.
+        colI, colJ: np.ndarray
+            Columns in the block.
+
+        Returns
+        -------
+        np.ndarray
+            Coefficients with shape (len(colI), len(colJ)).
+
+        Notes
+        -----
+        For each pair the ranks 1..k of both columns have the same sum
+        k(k+1)/2 and the coefficient follows from the sums of the rank
+        products.
+    """
+    # Test in test.unit.core.test_statistic.Test_Corr
+    #region -----------------------------------------------------------> Ranks
+    a = np.stack([_RankMasked(prep[i], mB[:,colJ]) for i in colI])
+    b = np.stack([_RankMasked(prep[j], mB[:,colI]) for j in colJ])
+    b = b.transpose(2,1,0)
+    #endregion --------------------------------------------------------> Ranks
+
+    #region -----------------------------------------------------> Coefficient
+    k = k[np.ix_(colI, colJ)]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        s = (k*(k+1)/2)**2/k
+        r = ((a*b).sum(axis=1) - s)/np.sqrt(
+            ((a*a).sum(axis=1) - s)*((b*b).sum(axis=1) - s))
+    r[k < 2] = np.nan
+    #endregion --------------------------------------------------> Coefficient
+
+    return r
+#---
+
+
+def Corr(
+    df:pd.DataFrame,
+    method:str    = 'pearson',
+    pairwise:bool = True,
+    block:int     = 256,
+    workers:int   = 1,
+    ) -> pd.DataFrame:
+    """Calculate the correlation coefficients between the columns in df.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Numeric data.
+        method: str
+            One of 'pearson', 'spearman' or 'kendall'. Case insensitive.
+        pairwise: bool
+            Use for each pair of columns the rows with values in both
+            columns (True), like pd.DataFrame.corr, or only the rows without
+            NA values (False).
+        block: int
+            Number of columns in each block of the matrix products.
+        workers: int
+            Number of threads computing blocks at the same time.
+
+        Returns
+        -------
+        pd.DataFrame
+            Correlation coefficients. Index and columns are df.columns.
+
+        Notes
+        -----
+        Pearson and Spearman coefficients are obtained from masked matrix
+        products computed in blocks of columns. For Spearman the data is
+        ranked only once. If there are NA values and pairwise is True, the
+        pairs involving columns with NA are ranked again using only the
+        common rows, as in pd.DataFrame.corr. The ranks for all pairs in a
+        block are obtained from cumulative sums of the masks over the sorted
+        columns, so the columns are sorted only once. Use pairwise=False to
+        rank only once and skip this step.
+        Kendall coefficients are calculated with pd.DataFrame.corr.
+
+        The output matches pd.DataFrame.corr within floating point
+        tolerance.
+    """
+    # Test in test.unit.core.test_statistic.Test_Corr
+    #region ---------------------------------------------------------> Kendall
+    method = method.lower()
+    if method not in ['pearson', 'spearman']:
+        return df.corr(method=method)                                           # type: ignore
+    #endregion ------------------------------------------------------> Kendall
+
+    #region ------------------------------------------------------------> Data
+    x = df.to_numpy(dtype='float64', copy=True)
+    if not pairwise:
+        x[np.isnan(x).any(axis=1)] = np.nan
+    mB = ~np.isnan(x)
+    #------------------------------> Rank once
+    if method == 'spearman':
+        x = stats.rankdata(x, axis=0, nan_policy='omit')
+    #------------------------------> Center to avoid cancellation
+    x0 = np.where(mB, x, 0.0)
+    m  = mB.astype('float64')
+    with np.errstate(divide='ignore', invalid='ignore'):
+        x0 = np.where(mB, x0 - x0.sum(axis=0)/m.sum(axis=0), 0.0)
+    #endregion ---------------------------------------------------------> Data
+
+    #region ----------------------------------------------------------> Blocks
+    nCol = x.shape[1]
+    bL   = [slice(k, min(k+block, nCol)) for k in range(0, nCol, max(block, 1))]
+    pL   = [(i, j) for i in range(len(bL)) for j in range(i, len(bL))]
+    r    = np.empty((nCol, nCol))
+    #------------------------------>
+    def _Run(pair:tuple[int, int]) -> None:
+        bI, bJ = bL[pair[0]], bL[pair[1]]
+        rB = _CorrBlock(x0, m, bI, bJ)
+        r[bI,bJ] = rB
+        r[bJ,bI] = rB.T
+    #------------------------------>
+    if workers > 1 and len(pL) > 1:
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            list(executor.map(_Run, pL))
+    else:
+        for pair in pL:
+            _Run(pair)
+    #endregion -------------------------------------------------------> Blocks
+
+    #region -----------------------------------------------> Spearman & NA
+    colN = np.flatnonzero(~mB.all(axis=0))
+    if method == 'spearman' and pairwise and colN.size:
+        #------------------------------> Rank products are rows*sub*sub
+        xR   = df.to_numpy(dtype='float64')
+        sub  = max(1, min(block, int(np.sqrt(2**23/max(len(xR), 1)))))
+        colF = np.flatnonzero(mB.all(axis=0))
+        bN   = [colN[k:k+sub] for k in range(0, len(colN), sub)]
+        bF   = [colF[k:k+sub] for k in range(0, len(colF), sub)]
+        bS   = bN + bF
+        pS   = [(i, j) for i in range(len(bN)) for j in range(i, len(bS))]
+        prep = [_RankPrep(xR[:,c], mB[:,c]) for c in range(nCol)]
+        k    = m.T @ m
+        #------------------------------>
+        def _RunNA(pair:tuple[int, int]) -> None:
+            bI, bJ = bS[pair[0]], bS[pair[1]]
+            rB = _SpearmanBlock(prep, mB, k, bI, bJ)
+            r[np.ix_(bI, bJ)] = rB
+            r[np.ix_(bJ, bI)] = rB.T
+        #------------------------------>
+        if workers > 1 and len(pS) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(_RunNA, pS))
+        else:
+            for pair in pS:
+                _RunNA(pair)
+    #endregion --------------------------------------------> Spearman & NA
+
+    return pd.DataFrame(np.clip(r, -1, 1), index=df.columns, columns=df.columns)
+#---
+#endregion ------------------------------------------------------> Correlation
+
+
 #region -------------------------------------------------------------> Methods
 def CI_Sample(
     df:pd.DataFrame,
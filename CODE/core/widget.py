@@ -21,7 +21,7 @@ import math
 import webbrowser
 from datetime import datetime
 from pathlib  import Path
-from typing   import Optional, Callable, Union, Literal
+from typing   import Any, Optional, Callable, Union, Literal
 
 from pubsub  import pub
 
@@ -529,8 +529,15 @@ class ButtonRun():
 
         Attributes
         ----------
+        rCancel: cMethod.CancelToken
+            Token to cancel the running analysis. It is checked between steps.
         rDeltaT: str
             Time used by the analysis.
+        rProfile: str
+            Top functions of the profile of the analysis. Empty if profiling
+            is disabled.
+        rTimer: cMethod.StepTimer
+            Wall time, CPU time and peak memory of the steps of the analysis.
         wBtnRun: wx.Button
             The button.
 
@@ -539,7 +546,11 @@ class ButtonRun():
         OnRun(event)
             Start new thread to run the analysis.
         Run(test)
+            Run the analysis and restart the GUI.
+        RunSteps()
             Run the steps of the analysis.
+        RunStep(name, step)
+            Run one step of the analysis and record its resources.
         CheckInput()
             Check user input. Override as needed.
         PrepareRun()
@@ -550,6 +561,8 @@ class ButtonRun():
             Run the actual analysis. Override as needed.
         WriteOutput()
             Write output files. Override as needed.
+        ProfileFile()
+            File for the profile of the analysis. Override as needed.
         EndRun()
             Restart GUI and variables. Override as needed.
     """
@@ -563,6 +576,9 @@ class ButtonRun():
         """ """
         #region -----------------------------------------------> Initial Setup
         self.rDeltaT = ''
+        self.rCancel = cMethod.CancelToken()
+        self.rTimer  = cMethod.StepTimer()
+        self.rProfile = ''
         #endregion --------------------------------------------> Initial Setup
 
         #region -----------------------------------------------------> Widgets
@@ -595,64 +611,135 @@ class ButtonRun():
 
     #region ---------------------------------------------------> Class methods
     def Run(self, *args) -> bool:                                               # pylint: disable=unused-argument
-        """Run the analysis's steps.
+        """Run the analysis and restart the GUI.
 
             Parameters
             ----------
             *args is needed by _thread.start_new_thread.
 
+            Returns
+            -------
+            bool
+
             Notes
             -----
-            - Messages to the Progress dialog of the app can be set in the
-            individual step methods.
             - Function self.RunEnd should load the calculated results to avoid
             circular import errors and thread safety issues in pubsub.
+            - The steps are profiled when profiling is enabled, see
+            cMethod.ProfileOn. The top functions are kept in self.rProfile.
+        """
+        #region ---------------------------------------------------------> Run
+        profiler = cMethod.Profiler()
+        profiler.Start()
+        #------------------------------>
+        out = self.RunSteps()
+        #------------------------------>
+        self.rProfile = profiler.Stop(self.ProfileFile())
+        #endregion ------------------------------------------------------> Run
+
+        #region -------------------------------------------------> Restart GUI
+        wx.CallAfter(self.RunEnd)
+        return out
+        #endregion ----------------------------------------------> Restart GUI
+    #---
+
+    def RunSteps(self) -> bool:
+        """Run the analysis's steps.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            - Messages to the Progress dialog of the app can be set in the
+            individual step methods.
+            - self.rCancel is checked before each step. rDeltaT is not set
+            when the analysis is cancelled.
+            - self.rTimer records the resources used by each step.
         """
         #region --------------------------------------------------->
         start = datetime.now()
+        self.rTimer = cMethod.StepTimer(memory=mConfig.core.traceMemory)
+        self.rTimer.Start()
         #endregion ------------------------------------------------>
 
         #region -------------------------------------------------> Check input
-        if not self.CheckInput():
-            wx.CallAfter(self.RunEnd)
+        if not self.RunStep('Check input', self.CheckInput):
+            self.rTimer.Stop()
             return False
         #endregion ----------------------------------------------> Check input
 
         #region -------------------------------------------------> Prepare run
-        if not self.PrepareRun():
-            wx.CallAfter(self.RunEnd)
+        if not self.RunStep('Prepare run', self.PrepareRun):
+            self.rTimer.Stop()
             return False
         #endregion ----------------------------------------------> Prepare run
 
         #region ---------------------------------------------> Read input file
-        if not self.ReadInputFiles():
-            wx.CallAfter(self.RunEnd)
+        if not self.RunStep('Read input files', self.ReadInputFiles):
+            self.rTimer.Stop()
             return False
         #endregion ------------------------------------------> Read input file
 
         #region ------------------------------------------------> Run analysis
-        if not self.RunAnalysis():
-            wx.CallAfter(self.RunEnd)
+        if not self.RunStep('Run analysis', self.RunAnalysis):
+            self.rTimer.Stop()
             return False
         #endregion ---------------------------------------------> Run analysis
 
         #region ------------------------------------------------> Write output
-        if not self.WriteOutput():
-            wx.CallAfter(self.RunEnd)
+        if not self.RunStep('Write output', self.WriteOutput):
+            self.rTimer.Stop()
             return False
         #endregion ---------------------------------------------> Write output
 
         #region --------------------------------------------------> Delta Time
+        self.rTimer.Stop()
         end = datetime.now()
         self.rDeltaT = datetime.utcfromtimestamp(
             (end-start).total_seconds()
         ).strftime("%H:%M:%S")
         #endregion -----------------------------------------------> Delta Time
 
-        #region -------------------------------------------------> Restart GUI
-        wx.CallAfter(self.RunEnd)
         return True
-        #endregion ----------------------------------------------> Restart GUI
+    #---
+
+    def RunStep(self, name:str, step:Callable[[], bool]) -> bool:
+        """Run one step of the analysis and record its resources.
+
+            Parameters
+            ----------
+            name: str
+                Name of the step in self.rTimer.
+            step: Callable
+                Method running the step.
+
+            Returns
+            -------
+            bool
+                False if the analysis was cancelled or the step failed.
+        """
+        #region --------------------------------------------------->
+        if self.rCancel.IsCancelled():
+            return False
+        #------------------------------>
+        self.rTimer.Begin(name)
+        try:
+            return step()
+        finally:
+            self.rTimer.End(name)
+        #endregion ------------------------------------------------>
+    #---
+
+    def ProfileFile(self) -> Path:
+        """Get the file for the profile of the analysis. Override as needed.
+
+            Returns
+            -------
+            Path
+        """
+        return cMethod.ProfileFile(None, 'Run')
     #---
 
     def CheckInput(self) -> bool:
@@ -683,7 +770,8 @@ class ButtonRun():
     def RunEnd(self) -> bool:
         """Restart GUI and needed variables."""
         #region -------------------------------------------> Restart variables
-        self.rDeltaT = None
+        self.rDeltaT  = None
+        self.rProfile = ''
         #endregion ----------------------------------------> Restart variables
 
         return True
@@ -1115,7 +1203,7 @@ class MyListCtrl(wx.ListCtrl):
             wx.EVT_LIST_ITEM_SELECTED is bound. Default is True.
         style: wx style specification
             Style of the wx.ListCtrl. Default is wx.LC_REPORT.
-        data: list of list of str
+        data: list of list of str or cMethod.ListData
             Data for the wx.ListCtrl when in virtual mode.
         color: str
             Row color for zebra style when wx.ListCtrl is in virtual mode.
@@ -1137,12 +1225,19 @@ class MyListCtrl(wx.ListCtrl):
             Default is True.
         rSep: str
             String used to join column numbers. Default is ','.
-        rData: list of list of str
+        rData: list of list of str or cMethod.ListData
             Data for the wx.ListCtrl when in virtual mode.
         rColor: str
             Row color for zebra style when wx.ListCtrl is in virtual mode.
         attr1: wx.ItemAttr
             For zebra style when in virtual mode.
+        attrS: wx.ItemAttr
+            For rows matching the search when in virtual mode.
+        rIndex: cMethod.SearchIndex or None
+            Search index of the content. Built in the first search after the
+            content changes.
+        rHighlight: set[int]
+            Rows highlighted with attrS.
         rSearchMode: dict
             Keys are True/False and values methods to search in virtual or
             normal mode.
@@ -1191,6 +1286,8 @@ class MyListCtrl(wx.ListCtrl):
         self.rSep             = ' ' if sep == ' ' else f"{sep} "
         self.rData            = data
         self.rColor           = color
+        self.rIndex           = None
+        self.rHighlight       = set()
         #------------------------------>
         self.rSearchMode = {
             True : self.SearchVirtual,
@@ -1205,6 +1302,8 @@ class MyListCtrl(wx.ListCtrl):
             #------------------------------>
             self.attr1 = wx.ItemAttr()
             self.attr1.SetBackgroundColour(self.rColor)
+            self.attrS = wx.ItemAttr()
+            self.attrS.SetBackgroundColour(mConfig.core.cSearch)
         #endregion --------------------------------------------> Initial Setup
 
         #region -----------------------------------------------------> Columns
@@ -1241,11 +1340,33 @@ class MyListCtrl(wx.ListCtrl):
         self.SetAcceleratorTable(
             wx.AcceleratorTable(list(x for x in accel.values()))
         )
+        #------------------------------> Content changes
+        if not self.IsVirtual():
+            self.Bind(wx.EVT_LIST_INSERT_ITEM,      self.OnContentChange)
+            self.Bind(wx.EVT_LIST_DELETE_ITEM,      self.OnContentChange)
+            self.Bind(wx.EVT_LIST_DELETE_ALL_ITEMS, self.OnContentChange)
         #endregion -----------------------------------------------------> Bind
     #---
     #endregion -----------------------------------------------> Instance setup
 
     #region ---------------------------------------------------> Event Methods
+    def OnContentChange(self, event:wx.ListEvent) -> bool:
+        """Discard the search index after rows are added or deleted.
+
+            Parameters
+            ----------
+            event: wx.ListEvent
+                Information about the event.
+
+            Returns
+            -------
+            bool
+        """
+        self.rIndex = None
+        event.Skip()
+        return True
+    #---
+
     def OnAll(self, event:wx.Event) -> bool:                                    # pylint: disable=unused-argument
         """Select all rows.
 
@@ -1469,110 +1590,145 @@ class MyListCtrl(wx.ListCtrl):
         return True
     #---
 
-    def Search(self, tStr:str) -> list[list[int]]:
+    def Search(
+        self,
+        tStr:str,
+        mode:cMethod.LIT_Search = 'substring',
+        ) -> list[list[int]]:
         """Search tStr in the content of the wx.ListCtrl.
 
             Parameters
             ----------
             tStr: str
                 String to search for.
+            mode: str
+                One of substring, prefix or regex.
 
             Returns
             -------
             list of list of int
                 List with index of the row in which the tStr was exactly found
                 or empty list and list with the index of the rows in which the
-                Str is contained or empty list.
+                Str was found according to mode or empty list.
 
             Notes
             -----
             All occurrence of tStr are found.
         """
-        return self.rSearchMode[self.IsVirtual()](tStr)
+        return self.rSearchMode[self.IsVirtual()](tStr, mode)
     #---
 
-    def SearchVirtual(self, tStr:str) -> list[list[int]]:
+    def SearchVirtual(
+        self,
+        tStr:str,
+        mode:cMethod.LIT_Search = 'substring',
+        ) -> list[list[int]]:
         """Search the tStr in a virtual wx.ListCtrl.
 
             Parameters
             ----------
             tStr: str
                 String to look for.
+            mode: str
+                One of substring, prefix or regex.
 
             Returns
             -------
             list of list of int
                 List with index of the row in which the tStr was exactly found
                 or empty list and list with the index of the rows in which the
-                Str is contained or empty list.
+                Str was found according to mode or empty list.
 
             Notes
             -----
-            All rows containing tStr are found.
+            The index is built in the first search after SetNewData.
         """
-        #region ---------------------------------------------------> Variables
-        iEqual   = []
-        iSimilar = []
-        #endregion ------------------------------------------------> Variables
-
-        #region ------------------------------------------------------> Search
-        for k,row in enumerate(self.rData):
-            for col in row:
-                #------------------------------>
-                if tStr == col:
-                    iEqual.append(k)
-                    iSimilar.append(k)
-                    break
-                #------------------------------>
-                if tStr in col:
-                    iSimilar.append(k)
-                    break
-        #endregion ---------------------------------------------------> Search
+        #region -------------------------------------------------------> Index
+        if self.rIndex is None:
+            self.rIndex = cMethod.SearchIndex(self.rData)
+        #endregion ----------------------------------------------------> Index
 
-        return [iEqual, iSimilar]
+        return self.rIndex.Search(tStr, mode)
     #---
 
-    def SearchReport(self, tStr:str) -> list[list[int]]:
+    def SearchReport(
+        self,
+        tStr:str,
+        mode:cMethod.LIT_Search = 'substring',
+        ) -> list[list[int]]:
         """Search a non virtual wx.ListCtrl for the given string.
 
             Parameters
             ----------
             tStr: str
                 String to look for.
+            mode: str
+                One of substring, prefix or regex.
 
             Returns
             -------
             list of list of int
                 List with index of the row in which the tStr was exactly found
                 or empty list and list with the index of the rows in which the
-                Str is contained or empty list.
+                Str was found according to mode or empty list.
 
             Notes
             -----
-            All rows containing tStr are found.
+            The index is built in the first search after rows are added,
+            deleted or edited.
         """
-        #region ---------------------------------------------------> Variables
-        iEqual   = []
-        iSimilar = []
-        #endregion ------------------------------------------------> Variables
+        #region -------------------------------------------------------> Index
+        if self.rIndex is None:
+            self.rIndex = cMethod.SearchIndex([
+                self.GetRowContent(r) for r in range(0, self.GetItemCount())])
+        #endregion ----------------------------------------------------> Index
 
-        #region ------------------------------------------------------> Search
-        for r in range(0, self.GetItemCount()):
-            for c in range(0, self.GetColumnCount()):
-                #------------------------------>
-                cellText = self.GetItemText(r, c)
-                #------------------------------>
-                if tStr == cellText:
-                    iEqual.append(r)
-                    iSimilar.append(r)
-                    break
-                #------------------------------>
-                if tStr in cellText:
-                    iSimilar.append(r)
-                    break
-        #endregion ---------------------------------------------------> Search
+        return self.rIndex.Search(tStr, mode)
+    #---
+
+    def SetItem(self, *args, **kwargs) -> bool:
+        """Set the content of an item and discard the search index.
+
+            Parameters
+            ----------
+            *args, **kwargs:
+                See wx.ListCtrl.SetItem.
 
-        return [iEqual, iSimilar]
+            Returns
+            -------
+            bool
+        """
+        self.rIndex = None
+        return super().SetItem(*args, **kwargs)
+    #---
+
+    def SetHighlight(self, row:list[int]) -> bool:
+        """Highlight the given rows in a virtual wx.ListCtrl.
+
+            Parameters
+            ----------
+            row: list[int]
+                Row indexes. Empty list removes the highlight.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Highlight
+        if not self.IsVirtual() or (not row and not self.rHighlight):
+            return False
+        #------------------------------>
+        self.rHighlight = set(row)
+        #endregion ------------------------------------------------> Highlight
+
+        #region -----------------------------------------------------> Refresh
+        if (n := self.GetItemCount()) > 0:
+            self.RefreshItems(0, n-1)
+        if row:
+            self.EnsureVisible(row[0])
+        #endregion --------------------------------------------------> Refresh
+
+        return True
     #---
 
     def SelectAll(self) -> bool:
@@ -1791,6 +1947,9 @@ class MyListCtrl(wx.ListCtrl):
             str
                 Cell value
         """
+        if isinstance(self.rData, cMethod.ListData):
+            return self.rData.Cell(row, column)
+        #------------------------------>
         return self.rData[row][column]
     #---
 
@@ -1806,18 +1965,24 @@ class MyListCtrl(wx.ListCtrl):
             ------
             wx.ItemAttr
         """
+        if item in self.rHighlight:
+            return self.attrS
+        #------------------------------>
         if item % 2 == 0:
             return self.attr1
         #------------------------------>
         return None
     #---
 
-    def SetNewData(self, data:list[list[str]]) -> bool:
+    def SetNewData(
+        self,
+        data:Union[list[list[str]], cMethod.ListData],
+        ) -> bool:
         """Set new data for a virtual wx.ListCtrl.
 
             Parameters
             ----------
-            data: list of list of str
+            data: list of list of str or cMethod.ListData
                 One str field for each column in the wx.ListCtrl.
 
             Returns
@@ -1825,7 +1990,9 @@ class MyListCtrl(wx.ListCtrl):
             bool
         """
         #region ---------------------------------------------------> Set Data
-        self.rData = data
+        self.rData      = data
+        self.rIndex     = None
+        self.rHighlight = set()
         #------------------------------>
         self.SetItemCount(len(self.rData))
         #endregion ------------------------------------------------> Set Data
@@ -2141,6 +2308,8 @@ class MatPlotPanel(wx.Panel):
         ----------
         rAxes:
             Axes in the canvas.
+        rBg: matplotlib object or None
+            Canvas after the last full draw without the artists in rOverlay.
         rBindId: list
             List of bound events to connect and disconnect them.
         rCanvas: FigureCanvas
@@ -2157,6 +2326,8 @@ class MatPlotPanel(wx.Panel):
             x coordinate in the plot scale when left click is pressed.
         rInitY: float
             y coordinate in the plot scale when left click is pressed.
+        rOverlay: list
+            Animated artists, e.g. selections. They are drawn over rBg.
         rZoomRect: mpl.patches.Rectangle or None
             Rectangle to show the zoom in area.
         rZoomReset: dict
@@ -2188,6 +2359,8 @@ class MatPlotPanel(wx.Panel):
         self.rZoomRect     = None
         self.rZoomReset    = {}
         self.rBindId       = []
+        self.rBg           = None
+        self.rOverlay      = []
         super().__init__(parent)
         #endregion --------------------------------------------> Initial Setup
 
@@ -2212,6 +2385,7 @@ class MatPlotPanel(wx.Panel):
 
         #region --------------------------------------------------------> Bind
         self.ConnectEvent()
+        self.rCanvas.mpl_connect('draw_event', self.OnDraw)
         #------------------------------> Keyboard shortcut
         #--------------> Accelerator entries
         accel = {
@@ -2264,6 +2438,21 @@ class MatPlotPanel(wx.Panel):
         return cMethod.OnGUIMethod(self.ZoomResetPlot)
     #---
 
+    def OnDraw(self, event) -> bool:
+        """Process a draw event.
+
+            Parameters
+            ----------
+            event: mpl.DrawEvent
+                Information about the mpl event.
+
+            Returns
+            -------
+            bool
+        """
+        return cMethod.OnGUIMethod(self.SetBg, event)
+    #---
+
     def OnKeyPress(self, event) -> bool:
         """Process a key press event.
 
@@ -2424,7 +2613,11 @@ class MatPlotPanel(wx.Panel):
         #endregion --------------------------------> Reset initial coordinates
 
         #region --------------------------------------------> Delete zoom rect
-        self.ZoomRectDelete()
+        if self.rZoomRect is not None:
+            self.rZoomRect.remove()
+            self.rZoomRect = None
+        #------------------------------> New axis limits
+        self.rCanvas.draw()
         #endregion -----------------------------------------> Delete zoom rect
 
         return True
@@ -2491,15 +2684,108 @@ class MatPlotPanel(wx.Panel):
         #endregion ---------------------------------> Delete & Create zoomRect
 
         #region --------------------------------------------------> Add & Draw
-        self.rAxes.add_patch(
+        self.AddOverlay(self.rAxes.add_patch(
             self.rZoomRect
-        )
-        self.rCanvas.draw()
+        ))
+        self.Blit()
         #endregion -----------------------------------------------> Add & Draw
 
         return True
     #---
 
+    def AddOverlay(self, artist:Any) -> Any:
+        """Draw an artist over the rest of the plot.
+
+            Parameters
+            ----------
+            artist: matplotlib artist or list of artists
+                Artist already added to an axes in the figure, e.g. the
+                output of rAxes.plot.
+
+            Returns
+            -------
+            artist
+                The given artist.
+
+            Notes
+            -----
+            The artist is animated. Changes to the artist are shown with
+            self.Blit(). To remove the artist use artist.remove() and then
+            self.Blit().
+        """
+        #region --------------------------------------------------------> Add
+        for a in (artist if isinstance(artist, list) else [artist]):
+            a.set_animated(True)
+            self.rOverlay.append(a)
+        #endregion -----------------------------------------------------> Add
+
+        return artist
+    #---
+
+    def DrawOverlay(self) -> bool:
+        """Draw the artists in rOverlay still present in the figure.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------------> Draw
+        self.rOverlay = [
+            a for a in self.rOverlay
+            if a.axes is not None and a.axes in self.rFigure.axes]
+        #------------------------------>
+        for a in self.rOverlay:
+            self.rFigure.draw_artist(a)
+        #endregion -----------------------------------------------------> Draw
+
+        return True
+    #---
+
+    def SetBg(self, event) -> bool:                                             # pylint: disable=unused-argument
+        """Keep the canvas after a full draw and draw the overlay on top.
+
+            Parameters
+            ----------
+            event: mpl.DrawEvent
+                Information about the mpl event.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------------> Save
+        if self.rCanvas.is_saving():                                            # Images include the overlay
+            return True
+        #endregion -----------------------------------------------------> Save
+
+        #region ----------------------------------------------------------> Bg
+        self.rBg = self.rCanvas.copy_from_bbox(self.rFigure.bbox)
+        self.DrawOverlay()
+        #endregion -------------------------------------------------------> Bg
+
+        return True
+    #---
+
+    def Blit(self) -> bool:
+        """Show changes in the overlay without drawing the rest of the plot.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------------> Draw
+        if self.rBg is None:
+            self.rCanvas.draw()
+            return True
+        #------------------------------>
+        self.rCanvas.restore_region(self.rBg)
+        self.DrawOverlay()
+        self.rCanvas.blit(self.rFigure.bbox)
+        #endregion -----------------------------------------------------> Draw
+
+        return True
+    #---
+
     def SaveImage(
         self,
         ext:str,
@@ -2611,7 +2897,7 @@ class MatPlotPanel(wx.Panel):
         #region --------------------------------------------------------> Rect
         if self.rZoomRect is not None:
             self.rZoomRect.remove()
-            self.rCanvas.draw()
+            self.Blit()
             self.rZoomRect = None
         #endregion -----------------------------------------------------> Rect
 
@@ -2735,6 +3021,8 @@ class ListCtrlSearch():
         ----------
         listTDict: dict
             Keys are 0,1,2 and methods the class for the wx.ListCtrl.
+        rSearchMode: str
+            Search mode selected in the menu of wSearch.
         wLC : wx.ListCtrl
         wSearch : wx.SearchCtrl
     """
@@ -2744,6 +3032,12 @@ class ListCtrlSearch():
         1: MyListCtrlZebra,
         2: MyListCtrlZebraMaxWidth,
     }
+    #------------------------------> Label
+    cLSearchMode = {
+        'Contains'          : 'substring',
+        'Starts with'       : 'prefix',
+        'Regular Expression': 'regex',
+    }
     #endregion --------------------------------------------------> Class setup
 
     #region --------------------------------------------------> Instance setup
@@ -2787,6 +3081,13 @@ class ListCtrlSearch():
         #------------------------------> wx.SearchCtrl
         self.wSearch = wx.SearchCtrl(parent)
         self.wSearch.SetHint(tcHint) if tcHint else ''                          # pylint: disable=expression-not-assigned
+        #------------------------------> Search mode
+        self.rSearchMode = 'substring'
+        self.mSearch     = wx.Menu()
+        for k in self.cLSearchMode:
+            item = self.mSearch.AppendRadioItem(-1, k)
+            self.mSearch.Bind(wx.EVT_MENU, self.OnSearchMode, source=item)
+        self.wSearch.SetMenu(self.mSearch)
         #endregion --------------------------------------------------> Widgets
 
         #region ------------------------------------------------------> Sizers
@@ -2799,6 +3100,28 @@ class ListCtrlSearch():
         #endregion ---------------------------------------------------> Sizers
     #---
     #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Event Methods
+    def OnSearchMode(self, event:wx.CommandEvent) -> bool:
+        """Set the search mode.
+
+            Parameters
+            ----------
+            event: wx.CommandEvent
+                Information about the event.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Set mode
+        label = self.mSearch.FindItemById(event.GetId()).GetItemLabelText()
+        self.rSearchMode = self.cLSearchMode[label]
+        #endregion ------------------------------------------------> Set mode
+
+        return True
+    #---
+    #endregion ------------------------------------------------> Event Methods
 #---
 
 
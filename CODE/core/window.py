@@ -15,12 +15,15 @@
 
 
 #region -------------------------------------------------------------> Imports
+import re
 from math    import ceil
 from pathlib import Path
 from typing  import Optional, Union, Literal, TYPE_CHECKING
 
-import matplotlib.patches as mpatches
-import pandas             as pd
+import matplotlib.collections as mcollections
+import matplotlib.patches     as mpatches
+import numpy                  as np
+import pandas                 as pd
 
 from pubsub  import pub
 
@@ -584,6 +587,7 @@ class BaseWindowResultListText(BaseWindowResult):
         self.wLC.wLCS.wLC.Bind(wx.EVT_LIST_ITEM_SELECTED, self.OnListSelect)
         self.wLC.wLCS.wLC.Bind(wx.EVT_LEFT_UP, self.OnListSelectEmpty)
         self.wLC.wLCS.wSearch.Bind(wx.EVT_SEARCH, self.OnSearch)
+        self.wLC.wLCS.wSearch.Bind(wx.EVT_TEXT, self.OnSearchType)
         #endregion -----------------------------------------------------> Bind
     #---
     #endregion -----------------------------------------------> Instance setup
@@ -604,6 +608,21 @@ class BaseWindowResultListText(BaseWindowResult):
         return cMethod.OnGUIMethod(self.Search)
     #---
 
+    def OnSearchType(self, event:wx.Event) -> bool:                             # pylint: disable=unused-argument
+        """Highlight the rows matching the search while typing.
+
+            Parameters
+            ----------
+            event: wx.Event
+                Information about the event.
+
+            Returns
+            -------
+            bool
+        """
+        return cMethod.OnGUIMethod(self.SearchType)
+    #---
+
     def OnListSelect(self, event:Union[wx.CommandEvent, str]) -> bool:          # pylint: disable=unused-argument
         """Processes a wx.ListCtrl event.
 
@@ -676,7 +695,13 @@ class BaseWindowResultListText(BaseWindowResult):
         """
         #region ---------------------------------------------------> Get index
         tStr = self.wLC.wLCS.wSearch.GetValue()
-        iEqual, iSimilar = self.wLC.wLCS.wLC.Search(tStr)
+        try:
+            iEqual, iSimilar = self.wLC.wLCS.wLC.Search(
+                tStr, self.wLC.wLCS.rSearchMode)
+        except re.error as e:
+            msg = f'The string, {tStr}, is not a valid regular expression.'
+            Notification('errorU', msg=msg, tException=e, parent=self)
+            return False
         #endregion ------------------------------------------------> Get index
 
         #region ----------------------------------------------> Show 1 Results
@@ -715,6 +740,37 @@ class BaseWindowResultListText(BaseWindowResult):
         return True
     #---
 
+    def SearchType(self) -> bool:
+        """Highlight the rows matching the search string.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            Invalid regular expressions are ignored while typing. Only virtual
+            wx.ListCtrl highlight rows.
+        """
+        #region ---------------------------------------------------> Get index
+        if not self.wLC.wLCS.wLC.IsVirtual():
+            return False
+        #------------------------------>
+        tStr = self.wLC.wLCS.wSearch.GetValue()
+        try:
+            iSimilar = self.wLC.wLCS.wLC.Search(
+                tStr, self.wLC.wLCS.rSearchMode)[1]
+        except re.error:
+            return False
+        #endregion ------------------------------------------------> Get index
+
+        #region ---------------------------------------------------> Highlight
+        self.wLC.wLCS.wLC.SetHighlight(iSimilar)
+        #endregion ------------------------------------------------> Highlight
+
+        return True
+    #---
+
     def ListSelect(self) -> bool:
         """Processes a wx.ListCtrl event.
 
@@ -1124,7 +1180,8 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
         self.rFragments   = {}
         self.rPeptide     = None
         self.rFragSelC    = [None, None, None]
-        self.rRectsFrag   = []
+        self.rRectsFrag   = None
+        self.rRectsFragL  = []
         self.rDataC:Union['limpMethod.LimpAnalysis', 'tarpMethod.TarpAnalysis']
         #------------------------------>
         super().__init__(parent)
@@ -1173,6 +1230,63 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
         return True
     #---
 
+    def PickRect(self, event) -> tuple[int, int, int]:
+        """Get the picked rectangle in a collection of rectangles.
+
+            Parameters
+            ----------
+            event: matplotlib pick event.
+
+            Returns
+            -------
+            tuple[int, int, int]
+                Index of the rectangle in the collection and rounded x, y
+                coordinates of its lower left corner.
+
+            Notes
+            -----
+            When several rectangles are picked the one drawn last is used.
+        """
+        #region ---------------------------------------------------> Rectangle
+        idx  = int(event.ind[-1])
+        x, y = event.artist.get_paths()[idx].vertices[0]
+        #endregion ------------------------------------------------> Rectangle
+
+        return (idx, round(x), round(y))
+    #---
+
+    def SetRectsLineWidth(
+        self,
+        rects:Optional[mcollections.PolyCollection],
+        sel:Optional[list[int]] = None,
+        ) -> bool:
+        """Set the line width of the rectangles in a collection.
+
+            Parameters
+            ----------
+            rects: mcollections.PolyCollection or None
+                Rectangles.
+            sel: list[int] or None
+                Index of the highlighted rectangles. Default is None.
+
+            Returns
+            -------
+            bool
+        """
+        #region --------------------------------------------------> Line Width
+        if rects is None:
+            return False
+        #------------------------------>
+        sel = set(sel) if sel else set()
+        rects.set_linewidths([
+            2.0 if k in sel else self.cGelLineWidth
+            for k in range(len(rects.get_paths()))
+        ])
+        #endregion -----------------------------------------------> Line Width
+
+        return True
+    #---
+
     def SeqExport(self) -> bool:
         """Export the recombinant sequence.
 
@@ -1236,6 +1350,8 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
         #------------------------------>
         self.rFragSelLine = None
         self.rFragSelC    = [None, None, None]
+        self.rRectsFrag   = None
+        self.rRectsFragL  = []
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
@@ -1270,11 +1386,9 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
 
         #region ----------------------------------------------------> Get Data
         col = [self.rDf.columns.get_loc(c) for c in self.rDf.loc[:,self.rIdxP].columns.values]      # type: ignore
-        data = cMethod.DFFilterByColN(self.rDf, col, self.rDataC.alpha, 'le')
-        data = data.iloc[:,0:2].reset_index(drop=True)
-        data.insert(0, 'kbr', data.index.values.tolist())
-        data = data.astype(str)
-        data = data.iloc[:,0:2].values.tolist()
+        mask = cMethod.DFMaskByColN(self.rDf, col, self.rDataC.alpha, 'le')
+        val  = self.rDf.iloc[mask,0]
+        data = cMethod.ListData([np.arange(len(val)), val])
         #endregion -------------------------------------------------> Get Data
 
         #region ------------------------------------------> Set in wx.ListCtrl
@@ -1302,7 +1416,8 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
             bool
         """
         #region ---------------------------------------------------> Variables
-        self.rRectsFrag = []
+        self.rRectsFragL = []
+        x, y, w, color   = [], [], [], []
         #endregion ------------------------------------------------> Variables
 
         #region ----------------------------------------------------> Set Axis
@@ -1316,17 +1431,20 @@ class BaseWindowResultListText2PlotFragments(BaseWindowResultListText2Plot):
         for k,v in enumerate(tKeyLabel, start=1):
             frag = getattr(self.rFragments, v)
             for j,f in enumerate(frag.coord):
-                self.rRectsFrag.append(mpatches.Rectangle(
-                    (f[0], k-0.2),
-                    (f[1]-f[0]),
-                    0.4,
-                    picker    = True,
-                    linewidth = self.cGelLineWidth,
-                    facecolor = self.cSpot[(k-1)%nc],
-                    edgecolor = 'black',
-                    label     = f'{tKeyLabel[v]}.{j}',
-                ))
-                self.wPlot['Main'].rAxes.add_patch(self.rRectsFrag[-1])
+                x.append(f[0])
+                y.append(k-0.2)
+                w.append(f[1]-f[0])
+                color.append(self.cSpot[(k-1)%nc])
+                self.rRectsFragL.append(f'{tKeyLabel[v]}.{j}')
+        #------------------------------>
+        self.rRectsFrag = self.wPlot['Main'].rAxes.add_collection(
+            cMethod.RectCollection(
+                x, y, w, 0.4,
+                picker     = True,
+                linewidths = self.cGelLineWidth,
+                facecolors = color,
+                edgecolors = 'black',
+            ))
         #endregion ------------------------------------------------> Fragments
 
         #region -----------------------------------------------------> Protein
@@ -1876,6 +1994,9 @@ class Progress(wx.Dialog):
             Image to show in the dialogue.
         style: wx style
             Style of the dialogue.
+        cancel: cMethod.CancelToken or None
+            Token of the running analysis. If given, a Cancel button is shown
+            while the analysis runs.
     """
     #region --------------------------------------------------> Instance setup
     def __init__(
@@ -1885,9 +2006,12 @@ class Progress(wx.Dialog):
         count:int,
         img:Path  = mConfig.core.fImgIcon,
         style:int = wx.CAPTION|wx.CLOSE_BOX|wx.RESIZE_BORDER,
+        cancel:Optional[cMethod.CancelToken] = None,
         ) -> None:
         """ """
         #region -----------------------------------------------> Initial Setup
+        self.rCancel = cancel
+        #------------------------------>
         super().__init__(parent, title=title, style=style)
         #endregion --------------------------------------------> Initial Setup
 
@@ -1902,6 +2026,11 @@ class Progress(wx.Dialog):
             size  = (565, 100),
             style = wx.TE_READONLY|wx.TE_MULTILINE,
         )
+        self.wBtnCancel = wx.Button(self, label='Cancel')
+        self.wBtnCancel.SetToolTip(
+            'Stop the analysis after the current step.'
+            + (' Finished steps are reused when the analysis is started again.'
+               if mConfig.core.checkpoint else ''))
         if img is not None:
             self.img = wx.StaticBitmap(
                 self,
@@ -1918,6 +2047,7 @@ class Progress(wx.Dialog):
         self.sStG.Add(self.wSt, 0, wx.ALIGN_LEFT|wx.TOP|wx.LEFT, 5)
         self.sStG.Add(self.wG, 0, wx.EXPAND|wx.LEFT|wx.RIGHT, 5)
         self.sStG.Add(self.wStTime, 0, wx.ALIGN_CENTRE|wx.LEFT|wx.RIGHT, 5)
+        self.sStG.Add(self.wBtnCancel, 0, wx.ALIGN_RIGHT|wx.ALL, 5)
 
         self.sProgress = wx.GridBagSizer(1,1)
         if self.img is not None:
@@ -1952,15 +2082,46 @@ class Progress(wx.Dialog):
 
         self.sSizer.Hide(self.sError, recursive=True)
         self.sSizer.Hide(self.sBtn, recursive=True)
+        if self.rCancel is None:
+            self.sStG.Hide(self.wBtnCancel)
 
         self.SetSizer(self.sSizer)
         self.Fit()
         #endregion ---------------------------------------------------> Sizers
+
+        #region --------------------------------------------------------> Bind
+        self.wBtnCancel.Bind(wx.EVT_BUTTON, self.OnCancel)
+        #endregion -----------------------------------------------------> Bind
         if parent is not None:
             self.CenterOnParent()
     #---
     #endregion -----------------------------------------------> Instance setup
 
+    #region ---------------------------------------------------> Event methods
+    def OnCancel(self, event:wx.CommandEvent) -> bool:                          # pylint: disable=unused-argument
+        """Request the cancellation of the analysis.
+
+            Parameters
+            ----------
+            event: wx.CommandEvent
+                Information about the event.
+
+            Returns
+            -------
+            bool
+        """
+        #region ------------------------------------------------------> Cancel
+        if self.rCancel is not None:
+            self.rCancel.Cancel()
+        #------------------------------>
+        self.wBtnCancel.SetLabel('Cancelling...')
+        self.wBtnCancel.Disable()
+        #endregion ---------------------------------------------------> Cancel
+
+        return True
+    #---
+    #endregion ------------------------------------------------> Event methods
+
     #region ---------------------------------------------------> Class methods
     def UpdateStG(self, text:str, step:int=1) -> bool:
         """Update the step message and the gauge step.
@@ -2033,7 +2194,7 @@ class Progress(wx.Dialog):
         return True
     #---
 
-    def SuccessMessage(self, label:str, eTime:str='') -> bool:
+    def SuccessMessage(self, label:str, eTime:str='', profile:str='') -> bool:
         """Show a Success message.
 
             Parameters
@@ -2042,18 +2203,27 @@ class Progress(wx.Dialog):
                 All done message.
             eTime: str
                 Secondary message to display below the gauge. e.g. Elapsed time.
+            profile: str
+                Top functions in the profile of the analysis.
         """
         #region ------------------------------------------------------> Labels
         self.wSt.SetLabel(label)
         self.wSt.SetFont(self.wSt.GetFont().MakeBold())
         if eTime:
             self.wStTime.SetLabel(eTime)
+        #------------------------------>
+        if profile:
+            self.wStLabel.SetLabel('Profile')
+            self.wTcError.SetValue(profile)
+            self.wTcError.SetInsertionPoint(0)
+            self.sSizer.Show(self.sError, recursive=True)
         #endregion ---------------------------------------------------> Labels
 
         #region -------------------------------------------------------> Sizer
         #------------------------------> Center Success message
         self.sStG.GetItem(self.wSt).SetFlag(wx.ALIGN_CENTRE|wx.TOP|wx.LEFT)
         #------------------------------> Show buttons
+        self.sStG.Hide(self.wBtnCancel)
         self.sSizer.Show(self.sBtn, recursive=True)
         #------------------------------> Layout & Show
         self.sSizer.Layout()
@@ -2070,6 +2240,7 @@ class Progress(wx.Dialog):
         label:str,
         error:str                      = '',
         tException:Optional[Exception] = None,
+        profile:str                    = '',
         ) -> bool:
         """Show error message.
 
@@ -2081,6 +2252,8 @@ class Progress(wx.Dialog):
                 Error message.
             tException : Exception or None
                 Exception raised to offer full traceback.
+            profile: str
+                Top functions in the profile of the analysis.
         """
         #region -------------------------------------------------> Check input
         if not error and tException is None:
@@ -2099,10 +2272,14 @@ class Progress(wx.Dialog):
                 self.wTcError.AppendText('\n\nFurther details:\n')
             self.wTcError.AppendText(cMethod.StrException(tException))
         #------------------------------>
+        if profile:
+            self.wTcError.AppendText(f'\n\nProfile:\n{profile}')
+        #------------------------------>
         self.wTcError.SetInsertionPoint(0)
         #endregion ---------------------------------------------------> Labels
 
         #region -------------------------------------------------------> Sizer
+        self.sStG.Hide(self.wBtnCancel)
         self.sSizer.Show(self.sError, recursive=True)
         self.sSizer.Show(self.sBtn, recursive=True)
 
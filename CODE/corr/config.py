@@ -30,6 +30,8 @@ class Configuration():
     nPane:str = 'CorrA Pane Correlation Analysis'                               # Name for Conf Pane
     tUtil:str = 'Correlation Analysis'                                          # Name of the Utility
     tTab:str  = 'CorrA'                                                         # Title of the Tab
+    #------------------------------> File names
+    fnMainData:str = '{}_{}-CorrelationCoefficients-Data.txt'                   # Main results file in Steps_Data_Files
     #------------------------------> Label
     lmSelCol:str = 'Show Selected Columns'                                      # lm: Label for wx.MenuItem
     lmAllCol:str = 'Show All Columns'
@@ -51,6 +53,8 @@ class Configuration():
     corrMethod:str = ''                                                         # Default correlation method
     axisLabel:str  = 'Names'                                                    # In Res Plot show column names by default
     showBar:bool   = False                                                      # Do not show color bar by default
+    corrBlock:int   = 256                                                       # Columns in each block of the coefficient calculation
+    corrWorkers:int = 1                                                         # Threads calculating the coefficients
     #endregion ------------------------------------------------------> Options
 #---
 #endregion ----------------------------------------------------> Configuration
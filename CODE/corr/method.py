@@ -16,12 +16,16 @@
 
 #region -------------------------------------------------------------> Imports
 from dataclasses import dataclass, field
-from typing      import Optional
+from typing      import Callable, Optional
 
+import numpy  as np
 import pandas as pd
 
-from core     import method as cMethod
-from dataprep import method as dataMethod
+from config.config import config as mConfig
+from core     import file      as cFile
+from core     import method    as cMethod
+from core     import statistic as cStatistic
+from dataprep import method    as dataMethod
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -33,7 +37,7 @@ class UserData(cMethod.BaseUserData):
     dO:list = field(default_factory=lambda:                                     # Attr printed to UMSAP file
         ['iFileN', 'ID', 'cero', 'tran', 'norm', 'imp', 'shift', 'width',
          'corr', 'labelA', 'ocColumn', 'resCtrl', 'ocResCtrl', 'ocResCtrlFlat',
-         'minRep', 'minRepList', 'dfResCtrl',
+         'minRep', 'minRepList', 'float32', 'dfResCtrl',
         ])
     longestKey:int = 18                                                         # Length of the longest Key in dI
     #endregion ------------------------------------------------------> Options
@@ -54,9 +58,13 @@ class CorrAnalysis():
 #region -------------------------------------------------------------> Methods
 def CorrA(                                                                      # pylint: disable=dangerous-default-value
     *args,                                                                      # pylint: disable=unused-argument
-    df:pd.DataFrame = pd.DataFrame(),
-    rDO:UserData    = UserData(),
-    resetIndex:bool = True,
+    df:pd.DataFrame                       = pd.DataFrame(),
+    rDO:UserData                          = UserData(),
+    resetIndex:bool                       = True,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs,
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform a Correlation Analysis.
@@ -70,6 +78,15 @@ def CorrA(
             rDO dictionary from the PrepareRun step of the analysis.
         resetIndex: bool
             Reset index of dfS (True) or not (False). Default is True.
+        cancel: cMethod.CancelToken or None
+            Cancel the analysis.
+        checkpoint: cFile.Checkpoint or None
+            Resume the data preparation.
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation and statistics.
+        spill: Callable or None
+            Write the finished data preparation steps to disk, see
+            dataMethod.RunDataPreparation.
         **kwargs: These are ignore here.
 
         Returns
@@ -86,6 +103,7 @@ def CorrA(
                         'dfE' : pd.DataFrame,
                         'dfS' : pd.DataFrame,
                         'dfR' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -99,20 +117,122 @@ def CorrA(
     """
     # Test in test.unit.corr.test_method.Test_CorrA
     #region ------------------------------------------------> Data Preparation
-    tOut = dataMethod.RunDataPreparation(df=df, rDO=rDO, resetIndex=resetIndex)
+    timer = timer if timer is not None else cMethod.StepTimer(memory=False)
+    #------------------------------>
+    tOut = dataMethod.RunDataPreparation(
+        df=df, rDO=rDO, resetIndex=resetIndex, cancel=cancel,
+        checkpoint=checkpoint, timer=timer, spill=spill)
     if not tOut[0]:
         return tOut
     #endregion ---------------------------------------------> Data Preparation
 
     #region -----------------------------------------------------------> CorrA
+    timer.Begin('Statistics')
     try:
-        dfR = tOut[0]['dfIm'].corr(method=rDO.corr.lower())
+        dfR = cStatistic.Corr(
+            tOut[0]['dfIm'],
+            method  = rDO.corr,
+            block   = mConfig.corr.corrBlock,
+            workers = mConfig.corr.corrWorkers,
+        )
     except Exception as e:
         return ({}, 'Correlation coefficients calculation failed.', e)
     #------------------------------>
     tOut[0]['dfR'] = dfR
+    timer.End('Statistics')
     #endregion --------------------------------------------------------> CorrA
 
     return (tOut[0], '', None)
 #---
+
+
+def StepDict(tDate:str, rDO:UserData, dfDict:dict) -> dict:
+    """Files and keys written in the output of a Correlation Analysis.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+        rDO: UserData
+            User input.
+        dfDict: dict
+            Output of the steps of the analysis, see mConfig.core.ltDFKeys.
+
+        Returns
+        -------
+        dict
+            {
+                'DP'   : dict,
+                'Files': {file name: pd.DataFrame},
+                'R'    : file with the results,
+            }
+    """
+    # No test
+    #region ---------------------------------------------------> Step Dict
+    stepDict = dataMethod.StepDict(tDate, rDO, dfDict)
+    stepDict['R'] = mConfig.corr.fnMainData.format(tDate, '07')
+    stepDict['Files'][stepDict['R']] = dfDict['dfR']
+    #endregion ------------------------------------------------> Step Dict
+
+    return stepDict
+#---
+
+
+def HeatmapImage(
+    rgba:np.ndarray,
+    idx:list[int],
+    lim:tuple[float, float, float, float],
+    maxCell:tuple[int, int],
+    ) -> tuple[np.ndarray, tuple[int, int, int, int]]:
+    """Image of the visible cells of a correlation heatmap.
+
+        Parameters
+        ----------
+        rgba: np.ndarray
+            Colors of all coefficients in the analysis, shape (n, n, 4).
+        idx: list[int]
+            Selected columns, 0 based.
+        lim: tuple[float, float, float, float]
+            Visible region (xmin, xmax, ymin, ymax) in cell units.
+        maxCell: tuple[int, int]
+            Maximum number of cells along x and y, e.g. the size of the axes
+            in pixels.
+
+        Returns
+        -------
+        tuple
+            Image with origin in the lower left corner and its extent.
+
+        Notes
+        -----
+        When the visible region has more cells than maxCell, blocks of cells
+        are shown as a single pixel with the mean color of the block. The
+        last block may be smaller and its pixel is clipped by the axis limit.
+        When the visible region is outside the heatmap, the nearest cells are
+        used so the image is never empty.
+    """
+    # Test in test.unit.corr.test_method.Test_HeatmapImage
+    #region -------------------------------------------------> Visible cells
+    n      = len(idx)
+    c0, r0 = (min(max(int(np.floor(x)), 0), n-1) for x in (lim[0], lim[2]))
+    c1, r1 = (min(int(np.ceil(x)), n)  for x in (lim[1], lim[3]))
+    c1, r1 = max(c1, c0+1), max(r1, r0+1)
+    tIdx   = np.asarray(idx)
+    img    = rgba[np.ix_(tIdx[r0:r1], tIdx[c0:c1])]
+    #endregion ----------------------------------------------> Visible cells
+
+    #region -------------------------------------------------------> Reduce
+    fC = -(-(c1-c0) // max(maxCell[0], 1))
+    fR = -(-(r1-r0) // max(maxCell[1], 1))
+    for axis, f, m in ((1, fC, c1-c0), (0, fR, r1-r0)):
+        if f > 1:
+            start = np.arange(0, m, f)
+            shape = [1, 1, 1]
+            shape[axis] = -1
+            img = np.add.reduceat(img, start, axis=axis)
+            img = img / np.diff(np.append(start, m)).reshape(shape)
+    #endregion ----------------------------------------------------> Reduce
+
+    return (img, (c0, c0+img.shape[1]*fC, r0, r0+img.shape[0]*fR))
+#---
 #endregion ----------------------------------------------------------> Methods
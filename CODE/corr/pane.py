@@ -69,6 +69,7 @@ class CorrA(cPane.BaseConfPanel):
                         'dfIm': Name of file with imputed data.
                     }
                     'R' : Name of result file
+                    'T' : Wall time, CPU time and peak memory of each step.
                 }
             }
         }
@@ -98,8 +99,8 @@ class CorrA(cPane.BaseConfPanel):
     cTitlePD        = 'Calculating Correlation Coefficients'
     cGaugePD        = 20
     cTTHelp         = mConfig.core.ttBtnHelp.format(cURL)
-    rMainData       = '{}_{}-CorrelationCoefficients-Data.txt'
     rAnalysisMethod = corrMethod.CorrA
+    rStepDictMethod = staticmethod(corrMethod.StepDict)
     #endregion --------------------------------------------------> Class Setup
 
     #region --------------------------------------------------> Instance setup
@@ -310,30 +311,6 @@ class CorrA(cPane.BaseConfPanel):
 
         return True
     #---
-
-    def WriteOutput(self) -> bool:
-        """Write output.
-
-            Returns
-            -------
-            bool
-        """
-        #region --------------------------------------------------> Data Steps
-        stepDict = self.SetStepDictDP()
-        stepDict['Files'] = {
-            mConfig.core.fnInitial.format(self.rDate, '01') : self.dfI,
-            mConfig.core.fnFloat.format(self.rDate,   '02') : self.dfF,
-            mConfig.core.fnMinRep.format(self.rDate,  '03') : self.dfMR,
-            mConfig.core.fnTrans.format(self.rDate,   '04') : self.dfT,
-            mConfig.core.fnNorm.format(self.rDate,    '05') : self.dfN,
-            mConfig.core.fnImp.format(self.rDate,     '06') : self.dfIm,
-            self.rMainData.format(self.rDate,         '07') : self.dfR,
-        }
-        stepDict['R'] = self.rMainData.format(self.rDate, '07')
-        #endregion -----------------------------------------------> Data Steps
-
-        return self.WriteOutputData(stepDict)
-    #---
     #endregion ------------------------------------------------> Run Analysis
 #---
 #endregion ----------------------------------------------------------> Classes
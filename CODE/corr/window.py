@@ -18,6 +18,7 @@
 from typing import Optional, TYPE_CHECKING
 
 import matplotlib as mpl
+import numpy      as np
 
 from config.config import config as mConfig
 from core import method as cMethod
@@ -59,10 +60,15 @@ class ResCorrA(cWindow.BaseWindowResultOnePlot):
             List of dates available for plotting.
         rDateC: one of rDate
             Current selected date
+        rImage: mpl.image.AxesImage or None
+            Heatmap in the plot.
         rNorm: mpl.colors.Normalize
             Color for the color bar
         rObj: parent.obj
             Pointer to the UMSAPFile object in parent.
+        rRGBA: dict[str, np.ndarray]
+            Colors of all coefficients for each shown date - ID. Selecting
+            columns or zooming reuses these colors.
         rSelColIdx: list[int]
             Selected columns index in self.rData[self.rDateC]['DF'].
         rSelColName: list[int]
@@ -107,6 +113,8 @@ class ResCorrA(cWindow.BaseWindowResultOnePlot):
         self.rSelColNum:list[int]  = []                                         # Selected Column numbers
         self.rSelColName:list[str] = []                                         # Selected Column names
         self.rSelColIdx:list[int]  = []                                         # Selected 0 based list of column numbers
+        self.rRGBA:dict[str, np.ndarray] = {}                                   # Colors of the coefficients
+        self.rImage:Optional[mpl.image.AxesImage] = None                        # Heatmap
         #------------------------------>
         self.cParent = parent
         self.cTitle  = f"{parent.cTitle} - {self.cSection} - {self.rDateC}"
@@ -278,6 +286,7 @@ class ResCorrA(cWindow.BaseWindowResultOnePlot):
         return True
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         tDate:str          = '',
@@ -331,16 +340,24 @@ class ResCorrA(cWindow.BaseWindowResultOnePlot):
 
         #region --------------------------------------------------------> Plot
         self.rDataPlot = self.rDataC.df.iloc[self.rSelColIdx,self.rSelColIdx]
+        #------------------------------> Colors are set once for each date
+        if (rgba := self.rRGBA.get(self.rDateC)) is None:
+            rgba = self.rCmap(
+                self.rNorm(np.ma.masked_invalid(self.rDataC.df.to_numpy())))
+            self.rRGBA[self.rDateC] = rgba
         #------------------------------>
-        self.wPlot[0].rAxes.pcolormesh(
-            self.rDataPlot,
-            cmap        = self.rCmap,
-            vmin        = -1,
-            vmax        = 1,
-            antialiased = True,
-            edgecolors  = 'k',
-            lw          = 0.005,
+        img, extent = corrMethod.HeatmapImage(
+            rgba, self.rSelColIdx, self.GetAxisLim(), self.GetAxisPixel())
+        self.rImage = self.wPlot[0].rAxes.imshow(
+            img,
+            extent        = extent,
+            origin        = 'lower',
+            aspect        = 'auto',
+            interpolation = 'nearest',
         )
+        #------------------------------> Detail follows the zoom level
+        self.wPlot[0].rAxes.callbacks.connect('xlim_changed', self.OnAxisLim)
+        self.wPlot[0].rAxes.callbacks.connect('ylim_changed', self.OnAxisLim)
         #------------------------------>
         if self.rBar:
             self.wPlot[0].rFigure.colorbar(
@@ -358,6 +375,63 @@ class ResCorrA(cWindow.BaseWindowResultOnePlot):
         return True
     #---
 
+    def GetAxisLim(self) -> tuple[float, float, float, float]:
+        """Visible region of the plot.
+
+            Returns
+            -------
+            tuple[float, float, float, float]
+                xmin, xmax, ymin, ymax
+        """
+        xLim = self.wPlot[0].rAxes.get_xlim()
+        yLim = self.wPlot[0].rAxes.get_ylim()
+        #------------------------------>
+        return (min(xLim), max(xLim), min(yLim), max(yLim))
+    #---
+
+    def GetAxisPixel(self) -> tuple[int, int]:
+        """Size of the plot area in pixels.
+
+            Returns
+            -------
+            tuple[int, int]
+                Width and height.
+        """
+        bbox = self.wPlot[0].rAxes.get_window_extent()
+        #------------------------------>
+        return (int(bbox.width), int(bbox.height))
+    #---
+
+    def OnAxisLim(self, ax) -> bool:                                            # pylint: disable=unused-argument
+        """Show the visible cells in the heatmap after a zoom.
+
+            Parameters
+            ----------
+            ax: mpl.axes.Axes
+                Axes with the new limits.
+
+            Returns
+            -------
+            bool
+        """
+        #region ------------------------------------------------------> Image
+        if self.rImage is None:
+            return False
+        #------------------------------>
+        img, extent = corrMethod.HeatmapImage(
+            self.rRGBA[self.rDateC],
+            self.rSelColIdx,
+            self.GetAxisLim(),
+            self.GetAxisPixel(),
+        )
+        self.rImage.set_data(img)
+        self.rImage.set_extent(extent)
+        self.wPlot[0].rCanvas.draw_idle()
+        #endregion ---------------------------------------------------> Image
+
+        return True
+    #---
+
     def SetAxis(self) -> bool:
         """General details of the plot area.
 
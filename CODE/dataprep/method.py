@@ -16,13 +16,16 @@
 
 #region -------------------------------------------------------------> Imports
 from dataclasses import dataclass, field
-from typing      import Optional, Union, Literal
+from typing      import Callable, Optional, Union, Literal
 
 import numpy  as np
 import pandas as pd
+from scipy import stats
 
 from config.config import config as mConfig
-from core import method as cMethod
+from core import file      as cFile
+from core import method    as cMethod
+from core import statistic as cStatistic
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -40,7 +43,7 @@ class UserData(cMethod.BaseUserData):
         ['iFileN', 'ID', 'cero', 'tran', 'norm', 'imp', 'shift',
          'width', 'labelA', 'resCtrl', 'ocResCtrlFlat', 'ocColumn',
          'dfColumnR', 'dfColumnF', 'dfResCtrl', 'dfResCtrlFlat',
-         'minRep', 'minRepList',
+         'minRep', 'minRepList', 'float32',
         ])
     longestKey:int = 20                                                         # Length of the longest Key in dI
     #endregion ------------------------------------------------------> Options
@@ -65,6 +68,21 @@ class DataAnalysis():
     #region --------------------------------------------------------> Options
     dp:DataSteps                                                                # Results as dataframe
     numColList:list[int]                                                        # Column numbers
+    repVal:list[int] = field(default_factory=list)                              # Values replaced with NA in dfF, missing in older versions
+    #endregion -----------------------------------------------------> Options
+#---
+
+
+@dataclass
+class HistData():
+    """Data class to hold the histogram of a column in a Data Preparation step.
+    """
+    #region --------------------------------------------------------> Options
+    edges:np.ndarray                                                            # Bin edges
+    counts:np.ndarray                                                           # Values per bin
+    countsI:Optional[np.ndarray] = None                                         # Imputed values per bin
+    pdfX:Optional[np.ndarray]    = None                                         # Gaussian KDE
+    pdfY:Optional[np.ndarray]    = None
     #endregion -----------------------------------------------------> Options
 #endregion ----------------------------------------------------------> Classes
 
@@ -73,9 +91,13 @@ class DataAnalysis():
 #region ----------------------------------------------------> Data Preparation
 def RunDataPreparation(                                                            # pylint: disable=dangerous-default-value
     *args,                                                                      # pylint: disable=unused-argument
-    df:pd.DataFrame          = pd.DataFrame(),
-    rDO:cMethod.BaseUserData = cMethod.BaseUserData(),
-    resetIndex: bool         = True,
+    df:pd.DataFrame                       = pd.DataFrame(),
+    rDO:cMethod.BaseUserData              = cMethod.BaseUserData(),
+    resetIndex: bool                      = True,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform the data preparation steps.
@@ -90,6 +112,16 @@ def RunDataPreparation(
             rDO dictionary from the PrepareRun step of the analysis.
         resetIndex: bool
             Reset index of dfS (True) or not (False). Default is True.
+        cancel: cMethod.CancelToken or None
+            Checked between the data preparation steps.
+        checkpoint: cFile.Checkpoint or None
+            Load or store the output of the data preparation ('DP').
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation steps.
+        spill: Callable or None
+            Called with the output of the finished steps and the keys of the
+            pd.DataFrames still needed, e.g. BaseConfPanel.SpillData. It
+            returns the output with the pd.DataFrames written to disk.
         **kwargs:
             Ignore here but needed for  compatibility.
 
@@ -106,7 +138,8 @@ def RunDataPreparation(
                         'dfIm': pd.DataFrame,
                         'dfTP': pd.DataFrame,
                         'dfE' : pd.DataFrame,
-                        'dfS' : pd.DataFrame
+                        'dfS' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -120,20 +153,30 @@ def RunDataPreparation(
     """
     # Test in test.unit.data.test_method.DataPreparation
     #region -------------------------------------------------------->
+    timer = timer if timer is not None else cMethod.StepTimer(memory=False)
+    timer.Begin('Data preparation')
+    #------------------------------>
     try:
         return DataPreparation(
-            *args, df=df, rDO=rDO, resetIndex=resetIndex, **kwargs)
+            *args, df=df, rDO=rDO, resetIndex=resetIndex, cancel=cancel,
+            checkpoint=checkpoint, timer=timer, spill=spill, **kwargs)
     except Exception as e:
         return ({}, str(e), e)
+    finally:
+        timer.End('Data preparation')
     #endregion ----------------------------------------------------->
 #---
 
 
 def DataPreparation(                                                            # pylint: disable=dangerous-default-value
     *args,                                                                      # pylint: disable=unused-argument
-    df:pd.DataFrame          = pd.DataFrame(),
-    rDO:cMethod.BaseUserData = cMethod.BaseUserData(),
-    resetIndex: bool         = True,
+    df:pd.DataFrame                       = pd.DataFrame(),
+    rDO:cMethod.BaseUserData              = cMethod.BaseUserData(),
+    resetIndex: bool                      = True,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform the data preparation steps.
@@ -148,6 +191,16 @@ def DataPreparation(
             rDO dictionary from the PrepareRun step of the analysis.
         resetIndex: bool
             Reset index of dfS (True) or not (False). Default is True.
+        cancel: cMethod.CancelToken or None
+            Checked between the data preparation steps.
+        checkpoint: cFile.Checkpoint or None
+            Load or store the output of the data preparation ('DP').
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation steps.
+        spill: Callable or None
+            Called with the output of the finished steps and the keys of the
+            pd.DataFrames still needed, e.g. BaseConfPanel.SpillData. It
+            returns the output with the pd.DataFrames written to disk.
         **kwargs:
             Ignore here but needed for  compatibility.
 
@@ -164,7 +217,8 @@ def DataPreparation(
                         'dfIm': pd.DataFrame,
                         'dfTP': pd.DataFrame,
                         'dfE' : pd.DataFrame,
-                        'dfS' : pd.DataFrame
+                        'dfS' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -176,51 +230,96 @@ def DataPreparation(
         *args are ignored. They are needed for compatibility.
         *kwargs are ignored. They are needed for compatibility.
     """
+    #region --------------------------------------------------> Checkpoint
+    if checkpoint is not None and (dictO := checkpoint.Load('DP')) is not None:
+        return (dictO, '', None)
+    #------------------------------>
+    cancel = cancel if cancel is not None else cMethod.CancelToken()
+    timer  = timer if timer is not None else cMethod.StepTimer(memory=False)
+    spill  = spill if spill is not None else lambda x, keep=(): x
+    #endregion -----------------------------------------------> Checkpoint
+
     #region ----------------------------------------> Run Data Preparation
+    #------------------------------> Only dictO holds the steps, so spilled
+    # steps are released from memory.
+    dictO = {}
     #------------------------------> dfI & dfF
-    dfI, dfF = DataPrep_Float(
+    timer.Begin('Float')
+    dictO['dfI'], dictO['dfF'], repVal = DataPrep_Float(
         df,
         rDO.cero,
         rDO.ocColumn,
         rDO.dfColumnR,
         rDO.dfColumnF,
+        dtype  = 'float32' if rDO.float32 else 'float',
+        colCat = [rDO.dfSeq, rDO.dfTargetProt, rDO.dfGene],
     )
+    dictO = spill(dictO, keep=('dfF',))
+    timer.End('Float')
+    cancel.Check()
     #------------------------------> Minimum Number of Valid Replicates
-    dfMR = DataPrep_MinRep(dfF, rDO.dfResCtrl, rDO.minRepList)
+    timer.Begin('Minimum replicates')
+    dictO['dfMR'] = DataPrep_MinRep(
+        dictO['dfF'], rDO.dfResCtrl, rDO.minRepList)
+    dictO = spill(dictO, keep=('dfMR',))
+    timer.End('Minimum replicates')
+    cancel.Check()
     #------------------------------> Transformation
-    dfT = DataTransformation(
-        dfMR,
+    timer.Begin('Transformation')
+    dictO['dfT'] = DataTransformation(
+        dictO['dfMR'],
         rDO.dfResCtrlFlat,
         method = rDO.tran,
         rep    = np.nan if rDO.cero else 0,
     )
+    dictO = spill(dictO, keep=('dfT',))
+    timer.End('Transformation')
+    cancel.Check()
     #------------------------------> Normalization
-    dfN = DataNormalization(dfT, rDO.dfResCtrlFlat, method=rDO.norm)
+    timer.Begin('Normalization')
+    dictO['dfN'] = DataNormalization(
+        dictO['dfT'], rDO.dfResCtrlFlat, method=rDO.norm)
+    dictO = spill(dictO, keep=('dfN',))
+    timer.End('Normalization')
+    cancel.Check()
     #------------------------------> Imputation
-    dfIm = DataImputation(
-        dfN,
+    timer.Begin('Imputation')
+    dictO['dfIm'] = DataImputation(
+        dictO['dfN'],
         rDO.dfResCtrlFlat,
         method = rDO.imp,
         shift  = rDO.shift,
         width  = rDO.width,
     )
+    dictO = spill(dictO, keep=('dfIm',))
+    timer.End('Imputation')
+    cancel.Check()
     #------------------------------> Target Protein
+    timer.Begin('Filters')
+    dfIm = dictO['dfIm']
+    mask = np.ones(dfIm.shape[0], dtype=bool)
     if rDO.targetProt:
-        dfTP = cMethod.DFFilterByColS(
+        mask &= cMethod.DFMaskByColS(
             dfIm, rDO.dfTargetProt, rDO.targetProt, 'e')
+        dfTP = dfIm.loc[mask]
     else:
-        dfTP = dfIm.copy()
+        dfTP = dfIm
     #------------------------------> Exclude
     if rDO.dfExcludeR:
-        dfE = cMethod.DFExclude(dfTP, rDO.dfExcludeR)
+        mask &= cMethod.DFMaskExclude(dfIm, rDO.dfExcludeR)
+        dfE = dfIm.loc[mask]
     else:
-        dfE = dfTP.copy()
+        dfE = dfTP
     #------------------------------> Score
     if rDO.dfScore > -1:
-        dfS = cMethod.DFFilterByColN(
-            dfE, [rDO.dfScore], rDO.scoreVal, 'ge')
+        mask &= cMethod.DFMaskByColN(
+            dfIm, [rDO.dfScore], rDO.scoreVal, 'ge')
+        dfS = dfIm.loc[mask]
     else:
-        dfS = dfE.copy()
+        dfS = dfE
+    #------------------------------> Drop categories of filtered rows
+    dfS = cMethod.DFCategory(dfS, [rDO.dfSeq, rDO.dfTargetProt, rDO.dfGene])
+    timer.End('Filters')
     #------------------------------> Check not Empty
     if dfS.empty:
         return ({}, mConfig.core.mNoDataLeft, None)
@@ -232,28 +331,76 @@ def DataPreparation(
     #endregion ----------------------------------------------> Reset index
 
     #region --------------------------------------------------->
-    dictO = {
-        'dfI' : dfI,
-        'dfF' : dfF,
-        'dfMR': dfMR,
-        'dfT' : dfT,
-        'dfN' : dfN,
-        'dfIm': dfIm,
-        'dfTP': dfTP,
-        'dfE' : dfE,
-        'dfS' : dfS,
-    }
+    dictO['dfTP']    = dfTP
+    dictO['dfE']     = dfE
+    dictO['dfS']     = dfS
+    dictO['rRepVal'] = repVal
+    dictO = spill(dictO, keep=('dfIm', 'dfS'))
+    #------------------------------>
+    if checkpoint is not None:
+        checkpoint.Save('DP', dictO)
+    #------------------------------>
     return (dictO, '', None)
     #endregion ------------------------------------------------>
 #---
 
 
-def DataPrep_Float(
+def _DataPrep_Numeric(
+    s:pd.Series,
+    cero:bool,
+    dtype:str = 'float',
+    ) -> tuple[np.ndarray, int]:
+    """Parse a column to float replacing '' and, optionally, 0 with np.nan.
+
+        Parameters
+        ----------
+        s: pd.Series
+            Column with the data.
+        cero: bool
+            Replace (True) or keep (False) cero values.
+        dtype: str
+            Float type of the output, 'float' or 'float32'.
+
+        Returns
+        -------
+        tuple[np.ndarray, int]
+            Parsed values and number of values replaced with np.nan.
+
+        Raise
+        -----
+        ValueError:
+            - When s contains values that cannot be converted to float.
+    """
+    # Test in test.unit.data.test_method.Test_DataPrep_Float
+    #region ----------------------------------------------------------> Parse
+    v = s.to_numpy()
+    n = 0
+    #------------------------------> Only object columns may hold ''
+    if v.dtype == object:
+        empty = v == ''
+        n = int(empty.sum())
+        v = pd.to_numeric(np.where(empty, np.nan, v))
+    #------------------------------>
+    v = v.astype(dtype)
+    #------------------------------> Cero
+    if cero:
+        zero = v == 0
+        n += int(zero.sum())
+        v[zero] = np.nan
+    #endregion -------------------------------------------------------> Parse
+
+    return (v, n)
+#---
+
+
+def DataPrep_Float(                                                             # pylint: disable=dangerous-default-value
     df:pd.DataFrame,
     cero:bool,
     col:list[int],
     colCero:list[int],
-    colFloat:list[int]
+    colFloat:list[int],
+    dtype:str        = 'float',
+    colCat:list[int] = [],
     ) -> list:
     """Replace cero and missing values in df and convert to float the
         appropriate columns.
@@ -270,25 +417,60 @@ def DataPrep_Float(
             Columns in which '' and/or 0 will be replaced with np.nan.
         colFloat: list[int]
             Columns for which the float type will be enforced.
+        dtype: str
+            Float type for the intensities in colCero, 'float' or 'float32'.
+            Other columns in colFloat are always float.
+        colCat: list[int]
+            Identifier columns, e.g. Sequence, Gene or Protein, encoded as
+            categorical columns in dfF. Negative values are ignored.
 
         Returns
         -------
         list
-            [dfI, dfF]
+            [dfI, dfF, repVal]. repVal holds the number of values replaced
+            with np.nan in each column of dfF.
+
+        Notes
+        -----
+        Columns in colCero and colFloat, i.e. the intensities, are parsed to
+        float and replaced in a single pass over the column. Only these
+        columns are copied from dfI.
+
+        With float32 intensities the results of the analyses match the float64
+        results within a relative tolerance of 1e-4 (absolute 1e-6), see
+        test_float32 in the tests of protprof.method and tarprot.method.
     """
     # Test in test.unit.data.test_method.Test_DataPrep_Float
     #region -------------------------------------------------------->
-    dfI = df.iloc[:,col]
-    #------------------------------>
-    if cero:
-        dfF = cMethod.DFReplace(dfI, [0, ''], np.nan, sel=colCero)
-    else:
-        dfF = cMethod.DFReplace(dfI, [''], np.nan, sel=colCero)
-    #------------------------------>
-    dfF.iloc[:,colFloat] = dfF.iloc[:,colFloat].astype('float')                 # type: ignore
+    dfI    = df.iloc[:,col]
+    dfF    = dfI.copy(deep=False)
+    repVal = [0]*dfF.shape[1]
+    #------------------------------> Intensities
+    for x in colCero:
+        if x in colFloat:
+            v, repVal[x] = _DataPrep_Numeric(dfI.iloc[:,x], cero, dtype=dtype)
+        else:
+            v = dfI.iloc[:,x].replace([0, ''] if cero else [''], np.nan)
+            repVal[x] = int(v.isna().sum() - dfI.iloc[:,x].isna().sum())
+        dfF.isetitem(x, v)
+    #------------------------------> Other float columns
+    for x in colFloat:
+        if x not in colCero:
+            dfF.isetitem(x, dfF.iloc[:,x].astype('float'))                      # type: ignore
+    #------------------------------> float32 for float columns not parsed yet
+    if dtype != 'float':
+        sel  = colCero if colCero else range(dfF.shape[1])
+        colD = {
+            dfF.columns[x]: dtype for x in sel
+            if dfF.dtypes.iloc[x].kind == 'f' and dfF.dtypes.iloc[x] != dtype
+        }
+        dfF = dfF.astype(colD) if colD else dfF
+    #------------------------------> Identifiers
+    if colCat:
+        dfF = cMethod.DFCategory(dfF, colCat)
     #endregion ----------------------------------------------------->
 
-    return [dfI, dfF]
+    return [dfI, dfF, repVal]
 #---
 
 
@@ -340,6 +522,74 @@ def DataPrep_MinRep(
 #endregion -------------------------------------------------> Data Preparation
 
 
+#region --------------------------------------------------------------> Output
+def StepDictDP(tDate:str) -> dict:
+    """Data Preparation part of the files and keys written in the output.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+
+        Returns
+        -------
+        dict
+    """
+    # No test
+    return {
+        'DP': {
+            mConfig.core.ltDPKeys[0] : mConfig.core.fnFloat.format(tDate, '02'),
+            mConfig.core.ltDPKeys[1] : mConfig.core.fnMinRep.format(tDate,'03'),
+            mConfig.core.ltDPKeys[2] : mConfig.core.fnTrans.format(tDate, '04'),
+            mConfig.core.ltDPKeys[3] : mConfig.core.fnNorm.format(tDate,  '05'),
+            mConfig.core.ltDPKeys[4] : mConfig.core.fnImp.format(tDate,   '06'),
+        },
+    }
+#---
+
+
+def StepDict(
+    tDate:str,
+    rDO:cMethod.BaseUserData,                                                   # pylint: disable=unused-argument
+    dfDict:dict,
+    ) -> dict:
+    """Files and keys written in the output of a Data Preparation.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+        rDO: cMethod.BaseUserData
+            User input.
+        dfDict: dict
+            Output of the steps of the analysis, see mConfig.core.ltDFKeys.
+
+        Returns
+        -------
+        dict
+            {
+                'DP'   : dict,
+                'Files': {file name: pd.DataFrame},
+            }
+    """
+    # No test
+    #region ---------------------------------------------------> Step Dict
+    stepDict = StepDictDP(tDate)
+    stepDict['Files'] = {
+        mConfig.core.fnInitial.format(tDate, '01') : dfDict['dfI'],
+        mConfig.core.fnFloat.format(tDate,   '02') : dfDict['dfF'],
+        mConfig.core.fnMinRep.format(tDate,  '03') : dfDict['dfMR'],
+        mConfig.core.fnTrans.format(tDate,   '04') : dfDict['dfT'],
+        mConfig.core.fnNorm.format(tDate,    '05') : dfDict['dfN'],
+        mConfig.core.fnImp.format(tDate,     '06') : dfDict['dfIm'],
+    }
+    #endregion ------------------------------------------------> Step Dict
+
+    return stepDict
+#---
+#endregion -----------------------------------------------------------> Output
+
+
 #region -------------------------------------------------> Data Transformation
 def _DataTransformation_None(
     df:pd.DataFrame,                                                            # pylint: disable=unused-argument
@@ -618,7 +868,7 @@ def _DataImputation_NormalDistribution(
         tIDX   = np.where(df[c].isna())[0]
         #------------------------------>
         df.loc[tIDX, c] = np.random.default_rng().normal(                       # type: ignore
-            median-std*shift, std*width, len(tIDX))                             # type: ignore
+            median-std*shift, std*width, len(tIDX)).astype(df[c].dtype)         # type: ignore
     #endregion -------------------------------> Normal Distribution imputation
 
     return df
@@ -665,4 +915,149 @@ def DataImputation(
     #endregion ---------------------------------------------------> Imputation
 #---
 #endregion --------------------------------------------------> Data Imputation
+
+
+#region ----------------------------------------------------------> Histogram
+def Histogram(
+    df:pd.DataFrame,
+    mask:Optional[pd.DataFrame] = None,
+    ) -> list[HistData]:
+    """Calculate the histogram of all columns in df in one pass.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Values. Non finite values are ignored.
+        mask: pd.DataFrame or None
+            Boolean dataframe with the same shape as df. True values in df are
+            also counted in HistData.countsI, e.g. imputed values.
+
+        Returns
+        -------
+        list[HistData]
+            One element per column.
+
+        Notes
+        -----
+        The number of bins is calculated with the Freedman – Diaconis rule as
+        in core.statistic.HistBin and the bins are those of np.histogram.
+    """
+    # Test in test.unit.dataprep.test_method.Test_Histogram
+    #region ---------------------------------------------------> Variables
+    x    = df.to_numpy(dtype=np.float64)
+    ok   = np.isfinite(x)
+    xN   = np.where(ok, x, np.nan)
+    nCol = x.shape[1]
+    #endregion ------------------------------------------------> Variables
+
+    #region ------------------------------------------------------------> Bins
+    with np.errstate(all='ignore'):
+        n      = ok.sum(axis=0)
+        q25, q75 = np.nanpercentile(xN, [25, 75], axis=0)
+        tMin   = np.nanmin(np.where(ok, x, np.inf), axis=0)
+        tMax   = np.nanmax(np.where(ok, x, -np.inf), axis=0)
+        width  = 2 * (q75 - q25) * n.astype(np.float64) ** (-1/3)
+        nBin   = np.round((tMax - tMin) / width)
+    nBin = np.where(np.isfinite(nBin) & (nBin > 0), nBin, 1).astype(np.int64)
+    #------------------------------> Empty or constant columns
+    tMin = np.where(n > 0, tMin, 0.0)
+    tMax = np.where(n > 0, tMax, 1.0)
+    same = tMin == tMax
+    tMin = np.where(same, tMin - 0.5, tMin)
+    tMax = np.where(same, tMax + 0.5, tMax)
+    #------------------------------> Edges of all columns in one array
+    start = np.concatenate(([0], np.cumsum(nBin + 1)[:-1]))
+    colE  = np.repeat(np.arange(nCol), nBin + 1)
+    pos   = np.arange(colE.size) - start[colE]
+    edges = tMin[colE] + pos * ((tMax - tMin) / nBin)[colE]
+    edges[start + nBin] = tMax
+    #endregion ---------------------------------------------------------> Bins
+
+    #region ----------------------------------------------------------> Counts
+    row, col = np.nonzero(ok)
+    v   = x[row, col]
+    idx = ((v - tMin[col]) * (nBin / (tMax - tMin))[col]).astype(np.int64)
+    idx = np.clip(idx, 0, nBin[col] - 1)
+    #------------------------------> Same correction as np.histogram
+    gIdx = start[col] + idx
+    dec  = v < edges[gIdx]
+    idx[dec] -= 1
+    gIdx = start[col] + idx
+    inc  = (v >= edges[gIdx + 1]) & (idx != nBin[col] - 1)
+    idx[inc] += 1
+    #------------------------------>
+    offset = np.concatenate(([0], np.cumsum(nBin)[:-1]))
+    bIdx   = offset[col] + idx
+    counts = np.bincount(bIdx, minlength=nBin.sum())
+    if mask is not None:
+        m       = mask.to_numpy(dtype=bool)[row, col]
+        countsI = np.bincount(bIdx[m], minlength=nBin.sum())
+    #endregion -------------------------------------------------------> Counts
+
+    return [
+        HistData(
+            edges   = edges[start[k]:start[k]+nBin[k]+1],
+            counts  = counts[offset[k]:offset[k]+nBin[k]],
+            countsI = (
+                countsI[offset[k]:offset[k]+nBin[k]]
+                if mask is not None else None),
+        ) for k in range(nCol)
+    ]
+#---
+
+
+def HistogramSteps(
+    dp:DataSteps,
+    col:Optional[list[int]] = None,
+    pdf:int                 = 300,
+    ) -> dict[str, list[HistData]]:
+    """Calculate the histograms of all the Data Preparation steps.
+
+        Parameters
+        ----------
+        dp: DataSteps
+            Data Preparation steps.
+        col: list[int] or None
+            Only these columns. None means all columns.
+        pdf: int
+            Number of points in the Gaussian KDE. The KDE is not calculated for
+            the Floated data.
+
+        Returns
+        -------
+        dict[str, list[HistData]]
+            Keys are the attribute names in DataSteps, dfMP replaces dfF if
+            present.
+    """
+    # No test
+    #region ---------------------------------------------------> Histograms
+    col  = list(range(dp.dfF.shape[1])) if col is None else col
+    dfI  = (dp.dfMP if dp.dfMP is not None else dp.dfF).iloc[:,col]
+    dfS  = {
+        'dfF' : dfI,
+        'dfT' : dp.dfT.iloc[:,col],
+        'dfN' : dp.dfN.iloc[:,col],
+        'dfIm': dp.dfIm.iloc[:,col],
+    }
+    dOut = {k:Histogram(v) for k,v in dfS.items() if k != 'dfIm'}
+    dOut['dfIm'] = Histogram(dfS['dfIm'], mask=dfI.isna())
+    #endregion ------------------------------------------------> Histograms
+
+    #region ---------------------------------------------------------> PDF
+    for k in ['dfT', 'dfN', 'dfIm']:
+        for c,h in enumerate(dOut[k]):
+            x = dfS[k].iloc[:,c].to_numpy(dtype=np.float64)
+            x = x[np.isfinite(x)]
+            try:
+                h.pdfX = np.linspace(*cStatistic.DataRange(
+                    h.edges, margin=mConfig.core.MatPlotMargin), pdf)
+                h.pdfY = stats.gaussian_kde(x).pdf(h.pdfX)
+            except (ValueError, np.linalg.LinAlgError):
+                h.pdfX = None
+                h.pdfY = None
+    #endregion ------------------------------------------------------> PDF
+
+    return dOut
+#---
+#endregion -------------------------------------------------------> Histogram
 #endregion ----------------------------------------------------------> Methods
@@ -65,6 +65,7 @@ class DataPrep(cPane.BaseConfPanel):
                         'dfN' : Name of file with normalized data.
                         'dfIm': Name of file with imputed data.
                     },
+                    'T' : Wall time, CPU time and peak memory of each step.
                 }
             }
         }
@@ -86,6 +87,7 @@ class DataPrep(cPane.BaseConfPanel):
     cTitlePD        = f"Running {mConfig.data.tUtil} Analysis"
     cGaugePD        = 19
     rAnalysisMethod = dataMethod.RunDataPreparation
+    rStepDictMethod = staticmethod(dataMethod.StepDict)
     #endregion --------------------------------------------------> Class setup
 
     #region --------------------------------------------------> Instance setup
@@ -262,28 +264,6 @@ class DataPrep(cPane.BaseConfPanel):
 
         return True
     #---
-
-    def WriteOutput(self) -> bool:
-        """Write output.
-
-            Returns
-            -------
-            bool
-        """
-        #region --------------------------------------------------> Data Steps
-        stepDict = self.SetStepDictDP()
-        stepDict['Files'] = {
-            mConfig.core.fnInitial.format(self.rDate, '01') : self.dfI,
-            mConfig.core.fnFloat.format(self.rDate,   '02') : self.dfF,
-            mConfig.core.fnMinRep.format(self.rDate,  '03') : self.dfMR,
-            mConfig.core.fnTrans.format(self.rDate,   '04') : self.dfT,
-            mConfig.core.fnNorm.format(self.rDate,    '05') : self.dfN,
-            mConfig.core.fnImp.format(self.rDate,     '06') : self.dfIm,
-        }
-        #endregion -----------------------------------------------> Data Steps
-
-        return self.WriteOutputData(stepDict)
-    #---
     #endregion ------------------------------------------------> Run methods
 #---
 #endregion ----------------------------------------------------------> Classes
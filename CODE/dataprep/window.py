@@ -15,6 +15,7 @@
 
 
 #region -------------------------------------------------------------> Imports
+import _thread
 import shutil
 from pathlib import Path
 from typing  import Optional, TYPE_CHECKING
@@ -22,7 +23,6 @@ from typing  import Optional, TYPE_CHECKING
 import pandas as pd
 import numpy as np
 from pubsub import pub
-from scipy  import stats
 
 import wx
 
@@ -128,6 +128,7 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
     cLDFData = ['Floated', 'Valid Replicates', 'Transformed', 'Normalized', 'Imputed']
     cLdfCol  = [
         'Data', 'N', 'NaN', 'Mean', 'Median', 'SD', 'Kurtosis', 'Skewness']
+    cLRepVal = 'Values replaced with NaN'
     #endregion --------------------------------------------------> Class setup
 
     #region --------------------------------------------------> Instance setup
@@ -154,6 +155,8 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
         self.rCBar  = mConfig.data.cBar
         self.rCBarI = mConfig.data.cBarI
         self.rCPDF  = mConfig.data.cPDF
+        self.rHist:dict[str, dict[str, list[dataMethod.HistData]]] = {}         # Histograms by date
+        self.rHistPending:set[str] = set()                                      # Dates with SetHist running
         #------------------------------>
         self.ReportPlotDataError()
         #------------------------------>
@@ -381,32 +384,26 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
             bool
         """
         #region ---------------------------------------------------> Variables
-        if self.rDataPlot.dfMP is not None:
-            x     = self.rDataPlot.dfMP.iloc[:,col]
-            title = 'Valid Replicates'
-        else:
-            x     = self.rDataPlot.dfF.iloc[:,col]
-            title = 'Floated'
-        x = x[np.isfinite(x)]
-        #------------------------------>
-        nBin = cStatistic.HistBin(x)[0]
+        h     = self.GetHist('dfF', col)
+        title = (
+            'Valid Replicates' if self.rDataPlot.dfMP is not None else 'Floated')
         #endregion ------------------------------------------------> Variables
 
-        #region --------------------------------------------------------> Plot
-        #------------------------------>
+        #region --------------------------------------------------------> Draw
         self.wPlot.dPlot['Init'].rAxes.clear()
         #------------------------------> title
         self.wPlot.dPlot['Init'].rAxes.set_title(title)
         #------------------------------>
-        a = self.wPlot.dPlot['Init'].rAxes.hist(
-            x, bins=nBin, density=False, color=self.rCBar)
+        self.wPlot.dPlot['Init'].rAxes.bar(
+            h.edges[:-1], h.counts, width=np.diff(h.edges), align='edge',
+            color=self.rCBar)
         #------------------------------>
         self.wPlot.dPlot['Init'].rAxes.set_xlim(*cStatistic.DataRange(
-            a[1], margin=mConfig.core.MatPlotMargin))
+            h.edges, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Init'].ZoomResetSetValues()
         #------------------------------>
         self.wPlot.dPlot['Init'].rCanvas.draw()
-        #endregion -----------------------------------------------------> Plot
+        #endregion -----------------------------------------------------> Draw
 
         return True
     #---
@@ -424,10 +421,7 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
             bool
         """
         #region ---------------------------------------------------> Variables
-        x = self.rDataPlot.dfT.iloc[:,col]
-        x = x[np.isfinite(x)]
-        #------------------------------>
-        nBin = cStatistic.HistBin(x)[0]
+        h = self.GetHist('dfT', col)
         #endregion ------------------------------------------------> Variables
 
         #region --------------------------------------------------------> Draw
@@ -435,21 +429,20 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
         #------------------------------> title
         self.wPlot.dPlot['Transf'].rAxes.set_title("Transformed")
         #------------------------------>
-        a = self.wPlot.dPlot['Transf'].rAxes.hist(
-            x, bins=nBin, density=False, color=self.rCBar)
+        self.wPlot.dPlot['Transf'].rAxes.bar(
+            h.edges[:-1], h.counts, width=np.diff(h.edges), align='edge',
+            color=self.rCBar)
         #------------------------------>
-        xRange = cStatistic.DataRange(
-            a[1], margin=mConfig.core.MatPlotMargin)
-        self.wPlot.dPlot['Transf'].rAxes.set_xlim(*xRange)
+        self.wPlot.dPlot['Transf'].rAxes.set_xlim(*cStatistic.DataRange(
+            h.edges, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Transf'].rAxes.set_ylim(*cStatistic.DataRange(
-            a[0], margin=mConfig.core.MatPlotMargin))
+            h.counts, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Transf'].ZoomResetSetValues()
         #------------------------------>
-        gausX = np.linspace(xRange[0], xRange[1], 300)
-        gausY = stats.gaussian_kde(x)
         self.wPlot.dPlot['Transf'].rAxes2.clear()
-        self.wPlot.dPlot['Transf'].rAxes2.plot(
-            gausX, gausY.pdf(gausX), color=self.rCPDF)
+        if h.pdfY is not None:
+            self.wPlot.dPlot['Transf'].rAxes2.plot(
+                h.pdfX, h.pdfY, color=self.rCPDF)
         self.wPlot.dPlot['Transf'].rAxes2.set_yticks([])
         self.wPlot.dPlot['Transf'].rAxes2.set_yticklabels([])
         #------------------------------>
@@ -472,10 +465,7 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
             bool
         """
         #region ---------------------------------------------------> Variables
-        x = self.rDataPlot.dfN.iloc[:,col]
-        x = x[np.isfinite(x)]
-        #------------------------------>
-        nBin = cStatistic.HistBin(x)[0]
+        h = self.GetHist('dfN', col)
         #endregion ------------------------------------------------> Variables
 
         #region --------------------------------------------------------> Draw
@@ -483,21 +473,20 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
         #------------------------------> title
         self.wPlot.dPlot['Norm'].rAxes.set_title("Normalized")
         #------------------------------>
-        a = self.wPlot.dPlot['Norm'].rAxes.hist(
-            x, bins=nBin, density=False, color=self.rCBar)
+        self.wPlot.dPlot['Norm'].rAxes.bar(
+            h.edges[:-1], h.counts, width=np.diff(h.edges), align='edge',
+            color=self.rCBar)
         #------------------------------>
-        xRange = cStatistic.DataRange(
-            a[1], margin=mConfig.core.MatPlotMargin)
-        self.wPlot.dPlot['Norm'].rAxes.set_xlim(*xRange)
+        self.wPlot.dPlot['Norm'].rAxes.set_xlim(*cStatistic.DataRange(
+            h.edges, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Norm'].rAxes.set_ylim(*cStatistic.DataRange(
-            a[0], margin=mConfig.core.MatPlotMargin))
+            h.counts, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Norm'].ZoomResetSetValues()
         #------------------------------>
-        gausX = np.linspace(xRange[0], xRange[1], 300)
-        gausY = stats.gaussian_kde(x)
         self.wPlot.dPlot['Norm'].rAxes2.clear()
-        self.wPlot.dPlot['Norm'].rAxes2.plot(
-            gausX, gausY.pdf(gausX), color=self.rCPDF)
+        if h.pdfY is not None:
+            self.wPlot.dPlot['Norm'].rAxes2.plot(
+                h.pdfX, h.pdfY, color=self.rCPDF)
         self.wPlot.dPlot['Norm'].rAxes2.set_yticks([])
         self.wPlot.dPlot['Norm'].rAxes2.set_yticklabels([])
         #------------------------------>
@@ -520,10 +509,7 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
             bool
         """
         #region ---------------------------------------------------> Variables
-        x = self.rDataPlot.dfIm.iloc[:,col]
-        x = x[np.isfinite(x)]
-        #------------------------------>
-        nBin = cStatistic.HistBin(x)[0]
+        h = self.GetHist('dfIm', col)
         #endregion ------------------------------------------------> Variables
 
         #region --------------------------------------------------------> Draw
@@ -531,39 +517,82 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
         #------------------------------> title
         self.wPlot.dPlot['Imp'].rAxes.set_title("Imputed")
         #------------------------------>
-        a = self.wPlot.dPlot['Imp'].rAxes.hist(
-            x, bins=nBin, density=False, color=self.rCBar)
+        self.wPlot.dPlot['Imp'].rAxes.bar(
+            h.edges[:-1], h.counts, width=np.diff(h.edges), align='edge',
+            color=self.rCBar)
+        if h.countsI is not None and h.countsI.sum() > 0:
+            self.wPlot.dPlot['Imp'].rAxes.bar(
+                h.edges[:-1], h.countsI, width=np.diff(h.edges), align='edge',
+                color=self.rCBarI)
         #------------------------------>
-        xRange = cStatistic.DataRange(
-            a[1], margin=mConfig.core.MatPlotMargin)
-        self.wPlot.dPlot['Imp'].rAxes.set_xlim(*xRange)
+        self.wPlot.dPlot['Imp'].rAxes.set_xlim(*cStatistic.DataRange(
+            h.edges, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Imp'].rAxes.set_ylim(*cStatistic.DataRange(
-            a[0], margin=mConfig.core.MatPlotMargin))
+            h.counts, margin=mConfig.core.MatPlotMargin))
         self.wPlot.dPlot['Imp'].ZoomResetSetValues()
         #------------------------------>
-        if self.rDataPlot.dfMP is not None:
-            idx = np.where(self.rDataPlot.dfMP.iloc[:,col].isna())[0]
-        else:
-            idx = np.where(self.rDataPlot.dfF.iloc[:,col].isna())[0]
-        if len(idx) > 0:
-            y = self.rDataPlot.dfIm.iloc[idx,col]
-            if y.count() > 0:
-                self.wPlot.dPlot['Imp'].rAxes.hist(
-                    y, bins=nBin, density=False, color=self.rCBarI)
-        #------------------------------>
-        gausX = np.linspace(xRange[0], xRange[1], 300)
-        gausY = stats.gaussian_kde(x)
         self.wPlot.dPlot['Imp'].rAxes2.clear()
-        self.wPlot.dPlot['Imp'].rAxes2.plot(
-            gausX, gausY.pdf(gausX), color=self.rCPDF)
+        if h.pdfY is not None:
+            self.wPlot.dPlot['Imp'].rAxes2.plot(
+                h.pdfX, h.pdfY, color=self.rCPDF)
         self.wPlot.dPlot['Imp'].rAxes2.set_yticks([])
         self.wPlot.dPlot['Imp'].rAxes2.set_yticklabels([])
+        #------------------------------>
         self.wPlot.dPlot['Imp'].rCanvas.draw()
         #endregion -----------------------------------------------------> Draw
 
         return True
     #---
 
+    def GetHist(self, attr:str, col:int) -> dataMethod.HistData:
+        """Get the histogram of a column for the current date.
+
+            Parameters
+            ----------
+            attr: str
+                Data Preparation step, e.g. dfT.
+            col: int
+                Column index.
+
+            Returns
+            -------
+            dataMethod.HistData
+
+            Notes
+            -----
+            Histograms are calculated for the whole date in SetHist. If this is
+            not done yet, only the given column is calculated.
+        """
+        #region ------------------------------------------------------> Cache
+        if (tHist := self.rHist.get(self.rDateC)) is not None:
+            return tHist[attr][col]
+        #endregion ---------------------------------------------------> Cache
+
+        return dataMethod.HistogramSteps(self.rDataPlot, col=[col])[attr][0]
+    #---
+
+    def SetHist(self, tDate:str, dp:dataMethod.DataSteps) -> bool:
+        """Calculate the histograms of all columns for the given date.
+            Runs in a separate thread.
+
+            Parameters
+            ----------
+            tDate: str
+                Date of the analysis.
+            dp: dataMethod.DataSteps
+                Data Preparation steps.
+
+            Returns
+            -------
+            bool
+        """
+        try:
+            self.rHist[tDate] = dataMethod.HistogramSteps(dp)
+        finally:
+            self.rHistPending.discard(tDate)
+        return True
+    #---
+
     def SetText(self, col:int) -> bool:
         """Set the text with the descriptive statistics about the data
             preparation steps.
@@ -614,12 +643,16 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
 
         #region ------------------------------------------------> Add New Text
         self.wText.AppendText(df.to_string(index=False))
+        if col < len(self.rDataC.repVal):
+            self.wText.AppendText(
+                f'\n\n{self.cLRepVal}: {self.rDataC.repVal[col]}')
         self.wText.SetInsertionPoint(0)
         #endregion ---------------------------------------------> Add New Text
 
         return True
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(self, tDate:str='') -> bool:                         # pylint: disable=arguments-differ
         """Update window when a new date is selected.
 
@@ -642,6 +675,14 @@ class ResDataPrep(cWindow.BaseWindowResultListTextNPlot):
             self.cImgName[self.cLNPlot[0]] = '{}-01-Valid-Replicates-{}.{}'
         #endregion ------------------------------------------------> Variables
 
+        #region --------------------------------------------------> Histograms
+        if (self.rDateC not in self.rHist
+            and self.rDateC not in self.rHistPending):
+            self.rHistPending.add(self.rDateC)
+            _thread.start_new_thread(
+                self.SetHist, (self.rDateC, self.rDataPlot))
+        #endregion -----------------------------------------------> Histograms
+
         #region -------------------------------------------------> wx.ListCtrl
         self.FillListCtrl()
         #endregion ----------------------------------------------> wx.ListCtrl
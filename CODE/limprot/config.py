@@ -31,6 +31,8 @@ class Configuration():
     npResControlExp:str = 'LimProt ResControlExp Pane'                          # Name of the ResCtrl Config Pane
     tMod:str            = 'Limited Proteolysis'                                 # Name of the Module
     tTab:str            = 'LimProt'                                             # Title of the Config Tab
+    #------------------------------> File names
+    fnMainData:str = '{}_{}-LimitedProteolysis-Data.txt'                        # Main results file in Steps_Data_Files
     #------------------------------> Label
     lStLane:str         = 'Lanes'                                               # lSt: Label for wx.StaticText
     lStBand:str         = 'Bands'
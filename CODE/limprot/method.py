@@ -16,7 +16,7 @@
 
 #region -------------------------------------------------------------> Imports
 from dataclasses import dataclass, field
-from typing      import Optional
+from typing      import Callable, Optional
 
 from scipy                       import stats
 from statsmodels.stats.multitest import multipletests
@@ -25,6 +25,7 @@ import numpy  as np
 import pandas as pd
 
 from config.config import config as mConfig
+from core     import file      as cFile
 from core     import method    as cMethod
 from core     import statistic as cStatistic
 from dataprep import method    as dataMethod
@@ -47,7 +48,7 @@ class UserData(cMethod.BaseUserData):
          'gamma', 'theta', 'thetaM', 'indSample', 'ocSeq', 'ocTargetProt',
          'ocScore', 'ocColumn', 'resCtrl', 'labelA', 'labelB', 'ctrlName',
          'dfSeq', 'dfTargetProt', 'dfScore', 'dfResCtrl', 'protLength',
-         'protLoc', 'protDelta', 'minRep', 'minRepList',
+         'protLoc', 'protDelta', 'minRep', 'minRepList', 'float32',
         ])
     longestKey:int = 17                                                         # Length of the longest Key in dI
     #endregion ------------------------------------------------------> Options
@@ -75,10 +76,14 @@ class LimpAnalysis():
 #region -------------------------------------------------------------> Methods
 def LimProt(                                                                    # pylint: disable=dangerous-default-value
     *args,
-    df:pd.DataFrame  = pd.DataFrame(),                                          # pylint: disable=unused-argument
-    rDO:UserData     = UserData(),
-    resetIndex: bool = True,
-    equal_var:bool   = False,
+    df:pd.DataFrame                       = pd.DataFrame(),                     # pylint: disable=unused-argument
+    rDO:UserData                          = UserData(),
+    resetIndex: bool                      = True,
+    equal_var:bool                        = False,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs,
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform a Limited Proteolysis analysis.
@@ -95,6 +100,15 @@ def LimProt(
             Reset index of dfS (True) or not (False). Default is True.
         equal_var: bool
             Assume variances are equal (True) or not (False). Default is False.
+        cancel: cMethod.CancelToken or None
+            Checked before the calculation of each Band - Lane.
+        checkpoint: cFile.Checkpoint or None
+            Resume the data preparation.
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation and statistics.
+        spill: Callable or None
+            Write the finished data preparation steps to disk, see
+            dataMethod.RunDataPreparation.
         **kwargs:
             These are ignored here. Needed for compatibility.
 
@@ -112,6 +126,7 @@ def LimProt(
                         'dfE' : pd.DataFrame,
                         'dfS' : pd.DataFrame,
                         'dfR' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -244,7 +259,12 @@ def LimProt(
     #endregion ---------------------------------------------> Helper Functions
 
     #region ------------------------------------------------> Data Preparation
-    tOut = dataMethod.RunDataPreparation(df=df, rDO=rDO, resetIndex=resetIndex)
+    cancel = cancel if cancel is not None else cMethod.CancelToken()
+    timer  = timer if timer is not None else cMethod.StepTimer(memory=False)
+    #------------------------------>
+    tOut = dataMethod.RunDataPreparation(
+        df=df, rDO=rDO, resetIndex=resetIndex, cancel=cancel,
+        checkpoint=checkpoint, timer=timer, spill=spill)
     if tOut[0]:
         dfS = tOut[0]['dfS']
     else:
@@ -252,6 +272,7 @@ def LimProt(
     #endregion ---------------------------------------------> Data Preparation
 
     #region --------------------------------------------------------> Analysis
+    timer.Begin('Statistics')
     #------------------------------> Empty dfR
     dfR = _emptyDFR()
     #------------------------------> N, C Res Num
@@ -280,6 +301,7 @@ def LimProt(
             #------------------------------> Control & Data Column
             colD = rDO.dfResCtrl[b+1][l]
             #------------------------------> Calculate data
+            cancel.Check()
             if colD:
                 try:
                     _calcOutData(bN, lN, colC, colD, equal_var=equal_var)
@@ -306,8 +328,46 @@ def LimProt(
     dfR = dfR.reset_index(drop=True)
     #------------------------------>
     tOut[0]['dfR'] = dfR
+    timer.End('Statistics')
     #endregion -----------------------------------------------------> Sort
 
     return (tOut[0], '', None)
 #---
+
+
+def StepDict(tDate:str, rDO:UserData, dfDict:dict) -> dict:
+    """Files and keys written in the output of a Limited Proteolysis
+        analysis.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+        rDO: UserData
+            User input.
+        dfDict: dict
+            Output of the steps of the analysis, see mConfig.core.ltDFKeys.
+
+        Returns
+        -------
+        dict
+            {
+                'DP'   : dict,
+                'Files': {file name: pd.DataFrame},
+                'R'    : file with the results,
+            }
+    """
+    # No test
+    #region ---------------------------------------------------> Step Dict
+    stepDict = dataMethod.StepDict(tDate, rDO, dfDict)
+    stepDict['R'] = mConfig.limp.fnMainData.format(tDate, '09')
+    stepDict['Files'] |= {
+        mConfig.core.fnTargetProt.format(tDate, '07') : dfDict['dfTP'],
+        mConfig.core.fnScore.format(tDate,      '08') : dfDict['dfS'],
+        stepDict['R']                                 : dfDict['dfR'],
+    }
+    #endregion ------------------------------------------------> Step Dict
+
+    return stepDict
+#---
 #endregion ----------------------------------------------------------> Methods
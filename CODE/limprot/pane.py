@@ -83,6 +83,7 @@ class LimProt(cPane.BaseConfPanelMod2):
                         'dfIm': Name of file with imputed data.
                     }
                     'R' : Path to file with the analysis results.
+                    'T' : Wall time, CPU time and peak memory of each step.
                 }
             }
         }
@@ -121,8 +122,8 @@ class LimProt(cPane.BaseConfPanelMod2):
     cSection        = mConfig.limp.tMod
     cTitlePD        = f"Running {mConfig.limp.tMod} Analysis"
     cGaugePD        = 34
-    rMainData       = '{}_{}-LimitedProteolysis-Data.txt'
     rAnalysisMethod = limpMethod.LimProt
+    rStepDictMethod = staticmethod(limpMethod.StepDict)
     #------------------------------> Optional configuration
     cTTHelp = mConfig.core.ttBtnHelp.format(cURL)
     #endregion --------------------------------------------------> Class setup
@@ -554,43 +555,6 @@ class LimProt(cPane.BaseConfPanelMod2):
         return True
     #---
 
-    def RunAnalysis(self) -> bool:
-        """Run the analysis.
-
-            Returns
-            -------
-            bool
-        """
-        #region -----------------------------------------------------> Seq Obj
-        setattr(self.rDO, 'seqFileObj', self.rSeqFileObj)
-        #endregion --------------------------------------------------> Seq Obj
-
-        #region ---------------------------------------------------> Run Super
-        return super().RunAnalysis()
-        #endregion ------------------------------------------------> Run Super
-    #---
-
-    def WriteOutput(self):
-        """Write output. Override as needed"""
-        #region --------------------------------------------------> Data Steps
-        stepDict = self.SetStepDictDP()
-        stepDict['Files'] = {
-            mConfig.core.fnInitial.format(self.rDate,    '01') : self.dfI,
-            mConfig.core.fnFloat.format(self.rDate,      '02') : self.dfF,
-            mConfig.core.fnMinRep.format(self.rDate,     '03') : self.dfMR,
-            mConfig.core.fnTrans.format(self.rDate,      '04') : self.dfT,
-            mConfig.core.fnNorm.format(self.rDate,       '05') : self.dfN,
-            mConfig.core.fnImp.format(self.rDate,        '06') : self.dfIm,
-            mConfig.core.fnTargetProt.format(self.rDate, '07') : self.dfTP,
-            mConfig.core.fnScore.format(self.rDate,      '08') : self.dfS,
-            self.rMainData.format(self.rDate,            '09') : self.dfR,
-        }
-        stepDict['R'] = self.rMainData.format(self.rDate, '09')
-        #endregion -----------------------------------------------> Data Steps
-
-        return self.WriteOutputData(stepDict)
-    #---
-
     def RunEnd(self) -> bool:
         """Finish analysis"""
         #------------------------------>
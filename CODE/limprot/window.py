@@ -94,10 +94,13 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         rReqSeqColor: dict
             Keys are color and values are sequences to highlight in the given
             color.
-        rRectsFrag: list[mpatches]
+        rRectsFrag: PolyCollection or None
             Rectangles used in the Fragment plot.
-        rRectsGel: list[mpatches]
-            Rectangles used in the Gel spot.
+        rRectsFragL: list[str]
+            Label of each rectangle in rRectsFrag, e.g. '0.1.2'.
+        rRectsGel: PolyCollection or None
+            Rectangles used in the Gel spot. One per band and lane, band by
+            band.
         rSelBands: bool
             Select Bands (True) or Lanes (False).
         rSpotSelLine: line
@@ -317,9 +320,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             bool
         """
         #region ---------------------------------------------------> Variables
-        x, y = event.artist.xy
-        x = round(x)
-        y = round(y)
+        _, x, y = self.PickRect(event)
         #endregion ------------------------------------------------> Variables
 
         #region -------------------------------------------------> Flag picked
@@ -341,10 +342,11 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         #endregion ------------------------------------------> Remove Old Line
 
         #region -----------------------------------------------> Draw New Line
-        self.rSpotSelLine = self.wPlot['Sec'].rAxes.plot(
-            [x-0.3, x+0.3], [y,y], color='black', linewidth=4)
+        self.rSpotSelLine = self.wPlot['Sec'].AddOverlay(
+            self.wPlot['Sec'].rAxes.plot(
+                [x-0.3, x+0.3], [y,y], color='black', linewidth=4))
         #------------------------------>
-        self.wPlot['Sec'].rCanvas.draw()
+        self.wPlot['Sec'].Blit()
         #endregion --------------------------------------------> Draw New Line
 
         #region --------------------------------------------------------> Info
@@ -355,7 +357,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         if self.rFragSelLine is not None:
             self.rFragSelLine[0].remove()
             self.rFragSelLine = None
-            self.wPlot['Main'].rCanvas.draw()
+            self.wPlot['Main'].Blit()
             self.rFragSelC = [None, None, None]
         #endregion -------------------------------------> Remove Sel from Frag
 
@@ -397,18 +399,14 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             bool
         """
         #region ---------------------------------------------------> Variables
-        art   = event.artist
-        fragC = list(map(int, art.get_label().split('.')))
+        idx, x, y = self.PickRect(event)
+        fragC = list(map(int, self.rRectsFragL[idx].split('.')))
         #------------------------------>
         if self.rFragSelC != fragC:
             self.rFragSelC = fragC
         else:
             return True
         #------------------------------>
-        x, y = event.artist.xy
-        x = round(x)
-        y = round(y)
-        #------------------------------>
         tKey = f'{self.rDataC.labelB[fragC[0]]}-{self.rDataC.labelA[fragC[1]]}-{self.rPStr}'
         #------------------------------>
         frag = getattr(self.rFragments, tKey)
@@ -419,10 +417,11 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         if self.rFragSelLine is not None:
             self.rFragSelLine[0].remove()
         #------------------------------>
-        self.rFragSelLine = self.wPlot['Main'].rAxes.plot(
-            [x1+2, x2-2], [y,y], color='black', linewidth=4)
+        self.rFragSelLine = self.wPlot['Main'].AddOverlay(
+            self.wPlot['Main'].rAxes.plot(
+                [x1+2, x2-2], [y,y], color='black', linewidth=4))
         #------------------------------>
-        self.wPlot['Main'].rCanvas.draw()
+        self.wPlot['Main'].Blit()
         #endregion ---------------------------------------> Highlight Fragment
 
         #region -------------------------------------------------------> Print
@@ -433,7 +432,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         if self.rSpotSelLine is not None:
             self.rSpotSelLine[0].remove()
             self.rSpotSelLine = None
-            self.wPlot['Sec'].rCanvas.draw()
+            self.wPlot['Sec'].Blit()
             self.rGelSelC = [None, None]
         #endregion ----------------------------------------> Remove Sel in Gel
 
@@ -469,6 +468,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         return True
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         tDate:str            ='',
@@ -493,8 +493,8 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         self.rDataC:limpMethod.LimpAnalysis = getattr(self.rData, self.rDateC)
         #------------------------------>
         self.rDf        = self.rDataC.df.copy()
-        self.rRectsGel  = []
-        self.rRectsFrag = []
+        self.rRectsGel  = None
+        self.rRectsFrag = None
         self.rBlSelC    = [None, None]
         self.rGelSelC   = [None, None]
         self.rFragSelC  = [None, None, None]
@@ -594,18 +594,22 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         #endregion -----------------------------------------------------> Axis
 
         #region ---------------------------------------------------> Draw Rect
-        for nb,_ in enumerate(self.rDataC.labelB, start=1):
-            for nl,_ in enumerate(self.rDataC.labelA, start=1):
-                self.rRectsGel.append(mpatches.Rectangle(
-                    ((nl-0.4),(nb-0.4)),
-                    0.8,
-                    0.8,
-                    edgecolor = 'black',
-                    linewidth = self.cGelLineWidth,
-                    facecolor = self.SetGelSpotColor(nb-1,nl-1),
-                    picker    = True,
-                ))
-                self.wPlot['Sec'].rAxes.add_patch(self.rRectsGel[-1])
+        nB = len(self.rDataC.labelB)
+        nL = len(self.rDataC.labelA)
+        #------------------------------>
+        self.rRectsGel = self.wPlot['Sec'].rAxes.add_collection(
+            cMethod.RectCollection(
+                [nl-0.4 for _ in range(1, nB+1) for nl in range(1, nL+1)],
+                [nb-0.4 for nb in range(1, nB+1) for _ in range(1, nL+1)],
+                0.8,
+                0.8,
+                edgecolors = 'black',
+                linewidths = self.cGelLineWidth,
+                facecolors = [
+                    self.SetGelSpotColor(nb,nl)
+                    for nb in range(0, nB) for nl in range(0, nL)],
+                picker     = True,
+            ))
         #endregion ------------------------------------------------> Draw Rect
 
         #region --------------------------------------------------> Zoom Reset
@@ -742,8 +746,9 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             edgecolor = 'red',
             fill      = False,
         )
-        self.wPlot['Sec'].rAxes.add_patch(self.rBlSelRect)
-        self.wPlot['Sec'].rCanvas.draw()
+        self.wPlot['Sec'].AddOverlay(
+            self.wPlot['Sec'].rAxes.add_patch(self.rBlSelRect))
+        self.wPlot['Sec'].Blit()
         #endregion --------------------------------------------> Draw New Rect
 
         return True
@@ -1283,24 +1288,19 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             -------
             bool
         """
-        #region --------------------------------------------------->
-        for k in self.rRectsGel:
-            k.set_linewidth(self.cGelLineWidth)
-        #------------------------------>
-        for k in self.rRectsFrag:
-            k.set_linewidth(self.cGelLineWidth)
-        #endregion ------------------------------------------------>
-
         #region ---------------------------------------------------> Gel
-        j = 0
+        sel = []
+        j   = 0
         for b in self.rDataC.labelB:
             for l in self.rDataC.labelA:
                 frag = getattr(self.rFragments, f'{b}-{l}-{self.rPStr}')
                 for p in frag.seqL:
                     if self.rPeptide in p:
-                        self.rRectsGel[j].set_linewidth(2.0)
+                        sel.append(j)
                         break
                 j = j + 1
+        #------------------------------>
+        self.SetRectsLineWidth(self.rRectsGel, sel)
         #endregion ------------------------------------------------> Gel
 
         #region ---------------------------------------------------> Fragments
@@ -1318,14 +1318,17 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
                 for l in self.rDataC.labelA:
                     fKeys.append(f'{b}-{l}-{self.rPStr}')
         #------------------------------>
-        if self.rRectsFrag:
-            j = 0
+        if self.rRectsFrag is not None:
+            sel = []
+            j   = 0
             for k in fKeys:
                 frag = getattr(self.rFragments, k)
                 for p in frag.seqL:
                     if self.rPeptide in p:
-                        self.rRectsFrag[j].set_linewidth(2.0)
+                        sel.append(j)
                     j = j + 1
+            #------------------------------>
+            self.SetRectsLineWidth(self.rRectsFrag, sel)
         #endregion ------------------------------------------------> Fragments
 
         #region --------------------------------------------------->
@@ -1349,14 +1352,11 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             bool
         """
         #------------------------------>
-        j = 0
-        #------------------------------>
-        for nb,_ in enumerate(self.rDataC.labelB):
-            for nl,_ in enumerate(self.rDataC.labelA):
-                self.rRectsGel[j].set_facecolor(
-                    self.SetGelSpotColor(nb,nl, showAll=showAll)
-                )
-                j = j + 1
+        self.rRectsGel.set_facecolors([                                         # type: ignore
+            self.SetGelSpotColor(nb,nl, showAll=showAll)
+            for nb,_ in enumerate(self.rDataC.labelB)
+            for nl,_ in enumerate(self.rDataC.labelA)
+        ])
         #------------------------------>
         self.wPlot['Sec'].rCanvas.draw()
 
@@ -1609,11 +1609,8 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
-        for r in self.rRectsFrag:
-            r.set_linewidth(self.cGelLineWidth)
-
-        for r in self.rRectsGel:
-            r.set_linewidth(self.cGelLineWidth)
+        self.SetRectsLineWidth(self.rRectsFrag)
+        self.SetRectsLineWidth(self.rRectsGel)
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
@@ -1649,7 +1646,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         #region --------------------------------------------------->
         if plot:
             #------------------------------>
-            self.wPlot['Main'].rCanvas.draw()
+            self.wPlot['Main'].Blit()
             #------------------------------>
             if self.rFragSelC != [None, None, None]:
                 self.wText.Clear()
@@ -1693,7 +1690,7 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         #region --------------------------------------------------->
         if plot:
             #------------------------------>
-            self.wPlot['Sec'].rCanvas.draw()
+            self.wPlot['Sec'].Blit()
             #------------------------------>
             if self.rGelSelC != [None, None]:
                 self.wText.Clear()
@@ -1742,14 +1739,14 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
 
         #region --------------------------------------------------->
         if plot:
-            self.wPlot['Sec'].rCanvas.draw()
+            self.wPlot['Sec'].Blit()
             self.wText.Clear()
             self.RecSeqHighlight()
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
         self.rBlSelC = [None, None]
-        self.rRectsFrag = []
+        self.rRectsFrag = None
         #endregion ------------------------------------------------>
 
         return True
@@ -1825,9 +1822,10 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
             fill      = False,
         )
         #------------------------------>
-        self.wPlot['Sec'].rAxes.add_patch(self.rBlSelRect)
+        self.wPlot['Sec'].AddOverlay(
+            self.wPlot['Sec'].rAxes.add_patch(self.rBlSelRect))
         #------------------------------>
-        self.wPlot['Sec'].rCanvas.draw()
+        self.wPlot['Sec'].Blit()
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
@@ -1836,7 +1834,8 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         tLabel  = []
         tColor  = []
         tYLabel = []
-        self.rRectsFrag = []
+        x, y, w, color   = [], [], [], []
+        self.rRectsFragL = []
         #------------------------------>
         if self.rSelBands:
             for bk, b in enumerate(self.rDataC.labelB):
@@ -1861,17 +1860,20 @@ class ResLimProt(cWindow.BaseWindowResultListText2PlotFragments):
         for k,v in enumerate(tKeys, start=1):
             frag = getattr(self.rFragments, v)
             for j,f in enumerate(frag.coord):
-                self.rRectsFrag.append(mpatches.Rectangle(
-                    (f[0], k-0.2),
-                    (f[1]-f[0]),
-                    0.4,
-                    picker    = True,
-                    linewidth = self.cGelLineWidth,
-                    facecolor = self.cSpot[(tColor[k-1])%nc],                   # type: ignore
-                    edgecolor = 'black',
-                    label     = f'{tLabel[k-1]}.{j}',
-                ))
-                self.wPlot['Main'].rAxes.add_patch(self.rRectsFrag[-1])
+                x.append(f[0])
+                y.append(k-0.2)
+                w.append(f[1]-f[0])
+                color.append(self.cSpot[(tColor[k-1])%nc])                      # type: ignore
+                self.rRectsFragL.append(f'{tLabel[k-1]}.{j}')
+        #------------------------------>
+        self.rRectsFrag = self.wPlot['Main'].rAxes.add_collection(
+            cMethod.RectCollection(
+                x, y, w, 0.4,
+                picker     = True,
+                linewidths = self.cGelLineWidth,
+                facecolors = color,
+                edgecolors = 'black',
+            ))
         #------------------------------>
         self.DrawProtein(k+1)                                                   # type: ignore
         #------------------------------>
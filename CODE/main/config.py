@@ -19,7 +19,8 @@ from dataclasses import dataclass
 from typing import Optional, TYPE_CHECKING
 
 if TYPE_CHECKING:
-    from main import window as mWindow
+    from batch import method as batchMethod
+    from main  import window as mWindow
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -34,5 +35,7 @@ class Configuration():
     ttStart:str = 'Start'
     #------------------------------> Reference to main window
     mainWin:Optional['mWindow.WindowMain'] = None
+    #------------------------------> Queue for analyses running in parallel
+    jobQueue:Optional['batchMethod.JobQueue'] = None
 #---
 #endregion ----------------------------------------------------> Configuration
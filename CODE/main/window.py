@@ -256,8 +256,17 @@ class WindowMain(cWindow.BaseWindow):
             Returns
             -------
             bool
+
+            Notes
+            -----
+            Analyses in mConfig.main.jobQueue are cancelled and the worker
+            processes stopped without waiting for the running analyses.
         """
         #region --------------------------------------------------->
+        if mConfig.main.jobQueue is not None:
+            mConfig.main.jobQueue.Shutdown(wait=False, cancel=True)
+            mConfig.main.jobQueue = None
+        #------------------------------>
         self.Destroy()
         #------------------------------>
         mConfig.main.mainWin = None
@@ -32,6 +32,8 @@ class Configuration():
     npResControlExp:str   = 'ResControlExpPaneProtProf'
     tMod:str              = 'Proteome Profiling'                                # Name of the Module
     tTab:str              = 'ProtProf'                                          # Title of Conf Tab
+    #------------------------------> File names
+    fnMainData:str = '{}_{}-ProteomeProfiling-Data.txt'                         # Main results file in Steps_Data_Files
     #------------------------------> Labels
     lStCond:str             = 'Conditions'                                      # lSt: Label for wx.StaticText
     lStRP:str               = 'Relevant Points'
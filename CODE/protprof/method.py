@@ -16,7 +16,8 @@
 
 #region -------------------------------------------------------------> Imports
 from dataclasses import dataclass, field
-from typing      import Optional, Union
+from pathlib     import Path
+from typing      import Callable, Literal, Optional, Union
 
 import pandas as pd
 import numpy  as np
@@ -24,12 +25,17 @@ from scipy                       import stats
 from statsmodels.stats.multitest import multipletests
 
 from config.config import config as mConfig
+from core     import file      as cFile
 from core     import method    as cMethod
 from core     import statistic as cStatistic
 from dataprep import method    as dataMethod
 #endregion ----------------------------------------------------------> Imports
 
 
+LIT_FCEvol = Literal['up', 'down', 'no', 'upMon', 'downMon', 'div', 'opposite']
+LIT_Op     = Literal['<', '>']
+
+
 #region -------------------------------------------------------------> Classes
 @dataclass
 class UserData(cMethod.BaseUserData):
@@ -49,7 +55,7 @@ class UserData(cMethod.BaseUserData):
          'scoreVal', 'indSample', 'alpha', 'correctedP', 'ocTargetProt',
          'ocGene', 'ocScore', 'ocExcludeR', 'ocColumn', 'labelA', 'labelB',
          'ctrlType', 'ctrlName', 'resCtrl', 'dfTargetProt', 'dfGene', 'dfScore',
-         'dfExcludeR', 'dfResCtrl', 'minRep', 'minRepList',
+         'dfExcludeR', 'dfResCtrl', 'minRep', 'minRepList', 'float32',
         ])
     longestKey:int = 17                                                         # Length of the longest Key in dI
     #endregion ------------------------------------------------------> Options
@@ -60,25 +66,47 @@ class UserData(cMethod.BaseUserData):
 class ProtAnalysis():
     """Data class to hold the info regarding a Proteome Profiling analysis in
         an UMSAP file.
+
+        Notes
+        -----
+        The result is read from dfP the first time df is used, unless it is
+        given in dfCache.
     """
     #region --------------------------------------------------------> Options
-    df:pd.DataFrame                                                             # Result
+    dfP:Path                                                                    # Result file
     alpha:float                                                                 # Significance level
     filterS:dict                                                                # Filters
     labelA:list[str]                                                            # Conditions
     labelB:list[str]                                                            # Relevant Points
     ctrlType:str
     ctrlName:str
+    summary:dict = field(default_factory=dict)                                  # Summary of df, empty for older files
+    dfCache:Optional[pd.DataFrame] = field(default=None, repr=False)            # Result once read
     #endregion -----------------------------------------------------> Options
+
+    #region ------------------------------------------------------> Properties
+    @property
+    def df(self) -> pd.DataFrame:
+        """Result of the analysis."""
+        if self.dfCache is None:
+            self.dfCache = ReadResult(self.dfP)
+        return self.dfCache
+    #---
+    #endregion ---------------------------------------------------> Properties
+#---
 #endregion ----------------------------------------------------------> Classes
 
 
 #region -------------------------------------------------------------> Methods
 def ProtProf(                                                                   # pylint: disable=dangerous-default-value
     *args,
-    df:pd.DataFrame = pd.DataFrame(),                                           # pylint: disable=unused-argument
-    rDO:UserData    = UserData(),
-    resetIndex:bool = True,
+    df:pd.DataFrame                       = pd.DataFrame(),                     # pylint: disable=unused-argument
+    rDO:UserData                          = UserData(),
+    resetIndex:bool                       = True,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform a Proteome Profiling Analysis.
@@ -93,6 +121,15 @@ def ProtProf(
             Data class with user input.
         resetIndex: bool
             Reset index of dfS (True) or not (False). Default is True.
+        cancel: cMethod.CancelToken or None
+            Checked before the calculation of each Condition - Relevant Point.
+        checkpoint: cFile.Checkpoint or None
+            Resume the data preparation.
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation and statistics.
+        spill: Callable or None
+            Write the finished data preparation steps to disk, see
+            dataMethod.RunDataPreparation.
         **kwargs:
             For compatibility. They are ignore here.
 
@@ -110,6 +147,7 @@ def ProtProf(
                         'dfE' : pd.DataFrame,
                         'dfS' : pd.DataFrame,
                         'dfR' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -411,7 +449,12 @@ def ProtProf(
     #endregion ----------------------------------------------------> Variables
 
     #region ------------------------------------------------> Data Preparation
-    tOut = dataMethod.RunDataPreparation(df=df, rDO=rDO, resetIndex=resetIndex)
+    cancel = cancel if cancel is not None else cMethod.CancelToken()
+    timer  = timer if timer is not None else cMethod.StepTimer(memory=False)
+    #------------------------------>
+    tOut = dataMethod.RunDataPreparation(
+        df=df, rDO=rDO, resetIndex=resetIndex, cancel=cancel,
+        checkpoint=checkpoint, timer=timer, spill=spill)
     if tOut[0]:
         dfS = tOut[0]['dfS']
     else:
@@ -419,6 +462,8 @@ def ProtProf(
     #endregion ---------------------------------------------> Data Preparation
 
     #region ------------------------------------------------------------> Sort
+    timer.Begin('Statistics')
+    #------------------------------>
     dfS.sort_values(
         by=list(dfS.columns[0:2]), inplace=True, ignore_index=True)
     #endregion ---------------------------------------------------------> Sort
@@ -431,6 +476,7 @@ def ProtProf(
             #------------------------------> Control & Data Column
             colC, colD = dColCtrlData[rDO.ctrlType](c, t)
             #------------------------------> Calculate data
+            cancel.Check()
             try:
                 _calcOutData(cN, tN, colC, colD)
             except Exception as e:
@@ -441,11 +487,78 @@ def ProtProf(
 
     #region --------------------------------------------------->
     tOut[0]['dfR'] = dfR
+    timer.End('Statistics')
     return (tOut[0], '', None)
     #endregion ------------------------------------------------>
 #---
 
 
+def StepDict(tDate:str, rDO:UserData, dfDict:dict) -> dict:
+    """Files and keys written in the output of a Proteome Profiling
+        analysis.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+        rDO: UserData
+            User input.
+        dfDict: dict
+            Output of the steps of the analysis, see mConfig.core.ltDFKeys.
+
+        Returns
+        -------
+        dict
+            {
+                'DP'   : dict,
+                'Files': {file name: pd.DataFrame},
+                'R'    : file with the results,
+                'F'    : filters, empty for new analyses,
+                'S'    : summary of the results, see Summary,
+            }
+    """
+    # No test
+    #region ---------------------------------------------------> Step Dict
+    stepDict = dataMethod.StepDict(tDate, rDO, dfDict)
+    stepDict['R'] = mConfig.prot.fnMainData.format(tDate, '10')
+    stepDict['Files'] |= {
+        mConfig.core.fnTargetProt.format(tDate, '07') : dfDict['dfTP'],
+        mConfig.core.fnExclude.format(tDate,    '08') : dfDict['dfE'],
+        mConfig.core.fnScore.format(tDate,      '09') : dfDict['dfS'],
+        stepDict['R']                                 : dfDict['dfR'],
+    }
+    stepDict['F'] = {}
+    stepDict['S'] = Summary(dfDict['dfR'])
+    #endregion ------------------------------------------------> Step Dict
+
+    return stepDict
+#---
+
+
+def ReadResult(fileP:Path) -> pd.DataFrame:
+    """Read the result of a Proteome Profiling analysis.
+
+        Parameters
+        ----------
+        fileP: Path
+            Path to the result file in the Steps_Data_Files folder.
+
+        Returns
+        -------
+        pd.DataFrame
+    """
+    # Test in test.unit.protprof.test_method.Test_ProtAnalysis
+    #region ---------------------------------------------------> Read
+    colStr = [('Gene','Gene','Gene'),('Protein','Protein','Protein')]
+    #------------------------------>
+    df = cFile.ReadCSV2DF(fileP, header=[0,1,2])
+    df = df.astype({c:'str' for c in colStr})                                   # type: ignore
+    #endregion ------------------------------------------------> Read
+
+    return cMethod.DFCategory(df, [0,1])
+#---
+
+
 def HCurve(x:Union[float,pd.DataFrame,pd.Series], t0:float, s0:float) -> float:
     """Calculate the hyperbolic curve values according to:
         doi: 10.1142/S0219720012310038
@@ -468,4 +581,532 @@ def HCurve(x:Union[float,pd.DataFrame,pd.Series], t0:float, s0:float) -> float:
     return abs((abs(x)*t0)/(abs(x)-t0*s0))                                      # type: ignore
     #endregion ------------------------------------------------> Calculate
 #---
+
+
+#region -------------------------------------------------------------> Filters
+def _FilterCol(df:pd.DataFrame, col:tuple[str, str, str]) -> np.ndarray:
+    """Get a column of the result dataframe as float.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        col: tuple[str, str, str]
+            Condition, relevant point and value, e.g. ('C1', 'RP1', 'FC').
+
+        Returns
+        -------
+        np.ndarray
+    """
+    # No test
+    return df[col].to_numpy(dtype=np.float64)
+#---
+
+
+def _FilterOp(x:np.ndarray, op:LIT_Op, val:float) -> np.ndarray:
+    """Compare the values with the threshold. NaN values are False.
+
+        Parameters
+        ----------
+        x: np.ndarray
+            Values.
+        op: str
+            < means x <= val and > means x >= val.
+        val: float
+            Threshold.
+
+        Returns
+        -------
+        np.ndarray
+    """
+    # No test
+    with np.errstate(invalid='ignore'):
+        return x <= val if op == '<' else x >= val
+#---
+
+
+def FilterFCEvol(
+    df:pd.DataFrame,
+    mode:LIT_FCEvol,
+    cond:Optional[str] = None,
+    anyC:bool          = False,
+    lim:float          = 0.0,
+    ) -> np.ndarray:
+    """Filter the results by the evolution of the FC values along the
+        relevant points of each condition.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        mode: str
+            - up, down: All FC are > 0 or < 0.
+            - no: All FC are in (-lim, lim).
+            - upMon, downMon: As up/down and FC increases/decreases
+              monotonically.
+            - div: upMon in any condition and downMon in any condition.
+            - opposite: up in any condition and down in any condition.
+        cond: str or None
+            Use only this condition. None means all conditions. Ignored for
+            div and opposite.
+        anyC: bool
+            Row is kept if the condition is fulfilled in any (True) or all
+            (False) conditions. Ignored for div and opposite.
+        lim: float
+            Limit for mode no.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the rows to keep.
+    """
+    # Test in test.unit.protprof.test_method.Test_Filter
+    #region ---------------------------------------------------> Variables
+    idx  = pd.IndexSlice
+    dfFC = df.loc[:,idx[:,:,'FC']]
+    x    = dfFC.to_numpy(dtype=np.float64)
+    lvl  = dfFC.columns.get_level_values(0)
+    allC = list(dict.fromkeys(lvl))
+    #endregion ------------------------------------------------> Variables
+
+    #region ---------------------------------------------------> Condition
+    def _Cond(c:str, tMode:str) -> np.ndarray:
+        """Mask for one condition."""
+        xC = x[:,np.asarray(lvl == c)]
+        with np.errstate(invalid='ignore'):
+            if tMode == 'up':
+                return (xC > 0).all(axis=1)
+            if tMode == 'down':
+                return (xC < 0).all(axis=1)
+            if tMode == 'no':
+                return ((xC > -lim) & (xC < lim)).all(axis=1)
+            if tMode == 'upMon':
+                return (
+                    (xC > 0).all(axis=1)
+                    & (np.diff(xC, axis=1) >= 0).all(axis=1))
+            return (
+                (xC < 0).all(axis=1) & (np.diff(xC, axis=1) <= 0).all(axis=1))
+    #---
+    #endregion ------------------------------------------------> Condition
+
+    #region --------------------------------------------------------> Mask
+    if mode in ['div', 'opposite']:
+        up, down = ('upMon', 'downMon') if mode == 'div' else ('up', 'down')
+        return (
+            np.any([_Cond(c, up) for c in allC], axis=0)
+            & np.any([_Cond(c, down) for c in allC], axis=0))
+    #------------------------------>
+    mask = np.array([_Cond(c, mode) for c in ([cond] if cond else allC)])
+    #endregion -----------------------------------------------------> Mask
+
+    return mask.any(axis=0) if anyC else mask.all(axis=0)
+#---
+
+
+def FilterHCurve(
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    t0:float,
+    s0:float,
+    corrP:bool = False,
+    ) -> np.ndarray:
+    """Filter the results by the Hyperbolic Curve.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        t0: float
+            T0 parameter.
+        s0: float
+            S0 parameter.
+        corrP: bool
+            Use the corrected (True) or uncorrected (False) P values.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the rows above the curve.
+    """
+    # Test in test.unit.protprof.test_method.Test_Filter
+    #region ---------------------------------------------------> Variables
+    fc = _FilterCol(df, (cond, rp, 'FC'))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        p  = -np.log10(_FilterCol(df, (cond, rp, 'Pc' if corrP else 'P')))
+        pH = np.where(np.abs(fc) > t0*s0, HCurve(fc, t0, s0), np.nan)
+    #endregion ------------------------------------------------> Variables
+
+    #region ------------------------------------------------------> Mask
+    with np.errstate(invalid='ignore'):
+        return pH < p
+    #endregion ---------------------------------------------------> Mask
+#---
+
+
+def FilterLog2FC(
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    op:LIT_Op,
+    val:float,
+    ) -> np.ndarray:
+    """Filter the results by the log2FC value.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        op: str
+            < or >. Threshold is included.
+        val: float
+            Threshold.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the rows to keep.
+    """
+    # Test in test.unit.protprof.test_method.Test_Filter
+    return _FilterOp(_FilterCol(df, (cond, rp, 'FC')), op, val)
+#---
+
+
+def FilterPValue(                                                               # pylint: disable=too-many-arguments
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    op:LIT_Op,
+    val:float,
+    absB:bool  = True,
+    corrP:bool = False,
+    ) -> np.ndarray:
+    """Filter the results by the P value.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        op: str
+            < or >. Threshold is included.
+        val: float
+            Threshold.
+        absB: bool
+            val is a P value (True) or a -log10(P) value (False).
+        corrP: bool
+            Use the corrected (True) or uncorrected (False) P values.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the rows to keep.
+    """
+    # Test in test.unit.protprof.test_method.Test_Filter
+    #region ---------------------------------------------------> Variables
+    x = _FilterCol(df, (cond, rp, 'Pc' if corrP else 'P'))
+    if not absB:
+        with np.errstate(divide='ignore', invalid='ignore'):
+            x = -np.log10(x)
+    #endregion ------------------------------------------------> Variables
+
+    return _FilterOp(x, op, val)
+#---
+
+
+def FilterZScore(
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    op:LIT_Op,
+    val:float,
+    ) -> np.ndarray:
+    """Filter the results by the Z score of the FC values.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        op: str
+            < keeps the rows outside the Z score limit for val and > keeps the
+            rows inside the limit.
+        val: float
+            Percentage of the normal distribution, between 0 and 100.
+
+        Returns
+        -------
+        np.ndarray
+            Boolean mask of the rows to keep.
+    """
+    # Test in test.unit.protprof.test_method.Test_Filter
+    #region ---------------------------------------------------> Variables
+    x    = _FilterCol(df, (cond, rp, 'FCz'))
+    zVal = stats.norm.ppf(1.0-(val/100.0))
+    #endregion ------------------------------------------------> Variables
+
+    #region ------------------------------------------------------> Mask
+    with np.errstate(invalid='ignore'):
+        if op == '<':
+            return (x >= zVal) | (x <= -zVal)
+        return (x <= zVal) | (x >= -zVal)
+    #endregion ---------------------------------------------------> Mask
+#---
+#endregion ----------------------------------------------------------> Filters
+
+
+#region -------------------------------------------------------> Volcano Color
+def _VolColor(down:np.ndarray, up:np.ndarray) -> np.ndarray:
+    """Get the index of the color of each protein in the volcano plot.
+
+        Parameters
+        ----------
+        down: np.ndarray
+            Boolean mask of the down regulated proteins.
+        up: np.ndarray
+            Boolean mask of the up regulated proteins.
+
+        Returns
+        -------
+        np.ndarray
+            0 for down, 1 for not regulated and 2 for up regulated proteins.
+    """
+    # No test
+    return np.select([down, up], [0, 2], default=1)
+#---
+
+
+def VolColorHCurve(                                                             # pylint: disable=too-many-arguments
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    t0:float,
+    s0:float,
+    corrP:bool = False,
+    ) -> np.ndarray:
+    """Color the proteins by the Hyperbolic Curve.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        t0: float
+            T0 parameter.
+        s0: float
+            S0 parameter.
+        corrP: bool
+            Use the corrected (True) or uncorrected (False) P values.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the color of each protein, see _VolColor.
+    """
+    # Test in test.unit.protprof.test_method.Test_VolColor
+    #region ---------------------------------------------------> Variables
+    fc    = _FilterCol(df, (cond, rp, 'FC'))
+    above = FilterHCurve(df, cond, rp, t0, s0, corrP=corrP)
+    #endregion ------------------------------------------------> Variables
+
+    return _VolColor(above & (fc < 0), above & (fc > 0))
+#---
+
+
+def VolColorZScore(
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    val:float,
+    ) -> np.ndarray:
+    """Color the proteins by the Z score of the FC values.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        val: float
+            Percentage of the normal distribution, between 0 and 100.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the color of each protein, see _VolColor.
+    """
+    # Test in test.unit.protprof.test_method.Test_VolColor
+    #region ---------------------------------------------------> Variables
+    x    = _FilterCol(df, (cond, rp, 'FCz'))
+    zVal = stats.norm.ppf(1.0-(val/100.0))
+    #endregion ------------------------------------------------> Variables
+
+    with np.errstate(invalid='ignore'):
+        return _VolColor(x < -zVal, x > zVal)
+#---
+
+
+def VolColorPLog2FC(                                                            # pylint: disable=too-many-arguments
+    df:pd.DataFrame,
+    cond:str,
+    rp:str,
+    pVal:float,
+    fcVal:float,
+    ) -> np.ndarray:
+    """Color the proteins by the P and log2FC values.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+        cond: str
+            Condition.
+        rp: str
+            Relevant point.
+        pVal: float
+            P value threshold.
+        fcVal: float
+            Log2FC threshold.
+
+        Returns
+        -------
+        np.ndarray
+            Index of the color of each protein, see _VolColor.
+    """
+    # Test in test.unit.protprof.test_method.Test_VolColor
+    #region ---------------------------------------------------> Variables
+    p  = _FilterCol(df, (cond, rp, 'P'))
+    fc = _FilterCol(df, (cond, rp, 'FC'))
+    #endregion ------------------------------------------------> Variables
+
+    with np.errstate(invalid='ignore'):
+        return _VolColor((p < pVal) & (fc < -fcVal), (p < pVal) & (fc > fcVal))
+#---
+#endregion ----------------------------------------------------> Volcano Color
+
+
+#region -------------------------------------------------------------> Summary
+def Summary(df:pd.DataFrame) -> dict:
+    """Summarize the result of the analysis. The summary is stored in the
+        UMSAP file to get the axis range of the plots without reading the
+        results.
+
+        Parameters
+        ----------
+        df: pd.DataFrame
+            Result of the analysis.
+
+        Returns
+        -------
+        dict
+            {
+                'N'  : Number of rows,
+                'FC' : [min, max],
+                ...
+                'Pc' : [min, max],
+            }
+            with one [min, max] for each value in the third level of the
+            column index of df.
+    """
+    # Test in test.unit.protprof.test_method.Test_Summary
+    #region ---------------------------------------------------> Summary
+    idx     = pd.IndexSlice
+    summary = {'N': len(df)}
+    #------------------------------>
+    for k in mConfig.prot.dfcolCLevel:
+        x = df.loc[:, idx[:,:,k]]
+        summary[k] = [float(x.min().min()), float(x.max().max())]
+    #endregion ------------------------------------------------> Summary
+
+    return summary
+#---
+
+
+def SummaryVolRange(summary:dict, corrP:bool) -> list[list[float]]:
+    """Get the XY range of the volcano plot from the summary.
+
+        Parameters
+        ----------
+        summary: dict
+            See Summary.
+        corrP: bool
+            Use the corrected P values (True) or not (False).
+
+        Returns
+        -------
+        list of list of floats
+            [xRange, yRange] e.g. [[-0.3, 0.3], [-0.1, 4.5]]
+    """
+    # Test in test.unit.protprof.test_method.Test_Summary
+    #region ---------------------------------------------------> Variables
+    pMin, pMax = summary['Pc'] if corrP else summary['P']
+    #------------------------------> -log10 reverses the order
+    with np.errstate(divide='ignore'):
+        y = [-np.log10(pMax), -np.log10(pMin)]
+    #endregion ------------------------------------------------> Variables
+
+    #region ---------------------------------------------------> Get Range
+    xRange = cStatistic.DataRange(
+        summary['FC'], symm=True, margin=mConfig.core.MatPlotMargin)
+    yRange = cStatistic.DataRange(y, margin=mConfig.core.MatPlotMargin)
+    #endregion ------------------------------------------------> Get Range
+
+    return [xRange, yRange]
+#---
+
+
+def SummaryFcRange(summary:dict, nRP:int) -> list[list[float]]:
+    """Get the XY range of the FC plot from the summary, including the CI.
+
+        Parameters
+        ----------
+        summary: dict
+            See Summary.
+        nRP: int
+            Number of relevant points.
+
+        Returns
+        -------
+        list of list of floats
+            [xRange, yRange] e.g. [[-0.3, 3.3], [-0.1, 4.5]]
+    """
+    # Test in test.unit.protprof.test_method.Test_Summary
+    #region ---------------------------------------------------> Get Range
+    #------------------------------> X
+    dm = nRP * mConfig.core.MatPlotMargin
+    xRange = [-dm, nRP + dm]
+    #------------------------------> Y
+    yMin, yMax = summary['FC']
+    ciMax      = summary['CI'][1]
+    #-------------->
+    yminLim = yMin - ciMax
+    ymaxLim = yMax + ciMax
+    #-------------->
+    dm = (ymaxLim - yminLim) * mConfig.core.MatPlotMargin
+    #-------------->
+    yRange = [yminLim - dm, ymaxLim + dm]
+    #endregion ------------------------------------------------> Get Range
+
+    return [xRange, yRange]
+#---
+#endregion ----------------------------------------------------------> Summary
 #endregion ----------------------------------------------------------> Methods
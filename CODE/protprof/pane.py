@@ -90,6 +90,8 @@ class ProtProf(cPane.BaseConfPanelMod):
                         'dfIm': Name of the file with imputed data.
                     }
                     'R' : Path to the file with the calculation results.
+                    'S' : Summary of the results, see protMethod.Summary.
+                    'T' : Wall time, CPU time and peak memory of each step.
                     'F' : Dict for Filters.
                 }
             }
@@ -124,8 +126,8 @@ class ProtProf(cPane.BaseConfPanelMod):
     cSection     = mConfig.prot.tMod
     cTitlePD     = f"Running {mConfig.prot.tMod} Analysis"
     cGaugePD     = 29
-    rMainData    = '{}_{}-ProteomeProfiling-Data.txt'
     rAnalysisMethod = protMethod.ProtProf
+    rStepDictMethod = staticmethod(protMethod.StepDict)
     #------------------------------> Optional configuration
     cTTHelp = mConfig.core.ttBtnHelp.format(cURL)
     #endregion --------------------------------------------------> Class setup
@@ -16,15 +16,14 @@
 
 #region -------------------------------------------------------------> Imports
 from pathlib import Path
-from typing  import Union, Optional, Literal, TYPE_CHECKING
+from typing  import Callable, Union, Optional, Literal, TYPE_CHECKING
 
 import numpy  as np
 import pandas as pd
 
+import matplotlib.colors  as mcolors
 import matplotlib.patches as mpatches
 
-from scipy import stats
-
 import wx
 
 from config.config import config as mConfig
@@ -80,6 +79,9 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             Currently selected date.
         rDf: pd.DataFrame
             DF with the data currently display in the window.
+        rListData: dict[str, cMethod.ListData]
+            Content of the wx.ListCtrl for each date. Filters only change the
+            visible rows.
         rFcXLabel: list of str
             List of labels for the x axis in the FC plot.
         rFcXRange: list of float
@@ -92,6 +94,11 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             Min and Max value for the y axis in the FC Plot including the CI.
         rFilterList: list
             List of applied filters. e.g. [['Key', {kwargs}], 'StatusBarText']
+        rFilterMask: list[np.ndarray]
+            Rows of the current date kept by each filter in rFilterList.
+        rFilterStack: list[np.ndarray]
+            Rows kept by the first n filters in rFilterMask. The last element
+            gives self.rDf.
         rGreenP: matplotlib object
             Reference to the green dot shown in the Volcano plot after selecting
             a protein in the wx.ListCtrl.
@@ -121,8 +128,15 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             Default is True.
         rT0: float
             t0 value to calculate the hyperbolic curve
+        rVolColor: dict[tuple, np.ndarray]
+            RGBA color of each protein in the Volcano plot for all rows of the
+            result. Keys are (date, cond, rp, scheme, parameters).
+        rVolLineArt: list
+            Artists of the lines in the Volcano plot.
         rVolLines: list[str]
             Lines to plot in the Volcano plot.
+        rVolScatter: matplotlib object or None
+            Points in the Volcano plot. Updated in place when the data change.
         rVXRange: list of float
             Min and Max values for the x axis in the Vol plot.
         rVYRange: list of float
@@ -169,6 +183,15 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         cLFCAny : cLFCAny,
         cLFCAll : cLFCAll,
     }
+    cLFFCMode = {                                                               # Mode in protMethod.FilterFCEvol
+        cLFFCUp      : 'up',
+        cLFFCDown    : 'down',
+        cLFFCUpMon   : 'upMon',
+        cLFFCDownMon : 'downMon',
+        cLFFCOpposite: 'opposite',
+        cLFDiv       : 'div',
+        cLFFCNo      : 'no',
+    }
     #--------------> Id of the plots
     cLNPlot = ['Vol', 'FC']
     #------------------------------> Title
@@ -196,6 +219,13 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #region -----------------------------------------------> Initial Setup
         self.rObj            = parent.rObj
         self.rData:cMethod.BaseAnalysis = self.rObj.dConfigure[self.cSection]()
+        #------------------------------> Results are read when first shown
+        for k in list(self.rData.date):
+            if self.ReadDate(k, notify=False):
+                break
+            self.rData.date.remove(k)
+            self.rData.error.append(k)
+        #------------------------------>
         self.rDate, menuData = self.SetDateMenuDate()
         #------------------------------>
         self.ReportPlotDataError()
@@ -226,15 +256,22 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         self.rFcYMin      = []
         self.rProtLine    = []
         self.rFilterList  = []
+        self.rFilterMask  = []
+        self.rFilterStack = []
         self.rLabelProt   = []
         self.rLabelProtD  = {}
+        self.rListData    = {}
         self.rPickLabel   = False if mConfig.prot.pickP == 'Select' else True
         self.rVolLines    = ['Hyperbolic Curve Line']
+        self.rVolLineArt  = []
+        self.rVolScatter  = None
+        self.rVolColor    = {}
         self.rVolLinesZ   = mConfig.prot.zShow
         self.rCCV         = mConfig.prot.cCV
         self.rCFCAll      = mConfig.prot.cFCAll
         self.rCFCLines    = mConfig.core.cFragment
         self.rCVol        = mConfig.prot.cVol
+        self.rCVolRGBA    = mcolors.to_rgba_array(self.rCVol)
         self.rCVolSel     = mConfig.prot.cVolSel
         #------------------------------>
         super().__init__(parent)
@@ -484,17 +521,19 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
 
             Notes
             -----
-            Entries are read from self.rDf.
+            Entries are read from self.rDf. The cells are formatted when shown.
         """
         #region --------------------------------------------------> Delete old
         self.wLC.wLCS.wLC.DeleteAllItems()
         #endregion -----------------------------------------------> Delete old
 
         #region ----------------------------------------------------> Get Data
-        data = self.rDf.iloc[:,0:2]                                             # type: ignore
-        data.insert(0, 'kbr', self.rDf.index.values.tolist())                   # type: ignore
-        data = data.astype(str)                                                 # type: ignore
-        data = data.values.tolist()                                             # type: ignore
+        df = self.rDataC.df
+        if (data := self.rListData.get(self.rDateC)) is None:
+            data = cMethod.ListData([df.index, df.iloc[:,0], df.iloc[:,1]])
+            self.rListData[self.rDateC] = data
+        #------------------------------>
+        data.SetIdx(df.index.get_indexer(self.rDf.index))
         #endregion -------------------------------------------------> Get Data
 
         #region ------------------------------------------> Set in wx.ListCtrl
@@ -573,14 +612,19 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #endregion -----------------------------------------------------> Data
 
         #region --------------------------------------------------------> Plot
-        self.wPlot.dPlot['Vol'].rAxes.scatter(
-            x, y,
-            alpha     = 1,
-            edgecolor = 'black',
-            linewidth = 1,
-            color     = color,
-            picker    = True,
-        )
+        if self.rVolScatter is None:
+            self.rVolScatter = self.wPlot.dPlot['Vol'].rAxes.scatter(
+                x, y,
+                alpha     = 1,
+                edgecolor = 'black',
+                linewidth = 1,
+                color     = color,
+                picker    = True,
+            )
+        else:
+            self.rVolScatter.set_offsets(
+                np.column_stack((x.to_numpy().ravel(), y.to_numpy().ravel())))
+            self.rVolScatter.set_facecolors(color)
         #------------------------------>
         for l in self.rVolLines:
             self.dKeyMethod[l]()                                                # type: ignore
@@ -591,6 +635,10 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #endregion ----------------------------------> Update selected protein
 
         #region --------------------------------------------------->
+        for t in self.rLabelProtD.values():
+            t.remove()
+        self.rLabelProtD = {}
+        #------------------------------>
         self.AddProtLabel(draw=False)
         #endregion ------------------------------------------------>
 
@@ -629,17 +677,23 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             -------
             bool
         """
-        #------------------------------> Clear
-        self.wPlot.dPlot['Vol'].rAxes.clear()
-        #------------------------------>
-        self.wPlot.dPlot['Vol'].rAxes.grid(True, linestyle=":")
-        #------------------------------> Labels
+        #------------------------------> Clear only the first time
+        if self.rVolScatter is None:
+            self.wPlot.dPlot['Vol'].rAxes.clear()
+            #------------------------------>
+            self.wPlot.dPlot['Vol'].rAxes.grid(True, linestyle=":")
+            #------------------------------> Labels
+            self.wPlot.dPlot['Vol'].rAxes.set_xlabel(
+                "log$_{2}$[FC]", fontweight="bold")
+            self.wPlot.dPlot['Vol'].rAxes.set_ylabel(
+                "-log$_{10}$[p]", fontweight="bold")
+        #------------------------------> Lines depend on the color scheme
+        for a in self.rVolLineArt:
+            a.remove()
+        self.rVolLineArt = []
+        #------------------------------> Title
         self.wPlot.dPlot['Vol'].rAxes.set_title(
             f'C: {self.rCondC} RP: {self.rRpC}')
-        self.wPlot.dPlot['Vol'].rAxes.set_xlabel(
-            "log$_{2}$[FC]", fontweight="bold")
-        self.wPlot.dPlot['Vol'].rAxes.set_ylabel(
-            "-log$_{10}$[p]", fontweight="bold")
         #------------------------------>
         return True
     #---
@@ -677,20 +731,21 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         else:
             y = -np.log10(
                 self.rDf.at[self.rDf.index[idx], (self.rCondC, self.rRpC, 'P')])
-        #------------------------------> Remove old point
+        #------------------------------> Move the point or add a new one
         if self.rGreenP is not None:
-            self.rGreenP.remove()
-        #------------------------------> Add new one
-        self.rGreenP = self.wPlot.dPlot['Vol'].rAxes.scatter(
-            x, y,
-            alpha     = 1,
-            edgecolor = self.rCVolSel,
-            linewidth = 1,
-            color     = self.rCVolSel,
-        )
+            self.rGreenP.set_offsets([[x, y]])
+        else:
+            self.rGreenP = self.wPlot.dPlot['Vol'].AddOverlay(
+                self.wPlot.dPlot['Vol'].rAxes.scatter(
+                    x, y,
+                    alpha     = 1,
+                    edgecolor = self.rCVolSel,
+                    linewidth = 1,
+                    color     = self.rCVolSel,
+                ))
         #------------------------------> Draw
         if draw:
-            self.wPlot.dPlot['Vol'].rCanvas.draw()
+            self.wPlot.dPlot['Vol'].Blit()
         #endregion ---------------------------------------------> Volcano Plot
 
         return True
@@ -713,7 +768,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #region --------------------------------------------------->
         if not self.rLabelProt:
             if draw:
-                self.wPlot.dPlot['Vol'].rCanvas.draw()
+                self.wPlot.dPlot['Vol'].Blit()
                 #------------------------------>
                 self.wPlot.dPlot['Vol'].ZoomResetSetValues()
             #------------------------------>
@@ -752,14 +807,15 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             y = -np.log10(y)
             #------------------------------>
             if x > 0:
-                self.rLabelProtD[tKey] = self.wPlot.dPlot['Vol'].rAxes.text(
+                tText = self.wPlot.dPlot['Vol'].rAxes.text(
                     x+dX,y-dY, prot[1], va='top')
             else:
-                self.rLabelProtD[tKey] = self.wPlot.dPlot['Vol'].rAxes.text(
+                tText = self.wPlot.dPlot['Vol'].rAxes.text(
                     x-dX,y-dY, prot[1], ha='right',va='top')
+            self.rLabelProtD[tKey] = self.wPlot.dPlot['Vol'].AddOverlay(tText)
         #------------------------------>
         if draw:
-            self.wPlot.dPlot['Vol'].rCanvas.draw()
+            self.wPlot.dPlot['Vol'].Blit()
             #------------------------------>
             self.wPlot.dPlot['Vol'].ZoomResetSetValues()
         #endregion ------------------------------------------------>
@@ -1316,29 +1372,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             list of list of floats
                 [xRange, yRange] e.g. [[-0.3, 0.3], [-0.1, 4.5]]
         """
-        #region ---------------------------------------------------> Variables
-        data = getattr(self.rData, date)
-        idx  = pd.IndexSlice
-        #------------------------------>
-        x = data.df.loc[:, idx[:,:,'FC']]
-        #------------------------------>
-        if self.rCorrP:
-            y = data.df.loc[:, idx[:,:,'Pc']]
-        else:
-            y = data.df.loc[:, idx[:,:,'P']]
-        #------------------------------>
-        y = -np.log10(y)
-        #endregion ------------------------------------------------> Variables
-
-        #region ---------------------------------------------------> Get Range
-        #------------------------------> X
-        xRange = cStatistic.DataRange(
-            x, symm=True, margin=mConfig.core.MatPlotMargin)
-        #------------------------------> Y
-        yRange = cStatistic.DataRange(y, margin=mConfig.core.MatPlotMargin)
-        #endregion ------------------------------------------------> Get Range
-
-        return [xRange, yRange]
+        return protMethod.SummaryVolRange(self.GetSummary(date), self.rCorrP)
     #---
 
     def GetFcXYRange(self, date:str) -> list[list[float]]:
@@ -1354,32 +1388,74 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             list of list of floats
                 [xRange, yRange] e.g. [[-0.3, 3.3], [-0.1, 4.5]]
         """
-        #region ---------------------------------------------------> Variables
-        data = getattr(self.rData, date)
-        idx  = pd.IndexSlice
-        #------------------------------>
-        y   = data.df.loc[:, idx[:,:,'FC']]
-        yCI = data.df.loc[:, idx[:,:,'CI']]
-        #endregion ------------------------------------------------> Variables
+        return protMethod.SummaryFcRange(
+            self.GetSummary(date), len(self.rDataC.labelB))
+    #---
 
-        #region ---------------------------------------------------> Get Range
-        #------------------------------> X
-        dm = len(self.rDataC.labelB) * mConfig.core.MatPlotMargin
-        xRange = [-dm, len(self.rDataC.labelB) + dm]
-        #------------------------------> Y
-        #-------------->
-        yMin, yMax = cStatistic.DataRange(y)
-        _, ciMax   = cStatistic.DataRange(yCI)
-        #-------------->
-        yminLim = yMin - ciMax
-        ymaxLim = yMax + ciMax
-        #-------------->
-        dm = (ymaxLim - yminLim) * mConfig.core.MatPlotMargin
-        #-------------->
-        yRange = [yminLim - dm, ymaxLim + dm]
-        #endregion ------------------------------------------------> Get Range
+    def ReadDate(self, tDate:str, notify:bool=True) -> bool:
+        """Read the result of an analysis the first time it is shown.
 
-        return [xRange, yRange]
+            Parameters
+            ----------
+            tDate: str
+                A valid date from the project.
+            notify: bool
+                Show a notification if the result cannot be read.
+
+            Returns
+            -------
+            bool
+                False if the result file cannot be read.
+
+            Notes
+            -----
+            Results are read when first used, see protMethod.ProtAnalysis.
+            Read errors are reported like the errors found when the UMSAP
+            file was loaded.
+        """
+        #region ---------------------------------------------------> Read
+        try:
+            getattr(self.rData, tDate).df                                       # pylint: disable=expression-not-assigned
+        except Exception as e:
+            if notify:
+                cWindow.Notification(
+                    'warning',
+                    msg = (f'The data for analysis:\n{tDate}\n contains '
+                           f'errors or was not found.'),
+                    setText    = True,
+                    tException = e,
+                    parent     = self,
+                )
+            return False
+        #endregion ------------------------------------------------> Read
+
+        return True
+    #---
+
+    def GetSummary(self, date:str) -> dict:
+        """Get the summary of the results for the given date.
+
+            Parameters
+            ----------
+            date: str
+                A valid date from the project.
+
+            Returns
+            -------
+            dict
+                See protMethod.Summary.
+
+            Notes
+            -----
+            UMSAP files created by older versions do not have the summary. In
+            this case the summary is calculated once from the results.
+        """
+        data = getattr(self.rData, date)
+        #------------------------------>
+        if not data.summary:
+            data.summary = protMethod.Summary(data.df)
+        #------------------------------>
+        return data.summary
     #---
 
     def DrawLinesHypCurve(self) -> bool:
@@ -1392,9 +1468,9 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         lim = self.rT0*self.rS0
         xCP = np.arange(lim+0.001, 20, 0.001)
         yCP = abs((abs(xCP)*self.rT0)/(abs(xCP)-lim))
-        self.wPlot.dPlot['Vol'].rAxes.plot(
+        self.rVolLineArt += self.wPlot.dPlot['Vol'].rAxes.plot(
             xCP,  yCP, color=self.rCCV)
-        self.wPlot.dPlot['Vol'].rAxes.plot(
+        self.rVolLineArt += self.wPlot.dPlot['Vol'].rAxes.plot(
             -xCP, yCP, color=self.rCCV)
         return True
     #---
@@ -1411,12 +1487,12 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #endregion ------------------------------------------------> Variables
 
         #region --------------------------------------------------->
-        self.wPlot.dPlot['Vol'].rAxes.hlines(
-            p, -100, 100, color=self.rCCV)
-        self.wPlot.dPlot['Vol'].rAxes.vlines(
-            self.rLog2FC, -100, 100, color=self.rCCV)
-        self.wPlot.dPlot['Vol'].rAxes.vlines(
-            -self.rLog2FC, -100, 100, color=self.rCCV)
+        self.rVolLineArt.append(self.wPlot.dPlot['Vol'].rAxes.hlines(
+            p, -100, 100, color=self.rCCV))
+        self.rVolLineArt.append(self.wPlot.dPlot['Vol'].rAxes.vlines(
+            self.rLog2FC, -100, 100, color=self.rCCV))
+        self.rVolLineArt.append(self.wPlot.dPlot['Vol'].rAxes.vlines(
+            -self.rLog2FC, -100, 100, color=self.rCCV))
         #endregion ------------------------------------------------>
 
         return True
@@ -1434,94 +1510,88 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         return True
     #---
 
-    def GetColorHyCurve(self, *args) -> list:
+    def GetColorHyCurve(self, *args) -> np.ndarray:                             # pylint: disable=unused-argument
         """Get color for Volcano plot when schemes is Hyp Curve.
 
             Returns
             -------
-            list
-                List with a color for each protein.
+            np.ndarray
+                RGBA color for each protein.
         """
-        #region ---------------------------------------------------> Variables
-        color = []
-        lim = self.rT0*self.rS0
-        x = args[0]
-        y = args[1]
-        #endregion ------------------------------------------------> Variables
-
-        #region -------------------------------------------------------> Color
-        for k,v in enumerate(x.values):
-            if v < -lim:
-                if abs((abs(v)*self.rT0)/(abs(v)-lim)) < y.values[k]:
-                    color.append(self.rCVol[0])
-                else:
-                    color.append(self.rCVol[1])
-            elif v > lim:
-                if abs((abs(v)*self.rT0)/(abs(v)-lim)) < y.values[k]:
-                    color.append(self.rCVol[2])
-                else:
-                    color.append(self.rCVol[1])
-            else:
-                color.append(self.rCVol[1])
-        #endregion ----------------------------------------------------> Color
-
         #region --------------------------------------------------->
         self.rVolLines = ['Hyperbolic Curve Line']
         #endregion ------------------------------------------------>
 
-        return color
+        return self.GetColor(
+            protMethod.VolColorHCurve, self.rT0, self.rS0, self.rCorrP)
     #---
 
-    def GetColorZScore(self, *args) -> list:                                    # pylint: disable=unused-argument
+    def GetColorZScore(self, *args) -> np.ndarray:                              # pylint: disable=unused-argument
         """Get the color by z value.
 
             Returns
             -------
-            list
-                List of colors.
+            np.ndarray
+                RGBA color for each protein.
         """
-        #region ---------------------------------------------------> Variables
-        zVal = stats.norm.ppf(1.0-(self.rZ/100.0))
-        #------------------------------>
-        idx = pd.IndexSlice
-        col = idx[self.rCondC,self.rRpC,'FCz']
-        val = self.rDf.loc[:,col]                                               # type: ignore
-        #------------------------------>
-        cond   = [val < -zVal, val > zVal]
-        choice = [self.rCVol[0], self.rCVol[2]]
-        #endregion ------------------------------------------------> Variables
-
         #region --------------------------------------------------->
         self.rVolLines = ['Z Score Line']
         #endregion ------------------------------------------------>
 
-        return np.select(cond, choice, default=self.rCVol[1])           # type: ignore
+        return self.GetColor(protMethod.VolColorZScore, self.rZ)
     #---
 
-    def GetColorPLog2FC(self, *args) -> list:                                   # pylint: disable=unused-argument
+    def GetColorPLog2FC(self, *args) -> np.ndarray:                             # pylint: disable=unused-argument
         """Get the color by P - Log2FC.
 
             Returns
             -------
-            list
-                List of colors
+            np.ndarray
+                RGBA color for each protein.
         """
-        #region -------------------------------------------------------->
-        idx  = pd.IndexSlice
-        colP = idx[self.rCondC, self.rRpC,'P']
-        valP = self.rDf.loc[:,colP]                                             # type: ignore
-        colF = idx[self.rCondC, self.rRpC,'FC']
-        valF = self.rDf.loc[:,colF]                                             # type: ignore
-        cond = [(valP < self.rP) & (valF < -self.rLog2FC),
-                (valP < self.rP) & (valF > self.rLog2FC),]
-        choice = [self.rCVol[0], self.rCVol[2]]
-        #endregion ----------------------------------------------------->
-
         #region --------------------------------------------------->
         self.rVolLines = ['P - Log2FC Line']
         #endregion ------------------------------------------------>
 
-        return np.select(cond, choice, default=self.rCVol[1])           # type: ignore
+        return self.GetColor(
+            protMethod.VolColorPLog2FC, self.rP, self.rLog2FC)
+    #---
+
+    def GetColor(self, method:Callable, *args) -> np.ndarray:
+        """Get the color of the proteins currently displayed.
+
+            Parameters
+            ----------
+            method: Callable
+                One of the protMethod.VolColor methods.
+            *args:
+                Parameters of method after df, cond and rp.
+
+            Returns
+            -------
+            np.ndarray
+                RGBA color for each protein in self.rDf.
+
+            Notes
+            -----
+            The colors are calculated once for all rows in the result of the
+            date and stored in self.rVolColor.
+        """
+        #region -------------------------------------------------------> Color
+        df  = self.rDataC.df
+        key = (self.rDateC, self.rCondC, self.rRpC, method.__name__, *args)
+        #------------------------------>
+        if (color := self.rVolColor.get(key)) is None:
+            color = self.rCVolRGBA[method(df, self.rCondC, self.rRpC, *args)]
+            self.rVolColor[key] = color
+        #endregion ----------------------------------------------------> Color
+
+        #region -----------------------------------------------------> Filters
+        if len(self.rDf) != len(df):
+            color = color[df.index.get_indexer(self.rDf.index)]
+        #endregion --------------------------------------------------> Filters
+
+        return color
     #---
 
     def PickLabel(self, ind:list[int]) -> bool:
@@ -1600,6 +1670,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         return True
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         tDate:str              = '',
@@ -1633,6 +1704,11 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             -------
             bool
         """
+        #region --------------------------------------------> Check
+        if tDate and not self.ReadDate(tDate):
+            return False
+        #endregion -----------------------------------------> Check
+
         #region --------------------------------------------> Update variables
         self.rDateC      = tDate if tDate else self.rDateC
         self.rDataC      = getattr(self.rData, self.rDateC)
@@ -1644,7 +1720,9 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         self.rS0         = s0 if s0 is not None else self.rS0
         self.rDf         = getattr(self.rData, self.rDateC).df.copy()
         self.rLabelProt  = self.UpdateLabelProt() if tDate else self.rLabelProt
-        self.rLabelProtD = {} if tDate else self.rLabelProtD
+        #------------------------------> Masks depend on date, cond and rp
+        self.rFilterMask  = []
+        self.rFilterStack = []
         #endregion -----------------------------------------> Update variables
 
         #region ---------------------------------------------------> FC minMax
@@ -1827,8 +1905,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #region --------------------------------------------------->
         data = self.rDf.iloc[:,0:2]                                             # type: ignore
         data.insert(0, 'kbr', self.rDf.index.values.tolist())
-        data = data.astype(str)
-        data = data.values.tolist()                                             # type: ignore
+        data = cMethod.DFStrList(data)
         #endregion ------------------------------------------------>
 
         #region -------------------------------------------------> Get New Sel
@@ -1936,7 +2013,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             #------------------------------>
             self.rGreenP.remove()                                               # type: ignore
             self.rGreenP = None
-            self.wPlot.dPlot['Vol'].rCanvas.draw()
+            self.wPlot.dPlot['Vol'].Blit()
             #------------------------------>
             self.FCDraw()
             #------------------------------>
@@ -1960,7 +2037,7 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         self.rLabelProtD = {}
         self.rLabelProt = []
         #------------------------------>
-        self.wPlot.dPlot['Vol'].rCanvas.draw()
+        self.wPlot.dPlot['Vol'].Blit()
         #endregion ------------------------------------------------>
 
         return True
@@ -2055,46 +2132,16 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #endregion ------------------------------------------------> Get Value
 
         #region ----------------------------------------------------------> DF
-        idx = pd.IndexSlice
-        #------------------------------>
-        if choice1 == self.cLFCSel:
-            df = self.rDf.loc[:,idx[self.rCondC,:,'FC']]                        # type: ignore
-        else:
-            df = self.rDf.loc[:,idx[:,:,'FC']]                                  # type: ignore
-        #------------------------------>
-        if choice0 == self.cLFFCUp:
-            mask = df.groupby(level=0, axis=1).apply(lambda x: (x > 0).all(axis=1))                                                                                     # type: ignore
-        elif choice0 == self.cLFFCDown:
-            mask = df.groupby(level=0, axis=1).apply(lambda x: (x < 0).all(axis=1))                                                                                     # type: ignore
-        elif choice0 == self.cLFFCNo:
-            # pylint: disable=invalid-unary-operand-type
-            mask = df.groupby(level=0, axis=1).apply(lambda x: ((x > -self.rT0*self.rS0) & (x < self.rT0*self.rS0)).all(axis=1))                                        # type: ignore
-        elif choice0 == self.cLFFCUpMon:
-            mask = df.groupby(level=0, axis=1).apply(lambda x: x.apply(lambda x: ((x.is_monotonic_increasing) & (x > 0)).all(), axis=1))                                # type: ignore
-        elif choice0 == self.cLFFCDownMon:
-            mask = df.groupby(level=0, axis=1).apply(lambda x: x.apply(lambda x: ((x.is_monotonic_decreasing) & (x < 0)).all(), axis=1))                                # type: ignore
-        elif choice0 == self.cLFDiv:
-            maskUp = self.rDf.loc[:,idx[:,:,'FC']].groupby(level=0, axis=1).apply(lambda x: x.apply(lambda x: ((x.is_monotonic_increasing) & (x > 0)).all(), axis=1))   # type: ignore
-            maskUp = maskUp.any(axis=1)                                                                                                                                 # type: ignore
-            maskDown = self.rDf.loc[:,idx[:,:,'FC']].groupby(level=0, axis=1).apply(lambda x: x.apply(lambda x: ((x.is_monotonic_decreasing) & (x < 0)).all(), axis=1)) # type: ignore
-            maskDown = maskDown.any(axis=1)                                                                                                                             # type: ignore
-        elif choice0 == self.cLFFCOpposite:
-            maskUp = self.rDf.loc[:,idx[:,:,'FC']].groupby(level=0, axis=1).apply(lambda x: (x > 0).all(axis=1))                                                        # type: ignore
-            maskUp = maskUp.any(axis=1)                                                                                                                                 # type: ignore
-            maskDown = self.rDf.loc[:,idx[:,:,'FC']].groupby(level=0, axis=1).apply(lambda x: (x < 0).all(axis=1))                                                      # type: ignore
-            maskDown = maskDown.any(axis=1)                                                                                                                             # type: ignore
-        else:
+        if (mode := self.cLFFCMode.get(choice0)) is None:
             return False
         #------------------------------>
-        if choice0 not in [self.cLFDiv, self.cLFFCOpposite]:
-            if choice1 == self.cLFCAny:
-                mask = mask.any(axis=1)                                         # type: ignore
-            else:
-                mask = mask.all(axis=1)                                         # type: ignore
-        else:
-            mask = pd.concat([maskUp, maskDown], axis=1).all(axis=1)            # type: ignore
-        #------------------------------>
-        self.rDf = self.rDf[mask]
+        self.FilterAdd(protMethod.FilterFCEvol(
+            self.rDataC.df,
+            mode,
+            cond = self.rCondC if choice1 == self.cLFCSel else None,
+            anyC = choice1 == self.cLFCAny,
+            lim  = self.rT0*self.rS0,
+        ))
         #endregion -------------------------------------------------------> DF
 
         #region --------------------------------------------------> Update GUI
@@ -2125,28 +2172,11 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             -------
             bool
         """
-        #region ---------------------------------------------------> Variables
-        filterText = mConfig.prot.kwFilterHypCurve
-        lim        = self.rT0 * self.rS0
-        fc         = self.rDf.loc[:,[(self.rCondC,self.rRpC,'FC')]]
-        p          = -np.log10(self.rDf.loc[:,[(self.rCondC,self.rRpC,'P')]])
-        #endregion ------------------------------------------------> Variables
-
-        #region ---------------------------------------------------> H Curve
-        cond   = [fc < -lim, fc > lim]
-        choice = [
-            protMethod.HCurve(fc, self.rT0, self.rS0),
-            protMethod.HCurve(fc, self.rT0, self.rS0),
-        ]
-        pH = np.select(cond, choice, np.nan)
-        #endregion ------------------------------------------------> H Curve
-
         #region ---------------------------------------------------> Filter
-        cond     = [pH < p, pH > p]
-        choice   = [True, False]
-        npBool   = np.select(cond, choice)
-        npBool   = npBool.astype(bool)
-        self.rDf = self.rDf[npBool]
+        filterText = mConfig.prot.kwFilterHypCurve
+        #------------------------------>
+        self.FilterAdd(protMethod.FilterHCurve(
+            self.rDataC.df, self.rCondC, self.rRpC, self.rT0, self.rS0))
         #endregion ------------------------------------------------> Filter
 
         #region --------------------------------------------------> Update GUI
@@ -2206,12 +2236,8 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         op, val = uText[0].strip().split()
         val = float(val)
         #------------------------------>
-        idx = pd.IndexSlice
-        col = idx[self.rCondC,self.rRpC,'FC']
-        if op == '<':
-            self.rDf = self.rDf[self.rDf[col] <= val]
-        else:
-            self.rDf = self.rDf[self.rDf[col] >= val]
+        self.FilterAdd(protMethod.FilterLog2FC(
+            self.rDataC.df, self.rCondC, self.rRpC, op, val))                   # type: ignore
         #endregion ---------------------------------------> Get Value and Plot
 
         #region ------------------------------------------> Update Filter List
@@ -2276,21 +2302,10 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #region ------------------------------------------> Get Value and Plot
         op, val = uText.strip().split()
         val = float(val)
-        #------------------------------> Apply to regular or corrected P values
-        idx = pd.IndexSlice
-        if self.rCorrP:
-            col = idx[self.rCondC,self.rRpC,'Pc']
-        else:
-            col = idx[self.rCondC,self.rRpC,'P']
-        #------------------------------> Given value is abs or -log10 P value
-        df = self.rDf.copy()
-        if not absB:
-            df.loc[:,col] = -np.log10(df.loc[:,col])                            # type: ignore
         #------------------------------>
-        if op == '<':
-            self.rDf = self.rDf[df[col] <= val]
-        else:
-            self.rDf = self.rDf[df[col] >= val]
+        self.FilterAdd(protMethod.FilterPValue(
+            self.rDataC.df, self.rCondC, self.rRpC, op, val,                    # type: ignore
+            absB=bool(absB), corrP=self.rCorrP))
         #endregion ---------------------------------------> Get Value and Plot
 
         #region ------------------------------> Update Filter List & StatusBar
@@ -2351,16 +2366,9 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
 
         #region ------------------------------------------> Get Value and Plot
         op, val = uText.strip().split()
-        zVal = stats.norm.ppf(1.0-(float(val.strip())/100.0))
         #------------------------------>
-        idx = pd.IndexSlice
-        col = idx[self.rCondC,self.rRpC,'FCz']
-        if op == '<':
-            self.rDf = self.rDf[
-                (self.rDf[col] >= zVal) | (self.rDf[col] <= -zVal)]
-        else:
-            self.rDf = self.rDf[
-                (self.rDf[col] <= zVal) | (self.rDf[col] >= -zVal)]
+        self.FilterAdd(protMethod.FilterZScore(
+            self.rDataC.df, self.rCondC, self.rRpC, op, float(val.strip())))   # type: ignore
         #endregion ---------------------------------------> Get Value and Plot
 
         #region ------------------------------------------> Update Filter List
@@ -2379,6 +2387,89 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         return True
     #---
 
+    def FilterAdd(self, mask:np.ndarray) -> bool:
+        """Add the rows kept by a new filter to the mask stack and update
+            self.rDf.
+
+            Parameters
+            ----------
+            mask: np.ndarray
+                Boolean mask over the rows of the current date.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Stack
+        self.rFilterMask.append(mask)
+        self.rFilterStack.append(
+            self.rFilterStack[-1] & mask if self.rFilterStack else mask)
+        #endregion ------------------------------------------------> Stack
+
+        return self.FilterSetDf()
+    #---
+
+    def FilterRemove(self, idx:list[int]) -> bool:
+        """Remove filters using the cached masks.
+
+            Parameters
+            ----------
+            idx: list[int]
+                Index of the filters in self.rFilterList.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            If the masks are not available, e.g. filters were not applied
+            after changing the date, the remaining filters are applied again.
+        """
+        #region ---------------------------------------------------> Remove
+        cached = len(self.rFilterMask) == len(self.rFilterList)
+        #------------------------------>
+        for k in sorted(idx, reverse=True):
+            del self.rFilterList[k]
+            if cached:
+                del self.rFilterMask[k]
+        #endregion ------------------------------------------------> Remove
+
+        #region ---------------------------------------------------> Update
+        if not cached:
+            self.rFilterMask  = []
+            self.rFilterStack = []
+            self.FilterSetDf()
+            for k in self.rFilterList:
+                self.dKeyMethod[k[0]](**k[1])
+        elif idx == [len(self.rFilterList)]:
+            self.rFilterStack.pop()
+        else:
+            self.rFilterStack = list(np.logical_and.accumulate(self.rFilterMask))
+        #endregion ------------------------------------------------> Update
+
+        return self.FilterSetDf()
+    #---
+
+    def FilterSetDf(self) -> bool:
+        """Set self.rDf from the top of the mask stack.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Set
+        df = getattr(self.rData, self.rDateC).df
+        #------------------------------>
+        if self.rFilterStack:
+            self.rDf = df[self.rFilterStack[-1]]
+        else:
+            self.rDf = df.copy()
+        #endregion ------------------------------------------------> Set
+
+        return True
+    #---
+
     def FilterApply(self, reset:bool=True) -> bool:
         """Apply all filter to the current date.
 
@@ -2394,6 +2485,8 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #region ----------------------------------------------------> Reset df
         if reset:
             self.rDf = getattr(self.rData, self.rDateC).df.copy()
+        self.rFilterMask  = []
+        self.rFilterStack = []
         #endregion -------------------------------------------------> Reset df
 
         #region -----------------------------------------------> Apply Filters
@@ -2416,8 +2509,10 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             bool
         """
         #region -------------------------------------------> Update Attributes
-        self.rDf         = getattr(self.rData, self.rDateC).df.copy()
-        self.rFilterList = []
+        self.rFilterList  = []
+        self.rFilterMask  = []
+        self.rFilterStack = []
+        self.FilterSetDf()
         self.wStatBar.SetStatusText('', 1)
         #endregion ----------------------------------------> Update Attributes
 
@@ -2441,11 +2536,10 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
         #endregion --------------------------------> Check Something to Delete
 
         #region -------------------------------------------> Update Attributes
-        del self.rFilterList[-1]
+        self.FilterRemove([len(self.rFilterList)-1])
         #endregion ----------------------------------------> Update Attributes
 
         #region --------------------------------------------------> Update GUI
-        self.FilterApply()
         self.UpdateStatusBarFilterText()
         self.UpdateGUI()
         #endregion -----------------------------------------------> Update GUI
@@ -2479,14 +2573,9 @@ class ResProtProf(cWindow.BaseWindowResultListTextNPlot):
             return True
         #endregion ---------------------------------------------------> Dialog
 
-        #region ---------------------------------------------------> Variables
-        for k in reversed(lo):
-            del self.rFilterList[k]
-        #endregion ------------------------------------------------> Variables
-
         #region --------------------------------------------------> Update GUI
-        if self.rFilterList:
-            self.FilterApply()
+        if len(lo) < len(self.rFilterList):
+            self.FilterRemove(lo)
             self.UpdateStatusBarFilterText()
             self.UpdateGUI()
         else:
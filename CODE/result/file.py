@@ -249,6 +249,7 @@ class UMSAPFile():
         setattr(data, tDate, dataMethod.DataAnalysis(
             dp         = dataMethod.DataSteps(**dp),
             numColList = numColList,
+            repVal     = self.rData[tSection][tDate].get('RV', []),
         ))
         data.date.append(tDate)
         #endregion -----------------------------------------------------> Data
@@ -290,6 +291,7 @@ class UMSAPFile():
             setattr(data, k, dataMethod.DataAnalysis(
                 dp         = dataMethod.DataSteps(**dp),
                 numColList = numColList,
+                repVal     = v.get('RV', []),
             ))
             data.date.append(k)
         #endregion ----------------------------------------------> Plot & Menu
@@ -307,20 +309,21 @@ class UMSAPFile():
                 value protMethod.ProtProfAnalysis.
         """
         #region ---------------------------------------------------> Variables
-        data   = cMethod.BaseAnalysis()
-        colStr = [('Gene','Gene','Gene'),('Protein','Protein','Protein')]
-        pathB  = mConfig.prot.tMod.replace(" ", "-")
+        data  = cMethod.BaseAnalysis()
+        pathB = mConfig.prot.tMod.replace(" ", "-")
         #endregion ------------------------------------------------> Variables
 
         #region -------------------------------------------------> Plot & Menu
         for k,v in self.rData[mConfig.prot.tMod].items():
             #------------------------------> Path
             pathA = k.split(" - ")[0]
-            tPath = self.rStepDataP / f'{pathA}_{pathB}'
+            fileP = self.rStepDataP / f'{pathA}_{pathB}' / v['R']
             #------------------------------> Read and type
-            try:
-                df = cFile.ReadCSV2DF(tPath/v['R'], header=[0,1,2])
-                df.loc[:,colStr] = df.loc[:,colStr].astype('str')               # type: ignore
+            try:                                                                # With a summary df is read when needed
+                if v.get('S', {}) and fileP.is_file():
+                    df = None
+                else:
+                    df = protMethod.ReadResult(fileP)
             except Exception:
                 data.error.append(k)
                 continue
@@ -339,13 +342,15 @@ class UMSAPFile():
                 ctrlName = v['CI']['ctrlName'][0]
             #------------------------------> Add to class
             setattr(data, k, protMethod.ProtAnalysis(
-                df       = df,
+                dfP      = fileP,
+                dfCache  = df,
                 filterS  = v['F'],
                 alpha    = alpha,
                 labelA   = labelA,
                 labelB   = labelB,
                 ctrlName = ctrlName,
                 ctrlType = ctrlType,
+                summary  = v.get('S', {}),                                      # Keep support for older versions
             ))
             data.date.append(k)
         #endregion ----------------------------------------------> Plot & Menu
@@ -375,6 +380,7 @@ class UMSAPFile():
             #------------------------------>
             try:
                 df = cFile.ReadCSV2DF(tPath/v['R'], header=[0,1,2])
+                df = cMethod.DFCategory(df, [0])
             except Exception:
                 plotData.error.append(k)
                 continue
@@ -434,6 +440,7 @@ class UMSAPFile():
             #------------------------------>
             try:
                 df  = cFile.ReadCSV2DF(tPath/v['R'], header=[0,1])
+                df  = cMethod.DFCategory(df, [0])
             except Exception:
                 data.error.append(k)
                 continue
@@ -655,10 +662,12 @@ class UMSAPFile():
         #endregion ---------------------------------------------> Path
 
         #region --------------------------------------------------->
-        seqObj = cFile.FastaFile(self.rInputFileP/fileN)
+        seqObj = cFile.FastaIndex(self.rInputFileP/fileN)
+        seqRec = seqObj.GetSeq(0)[1] if len(seqObj) > 0 else ''
+        seqNat = seqObj.GetSeq(1)[1] if len(seqObj) > 1 else ''
         #endregion ------------------------------------------------>
 
-        return (seqObj.rSeqRec, seqObj.rSeqNat)
+        return (seqRec, seqNat)
     #---
 
     def GetRecSeq(self, tSection:str, tDate:str) -> str:
@@ -91,17 +91,28 @@ def LoadUMSAPFile(
     #endregion -----------------------------------------> Get file from Dialog
 
     #region ----------------------------> Raise window if file is already open
-    if mConfig.res.winUMSAP.get(tFileP, '') != '':
-        #------------------------------>
-        mConfig.res.winUMSAP[tFileP].UpdateFileContent()
-        #------------------------------>
-        mConfig.res.winUMSAP[tFileP].Raise()
-        #------------------------------>
-        return True
+    profiler = cMethod.Profiler()
+    profiler.Start()
     #------------------------------>
-    mConfig.res.winUMSAP[tFileP] = resWindow.UMSAPControl(tFileP)
+    try:
+        if mConfig.res.winUMSAP.get(tFileP, '') != '':
+            #------------------------------>
+            mConfig.res.winUMSAP[tFileP].UpdateFileContent()
+            #------------------------------>
+            mConfig.res.winUMSAP[tFileP].Raise()
+        else:
+            mConfig.res.winUMSAP[tFileP] = resWindow.UMSAPControl(tFileP)
+    finally:
+        profile = profiler.Stop(cMethod.ProfileFile(tFileP, 'Load-UMSAP'))
     #endregion -------------------------> Raise window if file is already open
 
+    #region -----------------------------------------------------> Profile
+    if profile:
+        cWindow.Notification(
+            'success', msg='UMSAP file loaded.', tException=profile,
+            setText=True)
+    #endregion --------------------------------------------------> Profile
+
     return True
 #---
 #endregion ----------------------------------------------------------> Methods
@@ -710,6 +710,18 @@ class UMSAPControl(cWindow.BaseWindow):
                     else:
                         self.wTrc.SetItemFont(
                             childc, mConfig.core.fTreeItemDataFile)
+                #------------------------------> Add time & memory per step
+                if (tStep := d.get('T', {})):
+                    childc = self.wTrc.AppendItem(childb, 'Time & Memory')
+                    self.wTrc.SetItemFont(childc, mConfig.core.fTreeItemDataFile)
+                    for e, f in tStep.items():
+                        childd = self.wTrc.AppendItem(
+                            childc,
+                            (f"{e}: {f['Wall']:.2f} s, CPU {f['CPU']:.2f} s, "
+                             f"{f['Memory']:.1f} MB"),
+                        )
+                        self.wTrc.SetItemFont(
+                            childd, mConfig.core.fTreeItemDataFile)
         #endregion ---------------------------------------------> Add elements
 
         #region -------------------------------------------------> Expand root
@@ -39,6 +39,8 @@ class Configuration():
     tuCpR:str           = 'Cleavage per Residues'
     tuCEvol:str         = 'Cleavage Evolution'
     tTab:str            = 'TarProt'                                             # Title of the Conf Tab
+    #------------------------------> File names
+    fnMainData:str = '{}_{}-TargetedProteolysis-Data.txt'                       # Main results file in Steps_Data_Files
     #------------------------------> Label
     lStExp:str          = 'Experiments'                                         # lSt: Label for wx.StaticText
     lmClearPeptide:str  = 'Peptide'                                             # lm: Label for wx.MenuItem
@@ -17,7 +17,7 @@
 #region -------------------------------------------------------------> Imports
 from collections import namedtuple
 from dataclasses import dataclass, field
-from typing      import Optional, Literal, Union, TYPE_CHECKING
+from typing      import Callable, Optional, Literal, Union, TYPE_CHECKING
 
 import numpy  as np
 import pandas as pd
@@ -29,6 +29,8 @@ from reportlab.platypus      import SimpleDocTemplate, Paragraph, Spacer
 from reportlab.lib.styles    import getSampleStyleSheet, ParagraphStyle
 
 from config.config import config as mConfig
+from core     import exception as cException
+from core     import file      as cFile
 from core     import method    as cMethod
 from core     import statistic as cStatistic
 from dataprep import method    as dataMethod
@@ -58,7 +60,7 @@ class UserData(cMethod.BaseUserData):
          'correctedP', 'posAA', 'winHist', 'ocSeq', 'ocTargetProt', 'ocScore',
          'ocColumn', 'resCtrl', 'labelA', 'ctrlName', 'dfSeq', 'dfTargetProt',
          'dfScore', 'dfResCtrl', 'protLength', 'protLoc', 'protDelta', 'minRep',
-         'minRepList',
+         'minRepList', 'float32',
         ])
     longestKey:int = 17                                                         # Length of the longest Key in dI
     #endregion ------------------------------------------------------> Options
@@ -90,9 +92,13 @@ class TarpAnalysis():
 #region -------------------------------------------------------------> Methods
 def TarProt(
     *args,
-    df:pd.DataFrame  = pd.DataFrame(),                                          # pylint: disable=unused-argument
-    rDO:UserData     = UserData(),
-    resetIndex: bool = True,
+    df:pd.DataFrame                       = pd.DataFrame(),                     # pylint: disable=unused-argument
+    rDO:UserData                          = UserData(),
+    resetIndex: bool                      = True,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    spill:Optional[Callable[..., dict]]   = None,
     **kwargs
     ) -> tuple[dict, str, Optional[Exception]]:
     """Perform a Targeted Proteolysis analysis.
@@ -107,6 +113,15 @@ def TarProt(
             Dataclass with user input.
         resetIndex: bool
             Reset index of dfS (True) or not (False). Default is True.
+        cancel: cMethod.CancelToken or None
+            Checked for each peptide.
+        checkpoint: cFile.Checkpoint or None
+            Resume the data preparation.
+        timer: cMethod.StepTimer or None
+            Record the resources used by the data preparation and statistics.
+        spill: Callable or None
+            Write the finished data preparation steps to disk, see
+            dataMethod.RunDataPreparation.
         **kwargs:
             Ignored here. Needed for compatibility.
 
@@ -124,6 +139,7 @@ def TarProt(
                         'dfE' : pd.DataFrame,
                         'dfS' : pd.DataFrame,
                         'dfR' : pd.DataFrame,
+                        'rRepVal': list[int],
                     },
                     '',
                     None
@@ -247,12 +263,15 @@ def TarProt(
         """
         #region ------------------------------------------------------> Helper
         def _get_list(valT:Union[list,tuple]) -> list:
-            """Get intensities as a list, discarding NA values."""
+            """Get intensities as a list, discarding NA values. float32
+                values are converted with their shortest decimal
+                representation, e.g. 12.3 and not 12.300000190734863.
+            """
             #region --------------------------------------------------->
             listO = []
             for x in valT:
                 if np.isfinite(x):
-                    listO.append(x)
+                    listO.append(float(str(np.float32(x))) if rDO.float32 else x)
             #endregion ------------------------------------------------>
 
             return listO
@@ -288,6 +307,7 @@ def TarProt(
         #-------------->
         k = 0
         for row in dfS.itertuples(index=False):
+            cancel.Check()
             try:
                 dfAncova = _prepareAncova(row, totalRowAncovaDF)
                 #------------------------------> P value
@@ -352,7 +372,12 @@ def TarProt(
     #endregion ----------------------------------------------------> Variables
 
     #region ------------------------------------------------> Data Preparation
-    tOut = dataMethod.RunDataPreparation(df=df, rDO=rDO, resetIndex=resetIndex)
+    cancel = cancel if cancel is not None else cMethod.CancelToken()
+    timer  = timer if timer is not None else cMethod.StepTimer(memory=False)
+    #------------------------------>
+    tOut = dataMethod.RunDataPreparation(
+        df=df, rDO=rDO, resetIndex=resetIndex, cancel=cancel,
+        checkpoint=checkpoint, timer=timer, spill=spill)
     if tOut[0]:
         dfS = tOut[0]['dfS']
     else:
@@ -360,6 +385,7 @@ def TarProt(
     #endregion ---------------------------------------------> Data Preparation
 
     #region --------------------------------------------------------> Analysis
+    timer.Begin('Statistics')
     #------------------------------> Empty dfR
     dfR = _emptyDFR()
     #------------------------------> N, C Res Num
@@ -369,6 +395,7 @@ def TarProt(
     #------------------------------> Average Int
     k = 0
     for row in dfS.itertuples(index=False):
+        cancel.Check()
         _int_col(k, row)
         k = k + 1
     #------------------------------> P values
@@ -402,12 +429,170 @@ def TarProt(
     dfR = dfR.reset_index(drop=True)
     #------------------------------>
     tOut[0]['dfR'] = dfR
+    timer.End('Statistics')
     #endregion -----------------------------------------------------> Sort
 
     return (tOut[0], '', None)
 #---
 
 
+def FurtherAnalysis(
+    dfR:pd.DataFrame,
+    rDO:UserData,
+    cancel:Optional[cMethod.CancelToken]  = None,
+    checkpoint:Optional[cFile.Checkpoint] = None,
+    timer:Optional[cMethod.StepTimer]     = None,
+    msgFunc:Callable[[str], object]       = print,
+    ) -> tuple[dict, str, Optional[Exception]]:
+    """Calculate the Cleavage per Residue, Cleavage Evolution and the
+        requested AA distribution and Histograms.
+
+        Parameters
+        ----------
+        dfR: pd.DataFrame
+            Results of the Targeted Proteolysis analysis.
+        rDO: UserData
+            Dataclass with user input. rDO.seqFileObj is needed for the AA
+            distribution.
+        cancel: cMethod.CancelToken or None
+            Checked before each step.
+        checkpoint: cFile.Checkpoint or None
+            Load or store the output of each step.
+        timer: cMethod.StepTimer or None
+            Record the resources used by each step.
+        msgFunc: Callable
+            Called with the name of each step.
+
+        Returns
+        -------
+        tuple:
+            -   (
+                    {
+                        'dfCpR'  : pd.DataFrame,
+                        'dfCEvol': pd.DataFrame,
+                        'dfAA'   : pd.DataFrame, if rDO.posAA is not None
+                        'dfHist' : pd.DataFrame, if rDO.winHist is not None
+                    },
+                    '',
+                    None
+                )                                  when everything went fine.
+            -   ({}, 'Error message', Exception)   when something went wrong.
+    """
+    # No test
+    #region -------------------------------------------------------> Variables
+    cancel = cancel if cancel is not None else cMethod.CancelToken()
+    timer  = timer if timer is not None else cMethod.StepTimer(memory=False)
+    #------------------------------>
+    idx   = pd.IndexSlice
+    first = mConfig.tarp.dfcolFirstPart[2:]
+    tIdxH = idx[first+rDO.labelA, first+['P']]
+    tIdxE = idx[first+rDO.labelA, first+['Int', 'P']]
+    tIdxA = idx[['Sequence']+rDO.labelA, ['Sequence', 'P']]
+    #------------------------------> (key, checkpoint, name, method, error)
+    stepL = [
+        ('dfCpR', 'CpR', 'Cleavage per Residue',
+         lambda: R2CpR(dfR.loc[:,tIdxH], rDO.alpha, rDO.protLength),            # type: ignore
+         'The Cleavage per Residue method failed.'),
+        ('dfCEvol', 'CEvol', 'Cleavage Evolution',
+         lambda: R2CEvol(dfR.loc[:,tIdxE], rDO.alpha, rDO.protLength),          # type: ignore
+         'The Cleavage Evolution method failed.'),
+    ]
+    if rDO.posAA is not None:
+        stepL.append(('dfAA', 'AA', 'AA Distribution',
+            lambda: R2AA(dfR.loc[:,tIdxA], rDO.seqFileObj.rSeqRec, rDO.alpha,   # type: ignore
+                rDO.protLength[0], pos=rDO.posAA),                              # type: ignore
+            'Amino acid distribution calculation failed.'))
+    if rDO.winHist is not None:
+        stepL.append(('dfHist', 'Hist', 'Histograms',
+            lambda: R2Hist(dfR.loc[:,tIdxH], rDO.alpha, rDO.winHist,            # type: ignore
+                rDO.protLength),
+            'The Histogram generation method failed.'))
+    #endregion ----------------------------------------------------> Variables
+
+    #region -------------------------------------------------------------> Run
+    dictO = {}
+    for key, step, name, method, msgError in stepL:
+        try:
+            cancel.Check()
+        except cException.Cancelled as e:
+            return ({}, cMethod.StrCancel(), e)
+        #------------------------------>
+        msgFunc(name)
+        timer.Begin(name)
+        try:
+            if checkpoint is None or (df := checkpoint.Load(step)) is None:
+                df = method()
+                if checkpoint is not None:
+                    checkpoint.Save(step, df)
+        except Exception as e:
+            return ({}, msgError, e)
+        finally:
+            timer.End(name)
+        #------------------------------>
+        dictO[key] = df
+    #endregion ----------------------------------------------------------> Run
+
+    return (dictO, '', None)
+#---
+
+
+def StepDict(tDate:str, rDO:UserData, dfDict:dict) -> dict:
+    """Files and keys written in the output of a Targeted Proteolysis
+        analysis.
+
+        Parameters
+        ----------
+        tDate: str
+            Date of the analysis.
+        rDO: UserData
+            User input.
+        dfDict: dict
+            Output of the steps of the analysis, see mConfig.core.ltDFKeys.
+
+        Returns
+        -------
+        dict
+            {
+                'DP'   : dict,
+                'Files': {file name: pd.DataFrame},
+                'R'    : file with the results,
+                'CpR'  : file with the Cleavage per Residue,
+                'CEvol': file with the Cleavage Evolution,
+                'AA'   : {ID: file}, if rDO.posAA is not None,
+                'Hist' : {ID: file}, if rDO.winHist is not None,
+            }
+    """
+    # Test in test.unit.tarprot.test_method.Test_StepDict
+    #region ---------------------------------------------------> Step Dict
+    stepDict = dataMethod.StepDict(tDate, rDO, dfDict)
+    stepDict['R']     = mConfig.tarp.fnMainData.format(tDate, '09')
+    stepDict['CpR']   = f'{tDate}_CpR.txt'
+    stepDict['CEvol'] = f'{tDate}_CEvol.txt'
+    stepDict['Files'] |= {
+        mConfig.core.fnTargetProt.format(tDate, '07') : dfDict['dfTP'],
+        mConfig.core.fnScore.format(tDate,      '08') : dfDict['dfS'],
+        stepDict['R']                                 : dfDict['dfR'],
+        stepDict['CpR']                               : dfDict['dfCpR'],
+        stepDict['CEvol']                             : dfDict['dfCEvol'],
+    }
+    #endregion ------------------------------------------------> Step Dict
+
+    #region --------------------------------------------> Further Analysis
+    if rDO.posAA is not None:
+        fileN = f'{tDate}_AA-{rDO.posAA}.txt'
+        stepDict['AA'] = {f'{tDate}-{rDO.posAA}': fileN}
+        stepDict['Files'][fileN] = dfDict['dfAA']
+    #------------------------------>
+    if rDO.winHist is not None:
+        fileN = f'{tDate}_Hist-{rDO.winHist}.txt'
+        stepDict['Hist'] = {f'{tDate}-{rDO.winHist}': fileN}
+        stepDict['Files'][fileN] = dfDict['dfHist']
+    #endregion -----------------------------------------> Further Analysis
+
+    return stepDict
+#---
+
+
 def R2AA(
     df:pd.DataFrame,
     seq:str,
@@ -835,6 +1020,79 @@ def R2CEvol(df:pd.DataFrame, alpha:float, protL:tuple[int,int]) -> pd.DataFrame:
 #---
 
 
+def R2PDBResMap(
+    pdbObj:cFile.PDBFile,
+    seqRec:str,
+    ) -> tuple[np.ndarray, np.ndarray]:
+    """Map the atoms in a PDB to the residues in the Recombinant sequence.
+
+        Parameters
+        ----------
+        pdbObj: cFile.PDBFile
+            PDB to map.
+        seqRec: str
+            Sequence of the recombinant protein.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            Row in pdbObj.rDFAtom and 0 based residue number in seqRec for
+            each atom that can be mapped.
+
+        Notes
+        -----
+        All chains and models in the PDB are mapped. The sequence alignment is
+        calculated only once for chains with the same sequence. The returned
+        arrays can be used with the pd.DataFrame from R2CpR and R2CEvol as:
+        beta[rows] = df.loc[:,('Rec', Exp)].to_numpy()[res]
+    """
+    # No Test
+    #region ---------------------------------------------------> Variables
+    alignD = {}
+    rowL   = []
+    resL   = []
+    chainA = pdbObj.rDFAtom['Chain'].to_numpy()
+    resNA  = pdbObj.rDFAtom['ResNum'].to_numpy()
+    #endregion ------------------------------------------------> Variables
+
+    #region ---------------------------------------------------> Map
+    for chain in pdbObj.rChain:
+        #------------------------------> Alignment
+        dfRes  = pdbObj.GetResidue(chain)
+        resNum = dfRes['ResNum'].tolist()
+        seq    = "".join([mConfig.core.oAA3toAA[x] for x in dfRes['ResName']])
+        #------------------------------>
+        if not seq:
+            continue
+        if (align := alignD.get(seq)) is None:
+            align = alignD[seq] = cFile.SeqAlignment(seq, seqRec)
+        #------------------------------> PDB residue number -> Rec residue
+        resMap = {}
+        p = 0
+        r = 0
+        #------------------------------>
+        for a,b in zip(align.seqA, align.seqB):
+            if a != '-' and b != '-':
+                resMap[resNum[p]] = r
+            if a != '-':
+                p = p + 1
+            if b != '-':
+                r = r + 1
+        #------------------------------> Atoms
+        rows = np.flatnonzero((chainA == chain) & np.isin(resNA, list(resMap)))
+        rowL.append(rows)
+        resL.append(np.array([resMap[x] for x in resNA[rows]], dtype=int))
+    #endregion ------------------------------------------------> Map
+
+    #region ---------------------------------------------------> Return
+    if not rowL:
+        return (np.array([], dtype=int), np.array([], dtype=int))
+    #------------------------------>
+    return (np.concatenate(rowL), np.concatenate(resL))
+    #endregion ------------------------------------------------> Return
+#---
+
+
 def R2SeqAlignment(
     df:pd.DataFrame,
     alpha:float,
@@ -84,6 +84,7 @@ class TarProt(cPane.BaseConfPanelMod2):
                         'dfIm': Name of file with imputed data.
                     }
                     'R' : pd.DataFrame (dict) with the calculation results.
+                    'T' : Wall time, CPU time and peak memory of each step.
                 }
             }
         }
@@ -123,8 +124,8 @@ class TarProt(cPane.BaseConfPanelMod2):
     cSection  = mConfig.tarp.tMod
     cTitlePD  = f"Running {mConfig.tarp.tMod} Analysis"
     cGaugePD  = 35
-    rMainData = '{}_{}-TargetedProteolysis-Data.txt'
     rAnalysisMethod = tarpMethod.TarProt
+    rStepDictMethod = staticmethod(tarpMethod.StepDict)
     #------------------------------> Optional configuration
     cTTHelp = mConfig.core.ttBtnHelp.format(cURL)
     #endregion --------------------------------------------------> Class setup
@@ -602,147 +603,33 @@ class TarProt(cPane.BaseConfPanelMod2):
     #---
 
     def RunAnalysis(self) -> bool:
-        """Perform the equivalence tests.
+        """Perform the equivalence tests and the further analysis.
 
             Returns
             -------
             bool
         """
-        #region -----------------------------------------------------> Seq Obj
-        setattr(self.rDO, 'seqFileObj', self.rSeqFileObj)
-        #endregion --------------------------------------------------> Seq Obj
-
         #region -----------------------------------------------------> TarProt
         if not super().RunAnalysis():
             return False
         #endregion --------------------------------------------------> TarProt
 
-        # Further Analysis
-        idx = pd.IndexSlice
-
-        #region ----------------------------------------------------> Cleavage
-        msgStep = f'{self.cLPdRun} Cleavage per Residue'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        #------------------------------>
-        a = self.cLDFFirst[2:] + self.rDO.labelA
-        b = self.cLDFFirst[2:] + ['P']
-        tIdxH = idx[a,b] # Also used for Hist
-        #------------------------------>
-        try:
-            self.dfCpR = tarpMethod.R2CpR(
-                self.dfR.loc[:, tIdxH],                                         # type: ignore
-                self.rDO.alpha,
-                self.rDO.protLength,
-            )
-        except Exception as e:
-            self.rMsgError = 'The Cleavage per Residue method failed.'
-            self.rException = e
-            return False
-        #endregion -------------------------------------------------> Cleavage
-
-        #region ---------------------------------------------------> CutEvo
-        msgStep = f'{self.cLPdRun} Cleavage Evolution'
-        wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-        #------------------------------>
-        a    = self.cLDFFirst[2:] + self.rDO.labelA
-        b    = self.cLDFFirst[2:] + ['Int', 'P']
-        tIdx = idx[a,b]
-        #------------------------------>
-        try:
-            self.dfCEvol = tarpMethod.R2CEvol(
-                self.dfR.loc[:, tIdx],                                          # type: ignore
-                self.rDO.alpha,
-                self.rDO.protLength,
-            )
-        except Exception as e:
-            self.rMsgError = 'The Cleavage Evolution method failed.'
-            self.rException = e
-            return False
-        #endregion ------------------------------------------------> CutEvo
-
-        #region ----------------------------------------------------------> AA
-        if self.rDO.posAA is not None:
-            #------------------------------>
-            msgStep = f'{self.cLPdRun} AA Distribution'
-            wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-            #------------------------------>
-            tIdx = idx[['Sequence']+self.rDO.labelA,['Sequence', 'P']]
-            try:
-                self.dfAA = tarpMethod.R2AA(
-                    self.dfR.loc[:,tIdx],                                       # type: ignore
-                    self.rSeqFileObj.rSeqRec,
-                    self.rDO.alpha,
-                    self.rDO.protLength[0],
-                    pos = self.rDO.posAA,
-                )
-            except Exception as e:
-                self.rMsgError = 'Amino acid distribution calculation failed.'
-                self.rException = e
-                return False
-        #endregion -------------------------------------------------------> AA
-
-        #region --------------------------------------------------------> Hist
-        if self.rDO.winHist is not None:
-            #------------------------------>
-            msgStep = f'{self.cLPdRun} Histograms'
-            wx.CallAfter(self.rDlg.UpdateStG, msgStep)
-            #------------------------------>
-            try:
-                self.dfHist = tarpMethod.R2Hist(
-                    self.dfR.loc[:,tIdxH],                                      # type: ignore
-                    self.rDO.alpha,
-                    self.rDO.winHist,
-                    self.rDO.protLength
-                )
-            except Exception as e:
-                self.rMsgError = 'The Histogram generation method failed.'
-                self.rException = e
-                return False
-        #endregion -----------------------------------------------------> Hist
-
-        return True
-    #---
-
-    def WriteOutput(self) -> bool:
-        """Write output.
-
-            Returns
-            -------
-            bool
-        """
-        #region --------------------------------------------------> Data Steps
-        stepDict = self.SetStepDictDP()
-        stepDict['Files'] = {
-            mConfig.core.fnInitial.format(self.rDate,    '01') : self.dfI,
-            mConfig.core.fnFloat.format(self.rDate,      '02') : self.dfF,
-            mConfig.core.fnMinRep.format(self.rDate,     '03') : self.dfMR,
-            mConfig.core.fnTrans.format(self.rDate,      '04') : self.dfT,
-            mConfig.core.fnNorm.format(self.rDate,       '05') : self.dfN,
-            mConfig.core.fnImp.format(self.rDate,        '06') : self.dfIm,
-            mConfig.core.fnTargetProt.format(self.rDate, '07') : self.dfTP,
-            mConfig.core.fnScore.format(self.rDate,      '08') : self.dfS,
-            self.rMainData.format(self.rDate,            '09') : self.dfR,
-        }
-        stepDict['R'] = self.rMainData.format(self.rDate, '09')
-        #endregion -----------------------------------------------> Data Steps
-
         #region --------------------------------------------> Further Analysis
+        dfDict, self.rMsgError, self.rException = tarpMethod.FurtherAnalysis(
+            self.dfR,
+            self.rDO,
+            cancel     = self.rCancel,
+            checkpoint = self.rCheckpoint,
+            timer      = self.rTimer,
+            msgFunc    = lambda x: wx.CallAfter(
+                self.rDlg.UpdateStG, f'{self.cLPdRun}{x}'),
+        )
         #------------------------------>
-        stepDict['CpR']   = f'{self.rDate}_CpR.txt'
-        stepDict['CEvol'] = f'{self.rDate}_CEvol.txt'
-        #------------------------------>
-        if self.rDO.posAA is not None:
-            stepDict['AA'] = {
-                f'{self.rDate}-{self.rDO.posAA}' : f'{self.rDate}_AA-{self.rDO.posAA}.txt',
-            }
-        #------------------------------>
-        if self.rDO.winHist is not None:
-            stepDict['Hist'] = {
-                f'{self.rDate}-{self.rDO.winHist}' : f'{self.rDate}_Hist-{self.rDO.winHist}.txt',
-            }
+        for k,v in dfDict.items():
+            setattr(self, k, v)
         #endregion -----------------------------------------> Further Analysis
 
-        return self.WriteOutputData(stepDict)
+        return not self.rMsgError
     #---
 
     def RunEnd(self) -> bool:
@@ -16,16 +16,14 @@
 
 #region -------------------------------------------------------------> Imports
 import _thread
-from pathlib import Path
-from typing  import Optional, TYPE_CHECKING
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib            import Path
+from typing             import Optional, TYPE_CHECKING
 
 import pandas as pd
 
 import matplotlib.patches as mpatches
 
-from Bio       import pairwise2
-from Bio.Align import substitution_matrices
-
 import wx
 
 from config.config import config as mConfig
@@ -167,18 +165,14 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
             bool
         """
         #region ---------------------------------------------------> Variables
-        art   = event.artist
-        fragC = list(map(int, art.get_label().split('.')))
+        idx, _, y = self.PickRect(event)
+        fragC = list(map(int, self.rRectsFragL[idx].split('.')))
         #------------------------------>
         if self.rFragSelC != fragC:
             self.rFragSelC = fragC
         else:
             return True
         #------------------------------>
-        x, y = event.artist.xy
-        x = round(x)
-        y = round(y)
-        #------------------------------>
         tKey = f'{self.rDataC.labelA[fragC[0]]}-{self.rPStr}'
         #------------------------------>
         x1, x2 = getattr(self.rFragments, tKey).coord[fragC[1]]
@@ -188,10 +182,11 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
         if self.rFragSelLine is not None:
             self.rFragSelLine[0].remove()
         #------------------------------
-        self.rFragSelLine = self.wPlot['Main'].rAxes.plot(
-            [x1+2, x2-2], [y,y], color='black', linewidth=4)
+        self.rFragSelLine = self.wPlot['Main'].AddOverlay(
+            self.wPlot['Main'].rAxes.plot(
+                [x1+2, x2-2], [y,y], color='black', linewidth=4))
         #------------------------------>
-        self.wPlot['Main'].rCanvas.draw()
+        self.wPlot['Main'].Blit()
         #endregion ---------------------------------------> Highlight Fragment
 
         #region -------------------------------------------------------> Print
@@ -260,6 +255,7 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
         return (date, menuData)
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         tDate:str            ='',
@@ -431,21 +427,21 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
             bool
         """
         #region ---------------------------------------------------> Fragments
-        #------------------------------> Remove old
-        for k in self.rRectsFrag:
-            k.set_linewidth(self.cGelLineWidth)
         #------------------------------> Get Keys
         fKeys = [f'{x}-{self.rPStr}' for x in self.rDataC.labelA]
         #------------------------------> Highlight
-        j = 0
+        sel = []
+        j   = 0
         for k in fKeys:
             frag = getattr(self.rFragments, k)
             for p in frag.seqL:
                 if self.rPeptide in p:
-                    self.rRectsFrag[j].set_linewidth(2.0)
+                    sel.append(j)
                 else:
                     pass
                 j = j + 1
+        #------------------------------>
+        self.SetRectsLineWidth(self.rRectsFrag, sel)
         #------------------------------> Show
         self.wPlot['Main'].rCanvas.draw()
         #endregion ------------------------------------------------> Fragments
@@ -642,8 +638,7 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
-        for r in self.rRectsFrag:
-            r.set_linewidth(self.cGelLineWidth)
+        self.SetRectsLineWidth(self.rRectsFrag)
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
@@ -678,7 +673,7 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
             self.rFragSelLine[0].remove()
             self.rFragSelLine = None
             if plot:
-                self.wPlot['Main'].rCanvas.draw()
+                self.wPlot['Main'].Blit()
         #endregion ------------------------------------------------>
 
         #region --------------------------------------------------->
@@ -906,6 +901,11 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
             Returns
             -------
             bool
+
+            Notes
+            -----
+            The sequence alignment and the residue map are calculated once.
+            The PDB files for each experiment are written in a thread pool.
         """
         #region ------------------------------------------------------> Helper
         def _steps(*args) -> bool:                                              # pylint: disable=unused-argument
@@ -914,25 +914,54 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
             msgStep = 'Preparing PDB mapping'
             wx.CallAfter(dlp.UpdateStG, msgStep)
             #------------------------------>
-            pdbObj   = cFile.PDBFile(pdbI)
-            pdbSeq   = pdbObj.GetSequence(pdbObj.rChain[0])
-            cut      = self.rObj.GetCleavagePerResidue(self.cSection, self.rDateC)
-            cEvol    = self.rObj.GetCleavageEvolution(self.cSection, self.rDateC)
-            blosum62 = substitution_matrices.load("BLOSUM62")
+            try:
+                pdbObj = cFile.PDBFile(pdbI)
+                cut    = self.rObj.GetCleavagePerResidue(self.cSection, self.rDateC)
+                cEvol  = self.rObj.GetCleavageEvolution(self.cSection, self.rDateC)
+            except Exception as e:
+                wx.CallAfter(dlp.ErrorMessage, mConfig.core.lPdError,
+                    error=mConfig.core.mFileRead.format(pdbI), tException=e)
+                return False
             #endregion --------------------------------------------> Variables
 
             #region -----------------------------------------------------> Run
             msgStep = 'Performing sequence alignments'
             wx.CallAfter(dlp.UpdateStG, msgStep)
             #------------------------------>
-            align = pairwise2.align.globalds(                                       # type: ignore
-                pdbSeq, self.rRecSeqC, blosum62, -10, -0.5)
+            try:
+                rows, res = tarpMethod.R2PDBResMap(pdbObj, self.rRecSeqC)
+            except Exception as e:
+                wx.CallAfter(dlp.ErrorMessage, mConfig.core.lPdError,
+                    error='The sequence alignment failed.', tException=e)
+                return False
             #------------------------------>
             msgStep = 'Creating PDB files'
             wx.CallAfter(dlp.UpdateStG, msgStep)
             #------------------------------>
-            _helper(pdbObj, self.rDataC.labelA, align, cut, (self.rDateC, 'CpR'))
-            _helper(pdbObj, self.rDataC.labelA, align, cEvol, (self.rDateC, 'CEvol'))
+            idx   = pd.IndexSlice
+            chain = list(pdbObj.rChain)
+            beta  = pdbObj.rDFAtom['Beta'].to_numpy()
+            try:
+                with ThreadPoolExecutor() as executor:
+                    #------------------------------> Submit
+                    tasks = {}
+                    for tDF, name in ((cut, 'CpR'), (cEvol, 'CEvol')):
+                        for e in self.rDataC.labelA:
+                            betaE = beta.copy()
+                            betaE[rows] = tDF.loc[:,idx['Rec',e]].to_numpy()[res]
+                            fileP = pdbO/f'{self.rDateC} - {e} - {name}.pdb'
+                            tasks[executor.submit(
+                                pdbObj.WritePDB, fileP, chain, betaE)] = fileP
+                    #------------------------------> Report
+                    for t in as_completed(tasks):
+                        t.result()
+                        wx.CallAfter(
+                            dlp.UpdateStG, f'PDB file created: {tasks[t].name}')
+            except Exception as e:
+                wx.CallAfter(dlp.ErrorMessage, mConfig.core.lPdError,
+                    error='It was not possible to create the PDB files.',
+                    tException=e)
+                return False
             #------------------------------>
             msgStep = mConfig.core.lPdDone
             wx.CallAfter(dlp.UpdateG)
@@ -941,53 +970,6 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
 
             return True
         #---
-
-        def _helper(pdbObj, tExp, tAlign, tDF, name):
-            """Writes to file
-
-                Parameters
-                ----------
-                pdbObj: mFile.PDBFile
-                    PDB Object
-                tExp: str
-                    Current experiment
-                tAlign: BioPython alignment
-                    Sequence alignment
-                tDF: pd.DataFrame
-                    To get the beta values
-                name: str
-                    Part of the file name
-
-                Returns
-                -------
-                bool
-            """
-            #region -------------------------------------------------------->
-            pdbRes = pdbObj.GetResNum(pdbObj.rChain[0])
-            idx    = pd.IndexSlice
-            #------------------------------>
-            for e in tExp:
-                #------------------------------>
-                betaDict = {}
-                p = 0
-                s = 0
-                #------------------------------>
-                for j,r in enumerate(tAlign[0].seqB):
-                    if r != '-':
-                        #------------------------------>
-                        if tAlign[0].seqA[j] != '-':
-                            betaDict[pdbRes[p]] = tDF.iat[s, tDF.columns.get_loc(idx['Rec',e])]
-                            p = p + 1
-                        #------------------------------>
-                        s = s + 1
-                #------------------------------>
-                pdbObj.SetBeta(pdbObj.rChain[0], betaDict)
-                pdbObj.WritePDB(
-                    pdbO/f'{name[0]} - {e} - {name[1]}.pdb', pdbObj.rChain[0])
-            #endregion ----------------------------------------------------->
-
-            return True
-        #---
         #endregion ---------------------------------------------------> Helper
 
         #region ---------------------------------------------------------> dlg
@@ -1010,7 +992,8 @@ class ResTarProt(cWindow.BaseWindowResultListText2PlotFragments):
         #endregion ------------------------------------------------> Get Path
 
         #region -------------------------------------------------------->
-        dlp = cWindow.Progress(self, 'Creating PDB files', 4)
+        dlp = cWindow.Progress(
+            self, 'Creating PDB files', 4 + 2*len(self.rDataC.labelA))
         #endregion ----------------------------------------------------->
 
         #region -------------------------------------------------------->
@@ -1626,6 +1609,7 @@ class ResHist(cWindow.BaseWindowResultOnePlotFA):
         return menuData
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         nat:Optional[bool]  = None,
@@ -1911,6 +1895,7 @@ class ResCpR(cWindow.BaseWindowResultOnePlotFA):
         return menuData
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         nat:bool,
@@ -2191,6 +2176,7 @@ class ResCEvol(cWindow.BaseWindowResultListTextNPlot):
         return menuData
     #---
 
+    @cMethod.ProfileMethod('UpdateResultWindow')
     def UpdateResultWindow(                                                     # pylint: disable=arguments-differ
         self,
         nat:Optional[bool] = None,
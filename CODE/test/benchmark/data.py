@@ -0,0 +1,407 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Synthetic input files for the benchmarks"""
+
+
+#region -------------------------------------------------------------> Imports
+from dataclasses import asdict, dataclass
+from pathlib     import Path
+
+import numpy as np
+import pandas as pd
+
+from config.config import config as mConfig
+#endregion ----------------------------------------------------------> Imports
+
+
+#region --------------------------------------------------------------> Config
+AA = 'ACDEFGHIKLMNPQRSTVWY'
+#endregion -----------------------------------------------------------> Config
+
+
+#region -------------------------------------------------------------> Classes
+@dataclass
+class Scale():
+    """Size of the synthetic data.
+
+        Attributes
+        ----------
+        proteins: int
+            Number of proteins in the protein data file.
+        peptides: int
+            Number of peptides in the peptide data file.
+        conditions: int
+            Number of conditions, experiments or lanes.
+        points: int
+            Number of relevant points or bands.
+        replicates: int
+            Number of replicates per condition.
+        missing: float
+            Fraction of missing intensity values.
+        seqLength: int
+            Length of the native sequence of the target protein.
+        seed: int
+            Seed for the random number generator.
+    """
+    #region ---------------------------------------------------------> Options
+    proteins:int   = 2000
+    peptides:int   = 1000
+    conditions:int = 3
+    points:int     = 2
+    replicates:int = 3
+    missing:float  = 0.1
+    seqLength:int  = 600
+    seed:int       = 42
+    #endregion ------------------------------------------------------> Options
+
+    #region ---------------------------------------------------> Class Methods
+    def Dict(self) -> dict:
+        """Scale as a dict for the benchmark history.
+
+            Returns
+            -------
+            dict
+        """
+        return asdict(self)
+    #---
+    #endregion ------------------------------------------------> Class Methods
+#---
+
+
+class SyntheticData():
+    """Write the synthetic input files and create the jobs for the benchmarks.
+
+        Parameters
+        ----------
+        folder: Path
+            Folder for the input files.
+        scale: Scale
+            Size of the synthetic data.
+
+        Attributes
+        ----------
+        rFileProt: Path
+            Protein data file. Columns are Gene, Protein, Score, Reverse,
+            Contaminant and the intensities of the control and the conditions.
+        rFilePept: Path
+            Peptide data file. Columns are Sequence, Protein, Score and the
+            intensities of the control and the conditions.
+        rFileSeq: Path
+            FASTA file with the recombinant and native sequence of the target
+            protein.
+
+        Notes
+        -----
+        Intensities are log-normal with a protein specific mean. A fraction of
+        the proteins and peptides change in the conditions and a fraction of
+        all values is set to 0, i.e. missing values.
+    """
+    #region -----------------------------------------------------> Class setup
+    cTarget = 'Target'
+    cTag    = 'MGSSHHHHHHSSGLVPRGSH'
+    #endregion --------------------------------------------------> Class setup
+
+    #region --------------------------------------------------> Instance setup
+    def __init__(self, folder:Path, scale:Scale) -> None:
+        """ """
+        #region -----------------------------------------------> Initial Setup
+        self.rFolder = folder
+        self.rScale  = scale
+        self.rRng    = np.random.default_rng(scale.seed)
+        #------------------------------>
+        self.rFileProt = folder / 'benchmark-protein.txt'
+        self.rFilePept = folder / 'benchmark-peptide.txt'
+        self.rFileSeq  = folder / 'benchmark-sequence.txt'
+        #------------------------------>
+        self.rSeqNat = ''.join(self.rRng.choice(list(AA), scale.seqLength))
+        self.rSeqRec = self.cTag + self.rSeqNat
+        #endregion --------------------------------------------> Initial Setup
+
+        #region ---------------------------------------------------> Files
+        self.WriteSeqFile()
+        self.WriteProtFile()
+        self.WritePeptFile()
+        #endregion ------------------------------------------------> Files
+    #---
+    #endregion -----------------------------------------------> Instance setup
+
+    #region ---------------------------------------------------> Class methods
+    def Intensity(self, nRow:int, nCol:int, nChange:int) -> np.ndarray:
+        """Create the intensity values.
+
+            Parameters
+            ----------
+            nRow: int
+                Number of rows.
+            nCol: int
+                Number of columns.
+            nChange: int
+                Number of columns, at the end of the array, with changing
+                values.
+
+            Returns
+            -------
+            np.ndarray
+        """
+        #region ---------------------------------------------------> Values
+        mean = self.rRng.normal(22, 2, size=(nRow, 1))
+        a    = self.rRng.normal(mean, 0.3, size=(nRow, nCol))
+        #------------------------------> Changing rows
+        change = self.rRng.random(nRow) < 0.1
+        a[change, nCol-nChange:] += self.rRng.choice(
+            [-2.0, 2.0], size=(int(change.sum()), 1))
+        #------------------------------> Missing values
+        a = np.round(np.exp2(a))
+        a[self.rRng.random(a.shape) < self.rScale.missing] = 0
+        #endregion ------------------------------------------------> Values
+
+        return a
+    #---
+
+    def WriteSeqFile(self) -> bool:
+        """Write the FASTA file.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Write
+        with open(self.rFileSeq, 'w', encoding='utf-8') as file:
+            file.write(f'>{self.cTarget} Recombinant\n{self.rSeqRec}\n')
+            file.write(f'>{self.cTarget} Native\n{self.rSeqNat}\n')
+        #endregion ------------------------------------------------> Write
+
+        return True
+    #---
+
+    def WriteProtFile(self) -> bool:
+        """Write the protein data file.
+
+            Returns
+            -------
+            bool
+        """
+        #region ---------------------------------------------------> Variables
+        sc    = self.rScale
+        nRow  = sc.proteins
+        nRep  = sc.replicates
+        nCond = sc.conditions * sc.points * nRep
+        #endregion ------------------------------------------------> Variables
+
+        #region ---------------------------------------------------> Data
+        df = pd.DataFrame({
+            'Gene'       : [f'gene{x}' for x in range(nRow)],
+            'Protein'    : [f'P{x:05d}' for x in range(nRow)],
+            'Score'      : np.round(self.rRng.uniform(0, 300, nRow), 2),
+            'Reverse'    : np.where(self.rRng.random(nRow) < 0.01, '+', ''),
+            'Contaminant': np.where(self.rRng.random(nRow) < 0.01, '+', ''),
+        })
+        #------------------------------>
+        label = [f'Intensity Ctrl_{r}' for r in range(nRep)] + [
+            f'Intensity C{c}_RP{p}_{r}'
+            for c in range(sc.conditions)
+            for p in range(sc.points)
+            for r in range(nRep)
+        ]
+        val = self.Intensity(nRow, nRep+nCond, nCond)
+        df  = pd.concat([df, pd.DataFrame(val, columns=label)], axis=1)
+        #------------------------------>
+        df.to_csv(self.rFileProt, sep='\t', index=False)
+        #endregion ------------------------------------------------> Data
+
+        return True
+    #---
+
+    def WritePeptFile(self) -> bool:
+        """Write the peptide data file.
+
+            Returns
+            -------
+            bool
+
+            Notes
+            -----
+            Peptides of the target protein are substrings of the recombinant
+            sequence. The rest of the peptides belong to other proteins.
+        """
+        #region ---------------------------------------------------> Variables
+        sc    = self.rScale
+        nRow  = sc.peptides
+        nRep  = sc.replicates
+        nCond = max(sc.conditions, sc.conditions * sc.points) * nRep
+        lRec  = len(self.rSeqRec)
+        #endregion ------------------------------------------------> Variables
+
+        #region ---------------------------------------------------> Peptides
+        length = self.rRng.integers(7, 26, nRow)
+        start  = self.rRng.integers(0, lRec-length)
+        target = self.rRng.random(nRow) < 0.8
+        seq    = [
+            self.rSeqRec[s:s+l] if t else ''.join(self.rRng.choice(list(AA), l))
+            for s,l,t in zip(start, length, target)
+        ]
+        #endregion ------------------------------------------------> Peptides
+
+        #region ---------------------------------------------------> Data
+        df = pd.DataFrame({
+            'Sequence': seq,
+            'Protein' : np.where(target, self.cTarget, 'Other'),
+            'Score'   : np.round(self.rRng.uniform(0, 300, nRow), 2),
+        })
+        #------------------------------>
+        label = [f'Intensity Ctrl_{r}' for r in range(nRep)] + [
+            f'Intensity E{c}_{r}' for c in range(nCond//nRep) for r in range(nRep)]
+        val = self.Intensity(nRow, nRep+nCond, nCond)
+        df  = pd.concat([df, pd.DataFrame(val, columns=label)], axis=1)
+        #------------------------------>
+        df.to_csv(self.rFilePept, sep='\t', index=False)
+        #endregion ------------------------------------------------> Data
+
+        return True
+    #---
+
+    def Column(self, first:int, n:int) -> list[str]:
+        """Column numbers of n groups of replicates.
+
+            Parameters
+            ----------
+            first: int
+                Column number of the first replicate of the first group.
+            n: int
+                Number of groups.
+
+            Returns
+            -------
+            list[str]
+                Column numbers of the replicates in each group.
+        """
+        nRep = self.rScale.replicates
+        return [
+            ' '.join(str(first+g*nRep+r) for r in range(nRep))
+            for g in range(n)
+        ]
+    #---
+
+    def Job(self, section:str, **kwargs) -> dict:
+        """Create the job for an analysis. See batch.method.SetUserData.
+
+            Parameters
+            ----------
+            section: str
+                Section of the analysis, e.g. mConfig.tarp.tMod.
+            **kwargs:
+                Values replacing the default values of the job.
+
+            Returns
+            -------
+            dict
+        """
+        #region ---------------------------------------------------> Variables
+        sc   = self.rScale
+        base = {
+            'section': section,
+            'uFile'  : self.rFolder / 'benchmark.umsap',
+            'ID'     : 'Benchmark',
+            'cero'   : True,
+            'tran'   : 'Log2',
+            'norm'   : 'Median',
+            'imp'    : 'Normal Distribution',
+            'shift'  : 1.8,
+            'width'  : 0.3,
+            'alpha'  : 0.05,
+        }
+        #endregion ------------------------------------------------> Variables
+
+        #region ---------------------------------------------------> Job
+        if section in [mConfig.corr.tUtil, mConfig.data.tUtil]:
+            col  = self.Column(5, 1+sc.conditions*sc.points)
+            base.update({
+                'iFile'  : self.rFileProt,
+                'corr'   : 'Pearson',
+                'labelA' : [f'Col{x}' for x in ' '.join(col).split()],
+                'resCtrl': ' '.join(col),
+            })
+        elif section == mConfig.prot.tMod:
+            col = self.Column(5, 1+sc.conditions*sc.points)
+            base.update({
+                'iFile'       : self.rFileProt,
+                'scoreVal'    : 10.0,
+                'rawInt'      : True,
+                'indSample'   : 'i',
+                'correctedP'  : 'Benjamini - Hochberg',
+                'ocGene'      : 0,
+                'ocTargetProt': 1,
+                'ocScore'     : 2,
+                'ocExcludeR'  : [3, 4],
+                'labelA'      : [f'C{x}' for x in range(sc.conditions)],
+                'labelB'      : [f'RP{x}' for x in range(sc.points)],
+                'ctrlType'    : mConfig.prot.oControlType['OC'],
+                'ctrlName'    : 'Ctrl',
+                'resCtrl'     : '; '.join([col[0]] + [
+                    ', '.join(col[1+c*sc.points:1+(c+1)*sc.points])
+                    for c in range(sc.conditions)
+                ]),
+            })
+        elif section == mConfig.limp.tMod:
+            col = self.Column(3, 1+sc.conditions*sc.points)
+            base.update({
+                'iFile'       : self.rFilePept,
+                'seqFile'     : self.rFileSeq,
+                'targetProt'  : self.cTarget,
+                'scoreVal'    : 10.0,
+                'indSample'   : 'i',
+                'correctedP'  : 'Bonferroni',
+                'beta'        : 0.05,
+                'gamma'       : 0.8,
+                'theta'       : None,
+                'thetaM'      : 8.0,
+                'ocSeq'       : 0,
+                'ocTargetProt': 1,
+                'ocScore'     : 2,
+                'labelA'      : [f'Lane{x}' for x in range(sc.conditions)],
+                'labelB'      : [f'Band{x}' for x in range(sc.points)],
+                'ctrlName'    : 'Ctrl',
+                'resCtrl'     : '; '.join([col[0]] + [
+                    ', '.join(col[1+b*sc.conditions:1+(b+1)*sc.conditions])
+                    for b in range(sc.points)
+                ]),
+            })
+        elif section == mConfig.tarp.tMod:
+            col = self.Column(3, 1+sc.conditions)
+            base.update({
+                'iFile'       : self.rFilePept,
+                'seqFile'     : self.rFileSeq,
+                'targetProt'  : self.cTarget,
+                'scoreVal'    : 10.0,
+                'method'      : 'slope',
+                'indSample'   : 'i',
+                'correctedP'  : 'Bonferroni',
+                'ocSeq'       : 0,
+                'ocTargetProt': 1,
+                'ocScore'     : 2,
+                'labelA'      : [f'Exp{x}' for x in range(sc.conditions)],
+                'ctrlName'    : 'Ctrl',
+                'resCtrl'     : '; '.join(col),
+                'posAA'       : 5,
+                'winHist'     : [25],
+            })
+        #------------------------------>
+        base.update(kwargs)
+        #endregion ------------------------------------------------> Job
+
+        return base
+    #---
+    #endregion ------------------------------------------------> Class methods
+#---
+#endregion ----------------------------------------------------------> Classes
@@ -0,0 +1,487 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Methods to time the analyses and keep the benchmark history"""
+
+
+#region -------------------------------------------------------------> Imports
+import json
+import platform
+import statistics
+import time
+from functools import partial
+from pathlib import Path
+from typing  import Callable, Optional
+
+import numpy as np
+import pandas as pd
+
+from config.config import config as mConfig
+from batch    import method as batchMethod
+from core     import file   as cFile
+from core     import method as cMethod
+from corr     import method as corrMethod
+from limprot  import method as limpMethod
+from protprof import method as protMethod
+from result   import file   as resFile
+from tarprot  import method as tarpMethod
+
+from test.benchmark import data as benchData
+#endregion ----------------------------------------------------------> Imports
+
+
+#region --------------------------------------------------------------> Config
+SCALE = {
+    'small' : benchData.Scale(proteins=500,   peptides=300,   seqLength=300),
+    'medium': benchData.Scale(),
+    'large' : benchData.Scale(proteins=10000, peptides=5000,  seqLength=1200,
+        conditions=4, replicates=4),
+}
+HISTORY   = mConfig.core.pCache / 'benchmark-history.json'
+THRESHOLD = 1.25                                                                # Slowdown regarded as a regression
+NPREVIOUS = 5                                                                   # Runs in the history used as reference
+#endregion -----------------------------------------------------------> Config
+
+
+#region -------------------------------------------------------------> Methods
+def TimeIt(
+    func:Callable,
+    repeat:int = 3,
+    ) -> tuple[dict, object]:
+    """Time a function.
+
+        Parameters
+        ----------
+        func: Callable
+            Function without arguments.
+        repeat: int
+            Number of calls.
+
+        Returns
+        -------
+        tuple[dict, object]
+            {'Median': s, 'Min': s, 'N': repeat} and the output of the last
+            call.
+    """
+    # No test
+    #region ---------------------------------------------------> Time
+    tTime = []
+    out   = None
+    #------------------------------>
+    for _ in range(max(repeat, 1)):
+        start = time.perf_counter()
+        out   = func()
+        tTime.append(time.perf_counter() - start)
+    #endregion ------------------------------------------------> Time
+
+    return ({
+        'Median': round(statistics.median(tTime), 4),
+        'Min'   : round(min(tTime), 4),
+        'N'     : len(tTime),
+    }, out)
+#---
+
+
+def ReadInput(job:dict) -> batchMethod.BatchRun:
+    """Read the input files of a job like the batch runner.
+
+        Parameters
+        ----------
+        job: dict
+            See benchmark.data.SyntheticData.Job.
+
+        Returns
+        -------
+        batchMethod.BatchRun
+            rIFileObj and the sequence values in rDO are set.
+    """
+    # No test
+    #region ---------------------------------------------------> Read
+    cSection, rDO = batchMethod.SetUserData(job)
+    run = batchMethod.BatchRun(cSection, rDO, msgFunc=lambda x: None)
+    #------------------------------>
+    if not run.ReadInputFiles():
+        raise RuntimeError(run.rMsgError) from run.rException
+    #endregion ------------------------------------------------> Read
+
+    return run
+#---
+
+
+def RunBenchmark(
+    folder:Path,
+    scale:benchData.Scale,
+    repeat:int                      = 3,
+    msgFunc:Callable[[str], object] = print,
+    ) -> dict:
+    """Time the analysis methods with synthetic data.
+
+        Parameters
+        ----------
+        folder: Path
+            Folder for the input and output files.
+        scale: benchData.Scale
+            Size of the synthetic data.
+        repeat: int
+            Number of calls of each method.
+        msgFunc: Callable
+            Called with the result of each benchmark.
+
+        Returns
+        -------
+        dict
+            Name of the benchmark as keys and the output of TimeIt as values.
+    """
+    # No test
+    #region ---------------------------------------------------> Helper
+    result = {}
+    synth  = benchData.SyntheticData(folder, scale)
+    #------------------------------>
+    def Bench(name:str, func:Callable) -> object:
+        tTime, out = TimeIt(func, repeat)
+        result[name] = tTime
+        msgFunc(f'{name:<24}{tTime["Median"]:>10.4f} s{tTime["Min"]:>10.4f} s')
+        return out
+    #---
+
+    def Analysis(run:batchMethod.BatchRun) -> dict:
+        dfDict, msg, e = run.cAnalysisMethod[run.cSection](
+            df=run.rIFileObj.rDf, rDO=run.rDO)                                  # type: ignore
+        if not dfDict:
+            raise RuntimeError(msg) from e
+        return dfDict
+    #---
+
+    def Load(uFile:Path) -> resFile.UMSAPFile:
+        umsap = resFile.UMSAPFile(uFile)
+        for k in umsap.rData:
+            if k in umsap.dConfigure:
+                umsap.dConfigure[k]()
+        return umsap
+    #---
+    #endregion ------------------------------------------------> Helper
+
+    #region ---------------------------------------------------> Modules
+    msgFunc(f'{"Benchmark":<24}{"Median":>12}{"Min":>12}')
+    for name, job in [
+        ('RunDataPreparation', synth.Job(mConfig.data.tUtil)),
+        ('CorrA',              synth.Job(mConfig.corr.tUtil)),
+        ('ProtProf',           synth.Job(mConfig.prot.tMod)),
+        ('LimProt',            synth.Job(mConfig.limp.tMod)),
+        ('TarProt ttest',      synth.Job(mConfig.tarp.tMod, method='ttest')),
+        ]:
+        run = ReadInput(job)
+        Bench(name, partial(Analysis, run))
+    #------------------------------>
+    run = ReadInput(synth.Job(mConfig.tarp.tMod))
+    rDO = run.rDO
+    dfR = Bench('TarProt slope', partial(Analysis, run))['dfR']                 # type: ignore
+    #endregion ------------------------------------------------> Modules
+
+    #region ---------------------------------------------------> TarProt
+    idx   = pd.IndexSlice
+    first = mConfig.tarp.dfcolFirstPart[2:]
+    seqNC = mConfig.core.dfcolSeqNC
+    tIdxH = idx[first+rDO.labelA, first+['P']]
+    tIdxE = idx[first+rDO.labelA, first+['Int', 'P']]
+    tIdxA = idx[['Sequence']+rDO.labelA, ['Sequence', 'P']]
+    tIdxF = idx[seqNC+rDO.labelA, seqNC+['P']]
+    #------------------------------>
+    Bench('R2CpR', lambda: tarpMethod.R2CpR(
+        dfR.loc[:,tIdxH], rDO.alpha, rDO.protLength))
+    Bench('R2CEvol', lambda: tarpMethod.R2CEvol(
+        dfR.loc[:,tIdxE], rDO.alpha, rDO.protLength))
+    Bench('R2AA', lambda: tarpMethod.R2AA(
+        dfR.loc[:,tIdxA], rDO.seqFileObj.rSeqRec, rDO.alpha,
+        rDO.protLength[0], pos=rDO.posAA))
+    Bench('Fragments', lambda: cMethod.Fragments(
+        dfR.loc[:,tIdxF], rDO.alpha, 'le', rDO.protLength[0], rDO.protLoc))
+    #endregion ------------------------------------------------> TarProt
+
+    #region ---------------------------------------------------> UMSAP File
+    jobs = [synth.Job(x) for x in batchMethod.BatchRun.cAnalysisMethod]
+    runL = batchMethod.RunJob(jobs, msgFunc=lambda x: None)
+    if (msg := [x.rMsgError for x in runL if x.rMsgError]):
+        raise RuntimeError(msg[0])
+    #------------------------------>
+    Bench('UMSAPFile', partial(Load, runL[-1].rDO.uFile))
+    #endregion ------------------------------------------------> UMSAP File
+
+    return result
+#---
+
+
+def AssertFrameEqual(
+    result:pd.DataFrame,
+    expected:pd.DataFrame,
+    rtol:float = 1e-6,
+    atol:float = 1e-9,
+    ) -> bool:
+    """Check that two pd.DataFrames are equal within a tolerance.
+
+        Parameters
+        ----------
+        result: pd.DataFrame
+            Output of the analysis.
+        expected: pd.DataFrame
+            Expected output.
+        rtol: float
+            Relative tolerance.
+        atol: float
+            Absolute tolerance.
+
+        Returns
+        -------
+        bool
+
+        Raises
+        ------
+        AssertionError:
+            - When the pd.DataFrames are different.
+
+        Notes
+        -----
+        Object columns holding lists of numbers as strings, e.g. the
+        intensities in the Targeted Proteolysis results, are also compared
+        with the tolerance.
+    """
+    # No test
+    #region ---------------------------------------------------> Numbers
+    pd.testing.assert_index_equal(result.columns, expected.columns)
+    obj = [k for k,x in enumerate(result.dtypes) if x == object]
+    num = [k for k in range(result.shape[1]) if k not in obj]
+    #------------------------------>
+    pd.testing.assert_frame_equal(
+        result.iloc[:,num],
+        expected.iloc[:,num],
+        check_exact = False,
+        rtol        = rtol,
+        atol        = atol,
+    )
+    #endregion ------------------------------------------------> Numbers
+
+    #region ---------------------------------------------------> Objects
+    for k in obj:
+        for r,(a,b) in enumerate(zip(result.iloc[:,k], expected.iloc[:,k])):
+            if a == b:
+                continue
+            try:
+                equal = np.allclose(
+                    json.loads(a), json.loads(b), rtol=rtol, atol=atol)
+            except (TypeError, ValueError):
+                equal = False
+            if not equal:
+                raise AssertionError(
+                    f'Column {result.columns[k]}, row {r}: {a} != {b}')
+    #endregion ------------------------------------------------> Objects
+
+    return True
+#---
+
+
+def CheckGolden() -> dict[str, str]:
+    """Compare the output of the analysis methods with the expected output
+        used in the unit tests.
+
+        Returns
+        -------
+        dict[str, str]
+            Name of the check as keys and an empty string or the difference
+            as values.
+
+        Notes
+        -----
+        Values are compared with a tolerance, see AssertFrameEqual. The
+        output is rounded like in the unit tests when the expected output was
+        saved with fewer decimals.
+    """
+    # No test
+    #region ---------------------------------------------------> Import
+    # pylint: disable=import-outside-toplevel
+    from test.unit.corr     import test_method as tCorr
+    from test.unit.limprot  import test_method as tLimp
+    from test.unit.protprof import test_method as tProt
+    from test.unit.tarprot  import test_method as tTarp
+    #------------------------------>
+    for x in [tCorr.Test_CorrA, tLimp.Test_LimProt, tProt.Test_ProtProf,
+        tTarp.Test_TarProt]:
+        x.setUpClass()
+    #endregion ------------------------------------------------> Import
+
+    #region ---------------------------------------------------> Helper
+    def ReadGolden(fileP:Path, header:list[int], intCol:bool) -> pd.DataFrame:
+        if header == [0]:
+            return pd.read_csv(fileP, sep='\t', index_col=0)
+        dfF = pd.read_csv(fileP, sep='\t', header=header)
+        if intCol:
+            dfF.iloc[:,4:6] = dfF.iloc[:,4:6].astype('Int64')
+        return cMethod.DFCategory(dfF, [0,1])
+    #---
+
+    def Round(df:pd.DataFrame, nDec:Optional[int]) -> pd.DataFrame:
+        return df if nDec is None else df.round(nDec)
+    #---
+    #endregion ------------------------------------------------> Helper
+
+    #region ---------------------------------------------------> Check
+    tInput = [
+        ('CorrA 1',   corrMethod.CorrA,    tCorr.Test_CorrA.df,    tCorr.Test_CorrA.test1,    tCorr.corrA_1, [0],     False, 3),
+        ('CorrA 2',   corrMethod.CorrA,    tCorr.Test_CorrA.df,    tCorr.Test_CorrA.test2,    tCorr.corrA_2, [0],     False, 3),
+        ('CorrA 3',   corrMethod.CorrA,    tCorr.Test_CorrA.df,    tCorr.Test_CorrA.test3,    tCorr.corrA_3, [0],     False, 3),
+        ('CorrA 4',   corrMethod.CorrA,    tCorr.Test_CorrA.df,    tCorr.Test_CorrA.test4,    tCorr.corrA_4, [0],     False, 3),
+        ('LimProt',   limpMethod.LimProt,  tLimp.Test_LimProt.df,  tLimp.Test_LimProt.dict1,  tLimp.fileC,   [0,1,2], True,  None),
+        ('ProtProf',  protMethod.ProtProf, tProt.Test_ProtProf.df, tProt.Test_ProtProf.dict1, tProt.fileB,   [0,1,2], False, 2),
+        ('TarProt 1', tarpMethod.TarProt,  tTarp.Test_TarProt.df,  tTarp.Test_TarProt.dict1,  tTarp.fileC,   [0,1],   True,  None),
+        ('TarProt 2', tarpMethod.TarProt,  tTarp.Test_TarProt.df,  tTarp.Test_TarProt.dict2,  tTarp.fileD,   [0,1],   True,  None),
+    ]
+    #------------------------------>
+    out = {}
+    for name, func, df, rDO, fileP, header, intCol, nDec in tInput:
+        try:
+            result = func(df=df, rDO=rDO, resetIndex=True)[0]['dfR']
+            AssertFrameEqual(
+                Round(result, nDec),
+                Round(ReadGolden(fileP, header, intCol), nDec),
+            )
+            out[name] = ''
+        except Exception as e:
+            out[name] = cMethod.StrException(e, tRepr=False, trace=False)
+    #endregion ------------------------------------------------> Check
+
+    return out
+#---
+
+
+def ReadHistory(fileP:Path) -> list[dict]:
+    """Read the benchmark history.
+
+        Parameters
+        ----------
+        fileP: Path
+            JSON file with the history.
+
+        Returns
+        -------
+        list[dict]
+            Previous runs, oldest first. Empty if the file does not exist.
+    """
+    # No test
+    if not fileP.exists():
+        return []
+    return cFile.ReadJSON(fileP).get('Runs', [])
+#---
+
+
+def WriteHistory(fileP:Path, runs:list[dict]) -> bool:
+    """Write the benchmark history.
+
+        Parameters
+        ----------
+        fileP: Path
+            JSON file with the history.
+        runs: list[dict]
+            All runs, oldest first.
+
+        Returns
+        -------
+        bool
+    """
+    # No test
+    fileP.parent.mkdir(parents=True, exist_ok=True)
+    return cFile.WriteJSON(fileP, {'Runs': runs})
+#---
+
+
+def NewRun(
+    scale:benchData.Scale,
+    result:dict,
+    golden:Optional[dict] = None,
+    ) -> dict:
+    """Create the entry for a run in the history.
+
+        Parameters
+        ----------
+        scale: benchData.Scale
+            Size of the synthetic data.
+        result: dict
+            Output of RunBenchmark.
+        golden: dict or None
+            Output of CheckGolden.
+
+        Returns
+        -------
+        dict
+    """
+    # No test
+    return {
+        'Date'    : cMethod.StrNow(),
+        'Version' : mConfig.core.version,
+        'Python'  : platform.python_version(),
+        'Numpy'   : np.__version__,
+        'Pandas'  : pd.__version__,
+        'Platform': platform.platform(),
+        'Scale'   : scale.Dict(),
+        'Result'  : result,
+        'Golden'  : golden if golden is not None else {},
+    }
+#---
+
+
+def CheckRegression(
+    runs:list[dict],
+    run:dict,
+    threshold:float = THRESHOLD,
+    nPrevious:int   = NPREVIOUS,
+    ) -> list[str]:
+    """Compare a run with the previous runs with the same scale.
+
+        Parameters
+        ----------
+        runs: list[dict]
+            Previous runs, oldest first.
+        run: dict
+            New run. See NewRun.
+        threshold: float
+            A benchmark is a regression if its median time is larger than
+            threshold times the reference time.
+        nPrevious: int
+            Number of previous runs used to get the reference time. The
+            reference time is the smallest median time in these runs.
+
+        Returns
+        -------
+        list[str]
+            Description of the regressions.
+    """
+    # No test
+    #region ---------------------------------------------------> Reference
+    prev = [x for x in runs if x.get('Scale') == run['Scale']][-nPrevious:]
+    #endregion ------------------------------------------------> Reference
+
+    #region ---------------------------------------------------> Check
+    msg = []
+    for k,v in run['Result'].items():
+        ref = [x['Result'][k]['Median'] for x in prev if k in x['Result']]
+        if not ref:
+            continue
+        #------------------------------>
+        ref = min(ref)
+        if v['Median'] > threshold * ref:
+            msg.append(
+                f'{k}: {v["Median"]:.4f} s vs {ref:.4f} s '
+                f'({v["Median"]/ref:.2f}x)')
+    #endregion ------------------------------------------------> Check
+
+    return msg
+#---
+#endregion ----------------------------------------------------------> Methods
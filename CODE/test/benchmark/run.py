@@ -0,0 +1,145 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Run the benchmarks of the analysis modules.
+
+    Examples
+    --------
+    Time all analyses with the default data size and save the results in the
+    history:
+    >>> python -m test.benchmark.run
+
+    Use a larger data set with more missing values and five calls per method:
+    >>> python -m test.benchmark.run --scale large --missing 0.3 --repeat 5
+
+    Check only that the output of the analyses matches the expected output:
+    >>> python -m test.benchmark.run --golden-only
+"""
+
+
+#region -------------------------------------------------------------> Imports
+import argparse
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib     import Path
+
+from config.config import config as mConfig
+
+from test.benchmark import data   as benchData
+from test.benchmark import method as benchMethod
+#endregion ----------------------------------------------------------> Imports
+
+
+#region -------------------------------------------------------------> Methods
+def GetArgs(argv:list[str]) -> argparse.Namespace:
+    """Parse the command line arguments.
+
+        Parameters
+        ----------
+        argv: list[str]
+            Command line arguments.
+
+        Returns
+        -------
+        argparse.Namespace
+    """
+    # No test
+    parser = argparse.ArgumentParser(
+        description=f'{mConfig.core.softwareF} - Benchmarks')
+    parser.add_argument(
+        '-s', '--scale', default='medium', choices=list(benchMethod.SCALE),
+        help='Size of the synthetic data.')
+    for k in benchData.Scale.__dataclass_fields__:                              # pylint: disable=no-member
+        parser.add_argument(
+            f'--{k}', type=float if k == 'missing' else int, default=None,
+            help=f'Replace the {k} value of the selected scale.')
+    parser.add_argument(
+        '-r', '--repeat', type=int, default=3,
+        help='Number of calls of each method.')
+    parser.add_argument(
+        '--history', type=Path, default=benchMethod.HISTORY,
+        help='JSON file with the results of previous runs.')
+    parser.add_argument(
+        '--threshold', type=float, default=benchMethod.THRESHOLD,
+        help='Slowdown regarded as a regression, e.g. 1.25.')
+    parser.add_argument(
+        '--no-save', action='store_true',
+        help='Do not add the results to the history.')
+    parser.add_argument(
+        '--golden-only', action='store_true',
+        help='Only compare the output of the analyses with the expected output.')
+    return parser.parse_args(argv)
+#---
+
+
+def Main(argv:list[str]) -> int:
+    """Run the benchmarks.
+
+        Parameters
+        ----------
+        argv: list[str]
+            Command line arguments.
+
+        Returns
+        -------
+        int
+            Exit code. 1 if an output differs from the expected output or a
+            benchmark is slower than in the previous runs.
+    """
+    # No test
+    #region ---------------------------------------------------> Golden
+    args   = GetArgs(argv)
+    golden = benchMethod.CheckGolden()
+    #------------------------------>
+    for k,v in golden.items():
+        print(f'{k:<24}{"OK" if not v else "DIFFERENT"}')
+        if v:
+            print(v)
+    if args.golden_only:
+        return 1 if any(golden.values()) else 0
+    #endregion ------------------------------------------------> Golden
+
+    #region ---------------------------------------------------> Benchmark
+    scale = replace(benchMethod.SCALE[args.scale], **{
+        k:v for k in benchData.Scale.__dataclass_fields__                       # pylint: disable=no-member
+        if (v := getattr(args, k)) is not None
+    })
+    #------------------------------>
+    print('')
+    with tempfile.TemporaryDirectory() as folder:
+        result = benchMethod.RunBenchmark(Path(folder), scale, args.repeat)
+    #endregion ------------------------------------------------> Benchmark
+
+    #region ---------------------------------------------------> History
+    runs = benchMethod.ReadHistory(args.history)
+    run  = benchMethod.NewRun(scale, result, golden)
+    msg  = benchMethod.CheckRegression(runs, run, args.threshold)
+    #------------------------------>
+    print('')
+    for x in msg:
+        print(f'Regression: {x}')
+    if not args.no_save:
+        benchMethod.WriteHistory(args.history, runs+[run])
+        print(f'History: {args.history}')
+    #endregion ------------------------------------------------> History
+
+    return 1 if msg or any(golden.values()) else 0
+#---
+#endregion ----------------------------------------------------------> Methods
+
+
+#region -----------------------------------------------------------> Start App
+if __name__ == "__main__":
+    sys.exit(Main(sys.argv[1:]))
+#endregion --------------------------------------------------------> Start App
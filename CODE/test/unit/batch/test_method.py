@@ -0,0 +1,410 @@
+# ------------------------------------------------------------------------------
+# Copyright (C) 2017 Kenny Bravo Rodriguez <www.umsap.nl>
+#
+# Author: Kenny Bravo Rodriguez (kenny.bravorodriguez@mpi-dortmund.mpg.de)
+#
+# This program is distributed for free in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+#
+# See the accompanying license for more details.
+# ------------------------------------------------------------------------------
+
+
+"""Tests for batch.method"""
+
+
+#region -------------------------------------------------------------> Imports
+import json
+import tempfile
+import unittest
+from pathlib import Path
+
+from config.config import config as mConfig
+from batch   import method as batchMethod
+from core    import method as cMethod
+from tarprot import method as tarpMethod
+#endregion ----------------------------------------------------------> Imports
+
+
+#region -------------------------------------------------------> File Location
+folder = Path(__file__).parent / 'file'
+fileA  = folder / 'job.json'
+fileB  = folder / 'job.toml'
+fileC  = folder / '../../tarprot/file/tarprot-data-file-1.txt'
+fileD  = folder / '../../tarprot/file/tarprot-seq-both-1.txt'
+#endregion ----------------------------------------------------> File Location
+
+
+#region ----------------------------------------------------------------> Jobs
+jobs = [                                                                        # One analysis per module. uFile is set in the tests
+    {
+        'section'   : 'corra',
+        'iFile'     : folder / '../../corr/file/corrA-tarprot-data-file.txt',
+        'ID'        : 'CorrA',
+        'tran'      : 'Log2',
+        'norm'      : 'Median',
+        'imp'       : 'None',
+        'corr'      : 'Pearson',
+        'resCtrl'   : '98 99 100 101 102',
+    },
+    {
+        'section'   : 'dataprep',
+        'iFile'     : folder / '../../dataprep/file/dataprep-tarprot-data-file.txt',
+        'ID'        : 'DataPrep',
+        'tran'      : 'Log2',
+        'norm'      : 'Median',
+        'imp'       : 'None',
+        'resCtrl'   : '98 99 100 101 102',
+    },
+    {
+        'section'   : 'limprot',
+        'iFile'     : folder / '../../limprot/file/limprot-data-file.txt',
+        'seqFile'   : folder / '../../limprot/file/limprot-seq-both.txt',
+        'ID'        : 'LimProt',
+        'cero'      : True,
+        'tran'      : 'Log2',
+        'norm'      : 'Median',
+        'imp'       : 'None',
+        'targetProt': 'Mis18alpha',
+        'scoreVal'  : 25.0,
+        'indSample' : 'i',
+        'correctedP': 'Bonferroni',
+        'alpha'     : 0.05,
+        'beta'      : 0.05,
+        'gamma'     : 0.8,
+        'thetaM'    : 8.0,
+        'labelA'    : ['Lane1', 'Lane2'],
+        'labelB'    : ['Band1', 'Band2'],
+        'ctrlName'  : 'Ctrl',
+        'ocSeq'     : 0,
+        'ocTargetProt': 34,
+        'ocScore'   : 42,
+        'resCtrl'   : '69 70 71; 81 82 83, 78 79 80; , 66 67 68',
+    },
+    {
+        'section'   : 'protprof',
+        'iFile'     : folder / '../../protprof/file/protprof-data-file.txt',
+        'ID'        : 'ProtProf',
+        'cero'      : True,
+        'tran'      : 'Log2',
+        'norm'      : 'Median',
+        'imp'       : 'None',
+        'scoreVal'  : 320.0,
+        'indSample' : 'i',
+        'correctedP': 'Benjamini - Hochberg',
+        'alpha'     : 0.05,
+        'labelA'    : ['C1', 'C2'],
+        'labelB'    : ['RP1', 'RP2'],
+        'ctrlType'  : 'One Control',
+        'ctrlName'  : '1Control',
+        'ocTargetProt': 0,
+        'ocGene'    : 6,
+        'ocScore'   : 39,
+        'ocExcludeR': [171, 172, 173],
+        'resCtrl'   : '105 115 125; 106 116 126, 101 111 121; 108 118 128, 103 113 123',
+    },
+    {
+        'section'   : 'tarprot',
+        'iFile'     : fileC,
+        'seqFile'   : fileD,
+        'ID'        : 'TarProt',
+        'cero'      : True,
+        'tran'      : 'Log2',
+        'norm'      : 'Median',
+        'imp'       : 'None',
+        'method'    : 'slope',
+        'indSample' : 'i',
+        'correctedP': 'Bonferroni',
+        'alpha'     : 0.05,
+        'targetProt': 'efeB',
+        'scoreVal'  : 100.0,
+        'labelA'    : ['Exp1', 'Exp2'],
+        'ctrlName'  : 'Ctrl',
+        'ocSeq'     : 0,
+        'ocTargetProt': 38,
+        'ocScore'   : 44,
+        'resCtrl'   : '98-105; 109-111; 112-114',
+    },
+]
+#endregion -------------------------------------------------------------> Jobs
+
+
+#region -------------------------------------------------------------> Classes
+class Test_ReadJob(unittest.TestCase):
+    """Test for batch.method.ReadJob"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        result = batchMethod.ReadJob(fileA)
+        #------------------------------>
+        self.assertEqual(len(result), 2)
+        self.assertEqual(result[0]['uFile'], folder/'res.umsap')
+        self.assertEqual(
+            result[1]['iFile'],
+            folder/'../../corr/file/corrA-tarprot-data-file.txt',
+        )
+    #---
+
+    @unittest.skipIf(batchMethod.tomllib is None, 'TOML reader not available')
+    def test_toml(self):
+        """Test for TOML job files"""
+        #------------------------------>
+        result = batchMethod.ReadJob(fileB)
+        #------------------------------>
+        self.assertEqual(len(result), 1)
+        self.assertEqual(result[0]['resCtrl'], '98 99 100 101 102')
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_SetColumn(unittest.TestCase):
+    """Test for batch.method.SetColumn"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        rDO = tarpMethod.UserData(
+            ocSeq        = 0,
+            ocTargetProt = 38,
+            ocScore      = 44,
+            resCtrl      = '98-105; 109-111; 112-114',
+            minRep       = '1; 1; 1',
+        )
+        #------------------------------>
+        batchMethod.SetColumn('Targeted Proteolysis', rDO)
+        #------------------------------>
+        tInput = [
+            (rDO.ocResCtrl,     [[[98, 99, 100, 101, 102, 103, 104, 105]], [[109, 110, 111]], [[112, 113, 114]]]),
+            (rDO.ocColumn,      [0, 38, 44, 98, 99, 100, 101, 102, 103, 104, 105, 109, 110, 111, 112, 113, 114]),
+            (rDO.dfResCtrl,     [[[3, 4, 5, 6, 7, 8, 9, 10]], [[11, 12, 13]], [[14, 15, 16]]]),
+            (rDO.dfResCtrlFlat, [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]),
+            (rDO.dfColumnR,     [3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]),
+            (rDO.dfColumnF,     [2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16]),
+            (rDO.minRepList,    [[[1]], [[1]], [[1]]]),
+        ]
+        #------------------------------>
+        for k,(a,b) in enumerate(tInput):
+            with self.subTest(f'{k}'):
+                self.assertEqual(a, b)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_SetUserData(unittest.TestCase):
+    """Test for batch.method.SetUserData"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            ('tarprot',              'Targeted Proteolysis', tarpMethod.UserData),
+            ('Targeted Proteolysis', 'Targeted Proteolysis', tarpMethod.UserData),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'section={a}'):
+                section, rDO = batchMethod.SetUserData(
+                    {'section': a, 'ID': 'Test', 'resCtrl': '98 99'})
+                self.assertEqual(section, b)
+                self.assertIsInstance(rDO, c)
+                self.assertEqual(rDO.ID, 'Test')
+    #---
+
+    def test_Exc(self):
+        """Test for unknown sections"""
+        self.assertRaises(
+            ValueError, batchMethod.SetUserData, {'section': 'Bad Section'})
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_CheckUserData(unittest.TestCase):
+    """Test for batch.method.CheckUserData"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Set test"""
+        self.tmp = tempfile.TemporaryDirectory()                                # pylint: disable=consider-using-with
+        self.job = {
+            'section'     : 'tarprot',
+            'uFile'       : Path(self.tmp.name) / 'res.umsap',
+            'iFile'       : fileC,
+            'seqFile'     : fileD,
+            'ID'          : 'Test',
+            'tran'        : 'Log2',
+            'norm'        : 'Median',
+            'imp'         : 'None',
+            'method'      : 'slope',
+            'indSample'   : 'i',
+            'correctedP'  : 'Bonferroni',
+            'alpha'       : 0.05,
+            'ocSeq'       : 0,
+            'ocTargetProt': 38,
+            'ocScore'     : 44,
+            'resCtrl'     : '98-105; 109-111; 112-114',
+        }
+    #---
+
+    def tearDown(self):
+        """Clean test"""
+        self.tmp.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        self.assertTrue(
+            batchMethod.CheckUserData(*batchMethod.SetUserData(self.job)))
+    #---
+
+    def test_Exc(self):
+        """Test for invalid user input"""
+        #------------------------------>
+        tInput = [
+            ('tran',    None),
+            ('imp',     'Bad'),
+            ('alpha',   2),
+            ('ID',      ''),
+            ('seqFile', folder / 'no-file.txt'),
+            ('ocScore', 38),
+        ]
+        #------------------------------>
+        for a,b in tInput:
+            with self.subTest(f'{a}={b}'):
+                job = dict(self.job)
+                if b is None:
+                    job.pop(a)
+                else:
+                    job[a] = b
+                self.assertRaises(
+                    ValueError,
+                    batchMethod.CheckUserData,
+                    *batchMethod.SetUserData(job),
+                )
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_RunJob(unittest.TestCase):
+    """Test for batch.method.RunJob"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Set test"""
+        self.tmp   = tempfile.TemporaryDirectory()                              # pylint: disable=consider-using-with
+        self.uFile = Path(self.tmp.name) / 'res.umsap'
+        self.jobs  = [dict(x, uFile=self.uFile) for x in jobs]
+    #---
+
+    def tearDown(self):
+        """Clean test"""
+        self.tmp.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        runL = batchMethod.RunJob(self.jobs, msgFunc=lambda x: None)
+        #------------------------------>
+        with open(self.uFile, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        #------------------------------>
+        for run in runL:
+            with self.subTest(run.cSection):
+                self.assertEqual(run.rMsgError, '')
+                self.assertIn(run.rDateID, data[run.cSection])
+                entry = data[run.cSection][run.rDateID]
+                fileL = list(entry['DP'].values()) + [entry.get('R', '')]
+                stepP = cMethod.DataStepsFolder(
+                    Path(self.tmp.name), run.rDate, run.cSection)
+                self.assertTrue(all((stepP/x).is_file() for x in fileL if x))
+    #---
+
+    def test_cancel(self):
+        """Test for cancelled analyses"""
+        #------------------------------>
+        cancel = cMethod.CancelToken()
+        cancel.Cancel()
+        run = batchMethod.BatchRun(
+            *batchMethod.SetUserData(self.jobs[0]),
+            msgFunc = lambda x: None,
+            cancel  = cancel,
+        )
+        #------------------------------>
+        self.assertFalse(run.Run())
+        self.assertEqual(run.rMsgError, cMethod.StrCancel())
+        self.assertTrue(run.rMsgError.startswith(mConfig.core.mCancel))
+        self.assertFalse(self.uFile.exists())
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_RunJobQueue(unittest.TestCase):
+    """Test for batch.method.RunJobQueue and batch.method.JobQueue"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Set test"""
+        self.tmp   = tempfile.TemporaryDirectory()                              # pylint: disable=consider-using-with
+        self.uFile = Path(self.tmp.name) / 'res.umsap'
+        self.jobs  = [dict(x, uFile=self.uFile) for x in jobs]
+    #---
+
+    def tearDown(self):
+        """Clean test"""
+        self.tmp.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        resL = batchMethod.RunJobQueue(                                         # Full runs are in Test_RunJob
+            self.jobs[:2], msgFunc=lambda x: None, maxWorkers=2)
+        #------------------------------>
+        with open(self.uFile, 'r', encoding='utf-8') as file:
+            data = json.load(file)
+        #------------------------------>
+        self.assertEqual(len(resL), 2)
+        for res in resL:
+            with self.subTest(res.cSection):
+                self.assertEqual(res.msgError, '')
+                self.assertEqual(res.uFile, self.uFile)
+                self.assertIn(res.dateID, data[res.cSection])
+                entry = data[res.cSection][res.dateID]
+                fileL = list(entry['DP'].values()) + [entry.get('R', '')]
+                stepP = cMethod.DataStepsFolder(
+                    Path(self.tmp.name),
+                    res.dateID.split(' - ')[0],
+                    res.cSection,
+                )
+                self.assertTrue(all((stepP/x).is_file() for x in fileL if x))
+    #---
+
+    def test_cancel(self):
+        """Test for cancelled analyses"""
+        #------------------------------>
+        jobQueue = batchMethod.JobQueue(maxWorkers=1, msgFunc=lambda x,y: None)
+        try:
+            cancel = jobQueue.CancelToken()
+            cancel.Cancel()
+            jobID = jobQueue.Submit(
+                *batchMethod.SetUserData(self.jobs[0]), cancel=cancel)
+        finally:
+            jobQueue.Shutdown()
+        #------------------------------>
+        self.assertTrue(jobQueue.rResult[jobID].cancelled)
+        self.assertEqual(jobQueue.rResult[jobID].msgError, cMethod.StrCancel())
+        self.assertFalse(self.uFile.exists())
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+#endregion ----------------------------------------------------------> Classes
@@ -19,6 +19,7 @@ import unittest
 from pathlib import Path
 
 from config.config import Configuration
+from batch    import config as batchConfig
 from core     import config as cConfig
 from corr     import config as corrConfig
 from dataprep import config as dataConfig
@@ -55,8 +56,9 @@ class Test_Configuration(unittest.TestCase):
             with self.subTest(f'File:{a}'):
                 #------------------------------>
                 conf = Configuration(                                           # Create new instance.
-                    cConfig.Configuration(),                                    # setUp is not called for
-                    corrConfig.Configuration(),                                 # each subTest
+                    batchConfig.Configuration(),                                # setUp is not called for
+                    cConfig.Configuration(),                                    # each subTest
+                    corrConfig.Configuration(),
                     dataConfig.Configuration(),
                     hConfig.Configuration(),
                     limpConfig.Configuration(),
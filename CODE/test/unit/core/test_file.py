@@ -15,11 +15,15 @@
 
 
 #region -------------------------------------------------------------> Imports
+import os
+import tempfile
 import unittest
-from pathlib import Path
+from pathlib  import Path
+from unittest import mock
 
 import pandas as pd
 
+from config.config import config as mConfig
 from core import file as cFile
 #endregion ----------------------------------------------------------> Imports
 
@@ -105,12 +109,128 @@ class Test_ReadFileFirstLine(unittest.TestCase):
 #---
 
 
+class Test_SeqAlignment(unittest.TestCase):
+    """Test for core.file.SeqAlignment"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Use a temporary cache folder"""
+        self.tmpDir = tempfile.TemporaryDirectory()
+        self.patch  = mock.patch.object(
+            mConfig.core, 'pCache', Path(self.tmpDir.name))
+        self.patch.start()
+        cFile.SeqAlignment.cache_clear()
+    #---
+
+    def tearDown(self):
+        """Remove the temporary cache folder"""
+        self.patch.stop()
+        self.tmpDir.cleanup()
+        cFile.SeqAlignment.cache_clear()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            ('MKTAYIAKQRQISFVKSHFSRQ', 'MKTAYIAKQRQISFVKSHFSRQ', 'MKTAYIAKQRQISFVKSHFSRQ'),
+            ('MKTAYIAKQRQISFVKSHFSRQ', 'AYIAKQRQISF',            '---AYIAKQRQISF--------'),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            msg = f"seqA={a}, seqB={b}"
+            with self.subTest(msg):
+                result = cFile.SeqAlignment(a, b)
+                self.assertEqual(result.seqA, a)
+                self.assertEqual(result.seqB, c)
+                self.assertEqual(result, cFile.SeqAlignment(a, b))
+        #------------------------------>
+        self.assertEqual(
+            len(list((Path(self.tmpDir.name)/'alignment').glob('*.json'))), 2)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_FastaIndex(unittest.TestCase):
+    """Test for core.file.FastaIndex"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):
+        """Create class instances"""
+        cls.tmpDir = tempfile.TemporaryDirectory()
+        cls.patch  = mock.patch.object(
+            mConfig.core, 'pCache', Path(cls.tmpDir.name))
+        cls.patch.start()
+        #------------------------------>
+        cls.index = cFile.FastaIndex(fileB)
+        cls.seq1  = ('HHHHHHHHHHHHHHMKKTAIAIAVALAGFATVAQAASWSHPQFEKIEGRRDRGQKTQSAP'
+                     'FFALPGVKDANDYFGSALLRVMMMMMMMHHHHHHHHHH')
+        cls.head1 = '>sp|P31545|EFEB_ECOLI Recombinant'
+        cls.seq2  = ('MKKTAIAIAVALAGFATVAQAASWSHPQFEKIEGRRDRGQKTQSAPFFALPGVKDANDYF'
+                     'GSALLRVM')
+        cls.head2 = '>sp|P31545|EFEB_ECOLI Native'
+    #---
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary cache folder"""
+        cls.patch.stop()
+        cls.tmpDir.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            (0,                                 (self.head1, self.seq1)),
+            (1,                                 (self.head2, self.seq2)),
+            ('>sp|P31545|EFEB_ECOLI Native',    (self.head2, self.seq2)),
+            ('sp|P31545|EFEB_ECOLI Recombinant',(self.head1, self.seq1)),
+            ('sp|P31545|EFEB_ECOLI',            (self.head1, self.seq1)),
+            ('P31545',                          (self.head1, self.seq1)),
+        ]
+        #------------------------------>
+        for a,b in tInput:
+            msg = f"key={a}"
+            with self.subTest(msg):
+                result = self.index.GetSeq(a)
+                self.assertEqual(result, b)
+        #------------------------------>
+        self.assertEqual(len(cFile.FastaIndex(fileB)), 2)
+        self.assertEqual(
+            self.index.rIndexP.parent, Path(self.tmpDir.name)/'fasta')
+        self.assertFalse(fileB.with_name(f'{fileB.name}.fai').exists())
+    #---
+
+    def test_Exc(self):
+        """Test for unknown keys"""
+        #------------------------------>
+        tInput = [2, -1, 'X']
+        #------------------------------>
+        for a in tInput:
+            msg = f"key={a}"
+            with self.subTest(msg):
+                self.assertRaises(KeyError, self.index.GetSeq, a)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
 class Test_FastaFile(unittest.TestCase):
     """Test for core.file.FastaFile"""
     #region -----------------------------------------------------> Class Setup
     @classmethod
     def setUpClass(cls):
         """Create class instances"""
+        cls.tmpDir = tempfile.TemporaryDirectory()
+        cls.patch  = mock.patch.object(
+            mConfig.core, 'pCache', Path(cls.tmpDir.name))
+        cls.patch.start()
+        #------------------------------>
         cls.f1Prot = cFile.FastaFile(fileA)
         cls.f2Prot = cFile.FastaFile(fileB)
         cls.fNProt = cFile.FastaFile(fileC)
@@ -127,6 +247,13 @@ class Test_FastaFile(unittest.TestCase):
                      'TNSGQLDMGLLFVCYQHDL')
         cls.head3 = '>sp|X|Other protein'
     #---
+
+    @classmethod
+    def tearDownClass(cls):
+        """Remove the temporary cache folder"""
+        cls.patch.stop()
+        cls.tmpDir.cleanup()
+    #---
     #endregion --------------------------------------------------> Class Setup
 
     #region -------------------------------------------------> Expected Output
@@ -366,6 +493,7 @@ class Test_PDBFile(unittest.TestCase):
         #------------------------------>
         tInput = [
             (self.pdb.rChain.tolist(), ['A', 'B'], self.assertEqual,               'Chain'),
+            (self.pdb.rModel,          [1],        self.assertEqual,               'Model'),
             (self.pdb.rDFAtom,         self.df,    pd._testing.assert_frame_equal, 'DF'),           # type: ignore
         ]
         #------------------------------>
@@ -426,4 +554,161 @@ class Test_PDBFile(unittest.TestCase):
     #---
     #endregion ----------------------------------------------> Expected Output
 #---
+
+
+class Test_Checkpoint(unittest.TestCase):
+    """Test for core.file.Checkpoint"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Set the checkpoint used by the test"""
+        self.tDir = tempfile.TemporaryDirectory()
+        self.cp   = cFile.Checkpoint('key', folder=Path(self.tDir.name))
+    #---
+
+    def tearDown(self):
+        """Remove the checkpoint folder"""
+        self.tDir.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        data = {'A': pd.DataFrame({'A': [1, 2, 3]}), 'B': 'B'}
+        #------------------------------>
+        with self.subTest('Missing step'):
+            self.assertIsNone(self.cp.Load('DP'))
+        with self.subTest('Save and Load'):
+            self.assertTrue(self.cp.Save('DP', data))
+            result = self.cp.Load('DP')
+            pd._testing.assert_frame_equal(result['A'], data['A'])              # type: ignore
+            self.assertEqual(result['B'], data['B'])
+        with self.subTest('Clear'):
+            self.cp.Clear()
+            self.assertFalse(self.cp.rFolder.exists())
+            self.assertIsNone(self.cp.Load('DP'))
+    #---
+
+    def test_spilled(self):
+        """SpilledDF are kept as files in the checkpoint"""
+        #------------------------------>
+        spill = cFile.SpilledDF(
+            Path(self.tDir.name)/'spill.txt', pd.DataFrame({'A': [1, 2, 3]}))
+        #------------------------------>
+        self.assertTrue(self.cp.Save('R', {'dfI': spill}))
+        spill.Remove()
+        result = self.cp.Load('R')
+        #------------------------------>
+        with self.subTest('Load'):
+            self.assertFalse(result['dfI'].rTemp)
+            pd._testing.assert_frame_equal(                                     # type: ignore
+                result['dfI'].Load(), pd.DataFrame({'A': [1, 2, 3]}))
+        with self.subTest('Missing file'):
+            result['dfI'].Move(Path(self.tDir.name)/'final.txt')
+            self.assertIsNone(self.cp.Load('R'))
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_NewCheckpoint(unittest.TestCase):
+    """Test for core.file.NewCheckpoint"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Use a temporary checkpoint folder"""
+        self.tDir  = tempfile.TemporaryDirectory()
+        self.patch = mock.patch.multiple(
+            mConfig.core,
+            checkpoint       = True,
+            checkpointFolder = self.tDir.name,
+            checkpointMaxAge = 7,
+        )
+        self.patch.start()
+    #---
+
+    def tearDown(self):
+        """Remove the temporary checkpoint folder"""
+        self.patch.stop()
+        self.tDir.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        folder = Path(self.tDir.name)/'umsap-checkpoint'
+        old    = folder/('a'*64)
+        new    = folder/('b'*64)
+        empty  = folder/('c'*64)
+        other  = folder/'other'
+        user   = Path(self.tDir.name)/'user'
+        for f in [old, new, empty, other, user]:
+            f.mkdir(parents=True)
+        for f in [old, new, other]:
+            (f/'DP.pkl').touch()
+        for f in [old, empty, other, user]:
+            os.utime(f, (0, 0))
+        #------------------------------>
+        with self.subTest('Disabled'):
+            with mock.patch.object(mConfig.core, 'checkpoint', False):
+                self.assertIsNone(cFile.NewCheckpoint('d'*64))
+            self.assertTrue(old.exists())
+        with self.subTest('Enabled'):
+            result = cFile.NewCheckpoint('d'*64)
+            self.assertEqual(result.rFolder, folder/('d'*64))                   # type: ignore
+            self.assertFalse(old.exists())
+            self.assertTrue(new.exists())
+        with self.subTest('Unrelated folders'):
+            self.assertTrue(empty.exists())
+            self.assertTrue(other.exists())
+            self.assertTrue(user.exists())
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_SpillDFs(unittest.TestCase):
+    """Test for core.file.SpillDFs"""
+    #region -----------------------------------------------------> Class Setup
+    def setUp(self):
+        """Set the folder used by the test"""
+        self.tDir = tempfile.TemporaryDirectory()
+        self.path = Path(self.tDir.name)
+        self.data = {
+            'dfI': pd.DataFrame({'A': range(100000), 'B': 1.5}),
+            'dfF': pd.DataFrame({'A': [1.0, 2.0, 3.0]}),
+            'dfR': pd.DataFrame({'A': range(100000)}),
+        }
+    #---
+
+    def tearDown(self):
+        """Remove the folder"""
+        self.tDir.cleanup()
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        with self.subTest('No limit'):
+            result = cFile.SpillDFs(self.path, self.data, 0)
+            self.assertIs(result, self.data)
+        with self.subTest('Spill'):
+            result = cFile.SpillDFs(self.path, self.data, 1)
+            self.assertIsInstance(result['dfI'], cFile.SpilledDF)
+            self.assertIs(result['dfF'], self.data['dfF'])
+            self.assertIs(result['dfR'], self.data['dfR'])
+            pd._testing.assert_frame_equal(                                     # type: ignore
+                result['dfI'].Load(), self.data['dfI'])
+        with self.subTest('Write'):
+            cFile.WriteDFs2CSV(self.path, {'I.txt': result['dfI']})
+            self.assertFalse(result['dfI'].rTemp)
+            self.assertEqual(
+                [x.name for x in self.path.iterdir()], ['I.txt'])
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
 #endregion ------------------------------------------------------> Class Setup
@@ -15,13 +15,16 @@
 
 
 #region -------------------------------------------------------------> Imports
+import tempfile
 import unittest
-from pathlib import Path
+from pathlib  import Path
+from unittest import mock
 
 import pandas as pd
 from numpy  import nan
 from pandas import NA
 
+from config.config import config as mConfig
 from core    import method as cMethod
 from core    import file   as cFile
 from limprot import method as limpMethod
@@ -41,6 +44,16 @@ DF_DFFilterByColS = pd.DataFrame({
 })
 
 
+DF_DFFilterByColSCat = DF_DFFilterByColS.astype({'B':'category'})
+
+
+DF_DFCategory = pd.DataFrame({
+    'A' : ['b', 'a', 'b', nan, 'c'],
+    'B' : [  1,   2,   3,   4,   5],
+    'C' : ['x', 'y', 'x', 'y', 'x'],
+})
+
+
 DF_DFExclude = pd.DataFrame({
     'A' : [  1,   2,   3,   4,     5],
     'B' : [  1,   2,   3,   4,     5],
@@ -324,6 +337,9 @@ class Test_DFFilterByColS(unittest.TestCase):
         """Set test"""
         cls.a = DF_DFFilterByColS.iloc[[1,3],:]
         cls.b = DF_DFFilterByColS.iloc[[0,2,4],:]
+        cls.c = DF_DFFilterByColSCat.iloc[[1,3],:]
+        cls.d = DF_DFFilterByColSCat.iloc[[0,2,4],:]
+        cls.e = DF_DFFilterByColSCat.iloc[[],:]
     #---
     #endregion --------------------------------------------------> Class Setup
 
@@ -335,6 +351,9 @@ class Test_DFFilterByColS(unittest.TestCase):
             (DF_DFFilterByColS, 1,   '2',  'e',  self.a),
             (DF_DFFilterByColS, 1,   '2', 'ne',  self.b),
             (DF_DFFilterByColS, 1,   '2', 'bad', self.b),
+            (DF_DFFilterByColSCat, 1, '2',  'e', self.c),
+            (DF_DFFilterByColSCat, 1, '2', 'ne', self.d),
+            (DF_DFFilterByColSCat, 1, '3',  'e', self.e),
         ]
         #------------------------------>
         for a,b,c,d,e in tInput:
@@ -349,6 +368,69 @@ class Test_DFFilterByColS(unittest.TestCase):
 #---
 
 
+class Test_DFCategory(unittest.TestCase):
+    """Test for core.method.DFCategory"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            ([0],        ['category', 'int64', 'object'],   ['a', 'b', 'c']),
+            ([-1, 0, 1], ['category', 'int64', 'object'],   ['a', 'b', 'c']),
+            ([0, 2],     ['category', 'int64', 'category'], ['a', 'b', 'c']),
+            ([],         ['object',   'int64', 'object'],   None),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'col={a}'):
+                #------------------------------>
+                result = cMethod.DFCategory(DF_DFCategory, a)
+                #------------------------------>
+                self.assertEqual([str(x) for x in result.dtypes], b)
+                self.assertEqual(
+                    result.astype(object).fillna('').values.tolist(),
+                    DF_DFCategory.fillna('').values.tolist(),
+                )
+                if c is not None:
+                    self.assertEqual(result['A'].cat.categories.tolist(), c)
+    #---
+
+    def test_unused_categories(self):
+        """Test that categories of filtered rows are dropped"""
+        #------------------------------>
+        df = cMethod.DFCategory(DF_DFCategory, [0]).iloc[[0,2],:]
+        #------------------------------>
+        result = cMethod.DFCategory(df, [0])
+        #------------------------------>
+        self.assertEqual(result['A'].cat.categories.tolist(), ['b'])
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_DFStrList(unittest.TestCase):
+    """Test for core.method.DFStrList"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            (DF_DFCategory,                            'Object'),
+            (cMethod.DFCategory(DF_DFCategory, [0,2]), 'Category'),
+        ]
+        #------------------------------>
+        for a,b in tInput:
+            with self.subTest(f'{b}'):
+                #------------------------------>
+                result = cMethod.DFStrList(a)
+                #------------------------------>
+                self.assertEqual(
+                    result, DF_DFCategory.astype(str).values.tolist())
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
 class Test_DFExclude(unittest.TestCase):
     """Test for core.method.DFExclude"""
     #region -----------------------------------------------------> Class Setup
@@ -442,6 +524,17 @@ class Test_DFReplace(unittest.TestCase):
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(result, e)                       # type: ignore
     #---
+
+    def test_input_unchanged(self):
+        """Test that the input df is not modified"""
+        #------------------------------>
+        df = DF_DFReplace.copy()
+        #------------------------------>
+        cMethod.DFReplace(df, [0, ""], nan, sel=[0,1])
+        #------------------------------>
+        # pylint: disable=protected-access
+        pd._testing.assert_frame_equal(df, DF_DFReplace)                        # type: ignore
+    #---
     #endregion ----------------------------------------------> Expected Output
 #---
 #endregion -----------------------------------------------------> pd.DataFrame
@@ -642,4 +735,240 @@ class Test_MergeOverlappingFragments(unittest.TestCase):
     #---
     #endregion ----------------------------------------------> Expected Output
 #---
+
+
+class Test_StrCheckpointKey(unittest.TestCase):
+    """Test for core.method.StrCheckpointKey"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        rDO    = limpMethod.UserData(iFile=fileA, uFile=Path('a.umsap'))
+        rDOU   = limpMethod.UserData(iFile=fileA, uFile=Path('b.umsap'))
+        rDOA   = limpMethod.UserData(iFile=fileA, uFile=Path('a.umsap'), alpha=0.01)
+        result = cMethod.StrCheckpointKey('Limited Proteolysis', rDO)
+        #------------------------------>
+        tInput = [
+            ('Limited Proteolysis', rDO,  True),
+            ('Limited Proteolysis', rDOU, True),
+            ('Limited Proteolysis', rDOA, False),
+            ('Proteome Profiling',  rDO,  False),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'section={a}, uFile={b.uFile}, alpha={b.alpha}'):
+                self.assertEqual(cMethod.StrCheckpointKey(a, b) == result, c)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_StrCancel(unittest.TestCase):
+    """Test for core.method.StrCancel"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        tInput = [
+            (False, mConfig.core.mCancel),
+            (True,  f'{mConfig.core.mCancel} {mConfig.core.mCancelCheckpoint}'),
+        ]
+        #------------------------------>
+        for a,b in tInput:
+            with self.subTest(f'checkpoint={a}'):
+                with mock.patch.object(mConfig.core, 'checkpoint', a):
+                    self.assertEqual(cMethod.StrCancel(), b)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_ReserveDataFolder(unittest.TestCase):
+    """Test for core.method.ReserveDataFolder"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        with tempfile.TemporaryDirectory() as tmp:
+            dateA = cMethod.ReserveDataFolder(Path(tmp), 'Limited Proteolysis')
+            dateB = cMethod.ReserveDataFolder(Path(tmp), 'Limited Proteolysis')
+            #------------------------------>
+            self.assertNotEqual(dateA, dateB)
+            for tDate in [dateA, dateB]:
+                with self.subTest(f'date={tDate}'):
+                    self.assertTrue(cMethod.DataStepsFolder(
+                        Path(tmp), tDate, 'Limited Proteolysis').is_dir())
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_StepTimer(unittest.TestCase):
+    """Test for core.method.StepTimer"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        timer = cMethod.StepTimer()
+        timer.Start()
+        timer.Begin('A')
+        timer.Begin('B')
+        data = list(range(100000))
+        timer.End('B')
+        timer.Begin('C')
+        timer.Begin('D')
+        timer.End('A')
+        timer.Begin('A')
+        timer.End()
+        timer.Stop()
+        result = timer.Dict()
+        #------------------------------>
+        with self.subTest('Keys'):
+            self.assertEqual(list(result.keys()), ['A/B', 'A/C/D', 'A/C', 'A'])
+            self.assertEqual(list(result['A'].keys()), ['Wall', 'CPU', 'Memory'])
+        with self.subTest('Memory'):
+            self.assertGreater(result['A/B']['Memory'], 1)
+            self.assertGreaterEqual(result['A']['Memory'], result['A/B']['Memory'])
+        with self.subTest('Wall'):
+            self.assertGreaterEqual(result['A']['Wall'], result['A/B']['Wall'])
+        with self.subTest('Unknown step'):
+            self.assertFalse(timer.End('E'))
+        del data
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_Profiler(unittest.TestCase):
+    """Test for core.method.Profiler & core.method.ProfileFile"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        with tempfile.TemporaryDirectory() as tDir:
+            #------------------------------>
+            uFile = Path(tDir) / 'res.umsap'
+            fileP = cMethod.ProfileFile(uFile, 'Targeted Proteolysis')
+            #------------------------------>
+            with self.subTest('ProfileFile'):
+                self.assertEqual(fileP.parent, Path(tDir))
+                self.assertTrue(fileP.name.endswith('_Targeted-Proteolysis.pstats'))
+                self.assertNotEqual(
+                    cMethod.ProfileFile(Path(tDir)/'a'/'res.umsap', 'A').parent,
+                    Path(tDir)/'a',
+                )
+            with self.subTest('Disabled'):
+                profiler = cMethod.Profiler(enable=False)
+                self.assertFalse(profiler.Start())
+                self.assertEqual(profiler.Stop(fileP), '')
+                self.assertFalse(fileP.exists())
+            with self.subTest('Enabled'):
+                profiler = cMethod.Profiler(enable=True)
+                profiler.Start()
+                cMethod.Str2ListNumber('1-100', sep=',')
+                result = profiler.Stop(fileP, nFunc=5)
+                self.assertTrue(fileP.exists())
+                self.assertIn(str(fileP), result)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_RectCollection(unittest.TestCase):
+    """Test for core.method.RectCollection"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        tInput = [
+            ([1, 5], [2, 2], [3, 1], 0.4, [[1, 2], [4, 2], [4, 2.4], [1, 2.4]]),
+            (0, 1, 2, 3, [[0, 1], [2, 1], [2, 4], [0, 4]]),
+        ]
+        #------------------------------>
+        for a,b,c,d,e in tInput:
+            with self.subTest(f'x={a}, y={b}, w={c}, h={d}'):
+                result = cMethod.RectCollection(a, b, c, d, facecolors='red')
+                #------------------------------>
+                self.assertEqual(len(result.get_paths()), len(a) if isinstance(a, list) else 1)
+                self.assertEqual(result.get_paths()[0].vertices[:4].tolist(), e)
+                self.assertEqual(len(result.get_facecolors()), 1)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_SearchIndex(unittest.TestCase):
+    """Test for core.method.SearchIndex"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):                                                        # pylint: disable=arguments-differ
+        """Set test"""
+        cls.index = cMethod.SearchIndex([
+            ['1', 'PEPTIDE',  'P1'],
+            ['2', 'TIDE',     'P2'],
+            ['3', 'PEPTIDEK', 'P12'],
+            ['4', 'KPEP',     'P1'],
+        ])
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        tInput = [
+            ('TIDE',       'substring', [[1], [0, 1, 2]]),
+            ('P1',         'substring', [[0, 3], [0, 2, 3]]),
+            ('PEP',        'prefix',    [[], [0, 2]]),
+            ('P1',         'prefix',    [[0, 3], [0, 2, 3]]),
+            ('^K|K$',      'regex',     [[], [2, 3]]),
+            ('DE\nT',     'substring', [[], []]),
+            ('',           'substring', [[], []]),
+            ('X',          'prefix',    [[], []]),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'tStr={a}, mode={b}'):
+                result = self.index.Search(a, b)
+                #------------------------------>
+                self.assertEqual(result, c)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_ListData(unittest.TestCase):
+    """Test for core.method.ListData"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        tInput = [
+            (DF_DFCategory,                            'Object'),
+            (cMethod.DFCategory(DF_DFCategory, [0,2]), 'Category'),
+        ]
+        #------------------------------>
+        for a,b in tInput:
+            with self.subTest(f'{b}'):
+                #------------------------------>
+                result = cMethod.ListData([x for _,x in a.items()])
+                expect = DF_DFCategory.astype(str).values.tolist()
+                #------------------------------>
+                self.assertEqual(list(result), expect)
+                self.assertEqual(
+                    [result.Cell(r, 1) for r in range(len(result))],
+                    [x[1] for x in expect],
+                )
+                #------------------------------>
+                result.SetIdx([3, 0])
+                self.assertEqual(len(result), 2)
+                self.assertEqual(result[0], expect[3])
+                self.assertEqual(result.Column(2), [expect[3][2], expect[0][2]])
+                self.assertEqual(
+                    cMethod.SearchIndex(result).Search(expect[0][1]),
+                    cMethod.SearchIndex([expect[3], expect[0]]).Search(
+                        expect[0][1]),
+                )
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
 #endregion -----------------------------------------------------------> Others
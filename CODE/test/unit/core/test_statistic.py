@@ -131,6 +131,53 @@ class Test_DataRange(unittest.TestCase):
 #---
 
 
+class Test_Corr(unittest.TestCase):
+    """Test for core.statistic.Corr"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):
+        """Set test"""
+        rng = np.random.default_rng(85)
+        x   = rng.normal(size=(60, 9))
+        x[:,1] = x[:,0] + rng.normal(scale=0.1, size=60)
+        x[:,2] = 5.0
+        x[:,3] = np.round(x[:,3])
+        x[rng.random((60, 9)) < 0.15] = nan
+        x[:,4] = nan
+        cls.df = pd.DataFrame(x, columns=list('ABCDEFGHI'))
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test for expected output"""
+        #------------------------------>
+        tInput = [
+            (DF_Log2,  'Pearson',  True,  256, 1),
+            (self.df,  'pearson',  True,  256, 1),
+            (self.df,  'pearson',  True,    2, 3),
+            (self.df,  'spearman', True,  256, 1),
+            (self.df,  'Spearman', True,    4, 2),
+            (self.df,  'kendall',  True,  256, 1),
+            (self.df,  'pearson',  False, 256, 1),
+            (self.df,  'spearman', False,   3, 1),
+        ]
+        #------------------------------>
+        for a,b,c,d,e in tInput:
+            with self.subTest(f'method={b}, pairwise={c}, block={d}, workers={e}'):
+                #------------------------------>
+                result = cStatistic.Corr(
+                    a, method=b, pairwise=c, block=d, workers=e)
+                #------------------------------>
+                tDF = a if c else a.dropna()
+                # pylint: disable=protected-access
+                pd._testing.assert_frame_equal(                                 # type: ignore
+                    result, tDF.corr(method=b.lower()), rtol=1e-9)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
 class Test_CI_Sample(unittest.TestCase):
     """Test for core.statistic.CI_Sample"""
     #region -----------------------------------------------------> Class Setup
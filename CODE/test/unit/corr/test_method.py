@@ -18,6 +18,7 @@
 import unittest
 from pathlib import Path
 
+import numpy  as np
 import pandas as pd
 
 from core import file   as cFile
@@ -127,4 +128,43 @@ class Test_CorrA(unittest.TestCase):
     #---
     #endregion ----------------------------------------------> Expected Output
 #---
+
+
+class Test_HeatmapImage(unittest.TestCase):
+    """Test for corr.method.HeatmapImage"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):
+        """Set test"""
+        cls.rgba = np.arange(6*6*4, dtype='float').reshape(6, 6, 4)
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_output(self):
+        """Test method output"""
+        #------------------------------>
+        idx = [0,1,2,3,4,5]
+        sel = [4,0,2]
+        tInput = [
+            (idx, (0, 6, 0, 6),       (100, 100), self.rgba,                                        (0, 6, 0, 6)),
+            (sel, (0, 3, 0, 3),       (100, 100), self.rgba[np.ix_(sel, sel)],                      (0, 3, 0, 3)),
+            (idx, (1.5, 3.2, 0, 0.5), (100, 100), self.rgba[0:1,1:4],                               (1, 4, 0, 1)),
+            (idx, (0, 6, 0, 6),       (3, 6),     (self.rgba[:,0::2]+self.rgba[:,1::2])/2,          (0, 6, 0, 6)),
+            (idx, (0, 6, 0, 6),       (6, 4),     np.stack([self.rgba[0:2].mean(0), self.rgba[2:4].mean(0), self.rgba[4:].mean(0)]), (0, 6, 0, 6)),
+            (idx, (0, 5, 0, 6),       (2, 6),     np.stack([self.rgba[:,0:3].mean(1), self.rgba[:,3:5].mean(1)], axis=1), (0, 6, 0, 6)),
+            (idx, (7, 9, 0, 6),       (100, 100), self.rgba[:,5:6],                                 (5, 6, 0, 6)),
+            (idx, (-3, -1, 6.5, 8),   (100, 100), self.rgba[5:6,0:1],                               (0, 1, 5, 6)),
+        ]
+        #------------------------------>
+        for a,b,c,d,e in tInput:
+            with self.subTest(f"idx={a}, lim={b}, maxCell={c}"):
+                #------------------------------>
+                img, extent = corrMethod.HeatmapImage(self.rgba, a, b, c)
+                #------------------------------>
+                np.testing.assert_allclose(img, d)
+                self.assertEqual(extent, e)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
 #endregion ----------------------------------------------------------> Classes
@@ -18,11 +18,13 @@
 import unittest
 from pathlib import Path
 
+import numpy  as np
 import pandas as pd
 from numpy  import nan, inf
 
-from core     import file   as cFile
-from dataprep import method as dataMethod
+from core     import file      as cFile
+from core     import statistic as cStatistic
+from dataprep import method    as dataMethod
 #endregion ----------------------------------------------------------> Imports
 
 
@@ -185,19 +187,20 @@ class Test_DataPrep_Float(unittest.TestCase):
         """Test for expected output"""
         #------------------------------>
         tInput = [
-            (DF_DataPrep_Float,  True, [0,1,2,5], [0,1,3], [0,1,3], DF_DataPrep_Float.iloc[:,[0,1,2,5]], DF_DataPrep_Float_True),
-            (DF_DataPrep_Float, False, [0,1,2,5], [0,1,3],   [0,3], DF_DataPrep_Float.iloc[:,[0,1,2,5]], DF_DataPrep_Float_False),
+            (DF_DataPrep_Float,  True, [0,1,2,5], [0,1,3], [0,1,3], DF_DataPrep_Float.iloc[:,[0,1,2,5]], DF_DataPrep_Float_True,  [2,1,0,2]),
+            (DF_DataPrep_Float, False, [0,1,2,5], [0,1,3],   [0,3], DF_DataPrep_Float.iloc[:,[0,1,2,5]], DF_DataPrep_Float_False, [1,0,0,1]),
         ]
         #------------------------------>
-        for a,b,c,d,e,f,g in tInput:
+        for a,b,c,d,e,f,g,h in tInput:
             with self.subTest(
                 f'df={a}, cero={b}, col={c}, colCero={d}, colFloat={e}'):
                 #------------------------------>
-                dfI, dfF = dataMethod.DataPrep_Float(a, b, c, d, e)
+                dfI, dfF, repVal = dataMethod.DataPrep_Float(a, b, c, d, e)
                 #------------------------------>
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(dfI, f)                          # type: ignore
                 pd._testing.assert_frame_equal(dfF, g)                          # type: ignore
+                self.assertEqual(repVal, h)
     #---
     #endregion ----------------------------------------------> Expected Output
 #---
@@ -344,6 +347,58 @@ class Test_DataPreparation(unittest.TestCase):
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(result, d)                       # type: ignore
     #---
+
+    def test_float32(self):
+        """Test float32 intensities"""
+        #------------------------------>
+        rDO = dataMethod.UserData(**{
+            k:getattr(self.dict1, k) for k in self.dict1.__dataclass_fields__}) # pylint: disable=no-member
+        rDO.float32   = True
+        rDO.dfColumnR = [0,1,2,3,4]
+        rDO.dfColumnF = [0,1,2,3,4]
+        #------------------------------>
+        result = dataMethod.RunDataPreparation(
+            df=self.df, rDO=rDO, resetIndex=True)[0]['dfS']
+        #------------------------------>
+        self.assertTrue((result.dtypes == 'float32').all())
+        # pylint: disable=protected-access
+        pd._testing.assert_frame_equal(                                         # type: ignore
+            result.iloc[range(0,20),:].astype('float'),
+            DF_DataPrep_1,
+            rtol = 1e-4,
+            atol = 1e-3,
+        )
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_Histogram(unittest.TestCase):
+    """Test for dataprep.method.Histogram"""
+    #region -------------------------------------------------> Expected Output
+    def test_output(self):
+        """Test method output"""
+        #------------------------------>
+        rng = np.random.default_rng(1)
+        x   = rng.normal(5, 2, (500, 4))
+        x[rng.random(x.shape) < 0.2] = nan
+        x[0,1] = inf
+        df   = pd.DataFrame(x)
+        mask = pd.DataFrame(rng.random(x.shape) < 0.3)
+        #------------------------------>
+        result = dataMethod.Histogram(df, mask=mask)
+        #------------------------------>
+        for c in range(df.shape[1]):
+            with self.subTest(f"col={c}"):
+                y = df.iloc[:,c]
+                y = y[np.isfinite(y)]
+                counts, edges = np.histogram(y, bins=cStatistic.HistBin(y)[0])
+                countsI = np.histogram(
+                    y[mask.iloc[:,c][y.index]], bins=edges)[0]
+                np.testing.assert_array_equal(result[c].edges, edges)
+                np.testing.assert_array_equal(result[c].counts, counts)
+                np.testing.assert_array_equal(result[c].countsI, countsI)
+    #---
     #endregion ----------------------------------------------> Expected Output
 #---
 #endregion ----------------------------------------------------------> Classes
@@ -21,6 +21,7 @@ from pathlib import Path
 import pandas as pd
 
 from core    import file   as cFile
+from core    import method as cMethod
 from limprot import method as limpMethod
 #endregion ----------------------------------------------------------> Imports
 
@@ -95,6 +96,7 @@ class Test_LimProt(unittest.TestCase):
                 #------------------------------>
                 dfF = pd.read_csv(d, sep='\t', header=[0,1,2])#.round(2)
                 dfF.iloc[:,4:6] = dfF.iloc[:,4:6].astype('Int64')
+                dfF = cMethod.DFCategory(dfF, [0])
                 #------------------------------>
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(result, dfF)                     # type: ignore
@@ -16,11 +16,16 @@
 
 #region -------------------------------------------------------------> Imports
 import unittest
-from pathlib import Path
+from dataclasses import replace
+from pathlib     import Path
 
+import numpy  as np
 import pandas as pd
 
-from core     import file   as cFile
+from config.config import config as mConfig
+from core     import file      as cFile
+from core     import method    as cMethod
+from core     import statistic as cStatistic
 from protprof import method as protMethod
 #endregion ----------------------------------------------------------> Imports
 
@@ -32,6 +37,23 @@ fileB  = folder / 'res-protprof-1.txt'
 #endregion ----------------------------------------------------> File Location
 
 
+#region ---------------------------------------------------------> Dataframes
+DF_Filter = pd.DataFrame(
+    [
+        [   1,    2,    1,   3, 1e-5,    1,    2],
+        [  -1,   -2, -0.5,  -1,  0.5,    1,   -2],
+        [   1,    2,   -1,  -3, 0.01,    1,  0.5],
+        [0.05, -0.05, 0.01, np.nan, 1e-10, 1e-3, np.nan],
+    ],
+    columns=pd.MultiIndex.from_tuples([
+        ('C1', 'RP1', 'FC'), ('C1', 'RP2', 'FC'), ('C2', 'RP1', 'FC'),
+        ('C2', 'RP2', 'FC'), ('C1', 'RP1', 'P'), ('C1', 'RP1', 'Pc'),
+        ('C1', 'RP1', 'FCz'),
+    ]),
+)
+#endregion ------------------------------------------------------> Dataframes
+
+
 #region -------------------------------------------------------------> Classes
 class Test_ProtProf(unittest.TestCase):
     """Test for protprof.method.ProtProf"""
@@ -90,10 +112,196 @@ class Test_ProtProf(unittest.TestCase):
                 result = result.round(2)
                 #------------------------------>
                 dfF = pd.read_csv(d, sep='\t', header=[0,1,2]).round(2)
+                dfF = cMethod.DFCategory(dfF, [0,1])
                 #------------------------------>
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(result, dfF)                     # type: ignore
     #---
+
+    def test_float32(self):
+        """Test float32 intensities, see dataMethod.DataPrep_Float"""
+        #------------------------------>
+        rDO = replace(self.dict1, float32=True)
+        #------------------------------>
+        result = protMethod.ProtProf(df=self.df, rDO=rDO)[0]['dfR']
+        dfF    = protMethod.ProtProf(df=self.df, rDO=self.dict1)[0]['dfR']
+        #------------------------------>
+        # pylint: disable=protected-access
+        pd._testing.assert_frame_equal(                                         # type: ignore
+            result, dfF, check_dtype=False, rtol=1e-4, atol=1e-6)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_Filter(unittest.TestCase):
+    """Test for the filters in protprof.method"""
+    #region -------------------------------------------------> Expected Output
+    def test_fc_evol(self):
+        """Test protprof.method.FilterFCEvol"""
+        #------------------------------>
+        tInput = [
+            ('up',       None, False, 0.0, [True, False, False, False]),
+            ('up',       None, True,  0.0, [True, False, True,  False]),
+            ('up',       'C2', False, 0.0, [True, False, False, False]),
+            ('upMon',    None, False, 0.0, [True, False, False, False]),
+            ('downMon',  None, False, 0.0, [False, True, False, False]),
+            ('div',      None, False, 0.0, [False, False, True, False]),
+            ('opposite', None, False, 0.0, [False, False, True, False]),
+            ('no',       None, True,  0.1, [False, False, False, True]),
+            ('no',       None, False, 0.1, [False, False, False, False]),
+        ]
+        #------------------------------>
+        for a,b,c,d,e in tInput:
+            with self.subTest(f'mode={a}, cond={b}, anyC={c}, lim={d}'):
+                result = protMethod.FilterFCEvol(
+                    DF_Filter, a, cond=b, anyC=c, lim=d)
+                #------------------------------>
+                self.assertEqual(result.tolist(), e)
+    #---
+
+    def test_value(self):
+        """Test the filters based on a single column"""
+        #------------------------------>
+        tInput = [
+            (protMethod.FilterHCurve, (1, 0.1),              [True, False, True, False]),
+            (protMethod.FilterLog2FC, ('<', 0),              [False, True, False, False]),
+            (protMethod.FilterLog2FC, ('>', 1),              [True, False, True, False]),
+            (protMethod.FilterPValue, ('<', 0.01),           [True, False, True, True]),
+            (protMethod.FilterPValue, ('>', 3, False),       [True, False, False, True]),
+            (protMethod.FilterPValue, ('<', 0.01, True, True), [False, False, False, True]),
+            (protMethod.FilterZScore, ('<', 10),             [True, True, False, False]),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'method={a.__name__}, args={b}'):
+                result = a(DF_Filter, 'C1', 'RP1', *b)
+                #------------------------------>
+                self.assertEqual(result.tolist(), c)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_VolColor(unittest.TestCase):
+    """Test for the volcano plot colors in protprof.method"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):
+        """Set test"""
+        cls.dfN = DF_Filter.copy()
+        cls.dfN[('C1', 'RP1', 'FC')] = -cls.dfN[('C1', 'RP1', 'FC')]
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Test the color index of each protein"""
+        #------------------------------>
+        tInput = [
+            (protMethod.VolColorHCurve,  DF_Filter, (1, 0.1),       [2, 1, 2, 1]),
+            (protMethod.VolColorHCurve,  self.dfN,  (1, 0.1),       [0, 1, 0, 1]),
+            (protMethod.VolColorHCurve,  DF_Filter, (1, 0.1, True), [1, 1, 1, 1]),
+            (protMethod.VolColorZScore,  DF_Filter, (10,),          [2, 0, 1, 1]),
+            (protMethod.VolColorPLog2FC, DF_Filter, (0.05, 0.5),    [2, 1, 2, 1]),
+            (protMethod.VolColorPLog2FC, self.dfN,  (0.05, 0.5),    [0, 1, 0, 1]),
+        ]
+        #------------------------------>
+        for a,b,c,d in tInput:
+            with self.subTest(f'method={a.__name__}, args={c}'):
+                result = a(b, 'C1', 'RP1', *c)
+                #------------------------------>
+                self.assertEqual(result.tolist(), d)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_ProtAnalysis(unittest.TestCase):
+    """Test for protprof.method.ProtAnalysis"""
+    #region -------------------------------------------------> Expected Output
+    def test_lazy_df(self):
+        """Test that the result is read when first used"""
+        #------------------------------>
+        data = protMethod.ProtAnalysis(
+            dfP      = fileB,
+            alpha    = 0.05,
+            filterS  = {},
+            labelA   = ['C1', 'C2'],
+            labelB   = ['RP1', 'RP2'],
+            ctrlType = 'One Control',
+            ctrlName = '1Control',
+        )
+        #------------------------------>
+        self.assertIsNone(data.dfCache)
+        # pylint: disable=protected-access
+        pd._testing.assert_frame_equal(                                         # type: ignore
+            data.df, protMethod.ReadResult(fileB))
+        self.assertIs(data.df, data.dfCache)
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
+
+
+class Test_Summary(unittest.TestCase):
+    """Test for protprof.method.Summary"""
+    #region -----------------------------------------------------> Class Setup
+    @classmethod
+    def setUpClass(cls):
+        """Set test"""
+        cls.df      = cFile.ReadCSV2DF(fileB, header=[0,1,2])
+        cls.summary = protMethod.Summary(cls.df)
+    #---
+    #endregion --------------------------------------------------> Class Setup
+
+    #region -------------------------------------------------> Expected Output
+    def test_summary(self):
+        """Test the number of rows and the range of each value"""
+        #------------------------------>
+        idx = pd.IndexSlice
+        #------------------------------>
+        self.assertEqual(self.summary['N'], len(self.df))
+        for k in mConfig.prot.dfcolCLevel:
+            with self.subTest(k):
+                x = self.df.loc[:, idx[:,:,k]]
+                self.assertEqual(
+                    self.summary[k], [x.min().min(), x.max().max()])
+    #---
+
+    def test_vol_range(self):
+        """Test the range of the volcano plot"""
+        #------------------------------>
+        idx    = pd.IndexSlice
+        margin = mConfig.core.MatPlotMargin
+        x      = self.df.loc[:, idx[:,:,'FC']]
+        #------------------------------>
+        for corrP, col in [(False, 'P'), (True, 'Pc')]:
+            with self.subTest(col):
+                y = -np.log10(self.df.loc[:, idx[:,:,col]])
+                #------------------------------>
+                self.assertEqual(
+                    protMethod.SummaryVolRange(self.summary, corrP),
+                    [cStatistic.DataRange(x, symm=True, margin=margin),
+                     cStatistic.DataRange(y, margin=margin)],
+                )
+    #---
+
+    def test_fc_range(self):
+        """Test the range of the FC plot"""
+        #------------------------------>
+        idx    = pd.IndexSlice
+        margin = mConfig.core.MatPlotMargin
+        #------------------------------>
+        yMin, yMax = cStatistic.DataRange(self.df.loc[:, idx[:,:,'FC']])
+        _, ciMax   = cStatistic.DataRange(self.df.loc[:, idx[:,:,'CI']])
+        dm         = (yMax - yMin + 2*ciMax) * margin
+        #------------------------------>
+        xRange, yRange = protMethod.SummaryFcRange(self.summary, 2)
+        #------------------------------>
+        self.assertEqual(xRange, [-2*margin, 2 + 2*margin])
+        self.assertAlmostEqual(yRange[0], yMin - ciMax - dm)
+        self.assertAlmostEqual(yRange[1], yMax + ciMax + dm)
+    #---
     #endregion ----------------------------------------------> Expected Output
 #---
 #endregion ----------------------------------------------------------> Classes
@@ -15,14 +15,19 @@
 
 
 #region -------------------------------------------------------------> Imports
+import json
 import unittest
-from pathlib import Path
+from dataclasses import replace
+from pathlib     import Path
 
+import numpy  as np
 import pandas as pd
 from numpy import nan
 from pandas import NA
 
+from config.config import config as mConfig
 from core    import file   as cFile
+from core    import method as cMethod
 from tarprot import method as tarpMethod
 #endregion ----------------------------------------------------------> Imports
 
@@ -122,10 +127,55 @@ class Test_TarProt(unittest.TestCase):
                 #------------------------------>
                 dfF = pd.read_csv(d, sep='\t', header=[0,1])#.round(2)
                 dfF.iloc[:,4:6] = dfF.iloc[:,4:6].astype('Int64')
+                dfF = cMethod.DFCategory(dfF, [0])
                 #------------------------------>
                 # pylint: disable=protected-access
                 pd._testing.assert_frame_equal(result, dfF)                     # type: ignore
     #---
+
+    def test_int_float32(self):
+        """Test the intensities in the output when using float32"""
+        #------------------------------>
+        rDO = replace(self.dict1, tran='None', norm='None', imp='None')
+        idx = pd.IndexSlice
+        #------------------------------>
+        result = tarpMethod.TarProt(
+            df=self.df, rDO=replace(rDO, float32=True))[0]['dfR']
+        dfF = tarpMethod.TarProt(df=self.df, rDO=rDO)[0]['dfR']
+        #------------------------------>
+        # pylint: disable=protected-access
+        pd._testing.assert_frame_equal(                                         # type: ignore
+            result.loc[:,idx[:,'Int']], dfF.loc[:,idx[:,'Int']])
+    #---
+
+    def test_float32(self):
+        """Test float32 intensities, see dataMethod.DataPrep_Float"""
+        #------------------------------>
+        for k,rDO in enumerate([self.dict1, self.dict2], start=1):
+            with self.subTest(f'Test - {k}'):
+                #------------------------------>
+                result = tarpMethod.TarProt(
+                    df=self.df, rDO=replace(rDO, float32=True))[0]['dfR']
+                dfF = tarpMethod.TarProt(df=self.df, rDO=rDO)[0]['dfR']
+                cInt = [x for x in dfF.columns if x[1] == 'Int']                # Intensities as str
+                #------------------------------>
+                # pylint: disable=protected-access
+                pd._testing.assert_frame_equal(                                 # type: ignore
+                    result.drop(columns=cInt),
+                    dfF.drop(columns=cInt),
+                    check_dtype = False,
+                    rtol        = 1e-4,
+                    atol        = 1e-6,
+                )
+                np.testing.assert_allclose(
+                    [x for y in result[cInt].to_numpy().ravel()
+                     for x in json.loads(y)],
+                    [x for y in dfF[cInt].to_numpy().ravel()
+                     for x in json.loads(y)],
+                    rtol = 1e-4,
+                    atol = 1e-6,
+                )
+    #---
     #endregion ----------------------------------------------> Expected Output
 #---
 
@@ -372,4 +422,35 @@ class Test_R2CEvol(unittest.TestCase):
     #---
     #endregion ----------------------------------------------> Expected Output
 #---
+
+
+class Test_StepDict(unittest.TestCase):
+    """Test for tarprot.method.StepDict"""
+    #region -------------------------------------------------> Expected Output
+    def test_expected_output(self):
+        """Expected output"""
+        #------------------------------>
+        dfDict = {k: pd.DataFrame() for k in mConfig.core.ltDFKeys}
+        tInput = [
+            (tarpMethod.UserData(),                        False, False),
+            (tarpMethod.UserData(posAA=5),                 True,  False),
+            (tarpMethod.UserData(posAA=5, winHist=[25]),   True,  True),
+        ]
+        #------------------------------>
+        for a,b,c in tInput:
+            with self.subTest(f'posAA={a.posAA}, winHist={a.winHist}'):
+                result = tarpMethod.StepDict('20230101-120000', a, dfDict)
+                #------------------------------>
+                self.assertEqual(len(result['Files']), 11 + b + c)
+                self.assertIn(result['R'],     result['Files'])
+                self.assertIn(result['CpR'],   result['Files'])
+                self.assertIn(result['CEvol'], result['Files'])
+                self.assertEqual('AA' in result, b)
+                self.assertEqual('Hist' in result, c)
+                for k in ['AA', 'Hist']:
+                    for v in result.get(k, {}).values():
+                        self.assertIn(v, result['Files'])
+    #---
+    #endregion ----------------------------------------------> Expected Output
+#---
 #endregion ----------------------------------------------------------> Classes